@@ -14,7 +14,7 @@ No parameter extraction. No templates. Just LLM → SQL → Results.
 """
 
 import structlog
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, date, timedelta
 import asyncio
 import re
@@ -23,8 +23,14 @@ from backend.services.chart_recommendation import chart_engine
 from backend.services.chart_data_builder import chart_data_builder
 from backend.utils.followup_query import build_contextual_followup_query
 from backend.config.settings import get_settings
-from backend.utils.aws_session import create_aws_session
+from backend.utils.aws_session import get_aws_client
 from backend.utils.aws_constants import AwsService
+from backend.services.athena_client import get_async_athena_client
+from backend.services.athena_polling import QueryClass, deadline_for
+from backend.services.athena_result_cache import athena_result_cache, result_scope
+from backend.services.athena_result_reader import AthenaResultReader
+from backend.services.query_result import ColumnarResult
+from backend.services.chat_stream_events import emit_event
 from backend.utils.sql_validation import (
     validate_service_code,
     validate_resource_id,
@@ -247,7 +253,10 @@ class AthenaExecutor:
     """Simplified Athena executor for text-to-SQL generated queries"""
     
     def __init__(self):
-        self.athena_client = create_aws_session().client(AwsService.ATHENA)
+        # Shared non-blocking client: Athena round-trips run on its I/O pool
+        self._athena = get_async_athena_client()
+        self.athena_client = self._athena.client
+        self._reader = AthenaResultReader(self._athena)
         self.database = CUR_DATABASE
         # Extract bucket from athena_output_location setting
         output_loc = settings.athena_output_location
@@ -255,98 +264,60 @@ class AthenaExecutor:
             output_loc += '/'
         self.output_location = output_loc
     
-    async def execute_sql(self, sql_query: str) -> List[Dict[str, Any]]:
+    async def execute_sql(self, sql_query: str, scope: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Execute SQL query in Athena and return results.
         
         Args:
             sql_query: Complete SQL query string
+            scope: Caller's account scope (see result_scope), part of the cache key
             
         Returns:
             List of result rows as dictionaries
         """
         try:
+            cached = await athena_result_cache.get(sql_query, scope)
+            if cached is not None:
+                logger.info("Serving Athena results from cache", row_count=len(cached))
+                return cached
+
             logger.info(
                 "Executing Athena SQL query",
                 query_preview=sql_query[:200],
                 query_length=len(sql_query)
             )
             
-            # Start query execution
-            response = self.athena_client.start_query_execution(
-                QueryString=sql_query,
-                QueryExecutionContext={
-                    'Database': self.database
-                },
-                ResultConfiguration={
-                    'OutputLocation': self.output_location
-                }
+            # Start (or reuse) the query and wait for it (adaptive backoff,
+            # per-class deadline)
+            status_response = await self._athena.execute_query(
+                sql_query,
+                database=self.database,
+                output_location=self.output_location,
+                query_class=QueryClass.INTERACTIVE,
             )
+            query_execution_id = status_response['QueryExecution']['QueryExecutionId']
+            logger.info(f"Athena query: {query_execution_id}")
+            query_status = status_response.get('QueryExecution', {}).get('Status', {})
+            status = query_status.get('State')
             
-            query_execution_id = response['QueryExecutionId']
-            logger.info(f"Started Athena query: {query_execution_id}")
+            if status in ['FAILED', 'CANCELLED']:
+                error_msg = query_status.get('StateChangeReason', 'Unknown error')
+                logger.error(f"Athena query failed: {error_msg}")
+                raise Exception(f"Query {status}: {error_msg}")
+            if status != 'SUCCEEDED':
+                deadline = deadline_for(QueryClass.INTERACTIVE)
+                raise Exception(f"Query timeout - took longer than {deadline:g} seconds")
             
-            # Wait for query to complete
-            max_attempts = 30
-            attempt = 0
+            logger.info("Query succeeded", query_execution_id=query_execution_id)
             
-            while attempt < max_attempts:
-                await asyncio.sleep(1)
-                attempt += 1
-                
-                status_response = self.athena_client.get_query_execution(
-                    QueryExecutionId=query_execution_id
-                )
-                
-                status = status_response['QueryExecution']['Status']['State']
-                
-                if status == 'SUCCEEDED':
-                    break
-                elif status in ['FAILED', 'CANCELLED']:
-                    error_msg = status_response['QueryExecution']['Status'].get(
-                        'StateChangeReason', 'Unknown error'
-                    )
-                    logger.error(f"Athena query failed: {error_msg}")
-                    raise Exception(f"Query {status}: {error_msg}")
-            
-            if attempt >= max_attempts:
-                raise Exception("Query timeout - took longer than 30 seconds")
-            
-            logger.info(f"Query succeeded after {attempt} attempts")
-            
-            # Get results
-            results_response = self.athena_client.get_query_results(
-                QueryExecutionId=query_execution_id,
-                MaxResults=1000
-            )
-            
-            # Parse results into list of dicts
-            rows = results_response['ResultSet']['Rows']
-            
-            if not rows or len(rows) < 2:
+            # Stream the CSV output from S3, typed by result-set metadata
+            # (previously a single 1000-row get_query_results page)
+            results = await self._reader.read_all(query_execution_id)
+            if not results:
                 logger.warning("Query returned no data rows")
-                return []
-            
-            # First row is headers
-            headers = [col['VarCharValue'] for col in rows[0]['Data']]
-            
-            # Convert remaining rows to dicts
-            results = []
-            for row in rows[1:]:
-                row_dict = {}
-                for i, col in enumerate(row['Data']):
-                    value = col.get('VarCharValue')
-                    # Try to convert numeric strings to numbers
-                    if value and value.replace('.', '', 1).replace('-', '', 1).replace('e', '', 1).replace('E', '', 1).replace('+', '', 1).isdigit():
-                        try:
-                            row_dict[headers[i]] = float(value) if '.' in value else int(value)
-                        except:
-                            row_dict[headers[i]] = value
-                    else:
-                        row_dict[headers[i]] = value
-                results.append(row_dict)
             
             logger.info(f"Query returned {len(results)} rows")
+            await athena_result_cache.put(sql_query, scope, results)
             return results
             
         except Exception as e:
@@ -355,6 +326,8 @@ class AthenaExecutor:
                 error=str(e),
                 error_type=type(e).__name__
             )
+            # Never hand out a memoized execution whose results failed to load
+            self._athena.forget_execution(sql_query, self.database)
             raise
 
 
@@ -370,7 +343,7 @@ async def _fetch_cost_explorer_fallback(
     end_date = tr.get("end_date") or date.today().isoformat()
     account_ids = [a for a in (context.get("account_ids") or []) if a]
 
-    ce_client = create_aws_session(region_name=COST_EXPLORER_REGION).client(AwsService.COST_EXPLORER)
+    ce_client = get_aws_client(AwsService.COST_EXPLORER, region_name=COST_EXPLORER_REGION)
     def _build_rows(req: Dict[str, Any]) -> List[Dict[str, Any]]:
         response = ce_client.get_cost_and_usage(**req)
         rows: List[Dict[str, Any]] = []
@@ -418,10 +391,55 @@ async def _fetch_cost_explorer_fallback(
     return out
 
 
-async def execute_query_simple(
+async def generate_sql_for_query(
     query: str,
     conversation_history: Optional[List[Dict[str, str]]] = None,
     previous_context: Optional[Dict[str, Any]] = None
+) -> Tuple[str, Optional[str], Dict[str, Any]]:
+    """
+    Rewrite follow-ups and generate SQL for a query (Step 1 of execute_query_simple).
+
+    Split out so the multi-agent workflow can start it speculatively while
+    optimization classification is still running.
+
+    Returns:
+        (effective_query, sql_query, metadata)
+    """
+    # Preserve prior drill-down scope for terse time-only follow-ups.
+    rewrite_context: Dict[str, Any] = dict(previous_context or {})
+    if conversation_history and "conversation_history" not in rewrite_context:
+        rewrite_context["conversation_history"] = conversation_history
+
+    effective_query = build_contextual_followup_query(query, rewrite_context)
+    if effective_query != query:
+        logger.info(
+            "Rewrote follow-up query with prior context",
+            original_query=query[:120],
+            effective_query=effective_query[:160],
+        )
+
+    # Generate SQL from natural language (or deterministic comparison path)
+    emit_event("status", stage="generating_sql", message="Generating SQL for your question...")
+    deterministic = None
+    if _is_period_comparison_query(effective_query, previous_context):
+        deterministic = _build_period_comparison_sql_and_metadata(effective_query, previous_context)
+
+    if deterministic:
+        sql_query, metadata = deterministic
+    else:
+        sql_query, metadata = await text_to_sql_service.generate_sql(
+            user_query=effective_query,
+            conversation_history=conversation_history,
+            previous_context=previous_context
+        )
+    return effective_query, sql_query, metadata
+
+
+async def execute_query_simple(
+    query: str,
+    conversation_history: Optional[List[Dict[str, str]]] = None,
+    previous_context: Optional[Dict[str, Any]] = None,
+    sql_generation: Optional["asyncio.Future[Tuple[str, Optional[str], Dict[str, Any]]]"] = None
 ) -> Dict[str, Any]:
     """
     Simplified query execution using pure text-to-SQL approach.
@@ -430,6 +448,8 @@ async def execute_query_simple(
         query: Natural language query from user
         conversation_history: Previous messages
         previous_context: Context from previous query
+        sql_generation: Already-started generate_sql_for_query() task for the
+            same arguments (speculative routing); started here if omitted
         
     Returns:
         Response dict with message, charts, suggestions
@@ -437,31 +457,12 @@ async def execute_query_simple(
     try:
         logger.info("Executing query with text-to-SQL approach", query=query[:100])
 
-        # Preserve prior drill-down scope for terse time-only follow-ups.
-        rewrite_context: Dict[str, Any] = dict(previous_context or {})
-        if conversation_history and "conversation_history" not in rewrite_context:
-            rewrite_context["conversation_history"] = conversation_history
-
-        effective_query = build_contextual_followup_query(query, rewrite_context)
-        if effective_query != query:
-            logger.info(
-                "Rewrote follow-up query with prior context",
-                original_query=query[:120],
-                effective_query=effective_query[:160],
-            )
-        
         # Step 1: Generate SQL from natural language (or deterministic comparison path)
-        deterministic = None
-        if _is_period_comparison_query(effective_query, previous_context):
-            deterministic = _build_period_comparison_sql_and_metadata(effective_query, previous_context)
-
-        if deterministic:
-            sql_query, metadata = deterministic
+        if sql_generation is not None:
+            effective_query, sql_query, metadata = await sql_generation
         else:
-            sql_query, metadata = await text_to_sql_service.generate_sql(
-                user_query=effective_query,
-                conversation_history=conversation_history,
-                previous_context=previous_context
+            effective_query, sql_query, metadata = await generate_sql_for_query(
+                query, conversation_history, previous_context
             )
         
         logger.info(
@@ -472,6 +473,7 @@ async def execute_query_simple(
         
         # Step 2: Execute SQL in Athena (only if we have a valid SQL)
         executor = AthenaExecutor()
+        cache_scope = result_scope((previous_context or {}).get("account_ids"))
         if not sql_query:
             # Return a clarification/error payload without executing
             status = metadata.get("status")
@@ -497,8 +499,9 @@ async def execute_query_simple(
                 "context": {"last_query": query, "timestamp": datetime.now().isoformat()}
             }
 
+        emit_event("status", stage="executing_query", message="Running query in Athena...")
         try:
-            results = await executor.execute_sql(sql_query)
+            results = await executor.execute_sql(sql_query, scope=cache_scope)
         except Exception as execute_error:
             error_text = str(execute_error)
             fallback_markers = [
@@ -519,7 +522,7 @@ async def execute_query_simple(
                                 to_table=DEMO_FALLBACK_CUR_TABLE_REF,
                             )
                             sql_query = rewritten_sql
-                            results = await executor.execute_sql(sql_query)
+                            results = await executor.execute_sql(sql_query, scope=cache_scope)
                         except Exception as rewrite_error:
                             logger.warning(
                                 "Athena retry with rewritten CUR table failed",
@@ -643,7 +646,7 @@ LIMIT 20
 """
                 
                 logger.info("Executing drill-down query for usage types")
-                drill_down_results = await executor.execute_sql(drill_down_sql)
+                drill_down_results = await executor.execute_sql(drill_down_sql, scope=cache_scope)
                 
                 # Use drill-down results if we got multiple rows
                 if drill_down_results and len(drill_down_results) > 1:
@@ -680,7 +683,7 @@ LIMIT 20
                         from_table="cost_usage_db.cur_data",
                         to_table=DEMO_FALLBACK_CUR_TABLE_REF,
                     )
-                    retry_results = await executor.execute_sql(rewritten_sql)
+                    retry_results = await executor.execute_sql(rewritten_sql, scope=cache_scope)
                     if retry_results:
                         results = retry_results
                         sql_query = rewritten_sql
@@ -732,6 +735,15 @@ LIMIT 20
             }
         
         # Step 3: Generate charts from results
+        # Column-oriented view built once and shared by the chart engine and builder
+        table = ColumnarResult.from_rows(results)
+        emit_event(
+            "results",
+            columns=table.columns,
+            rows=table[:settings.chat_stream_preview_rows].to_dicts(),
+            row_count=len(table),
+        )
+
         # Prefer explicit chart suggestions from LLM metadata; fallback to heuristics if absent/invalid.
         chart_specs = _chart_specs_from_llm_metadata(metadata, results)
 
@@ -748,20 +760,20 @@ LIMIT 20
 
             chart_specs = chart_engine.recommend_charts(
                 intent=chart_intent,
-                data_results=results,
+                data_results=table,
                 extracted_params={}
             )
 
             if not chart_specs and results:
                 chart_specs = chart_engine.recommend_charts(
                     intent=_fallback_chart_intent(results),
-                    data_results=results,
+                    data_results=table,
                     extracted_params={}
                 )
 
         charts_with_data = chart_data_builder.build_chart_data(
             chart_specs=chart_specs,
-            data_results=results,
+            data_results=table,
             conv_context=None
         )
 
@@ -770,36 +782,35 @@ LIMIT 20
             fallback_intent = metadata.get("query_type") or _fallback_chart_intent(results)
             fallback_specs = chart_engine.recommend_charts(
                 intent=fallback_intent,
-                data_results=results,
+                data_results=table,
                 extracted_params={}
             )
             if not fallback_specs:
                 fallback_specs = chart_engine.recommend_charts(
                     intent=_fallback_chart_intent(results),
-                    data_results=results,
+                    data_results=table,
                     extracted_params={}
                 )
             charts_with_data = chart_data_builder.build_chart_data(
                 chart_specs=fallback_specs,
-                data_results=results,
+                data_results=table,
                 conv_context=None
             )
         
+        if charts_with_data:
+            emit_event("charts", data=charts_with_data)
+        
         # Step 4: Use LLM's explanation as the response
         # The LLM already provides rich analysis, insights, and recommendations in the explanation
         formatted_response = metadata.get("explanation", "Here are your results.")
 
         # Add a simple data summary if the explanation doesn't include numbers
         if results:
-            # Helper to extract cost from any cost column
-            def _get_cost(row):
-                cost_columns = ['cost_usd', 'cost', 'total_cost_usd', 'daily_cost_usd', 'monthly_cost_usd', 'hourly_cost_usd']
-                for col in cost_columns:
-                    if col in row:
-                        return float(row.get(col) or 0)
-                return 0.0
-            
-            total_cost = sum(_get_cost(row) for row in results)
+            # Sum the first cost column each row has (NULL as 0), column-wise
+            total_cost = table.first_present_sum(
+                ['cost_usd', 'cost', 'total_cost_usd', 'daily_cost_usd', 'monthly_cost_usd', 'hourly_cost_usd'],
+                skip_null=False,
+            )
 
             # Replace standardized ${Variable} placeholders with actual values from results
             try:
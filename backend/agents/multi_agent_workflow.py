@@ -4,17 +4,32 @@ Simplified architecture where LLM generates SQL directly, no parameter extractio
 Includes OptimizationAgent integration for optimization-related queries.
 """
 
+import asyncio
 import structlog
 from typing import Dict, Any, List, Optional
 from uuid import UUID
 
+from prometheus_client import Counter
+
 from backend.config.settings import get_settings
 from backend.aasmaa.time_range import merge_time_range, TimeRangeResult
 from backend.agents.optimization_agent import get_optimization_agent
+from backend.services.chat_stream_events import emit_event
 
 logger = structlog.get_logger(__name__)
 settings = get_settings()
 
+speculative_routing_total = Counter(
+    "speculative_routing_total",
+    "Optimization/text-to-SQL routing outcomes in speculative mode",
+    labelnames=["outcome"],
+)
+
+# Embedding-router intents that settle the route without LLM classification
+_OPTIMIZATION_INTENTS = ("OPTIMIZATION", "UTILIZATION")
+_COST_ANALYSIS_INTENTS = ("COST_BREAKDOWN", "TOP_N_RANKING", "COST_TREND", "COMPARATIVE", "ANOMALY_ANALYSIS")
+_EMBEDDING_ROUTE_MARGIN = 0.10
+
 
 def _is_explicit_comparison_cost_query(query: str, time_range_result: TimeRangeResult) -> bool:
     """Return True when query is clearly comparative cost analysis (not optimization)."""
@@ -92,6 +107,46 @@ def _is_explicit_cost_analysis_query(
     return False
 
 
+def _discard(task: asyncio.Task) -> None:
+    """Cancel a speculative task and swallow its outcome."""
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+async def _confident_route(
+    query: str,
+    time_range_result: TimeRangeResult,
+    previous_context: Optional[Dict[str, Any]] = None,
+) -> Optional[bool]:
+    """
+    Optimization routing decision that needs no LLM classification.
+
+    Returns False for explicit cost-analysis queries (classification would be
+    overridden anyway), True/False when the embedding router clearly favours
+    one side, and None when unsure.
+    """
+    if _is_explicit_cost_analysis_query(query, time_range_result, previous_context):
+        return False
+
+    try:
+        from backend.services.embedding.embedding_intent_router import route_intent
+        similarities = await asyncio.to_thread(route_intent, query)
+    except Exception as e:
+        logger.debug("Embedding routing unavailable", error=str(e))
+        return None
+    if not similarities:
+        return None
+
+    optimization_score = max(similarities.get(i, 0.0) for i in _OPTIMIZATION_INTENTS)
+    cost_score = max(similarities.get(i, 0.0) for i in _COST_ANALYSIS_INTENTS)
+    threshold = settings.speculative_routing_embedding_threshold
+    if cost_score >= threshold and cost_score - optimization_score >= _EMBEDDING_ROUTE_MARGIN:
+        return False
+    if optimization_score >= threshold and optimization_score - cost_score >= _EMBEDDING_ROUTE_MARGIN:
+        return True
+    return None
+
+
 async def execute_multi_agent_query(
     query: str,
     conversation_id: str,
@@ -106,7 +161,9 @@ async def execute_multi_agent_query(
 
     Flow:
     1. Parse/merge time range from context and query
-    2. Detect if query is optimization-related
+    2. Detect if query is optimization-related (skipped when keyword/embedding
+       routing is confident; otherwise SQL generation starts speculatively
+       alongside the classifier and is cancelled if it picks optimization)
     3. Route to OptimizationAgent or Text-to-SQL as appropriate
     4. Return response with time_range in metadata
 
@@ -124,7 +181,7 @@ async def execute_multi_agent_query(
     """
     logger.info(f"Executing query with text-to-SQL: {query[:100]}")
 
-    from backend.agents.execute_query_v2 import execute_query_simple
+    from backend.agents.execute_query_v2 import execute_query_simple, generate_sql_for_query
 
     # Convert chat_history to conversation_history format
     conversation_history = chat_history if chat_history else []
@@ -143,20 +200,55 @@ async def execute_multi_agent_query(
         is_comparison=time_range_result.is_comparison_request
     )
 
+    # Text-to-SQL context (does not depend on the routing decision)
+    enhanced_context = previous_context.copy() if previous_context else {}
+    enhanced_context["time_range"] = time_range_result.primary.to_dict()
+    enhanced_context["account_ids"] = account_ids or []
+
+    if time_range_result.comparison:
+        enhanced_context["comparison_time_range"] = time_range_result.comparison.to_dict()
+
     # Step 2: Check if this is an optimization-related query.
-    # Use async classifier so LLM intent detection is applied (with keyword fallback).
     optimization_agent = get_optimization_agent(organization_id)
-    is_optimization = await optimization_agent.is_optimization_query_async(query)
-
-    # Deterministic override: explicit cost-analysis drill-downs should stay on text-to-sql.
-    if is_optimization and _is_explicit_cost_analysis_query(query, time_range_result, previous_context):
-        logger.info("Routing override applied: cost-analysis query forced to text-to-sql")
-        is_optimization = False
+    speculative = settings.speculative_routing_enabled
+    sql_generation: Optional[asyncio.Task] = None
+
+    decision = await _confident_route(query, time_range_result, previous_context) if speculative else None
+    if decision is not None:
+        # Keyword/embedding routing is confident: no classification round-trip
+        is_optimization = decision
+        speculative_routing_total.labels(outcome="classification_skipped").inc()
+    else:
+        if speculative:
+            # Generate SQL while the classifier runs; dropped if it says optimization
+            sql_generation = asyncio.create_task(generate_sql_for_query(
+                query, conversation_history, enhanced_context
+            ))
+        try:
+            # Use async classifier so LLM intent detection is applied (with keyword fallback).
+            is_optimization = await optimization_agent.is_optimization_query_async(query)
+        except BaseException:
+            if sql_generation is not None:
+                _discard(sql_generation)
+            raise
+
+        # Deterministic override: explicit cost-analysis drill-downs should stay on text-to-sql.
+        if is_optimization and _is_explicit_cost_analysis_query(query, time_range_result, previous_context):
+            logger.info("Routing override applied: cost-analysis query forced to text-to-sql")
+            is_optimization = False
+
+    if sql_generation is not None:
+        if is_optimization:
+            _discard(sql_generation)
+            speculative_routing_total.labels(outcome="sql_cancelled").inc()
+        else:
+            speculative_routing_total.labels(outcome="sql_used").inc()
 
     try:
         if is_optimization:
             # Step 3a: Route to OptimizationAgent
             logger.info("Routing to OptimizationAgent")
+            emit_event("status", stage="optimization", message="Reviewing optimization opportunities...")
 
             response = await optimization_agent.process_query(
                 query=query,
@@ -199,18 +291,11 @@ async def execute_multi_agent_query(
             }
 
         # Step 3b: Route to Text-to-SQL for cost queries
-        # Enhance context with time range
-        enhanced_context = previous_context.copy() if previous_context else {}
-        enhanced_context["time_range"] = time_range_result.primary.to_dict()
-        enhanced_context["account_ids"] = account_ids or []
-
-        if time_range_result.comparison:
-            enhanced_context["comparison_time_range"] = time_range_result.comparison.to_dict()
-
         response = await execute_query_simple(
             query=query,
             conversation_history=conversation_history,
-            previous_context=enhanced_context
+            previous_context=enhanced_context,
+            sql_generation=sql_generation
         )
 
         # Add time range to response metadata
@@ -27,7 +27,7 @@ from backend.models.opportunities import (
 )
 from backend.services.llm_service import BedrockLLMService
 from backend.utils.pii_masking import mask_query_for_logging, sanitize_exception
-from backend.utils.aws_session import create_aws_session
+from backend.utils.aws_session import get_aws_client
 from backend.utils.aws_constants import AwsService
 
 logger = structlog.get_logger(__name__)
@@ -848,7 +848,7 @@ class OptimizationAgent:
     ) -> Optional[Dict[str, Any]]:
         """Fetch top services and EC2 instances from CUR for tailored fallback responses."""
         try:
-            athena = create_aws_session().client(AwsService.ATHENA)
+            athena = get_aws_client(AwsService.ATHENA)
             end_date = datetime.utcnow().date()
             one_month_ago = (end_date - timedelta(days=30)).isoformat()
             account_filter = ""
@@ -1014,7 +1014,7 @@ class OptimizationAgent:
     def _fetch_cost_explorer_context(self, start_date, end_date) -> list:
         """Fallback billing lookup from AWS Cost Explorer when Athena rows are unavailable."""
         try:
-            ce = create_aws_session().client(AwsService.COST_EXPLORER, region_name="us-east-1")
+            ce = get_aws_client(AwsService.COST_EXPLORER, region_name="us-east-1")
             response = ce.get_cost_and_usage(
                 TimePeriod={
                     "Start": start_date.isoformat(),
@@ -1445,7 +1445,7 @@ class OptimizationAgent:
         )
         try:
             messages = [{"role": "user", "content": prompt}]
-            response = await self.llm_service._invoke_bedrock(messages, {"max_tokens": 500})
+            response = await self.llm_service._invoke_bedrock(messages, {"max_tokens": 500}, stream_tokens=True)
             explanation = (response or "").strip() or None
         except Exception:
             explanation = None
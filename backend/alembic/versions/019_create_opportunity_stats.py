@@ -0,0 +1,40 @@
+"""Create per-organization opportunity statistics summary
+
+Holds the precomputed OpportunitiesStats payload for each organization so
+the dashboard reads one row instead of aggregating the opportunities table
+on every request. OpportunitiesService refreshes an organization's row in
+the same transaction as its writes (ingest, create, update, status change,
+delete); rows older than OPPORTUNITIES_STATS_MAX_AGE_SECONDS are recomputed
+on read.
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+
+# revision identifiers, used by Alembic.
+revision = '019'
+down_revision = '018'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'opportunity_stats',
+        sa.Column(
+            'organization_id',
+            UUID(as_uuid=True),
+            sa.ForeignKey('organizations.id', ondelete='CASCADE'),
+            primary_key=True,
+        ),
+        sa.Column('stats', JSONB, nullable=False, comment='Serialized OpportunitiesStats'),
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('opportunity_stats')
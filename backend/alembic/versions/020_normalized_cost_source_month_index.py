@@ -0,0 +1,29 @@
+"""Index normalized_cost_partitions by data source and month
+
+Re-ingesting a data source replaces its rows month by month (delete the
+source's partitions for the uploaded months, then bulk COPY the new rows),
+so that delete needs an index on (data_source_id, partition_month).
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-16 00:00:00.000000
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '020'
+down_revision = '019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_normalized_cost_source_month',
+        'normalized_cost_partitions',
+        ['data_source_id', 'partition_month'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_normalized_cost_source_month', table_name='normalized_cost_partitions')
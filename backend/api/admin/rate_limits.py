@@ -12,6 +12,7 @@ from pydantic import BaseModel, Field
 import structlog
 
 from backend.middleware.authentication import AuthenticatedUser, require_auth
+from backend.middleware.rate_limiting import invalidate_rate_limit_overrides
 from backend.services.database import DatabaseService
 from backend.services.request_context import RequestContext
 
@@ -271,12 +272,13 @@ async def set_organization_role_limits(
             admin_user_id=admin.user_id
         )
 
-        return {
-            "success": True,
-            "message": f"Updated rate limits for {len(request.role_limits)} roles",
-            "organization_id": org_id,
-            "endpoint": request.endpoint
-        }
+    invalidate_rate_limit_overrides(org_id)
+    return {
+        "success": True,
+        "message": f"Updated rate limits for {len(request.role_limits)} roles",
+        "organization_id": org_id,
+        "endpoint": request.endpoint
+    }
 
 
 @admin_router.delete("/organizations/{org_id}/roles/{role}")
@@ -320,12 +322,13 @@ async def delete_organization_role_limit(
             admin_user_id=admin.user_id
         )
 
-        return {
-            "success": True,
-            "message": f"Reset rate limit for role '{role}' to system default",
-            "organization_id": org_id,
-            "role": role
-        }
+    invalidate_rate_limit_overrides(org_id)
+    return {
+        "success": True,
+        "message": f"Reset rate limit for role '{role}' to system default",
+        "organization_id": org_id,
+        "role": role
+    }
 
 
 @admin_router.put("/organizations/{org_id}/users/{user_id}")
@@ -399,13 +402,14 @@ async def set_user_rate_limit(
             admin_user_id=admin.user_id
         )
 
-        return {
-            "success": True,
-            "message": f"Set custom rate limit for user {user['email']}",
-            "user_id": user_id,
-            "user_email": user['email'],
-            "requests_per_hour": request.requests_per_hour
-        }
+    invalidate_rate_limit_overrides(org_id)
+    return {
+        "success": True,
+        "message": f"Set custom rate limit for user {user['email']}",
+        "user_id": user_id,
+        "user_email": user['email'],
+        "requests_per_hour": request.requests_per_hour
+    }
 
 
 @admin_router.delete("/organizations/{org_id}/users/{user_id}")
@@ -449,11 +453,12 @@ async def delete_user_rate_limit(
             admin_user_id=admin.user_id
         )
 
-        return {
-            "success": True,
-            "message": "Reset user rate limit to role-based default",
-            "user_id": user_id
-        }
+    invalidate_rate_limit_overrides(org_id)
+    return {
+        "success": True,
+        "message": "Reset user rate limit to role-based default",
+        "user_id": user_id
+    }
 
 
 # Organization Admin Endpoints
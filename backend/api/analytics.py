@@ -9,7 +9,7 @@ import hashlib
 import structlog
 
 from backend.config.settings import get_settings
-from backend.utils.aws_session import create_aws_session, create_aws_client
+from backend.utils.aws_session import create_aws_session, get_aws_client
 from backend.utils.aws_constants import AwsService, COST_EXPLORER_REGION
 from backend.services.request_context import require_context, RequestContext
 
@@ -120,7 +120,7 @@ async def check_historical_data_availability(
         )
         # Initialize Cost Explorer client using IAM role credentials
         # Cost Explorer API is only available in us-east-1
-        ce_client = create_aws_client(AwsService.COST_EXPLORER, region_name=COST_EXPLORER_REGION)
+        ce_client = get_aws_client(AwsService.COST_EXPLORER, region_name=COST_EXPLORER_REGION)
 
         # Query for maximum available historical data (13 months)
         end_date = date.today()
@@ -189,7 +189,7 @@ async def _load_historical_data_to_cache(
         logger.info(f"Starting historical data cache initialization for {months} months")
 
         # Use IAM role credentials via default credential chain
-        ce_client = create_aws_client(AwsService.COST_EXPLORER, region_name=COST_EXPLORER_REGION)
+        ce_client = get_aws_client(AwsService.COST_EXPLORER, region_name=COST_EXPLORER_REGION)
 
         end_date = date.today()
         start_date = end_date - timedelta(days=months * 30)
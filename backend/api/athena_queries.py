@@ -5,13 +5,14 @@ Handles Athena SQL query generation, execution, and result export
 
 import re
 from typing import Optional
-from datetime import timedelta, date
+from datetime import datetime, timedelta, date
 
 from fastapi import APIRouter, HTTPException, Request, Depends
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 import structlog
 
+from backend.services.athena_polling import QueryClass
 from backend.services.athena_query_service import athena_service
 from backend.services.chart_recommendation import chart_engine
 from backend.services.chart_data_builder import chart_data_builder
@@ -30,6 +31,11 @@ async def get_request_context(request: Request) -> RequestContext:
     return require_context(request)
 
 
+def _export_filename(extension: str) -> str:
+    """Timestamped export filename, matching AthenaQueryService's naming."""
+    return f"athena_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{extension}"
+
+
 class AthenaQueryRequest(BaseModel):
     """Request model for Athena query generation"""
     user_query: str = Field(..., description="Natural language query from user")
@@ -338,7 +344,9 @@ async def export_results_csv(
             services=request.services
         )
         
-        execution_result = await athena_service.execute_query(sql_query)
+        execution_result = await athena_service.execute_query(
+            sql_query, fetch_results=False, query_class=QueryClass.BATCH
+        )
         
         if execution_result.get("status") != "success":
             logger.error("athena_query_execution_failed", error=execution_result.get('error', 'Unknown error'))
@@ -347,9 +355,18 @@ async def export_results_csv(
                 detail="An internal error occurred. Please try again later."
             )
 
-        results = execution_result.get("results", [])
+        results = execution_result.get("results")
+        if results is None:
+            # Stream straight from the query's S3 output
+            return StreamingResponse(
+                athena_service.stream_results_csv(execution_result["query_execution_id"]),
+                media_type="text/csv",
+                headers={
+                    "Content-Disposition": f"attachment; filename={_export_filename('csv')}"
+                }
+            )
 
-        # Export to CSV
+        # Already materialized (result cache hit): export in one piece
         csv_content, filename = await athena_service.export_results_to_csv(results)
         
         # Return as downloadable file
@@ -415,7 +432,9 @@ async def export_results_json(
             services=request.services
         )
         
-        execution_result = await athena_service.execute_query(sql_query)
+        execution_result = await athena_service.execute_query(
+            sql_query, fetch_results=False, query_class=QueryClass.BATCH
+        )
         
         if execution_result.get("status") != "success":
             logger.error("athena_query_execution_failed", error=execution_result.get('error', 'Unknown error'))
@@ -424,9 +443,18 @@ async def export_results_json(
                 detail="An internal error occurred. Please try again later."
             )
 
-        results = execution_result.get("results", [])
+        results = execution_result.get("results")
+        if results is None:
+            # Stream straight from the query's S3 output
+            return StreamingResponse(
+                athena_service.stream_results_json(execution_result["query_execution_id"]),
+                media_type="application/json",
+                headers={
+                    "Content-Disposition": f"attachment; filename={_export_filename('json')}"
+                }
+            )
 
-        # Export to JSON
+        # Already materialized (result cache hit): export in one piece
         json_content, filename = await athena_service.export_results_to_json(results)
         
         # Return as downloadable file
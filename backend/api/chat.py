@@ -3,7 +3,9 @@ Chat API endpoints for natural language cost analysis
 Handles conversation management and agent orchestration with conversation history tracking
 """
 
-from typing import Optional
+import asyncio
+import time
+from typing import Any, Optional
 from datetime import datetime, timezone
 from uuid import uuid4
 
@@ -14,10 +16,12 @@ import structlog
 
 from backend.models.schemas import ChatRequest, ChatResponse
 from backend.services.conversation_manager import conversation_manager
+from backend.services.conversation_store import ExecutionRecord, MessageRecord, conversation_store
 from backend.agents.multi_agent_workflow import execute_multi_agent_query
 from backend.config.settings import get_settings
 from backend.services.request_context import require_context, RequestContext
 from backend.services.demo_identity_store import get_demo_identity_store, estimate_text_tokens
+from backend.services.chat_stream_events import ChatStreamEmitter, bind_emitter, chat_stream_ttfb
 
 router = APIRouter()
 logger = structlog.get_logger(__name__)
@@ -142,8 +146,9 @@ async def chat(
     allowed AWS accounts.
     """
     scope_info = context.to_scope_dict()
-    conversation_id = resolve_owned_conversation(
-        request.conversation_id, context, action="chat"
+    # Ownership lookup is a psycopg2 round trip; keep it off the event loop
+    conversation_id = await asyncio.to_thread(
+        resolve_owned_conversation, request.conversation_id, context, action="chat"
     )
     start_time = datetime.utcnow()
 
@@ -164,7 +169,7 @@ async def chat(
             # HIGH-14: user_id passed to the service layer — defense-in-depth beneath
             # require_conversation_owner(). If F-33's API check is ever bypassed
             # (new endpoint, scheduled job), the service layer now enforces ownership.
-            conversation_manager.add_message(
+            await conversation_store.add_message(
                 thread_id=conversation_id,
                 user_id=caller_user_id,
                 role="user",
@@ -172,7 +177,7 @@ async def chat(
                 message_type="query",
                 metadata={"include_reasoning": request.include_reasoning},
             )
-            derived_context = conversation_manager.get_context_for_query(
+            derived_context = await conversation_store.get_context_for_query(
                 conversation_id,
                 user_id=caller_user_id,
             )
@@ -263,10 +268,10 @@ async def chat(
                 },
             )
 
-        # Persist assistant message and execution logs in background
-        def _persist_multi_agent_default():
+        # Persist assistant message and execution log in background (write-behind batch)
+        async def _persist_multi_agent_default():
             try:
-                assistant_message_id = conversation_manager.add_message(
+                assistant_message = MessageRecord(
                     thread_id=conversation_id,
                     user_id=caller_user_id,
                     role="assistant",
@@ -274,18 +279,21 @@ async def chat(
                     message_type="response",
                     metadata={"charts_count": len(charts), "metadata": metadata},
                 )
-                conversation_manager.save_agent_execution(
-                    thread_id=conversation_id,
-                    user_id=caller_user_id,
-                    agent_name="MultiAgentSupervisor",
-                    agent_type="supervisor",
-                    input_query=request.message,
-                    output_response={"message": message_text, "charts_count": len(charts)},
-                    tools_used=metadata.get("agent_routing", []),
-                    execution_time_ms=int(execution_time * 1000),
-                    status="success",
-                    message_id=assistant_message_id,
-                )
+                await conversation_store.enqueue([
+                    assistant_message,
+                    ExecutionRecord(
+                        thread_id=conversation_id,
+                        user_id=caller_user_id,
+                        agent_name="MultiAgentSupervisor",
+                        agent_type="supervisor",
+                        input_query=request.message,
+                        output_response={"message": message_text, "charts_count": len(charts)},
+                        tools_used=metadata.get("agent_routing", []),
+                        execution_time_ms=int(execution_time * 1000),
+                        status="success",
+                        message_id=assistant_message.id,
+                    ),
+                ])
             except Exception as e:
                 logger.error("Failed to persist multi-agent conversation", error=str(e))
 
@@ -352,7 +360,9 @@ async def get_conversation(
         # HIGH-14 — service layer filters by user_id too. Belt-and-braces with
         # the require_conversation_owner() check directly above: that one gives
         # 403 + audit log, this one gives empty-result. Both must match.
-        messages = conversation_manager.get_conversation_history(
+        # The async store also returns messages still in the write-behind
+        # buffer, so a client sees its own /chat turn immediately.
+        messages = await conversation_store.get_conversation_history(
             conversation_id, user_id=str(context.user_id), limit=limit
         )
 
@@ -450,6 +460,11 @@ async def get_query_suggestions():
     return {"suggestions": suggestions}
 
 
+def _sse_frame(event_type: str, **fields: Any) -> str:
+    """One SSE frame whose data is a JSON object ``{"type": ..., **fields}``."""
+    return "data: " + json.dumps({"type": event_type, **fields}, default=str) + "\n\n"
+
+
 @router.post("/stream")
 async def chat_stream(
     request: ChatRequest,
@@ -460,7 +475,10 @@ async def chat_stream(
 
     Requires authentication. All responses are scoped to the caller's
     organization and allowed AWS accounts (multi-tenant isolation).
-    Returns server-sent events with incremental updates.
+    Returns server-sent events as the pipeline progresses: ``status``
+    (SQL generation / Athena state), ``token`` (LLM text deltas),
+    ``results`` and ``charts`` as soon as they exist, then ``message``,
+    ``suggestions`` and ``complete``.
     """
     conversation_id = resolve_owned_conversation(
         request.conversation_id, context, action="stream"
@@ -478,29 +496,46 @@ async def chat_stream(
         account_count=len(account_ids),
     )
 
+    started = time.perf_counter()
+
     async def generate_stream():
         """Generate streaming response events scoped to the caller's tenant."""
-        yield f"data: {{'type': 'start', 'conversation_id': '{conversation_id}'}}\n\n"
+        sent = set()
 
-        try:
-            yield "data: {{'type': 'status', 'message': 'Analyzing your query (multi-agent)...'}}\n\n"
-            # Non-incremental streaming: emit final results as a set of events
-            response = await execute_multi_agent_query(
-                query=request.message,
-                conversation_id=conversation_id,
-                chat_history=request.chat_history or [],
-                previous_context=request.context or {},
-                organization_id=organization_id,
-                account_ids=account_ids,
-                timezone=(request.context or {}).get("timezone", "UTC"),
-            )
+        def frame(event_type: str, **fields) -> str:
+            if event_type not in sent:
+                sent.add(event_type)
+                chat_stream_ttfb.labels(event=event_type).observe(time.perf_counter() - started)
+            return _sse_frame(event_type, **fields)
+
+        yield frame("start", conversation_id=conversation_id)
 
-            yield f"data: {{'type': 'message', 'content': {json.dumps(response.get('message', ''))}}}\n\n"
-            if response.get("charts"):
-                yield f"data: {{'type': 'charts', 'data': {json.dumps(response['charts'])}}}\n\n"
+        emitter = ChatStreamEmitter()
+        task = None
+        try:
+            yield frame("status", stage="analyzing", message="Analyzing your query (multi-agent)...")
+            # The workflow pushes status/token/results/charts events while it runs
+            with bind_emitter(emitter):
+                task = asyncio.create_task(execute_multi_agent_query(
+                    query=request.message,
+                    conversation_id=conversation_id,
+                    chat_history=request.chat_history or [],
+                    previous_context=request.context or {},
+                    organization_id=organization_id,
+                    account_ids=account_ids,
+                    timezone=(request.context or {}).get("timezone", "UTC"),
+                ))
+            async for event_type, payload in emitter.events_until(task):
+                yield frame(event_type, **payload)
+            response = task.result()
+
+            # Full message always follows any token deltas (replaces the draft)
+            yield frame("message", content=response.get("message", ""))
+            if response.get("charts") and "charts" not in sent:
+                yield frame("charts", data=response["charts"])
             if response.get("suggestions"):
-                yield f"data: {{'type': 'suggestions', 'data': {json.dumps(response['suggestions'])}}}\n\n"
-            yield "data: {{'type': 'complete'}}\n\n"
+                yield frame("suggestions", data=response["suggestions"])
+            yield frame("complete")
 
         except Exception as e:
             logger.error(
@@ -510,7 +545,11 @@ async def chat_stream(
                 error=str(e),
                 exc_info=True,
             )
-            yield "data: {'type': 'error', 'message': 'An error occurred processing your request.'}\n\n"
+            yield frame("error", message="An error occurred processing your request.")
+        finally:
+            if task is not None and not task.done():
+                # Client disconnected mid-stream
+                task.cancel()
 
     return StreamingResponse(
         generate_stream(),
@@ -26,6 +26,8 @@ isolation) and respect ``settings.cur_pattern_mining_enabled``.
 
 from __future__ import annotations
 
+import asyncio
+import os
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -35,6 +37,7 @@ from pydantic import BaseModel, Field
 
 from backend.config.settings import get_settings
 from backend.models.opportunities import OpportunityIngestResult
+from backend.services.analysis_pool import get_analysis_pool
 from backend.services.cur_csv_analyzer import CURCSVAnalyzer
 from backend.services.cur_pattern_mining_signals import CURPatternMiningSignalsService
 from backend.services.opportunities_service import get_opportunities_service
@@ -145,9 +148,12 @@ async def upload_cur_csv(
     """
     Advisory Mode: analyse an uploaded CUR CSV and persist findings.
 
-    The file is parsed in memory (no disk write), columns are normalised to
-    the canonical CUR schema, the seven detectors run, and resulting
-    opportunities are ingested into the caller's organisation.
+    The upload is streamed through the analyzer in fixed-size row chunks
+    (no disk write, bounded memory), columns are normalised to the
+    canonical CUR schema, the seven detectors aggregate each chunk, and
+    resulting opportunities are ingested into the caller's organisation.
+    Large files are aggregated in the analysis process pool so the event
+    loop stays responsive.
     """
     _ensure_enabled()
 
@@ -161,23 +167,32 @@ async def upload_cur_csv(
             detail="Only AWS CUR CSV exports (.csv or .csv.gz) are accepted.",
         )
 
-    try:
-        content = await file.read()
-    except Exception as exc:  # pragma: no cover - FastAPI already guards most cases
-        raise HTTPException(status_code=400, detail=f"Failed to read upload: {exc}") from exc
-
+    size = file.size
+    if size is None:
+        size = file.file.seek(0, os.SEEK_END)
     max_bytes = settings.cur_upload_max_size_mb * 1024 * 1024
-    if len(content) > max_bytes:
+    if size > max_bytes:
         raise HTTPException(
             status_code=413,
             detail=f"File exceeds {settings.cur_upload_max_size_mb} MB limit.",
         )
+    file.file.seek(0)
 
+    analyzer = CURCSVAnalyzer(
+        account_id=account_id,
+        organization_id=context.organization_id,
+    )
+    executor = get_analysis_pool() if size >= settings.cur_analysis_parallel_min_mb * 1024 * 1024 else None
     try:
-        df = CURCSVAnalyzer.load_dataframe(
-            content,
-            filename=file.filename,
-            max_rows=settings.cur_upload_max_rows,
+        result = await asyncio.to_thread(
+            analyzer.analyze_chunks,
+            CURCSVAnalyzer.iter_dataframes(
+                file.file,
+                filename=file.filename,
+                max_rows=settings.cur_upload_max_rows,
+                chunksize=settings.cur_upload_chunk_rows,
+            ),
+            executor,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -189,12 +204,6 @@ async def upload_cur_csv(
             "Ensure it was downloaded from the AWS Billing console or S3 CUR bucket.",
         ) from exc
 
-    analyzer = CURCSVAnalyzer(
-        account_id=account_id,
-        organization_id=context.organization_id,
-    )
-    result = analyzer.analyze(df)
-
     ingest_result: Optional[OpportunityIngestResult] = None
     if result["opportunities"]:
         try:
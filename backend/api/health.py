@@ -242,11 +242,11 @@ async def _check_llm_services() -> Dict[str, Any]:
     try:
         import time
         from config.settings import get_settings
-        from backend.utils.aws_session import create_aws_client
+        from backend.utils.aws_session import get_aws_client
         from backend.utils.aws_constants import AwsService, DEFAULT_AWS_REGION
         settings = get_settings()
         start = time.time()
-        bedrock = create_aws_client(
+        bedrock = get_aws_client(
             AwsService.BEDROCK_RUNTIME,
             region_name=getattr(settings, "aws_region", DEFAULT_AWS_REGION),
         )
@@ -279,7 +279,7 @@ async def _check_aws_services() -> Dict[str, Any]:
     try:
         from botocore.exceptions import ClientError
         from config.settings import get_settings
-        from backend.utils.aws_session import create_aws_session
+        from backend.utils.aws_session import get_aws_client
         from backend.utils.aws_constants import AwsService
 
         settings = get_settings()
@@ -287,9 +287,8 @@ async def _check_aws_services() -> Dict[str, Any]:
         details = {}
         all_healthy = True
 
-        session = create_aws_session()
-        athena_client = session.client(AwsService.ATHENA)
-        s3_client = session.client(AwsService.S3)
+        athena_client = get_aws_client(AwsService.ATHENA)
+        s3_client = get_aws_client(AwsService.S3)
 
         # Check Athena connectivity
         try:
@@ -395,7 +394,7 @@ async def _check_aws_services() -> Dict[str, Any]:
 
         # Check Cost Explorer (optional — does not affect overall status)
         try:
-            ce_client = session.client('ce')
+            ce_client = get_aws_client(AwsService.COST_EXPLORER)
             ce_client.get_cost_and_usage(
                 TimePeriod={
                     'Start': '2024-11-01',
@@ -12,8 +12,6 @@ Provides REST API for managing optimization opportunities:
 from typing import Optional, List
 from uuid import UUID
 from datetime import datetime
-import csv
-import io
 
 from fastapi import APIRouter, HTTPException, Depends, Query, BackgroundTasks, Response, Request, status
 from fastapi.responses import StreamingResponse
@@ -42,6 +40,7 @@ from backend.models.opportunities import (
 from backend.services.opportunities_service import (
     OpportunitiesService,
     get_opportunities_service,
+    gzip_chunks,
 )
 from backend.services.aws_optimization_signals import get_optimization_signals_service
 from backend.services.cloudwatch_optimization_signals import CloudWatchOptimizationSignalsService
@@ -140,7 +139,7 @@ async def list_opportunities(
             first_detected_before=first_detected_before,
         )
 
-        result = svc.list_opportunities(
+        result = await svc.list_opportunities_async(
             filter=filter_obj,
             sort=sort,
             page=page,
@@ -182,7 +181,7 @@ async def search_opportunities(
     try:
         svc = get_service(context)
 
-        result = svc.list_opportunities(
+        result = await svc.list_opportunities_async(
             filter=body.filter,
             sort=body.sort,
             page=body.page,
@@ -212,7 +211,7 @@ async def get_stats(
     """
     try:
         svc = get_service(context)
-        stats = svc.get_stats()
+        stats = await svc.get_stats_async()
 
         logger.info(
             "Retrieved opportunity stats",
@@ -244,7 +243,7 @@ async def get_opportunity(
     try:
         svc = get_service(context)
 
-        opportunity = svc.get_opportunity(opportunity_id, user_id=context.user_id)
+        opportunity = await svc.get_opportunity_async(opportunity_id, user_id=context.user_id)
 
         if not opportunity:
             raise_not_found("optimization opportunity", str(opportunity_id))
@@ -292,7 +291,7 @@ async def create_opportunity(
         if body.estimated_monthly_savings:
             data['estimated_annual_savings'] = body.estimated_monthly_savings * 12
 
-        opportunity = svc.create_opportunity(data)
+        opportunity = await svc.create_opportunity_async(data)
 
         logger.info(
             "Created manual opportunity",
@@ -327,7 +326,7 @@ async def update_opportunity(
         if body.implementation_steps:
             data['implementation_steps'] = [s.model_dump() for s in body.implementation_steps]
 
-        opportunity = svc.update_opportunity(opportunity_id, data, user_id=context.user_id)
+        opportunity = await svc.update_opportunity_async(opportunity_id, data, user_id=context.user_id)
 
         if not opportunity:
             raise_not_found("optimization opportunity", str(opportunity_id))
@@ -366,7 +365,7 @@ async def update_opportunity_status(
     try:
         svc = get_service(context)
 
-        opportunity = svc.update_status(
+        opportunity = await svc.update_status_async(
             opportunity_id,
             body.status,
             body.reason,
@@ -406,7 +405,7 @@ async def bulk_update_status(
     try:
         svc = get_service(context)
 
-        updated, failed, errors = svc.bulk_update_status(
+        updated, failed, errors = await svc.bulk_update_status_async(
             body.opportunity_ids,
             body.status,
             body.reason,
@@ -459,7 +458,7 @@ async def delete_opportunity(
     try:
         svc = get_service(context)
 
-        deleted = svc.delete_opportunity(opportunity_id, user_id=context.user_id)
+        deleted = await svc.delete_opportunity_async(opportunity_id, user_id=context.user_id)
 
         if not deleted:
             raise_not_found("optimization opportunity", str(opportunity_id))
@@ -596,7 +595,7 @@ async def ingest_signals(
 
         # Ingest into database
         opp_svc = get_service(context)
-        result = opp_svc.ingest_signals(signals)
+        result = await opp_svc.ingest_signals_async(signals)
 
         # Add any errors to result message
         if ingestion_errors:
@@ -620,6 +619,13 @@ async def ingest_signals(
         )
 
 
+_EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "json": "application/json",
+    "ndjson": "application/x-ndjson",
+}
+
+
 @router.post("/export")
 async def export_opportunities(
     request: Request,
@@ -627,53 +633,13 @@ async def export_opportunities(
     context: RequestContext = Depends(get_request_context),
 ):
     """
-    Export opportunities to CSV, JSON, or Excel format.
+    Export opportunities to CSV, JSON, NDJSON, or Excel format.
+
+    The file is streamed from a server-side cursor batch by batch, and
+    gzipped on the fly when ``compress`` is set.
     """
     try:
-        svc = get_service(context)
-
-        data = svc.export_opportunities(
-            filter=body.filter,
-            include_evidence=body.include_evidence,
-            include_steps=body.include_steps
-        )
-
-        if body.format == "json":
-            return data
-
-        elif body.format == "csv":
-            if not data:
-                return Response(
-                    content="No data",
-                    media_type="text/csv",
-                    headers={"Content-Disposition": "attachment; filename=opportunities.csv"}
-                )
-
-            output = io.StringIO()
-            writer = csv.DictWriter(output, fieldnames=data[0].keys())
-            writer.writeheader()
-
-            for row in data:
-                # Flatten complex fields
-                flat_row = {}
-                for k, v in row.items():
-                    if isinstance(v, (dict, list)):
-                        flat_row[k] = str(v)
-                    elif isinstance(v, datetime):
-                        flat_row[k] = v.isoformat()
-                    else:
-                        flat_row[k] = v
-                writer.writerow(flat_row)
-
-            output.seek(0)
-
-            return StreamingResponse(
-                iter([output.getvalue()]),
-                media_type="text/csv",
-                headers={"Content-Disposition": "attachment; filename=opportunities.csv"}
-            )
-
-        elif body.format == "excel":
+        if body.format == "excel":
             raise HTTPException(
                 status_code=status.HTTP_501_NOT_IMPLEMENTED,
                 detail=create_error_response(
@@ -682,12 +648,34 @@ async def export_opportunities(
                 ),
             )
 
-        else:
+        if body.format not in _EXPORT_MEDIA_TYPES:
             raise_validation_error(
-                f"Export format '{body.format}' is not supported. Use 'csv' or 'json'.",
+                f"Export format '{body.format}' is not supported. Use 'csv', 'json' or 'ndjson'.",
                 field="format",
             )
 
+        svc = get_service(context)
+
+        chunks = await svc.stream_export(
+            body.format,
+            filter=body.filter,
+            include_evidence=body.include_evidence,
+            include_steps=body.include_steps
+        )
+
+        media_type = _EXPORT_MEDIA_TYPES[body.format]
+        filename = f"opportunities.{body.format}"
+        if body.compress:
+            chunks = gzip_chunks(chunks)
+            media_type = "application/gzip"
+            filename += ".gz"
+
+        return StreamingResponse(
+            chunks,
+            media_type=media_type,
+            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        )
+
     except HTTPException:
         raise
     except Exception as e:
@@ -716,7 +704,7 @@ async def get_top_opportunities(
             statuses=[OpportunityStatus.OPEN]
         )
 
-        result = svc.list_opportunities(
+        result = await svc.list_opportunities_async(
             filter=filter_obj,
             sort=OpportunitySort.SAVINGS_DESC,
             page=1,
@@ -727,7 +715,7 @@ async def get_top_opportunities(
         # Fetch full details for each
         opportunities = []
         for summary in result.items:
-            detail = svc.get_opportunity(summary.id)
+            detail = await svc.get_opportunity_async(summary.id)
             if detail:
                 opportunities.append(detail)
 
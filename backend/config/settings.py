@@ -186,11 +186,127 @@ class Settings(BaseSettings):
         env="CHAT_HISTORY_ENABLED",
         description="Enable persistent conversation history and threaded chat storage"
     )
+    chat_stream_preview_rows: int = Field(
+        default=50,
+        env="CHAT_STREAM_PREVIEW_ROWS",
+        description="Rows pushed in the early table-preview event of /chat/stream.",
+    )
+    speculative_routing_enabled: bool = Field(
+        default=True,
+        env="SPECULATIVE_ROUTING_ENABLED",
+        description=(
+            "Start text-to-SQL generation concurrently with optimization classification "
+            "and skip classification when keyword/embedding routing is confident."
+        ),
+    )
+    speculative_routing_embedding_threshold: float = Field(
+        default=0.75,
+        env="SPECULATIVE_ROUTING_EMBEDDING_THRESHOLD",
+        description="Minimum embedding-router similarity to route without LLM classification.",
+    )
+    embedding_router_index_dir: Optional[str] = Field(
+        default=None,
+        env="EMBEDDING_ROUTER_INDEX_DIR",
+        description=(
+            "Directory for the memory-mapped intent exemplar matrix "
+            "(unset: encode exemplars at startup without persisting)."
+        ),
+    )
+    text_to_sql_cache_enabled: bool = Field(
+        default=True,
+        env="TEXT_TO_SQL_CACHE_ENABLED",
+        description="Reuse generated SQL for repeated questions instead of calling Bedrock again.",
+    )
+    text_to_sql_cache_similarity_threshold: float = Field(
+        default=0.93,
+        env="TEXT_TO_SQL_CACHE_SIMILARITY_THRESHOLD",
+        description="Minimum embedding similarity for a near-duplicate question to reuse cached SQL.",
+    )
+    text_to_sql_cache_local_max_entries: int = Field(
+        default=512,
+        env="TEXT_TO_SQL_CACHE_LOCAL_MAX_ENTRIES",
+        description="Generations kept in the in-process tier (and its embedding index).",
+    )
+    text_to_sql_cache_ttl_seconds: int = Field(
+        default=7 * 86400,
+        env="TEXT_TO_SQL_CACHE_TTL_SECONDS",
+        description="Lifetime of cached generations in Valkey.",
+    )
+    request_context_cache_enabled: bool = Field(
+        default=True,
+        env="REQUEST_CONTEXT_CACHE_ENABLED",
+        description="Cache the account-scoping RequestContext instead of loading it from Postgres per request.",
+    )
+    request_context_cache_local_ttl_seconds: int = Field(
+        default=30,
+        env="REQUEST_CONTEXT_CACHE_LOCAL_TTL_SECONDS",
+        description="Lifetime of request contexts in the in-process tier.",
+    )
+    request_context_cache_local_max_entries: int = Field(
+        default=2048,
+        env="REQUEST_CONTEXT_CACHE_LOCAL_MAX_ENTRIES",
+        description="Users whose request context is kept in the in-process tier.",
+    )
+    request_context_cache_ttl_seconds: int = Field(
+        default=300,
+        env="REQUEST_CONTEXT_CACHE_TTL_SECONDS",
+        description="Lifetime of request contexts in Valkey.",
+    )
+    conversation_write_buffer_enabled: bool = Field(
+        default=True,
+        env="CONVERSATION_WRITE_BUFFER_ENABLED",
+        description="Coalesce chat messages, intents and agent executions into batched INSERTs.",
+    )
+    conversation_write_buffer_max_batch: int = Field(
+        default=200,
+        env="CONVERSATION_WRITE_BUFFER_MAX_BATCH",
+        description="Pending records that trigger an immediate flush (and the per-flush cap).",
+    )
+    conversation_write_buffer_flush_interval_ms: int = Field(
+        default=250,
+        env="CONVERSATION_WRITE_BUFFER_FLUSH_INTERVAL_MS",
+        description="Maximum time a buffered conversation record waits before being written.",
+    )
+    conversation_write_buffer_max_pending: int = Field(
+        default=5000,
+        env="CONVERSATION_WRITE_BUFFER_MAX_PENDING",
+        description="Buffered records at which chat requests wait for the flusher (backpressure).",
+    )
     postgres_host: str = Field(default="localhost", env="POSTGRES_HOST")
     postgres_port: int = Field(default=5432, env="POSTGRES_PORT")
     postgres_db: str = Field(default="aasmaa", env="POSTGRES_DB")
     postgres_user: str = Field(default="aasmaa", env="POSTGRES_USER")
     postgres_password: str = Field(default="aasmaa", env="POSTGRES_PASSWORD")
+    opportunities_db_pool_max_connections: int = Field(
+        default=10,
+        env="OPPORTUNITIES_DB_POOL_MAX_CONNECTIONS",
+        description="Upper bound on pooled Postgres connections used by OpportunitiesService per process.",
+    )
+    opportunities_db_pool_timeout_seconds: float = Field(
+        default=10.0,
+        env="OPPORTUNITIES_DB_POOL_TIMEOUT_SECONDS",
+        description="How long a caller waits for a free opportunities connection before failing.",
+    )
+    opportunities_db_prepared_statements: bool = Field(
+        default=True,
+        env="OPPORTUNITIES_DB_PREPARED_STATEMENTS",
+        description="Run hot opportunities reads as named prepared statements; disable behind transaction-pooling PgBouncer.",
+    )
+    opportunities_stats_max_age_seconds: int = Field(
+        default=900,
+        env="OPPORTUNITIES_STATS_MAX_AGE_SECONDS",
+        description="Age after which a precomputed opportunity_stats row is recomputed on read (covers writes made outside OpportunitiesService).",
+    )
+    opportunities_export_fetch_size: int = Field(
+        default=2000,
+        env="OPPORTUNITIES_EXPORT_FETCH_SIZE",
+        description="Rows fetched per round trip from the server-side cursor while streaming an opportunities export.",
+    )
+    opportunities_export_max_connections: int = Field(
+        default=4,
+        env="OPPORTUNITIES_EXPORT_MAX_CONNECTIONS",
+        description="Concurrent streamed opportunities exports per process; each holds its own unpooled connection.",
+    )
 
     # Database SSL Configuration
     # SECURITY: SSL is required for production/RDS connections
@@ -248,6 +364,106 @@ class Settings(BaseSettings):
         env="ATHENA_OUTPUT_LOCATION"
     )
     athena_workgroup: str = Field(default="aasmaa-workgroup", env="ATHENA_WORKGROUP")
+    cur_partition_pruning_enabled: bool = Field(
+        default=True,
+        env="CUR_PARTITION_PRUNING_ENABLED",
+        description="Discover CUR billing-period partitions at startup and inject partition predicates into CUR queries.",
+    )
+    cur_partition_refresh_seconds: int = Field(
+        default=3600,
+        env="CUR_PARTITION_REFRESH_SECONDS",
+        description="How often CUR partition discovery is re-run to pick up newly delivered months.",
+    )
+    athena_workgroup_enabled: bool = Field(
+        default=False,
+        env="ATHENA_WORKGROUP_ENABLED",
+        description="Submit queries to ATHENA_WORKGROUP. Off by default: restrictive workgroups reject some query types.",
+    )
+    athena_result_reuse_max_age_minutes: int = Field(
+        default=60,
+        env="ATHENA_RESULT_REUSE_MAX_AGE_MINUTES",
+        description="Max age for Athena result reuse and the local SQL -> QueryExecutionId memo (0 disables both).",
+    )
+    athena_execution_memo_max_entries: int = Field(
+        default=1024,
+        env="ATHENA_EXECUTION_MEMO_MAX_ENTRIES",
+        description="Recent QueryExecutionIds remembered per process for repeat SQL.",
+    )
+    athena_result_stream_batch_rows: int = Field(
+        default=5000,
+        env="ATHENA_RESULT_STREAM_BATCH_ROWS",
+        description="Rows per batch when streaming Athena CSV output from S3.",
+    )
+    athena_result_max_rows: int = Field(
+        default=100_000,
+        env="ATHENA_RESULT_MAX_ROWS",
+        description="Cap on rows materialized in memory for chat/API responses (exports stream without a cap).",
+    )
+    athena_result_cache_enabled: bool = Field(
+        default=True,
+        env="ATHENA_RESULT_CACHE_ENABLED",
+        description="Serve repeated CUR queries from the result cache until new CUR data lands.",
+    )
+    athena_result_cache_local_max_entries: int = Field(
+        default=256,
+        env="ATHENA_RESULT_CACHE_LOCAL_MAX_ENTRIES",
+        description="Entries kept in the in-process LRU tier in front of Valkey.",
+    )
+    athena_result_cache_max_entry_bytes: int = Field(
+        default=2_000_000,
+        env="ATHENA_RESULT_CACHE_MAX_ENTRY_BYTES",
+        description="Result sets larger than this (serialized) are not cached.",
+    )
+    athena_result_cache_ttl_seconds: int = Field(
+        default=86400,
+        env="ATHENA_RESULT_CACHE_TTL_SECONDS",
+        description="Upper bound on Valkey entry lifetime; entries are normally superseded when CUR freshness changes.",
+    )
+    athena_client_max_workers: int = Field(
+        default=32,
+        env="ATHENA_CLIENT_MAX_WORKERS",
+        description="Dedicated Athena I/O threads and botocore connection-pool size per worker process.",
+    )
+    athena_client_call_timeout_seconds: float = Field(
+        default=15.0,
+        env="ATHENA_CLIENT_CALL_TIMEOUT_SECONDS",
+        description="Timeout for a single Athena API call (not the whole query).",
+    )
+    athena_client_connect_timeout_seconds: float = Field(
+        default=5.0,
+        env="ATHENA_CLIENT_CONNECT_TIMEOUT_SECONDS",
+        description="TCP/TLS connect timeout for the shared Athena client.",
+    )
+    athena_poll_initial_delay_ms: int = Field(
+        default=50,
+        env="ATHENA_POLL_INITIAL_DELAY_MS",
+        description="First wait before polling an Athena query for completion.",
+    )
+    athena_poll_max_delay_seconds: float = Field(
+        default=2.0,
+        env="ATHENA_POLL_MAX_DELAY_SECONDS",
+        description="Upper bound on the exponential backoff between completion polls.",
+    )
+    athena_poll_backoff_multiplier: float = Field(
+        default=2.0,
+        env="ATHENA_POLL_BACKOFF_MULTIPLIER",
+        description="Growth factor of the completion-poll backoff.",
+    )
+    athena_query_deadline_interactive_seconds: float = Field(
+        default=60.0,
+        env="ATHENA_QUERY_DEADLINE_INTERACTIVE_SECONDS",
+        description="Completion deadline for chat/API Athena queries.",
+    )
+    athena_query_deadline_batch_seconds: float = Field(
+        default=600.0,
+        env="ATHENA_QUERY_DEADLINE_BATCH_SECONDS",
+        description="Completion deadline for report/export/mining Athena queries.",
+    )
+    athena_query_deadline_metadata_seconds: float = Field(
+        default=30.0,
+        env="ATHENA_QUERY_DEADLINE_METADATA_SECONDS",
+        description="Completion deadline for catalog/discovery Athena queries.",
+    )
 
     # ------------------------------------------------------------------
     # CUR Pattern Mining (Feature 2: CUR / Billing Export Deep Analysis)
@@ -270,6 +486,26 @@ class Settings(BaseSettings):
         env="CUR_UPLOAD_MAX_ROWS",
         description="Hard cap on rows parsed from an uploaded CUR file (memory guard).",
     )
+    cur_upload_chunk_rows: int = Field(
+        default=200_000,
+        env="CUR_UPLOAD_CHUNK_ROWS",
+        description="Rows parsed per chunk when streaming an uploaded CUR file; bounds peak memory.",
+    )
+    cur_analysis_shard_rows: int = Field(
+        default=50_000,
+        env="CUR_ANALYSIS_SHARD_ROWS",
+        description="Target rows per account/month shard handed to an analysis worker process.",
+    )
+    cur_analysis_parallel_min_mb: int = Field(
+        default=16,
+        env="CUR_ANALYSIS_PARALLEL_MIN_MB",
+        description="Uploaded CUR files at least this large are analysed in the analysis process pool.",
+    )
+    analysis_pool_workers: int = Field(
+        default=4,
+        env="ANALYSIS_POOL_WORKERS",
+        description="Worker processes for CPU-bound billing analysis; 0 runs analyses in a worker thread instead.",
+    )
     cur_mining_lookback_days: int = Field(
         default=30,
         env="CUR_MINING_LOOKBACK_DAYS",
@@ -376,6 +612,16 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_requests: int = Field(default=100, env="RATE_LIMIT_REQUESTS")
     rate_limit_window: int = Field(default=60, env="RATE_LIMIT_WINDOW")  # seconds
+    rate_limit_backend: str = Field(
+        default="valkey",
+        env="RATE_LIMIT_BACKEND",
+        description="'valkey' shares windows across workers (in-process fallback when unreachable); 'memory' keeps them per process.",
+    )
+    rate_limit_override_cache_ttl_seconds: int = Field(
+        default=60,
+        env="RATE_LIMIT_OVERRIDE_CACHE_TTL_SECONDS",
+        description="How long per-user/role rate limit overrides are cached before re-reading Postgres.",
+    )
 
     # SECURITY (HIGH-12, HIGH-35): Number of trusted reverse proxies between
     # the client and this backend. Controls which X-Forwarded-For entry is
@@ -0,0 +1,191 @@
+"""FOCUS Normalizer Benchmark
+
+Times ``FocusNormalizer.normalize_batch`` on a synthetic export for each
+provider connector, and compares its two formerly per-row steps against the
+legacy implementations they replaced:
+
+- month truncation: per-row ``.apply(lambda ts: date(...))`` vs
+  ``dt.to_period('M')``
+- output: ``iterrows()`` building one ``NormalizedCostRecord`` per group vs
+  the columnar ``NormalizedCostBatch``
+
+Frames are generated with the column names each connector's
+``load_dataframe`` produces, so CSV parsing is excluded. No database is used.
+
+Usage:
+  python -m backend.evaluation.focus_normalizer_benchmark [--rows 5000000] [--seed 7]
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import date
+from typing import Callable, Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from backend.models.data_sources import DataSourceProvider, NormalizedCostBatch, NormalizedCostRecord
+from backend.services.focus_normalizer import FocusNormalizer
+
+# Distinct values per dimension; 12 x 120 x 40 x 10 possible groups per currency/unit
+MONTHS = 12
+SERVICES = 120
+ACCOUNTS = 40
+REGIONS = 10
+
+
+def _dimensions(rows: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+    start = np.datetime64("2025-01-01T00:00:00")
+    offsets = rng.integers(0, MONTHS * 30 * 24, rows).astype("timedelta64[h]")
+    return {
+        "usage_start": np.datetime_as_string(start + offsets, unit="s"),
+        "service": np.array([f"service-{i:03d}" for i in range(SERVICES)], dtype=object)[rng.integers(0, SERVICES, rows)],
+        "account": np.array([f"{i:012d}" for i in range(ACCOUNTS)], dtype=object)[rng.integers(0, ACCOUNTS, rows)],
+        "region": np.array([f"region-{i}" for i in range(REGIONS)], dtype=object)[rng.integers(0, REGIONS, rows)],
+        "cost": rng.exponential(1.0, rows),
+        "quantity": rng.exponential(3.0, rows),
+    }
+
+
+def _exports(rows: int, seed: int) -> List[Tuple[DataSourceProvider, pd.DataFrame]]:
+    d = _dimensions(rows, np.random.default_rng(seed))
+    return [
+        (DataSourceProvider.AWS_CUR, pd.DataFrame({
+            "line_item_usage_start_date": d["usage_start"],
+            "line_item_unblended_cost": d["cost"],
+            "line_item_product_code": d["service"],
+            "line_item_usage_account_id": d["account"],
+            "product_region": d["region"],
+            "line_item_usage_amount": d["quantity"],
+        })),
+        (DataSourceProvider.AZURE_EXPORT, pd.DataFrame({
+            "UsageDate": d["usage_start"],
+            "CostInBillingCurrency": d["cost"],
+            "BillingCurrencyCode": "USD",
+            "MeterCategory": d["service"],
+            "SubscriptionId": d["account"],
+            "ResourceLocation": d["region"],
+            "Quantity": d["quantity"],
+            "UnitOfMeasure": "1 Hour",
+        })),
+        (DataSourceProvider.GCP_BILLING, pd.DataFrame({
+            "usage_start_time": d["usage_start"],
+            "cost": d["cost"],
+            "currency": "USD",
+            "service.description": d["service"],
+            "project.id": d["account"],
+            "location.region": d["region"],
+            "usage.amount": d["quantity"],
+            "usage.unit": "hour",
+        })),
+        (DataSourceProvider.GENERIC_COST, pd.DataFrame({
+            "date": d["usage_start"],
+            "cost": d["cost"],
+            "currency": "USD",
+            "service": d["service"],
+            "account_id": d["account"],
+            "region": d["region"],
+            "usage": d["quantity"],
+        })),
+    ]
+
+
+def _legacy_month(usage_start: pd.Series) -> pd.Series:
+    return usage_start.apply(lambda ts: date(int(getattr(ts, "year")), int(getattr(ts, "month")), 1))
+
+
+def _legacy_records(provider: DataSourceProvider, grouped: pd.DataFrame) -> List[NormalizedCostRecord]:
+    out: List[NormalizedCostRecord] = []
+    for _, row in grouped.iterrows():
+        month = row["_partition_month"]
+        out.append(
+            NormalizedCostRecord(
+                provider_type=provider,
+                billing_period_start=month,
+                billing_period_end=month,
+                partition_month=month,
+                account_or_project_id=FocusNormalizer._str_or_none(row["_account"]),
+                service_name=str(row["_service"]),
+                region=FocusNormalizer._str_or_none(row["_region"]),
+                usage_quantity=float(row["usage_quantity"]),
+                usage_unit=FocusNormalizer._str_or_none(row["_unit"]),
+                cost_amount=float(row["cost_amount"]),
+                currency=FocusNormalizer._str_or_none(row["_currency"]) or "USD",
+                tags={"aggregated_record_count": int(row["record_count"])},
+            )
+        )
+    return out
+
+
+def _timed(fn: Callable[[], object]) -> Tuple[float, object]:
+    started = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - started, result
+
+
+def _grouped(batch: NormalizedCostBatch) -> pd.DataFrame:
+    """Grouped frame in the shape the legacy record loop consumed."""
+    return pd.DataFrame({
+        "_partition_month": batch.partition_month,
+        "_service": batch.service_name,
+        "_account": batch.account_or_project_id,
+        "_region": batch.region,
+        "_unit": batch.usage_unit,
+        "_currency": batch.currency,
+        "usage_quantity": batch.usage_quantity,
+        "cost_amount": batch.cost_amount,
+        "record_count": batch.record_count,
+    })
+
+
+def run(rows: int, seed: int) -> Dict[str, Dict[str, float]]:
+    normalizer = FocusNormalizer()
+    results: Dict[str, Dict[str, float]] = {}
+    for provider, df in _exports(rows, seed):
+        total, (batch, errors) = _timed(lambda: normalizer.normalize_batch(provider, df))
+        assert not errors, errors
+
+        usage_start = pd.to_datetime(df.iloc[:, 0], errors="coerce", utc=True)
+        legacy_month, _ = _timed(lambda: _legacy_month(usage_start))
+        vector_month, _ = _timed(lambda: FocusNormalizer._partition_month(usage_start))
+
+        grouped = _grouped(batch)
+        legacy_out, _ = _timed(lambda: _legacy_records(provider, grouped))
+        work = grouped.assign(_partition_month=pd.PeriodIndex(grouped["_partition_month"], freq="M"))
+        vector_out, _ = _timed(lambda: FocusNormalizer._to_batch(provider, work))
+
+        results[provider.value] = {
+            "groups": float(len(batch)),
+            "normalize_batch": total,
+            "legacy_month": legacy_month,
+            "vector_month": vector_month,
+            "legacy_records": legacy_out,
+            "vector_batch": vector_out,
+            "legacy_total": total - vector_month - vector_out + legacy_month + legacy_out,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    results = run(args.rows, args.seed)
+    print(f"{args.rows:,} rows per provider\n")
+    print(
+        f"{'provider':<14} {'groups':>8} {'month legacy':>13} {'to_period':>10} "
+        f"{'iterrows':>9} {'batch':>7} {'legacy total':>13} {'vectorized':>11}"
+    )
+    for provider, r in results.items():
+        print(
+            f"{provider:<14} {int(r['groups']):>8,} {r['legacy_month']:>12.2f}s {r['vector_month']:>9.2f}s "
+            f"{r['legacy_records']:>8.2f}s {r['vector_batch']:>6.2f}s {r['legacy_total']:>12.2f}s "
+            f"{r['normalize_batch']:>10.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
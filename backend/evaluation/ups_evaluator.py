@@ -9,6 +9,8 @@ Metrics:
 - Top-N extraction accuracy
 - Dimension extraction accuracy
 - Time range explicitness correctness (explicit vs inherited vs default)
+- Embedding-router intent accuracy (all queries scored in one batch; skipped
+  when sentence-transformers is not installed)
 
 Usage:
   python backend/evaluation/ups_evaluator.py
@@ -26,6 +28,7 @@ from collections import defaultdict, Counter
 os.environ.setdefault("UPS_DISABLE_LLM", "1")
 
 from backend.agents.intent_classifier import intent_classifier  # noqa: E402
+from backend.services.embedding.embedding_intent_router import choose_intent, route_intents  # noqa: E402
 
 SAMPLE_FILE = os.path.join(os.path.dirname(__file__), "sample_queries.json")
 
@@ -150,8 +153,15 @@ def aggregate(records: List[EvalRecord]) -> Dict[str, Any]:
         exp: dict(act_counts) for exp, act_counts in confusion.items()
     }
 
+    embedded = [r for r in records if r.details.get("embedding_intent") is not None]
+    embedding_accuracy = (
+        sum(1 for r in embedded if r.details["embedding_intent"] == r.details["expected_intent"]) / len(embedded)
+        if embedded else None
+    )
+
     return {
         "overall_pass_rate": overall,
+        "embedding_intent_accuracy": embedding_accuracy,
         "intent_accuracy": intent_accuracy,
         "precision_recall": pr_table,
         "confusion_matrix": confusion_matrix,
@@ -163,8 +173,11 @@ def main():
     samples = load_samples(SAMPLE_FILE)
     records: List[EvalRecord] = []
     prev_tr = None
-    for sample in samples:
+    embedding_maps = route_intents([sample["query"] for sample in samples])
+    for sample, similarities in zip(samples, embedding_maps):
         record, prev_tr = evaluate_sample(sample, prev_tr)
+        if similarities:
+            record.details["embedding_intent"], record.details["embedding_score"] = choose_intent(similarities)
         records.append(record)
 
     metrics = aggregate(records)
@@ -23,7 +23,16 @@ from backend.api import data_sources
 from backend.api.admin import rate_limits as admin_rate_limits
 from backend.api import demo_admin
 from backend.services.vector_store import VectorStoreService
-from backend.services.database import DatabaseService, DatabaseDisabledError
+from backend.services.database import (
+    DatabaseDisabledError,
+    get_database_service,
+    shared_database_service,
+)
+from backend.services.analysis_pool import shutdown_analysis_pool
+from backend.services.athena_client import shutdown_async_athena_client
+from backend.services.conversation_store import conversation_store
+from backend.services.cur_partitions import cur_partition_catalog
+from backend.services.embedding.embedding_intent_router import warm_exemplar_index
 from backend.middleware.account_scoping import AccountScopingMiddleware
 from backend.middleware.authentication import AuthenticationMiddleware
 from backend.middleware.feature_access import FeatureAccessMiddleware
@@ -84,11 +93,12 @@ async def lifespan(app: FastAPI):
         try:
             # Initialize database connection in the background to avoid blocking startup
             logger.info("Scheduling database service initialization (non-blocking)...")
-            db_service = DatabaseService()
+            # Shared with the conversation store so the app runs one engine/pool
+            db_service = shared_database_service()
 
             async def init_db_background():
                 try:
-                    await db_service.initialize()
+                    await get_database_service()
                     app.state.db = db_service
                     logger.info("Database service initialized successfully (background)")
                 except Exception as e:
@@ -119,6 +129,23 @@ async def lifespan(app: FastAPI):
         logger.error(f"Failed to initialize vector store service: {e}", exc_info=True)
         logger.warning("Continuing without vector store - some features may be limited")
     
+    if settings.cur_partition_pruning_enabled or settings.athena_result_cache_enabled:
+        # Partition discovery talks to Glue/Athena; run it in the background
+        # so startup is not blocked. Templates fall back to no pruning until
+        # the first discovery completes. It also supplies the result cache's
+        # freshness token, so it runs even with pruning disabled.
+        cur_partition_catalog.start_background_refresh(
+            settings.aws_cur_database,
+            settings.aws_cur_table,
+            settings.cur_partition_refresh_seconds,
+        )
+
+    if settings.speculative_routing_enabled:
+        # Encode (or memory-map) the intent exemplar matrix off the event loop so
+        # the first routed chat turn does not pay for model load and encoding.
+        # warm_exemplar_index logs its own failures; the router retries on first use.
+        app.state.exemplar_warmup = asyncio.create_task(asyncio.to_thread(warm_exemplar_index))
+
     logger.info("aasmaa AI Platform startup complete", 
                 database_available=hasattr(app.state, 'db'),
                 vector_store_available=hasattr(app.state, 'vector_store'))
@@ -127,6 +154,12 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down aasmaa AI Cost Intelligence Platform")
+    try:
+        # Before the engine is disposed: write out buffered chat history
+        await conversation_store.close()
+    except Exception as e:
+        logger.error(f"Error flushing conversation write buffer: {e}")
+
     if hasattr(app.state, 'db') and app.state.db:
         try:
             await app.state.db.close()
@@ -141,6 +174,20 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"Error closing vector store: {e}")
 
+    await cur_partition_catalog.stop_background_refresh()
+
+    try:
+        shutdown_async_athena_client()
+        logger.info("Athena client pool shut down")
+    except Exception as e:
+        logger.error(f"Error shutting down Athena client pool: {e}")
+
+    try:
+        shutdown_analysis_pool()
+        logger.info("Analysis process pool shut down")
+    except Exception as e:
+        logger.error(f"Error shutting down analysis process pool: {e}")
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -11,7 +11,8 @@ request.state.auth_user. This middleware uses that authenticated user
 to load the full context from the database.
 """
 
-from typing import Optional
+from datetime import datetime
+from typing import Iterable, Optional
 from uuid import UUID, uuid4
 import os
 import re
@@ -29,7 +30,8 @@ from backend.services.request_context import (
     OrganizationInfo,
     create_empty_context,
 )
-from backend.services.database import DatabaseService
+from backend.services.database import DatabaseService, get_database_service
+from backend.services.request_context_cache import request_context_cache
 from backend.middleware.authentication import AnonymousUser
 from backend.services.demo_identity_store import get_demo_identity_store
 
@@ -37,6 +39,11 @@ logger = structlog.get_logger(__name__)
 settings = get_settings()
 
 
+def _earliest_expiry(grants: Iterable) -> Optional[datetime]:
+    """Earliest non-null ``expires_at`` among permission rows, if any."""
+    return min((g['expires_at'] for g in grants if g['expires_at'] is not None), default=None)
+
+
 class AccountScopingMiddleware(BaseHTTPMiddleware):
     """
     Middleware that loads account scoping context from the database.
@@ -47,7 +54,8 @@ class AccountScopingMiddleware(BaseHTTPMiddleware):
 
     Flow:
     1. Get authenticated user from request.state.auth_user (set by AuthenticationMiddleware)
-    2. Load user from database
+    2. Serve the context from request_context_cache when current; otherwise
+       load user from database (steps 2-4) and cache the result
     3. Load user's organization and active saved view
     4. Compute effective account scope
     5. Attach RequestContext to request.state.context
@@ -197,8 +205,10 @@ class AccountScopingMiddleware(BaseHTTPMiddleware):
                 request.state.request_id = request_id
                 return await call_next(request)
 
-            # Load full context from database
-            context = await self._load_user_context(user_email, request_id)
+            # Load full context (cached; database on a miss)
+            context = await request_context_cache.get(user_email, request_id)
+            if context is None:
+                context = await self._load_user_context(user_email, request_id)
             request.state.context = context
             request.state.request_id = request_id
 
@@ -226,9 +236,9 @@ class AccountScopingMiddleware(BaseHTTPMiddleware):
         return await call_next(request)
 
     async def _load_user_context(self, user_email: str, request_id: UUID) -> RequestContext:
-        """Load user context from database"""
+        """Load user context from database (and cache it for later requests)"""
 
-        db = self.db_service or DatabaseService()
+        db = self.db_service or await get_database_service()
         if not db.engine:
             await db.initialize()
 
@@ -326,11 +336,11 @@ class AccountScopingMiddleware(BaseHTTPMiddleware):
                     effective_filters = view_row['filters']
 
             # Load allowed account IDs
-            allowed_account_ids = await self._load_allowed_accounts(
+            allowed_account_ids, allowed_accounts_expire_at = await self._load_allowed_accounts(
                 conn, user_id, organization_id, active_view, is_admin
             )
 
-            return RequestContext(
+            context = RequestContext(
                 user_id=user_id,
                 user_email=user_email,
                 is_admin=is_admin,
@@ -338,6 +348,7 @@ class AccountScopingMiddleware(BaseHTTPMiddleware):
                 organization_name=organization_name,
                 organization_info=organization_info,
                 allowed_account_ids=allowed_account_ids,
+                allowed_accounts_expire_at=allowed_accounts_expire_at,
                 active_saved_view=active_view,
                 effective_time_range=effective_time_range,
                 effective_filters=effective_filters,
@@ -345,6 +356,11 @@ class AccountScopingMiddleware(BaseHTTPMiddleware):
                 request_id=request_id,
             )
 
+        versions = await request_context_cache.versions_for(user_email, user_id, organization_id)
+        if versions is not None:
+            await request_context_cache.put(context, versions)
+        return context
+
     async def _load_allowed_accounts(
         self,
         conn,
@@ -352,7 +368,7 @@ class AccountScopingMiddleware(BaseHTTPMiddleware):
         organization_id: Optional[UUID],
         active_view: Optional[SavedViewInfo],
         is_admin: bool,
-    ) -> list[str]:
+    ) -> tuple[list[str], Optional[datetime]]:
         """
         Load the list of AWS account IDs the user is allowed to access.
 
@@ -360,16 +376,19 @@ class AccountScopingMiddleware(BaseHTTPMiddleware):
         1. If active view has account_ids, use those (intersected with permissions)
         2. Otherwise, use all accounts from organization that user has permission for
         3. Admins can access all accounts in their organization
+
+        Also returns the earliest expiry of the grants the list relies on, so a
+        cached context is not served past it.
         """
 
         if not organization_id:
-            return []
+            return [], None
 
         if active_view and active_view.account_ids:
             # Get AWS account IDs for the view's account_ids (UUIDs)
             view_account_uuids = active_view.account_ids
             if not view_account_uuids:
-                return []
+                return [], None
 
             # Load account IDs for view's selected accounts
             result = await conn.execute(
@@ -388,7 +407,7 @@ class AccountScopingMiddleware(BaseHTTPMiddleware):
             if not is_admin:
                 perm_result = await conn.execute(
                     """
-                    SELECT aa.account_id
+                    SELECT aa.account_id, ap.expires_at
                     FROM aws_accounts aa
                     JOIN account_permissions ap ON ap.account_id = aa.id
                     WHERE ap.user_email = (SELECT email FROM users WHERE id = :user_id)
@@ -398,10 +417,12 @@ class AccountScopingMiddleware(BaseHTTPMiddleware):
                     """,
                     {'user_id': user_id, 'org_id': organization_id}
                 )
-                user_permitted = {r['account_id'] for r in perm_result.mappings().all()}
-                return [r['account_id'] for r in rows if r['account_id'] in user_permitted]
+                grants = perm_result.mappings().all()
+                user_permitted = {r['account_id'] for r in grants}
+                allowed = [r['account_id'] for r in rows if r['account_id'] in user_permitted]
+                return allowed, _earliest_expiry(g for g in grants if g['account_id'] in allowed)
 
-            return [r['account_id'] for r in rows]
+            return [r['account_id'] for r in rows], None
 
         # No active view - load all accounts user can access
         if is_admin:
@@ -418,7 +439,7 @@ class AccountScopingMiddleware(BaseHTTPMiddleware):
             # Regular user - only permitted accounts
             result = await conn.execute(
                 """
-                SELECT aa.account_id
+                SELECT aa.account_id, ap.expires_at
                 FROM aws_accounts aa
                 JOIN account_permissions ap ON ap.account_id = aa.id
                 WHERE ap.user_email = (SELECT email FROM users WHERE id = :user_id)
@@ -430,4 +451,4 @@ class AccountScopingMiddleware(BaseHTTPMiddleware):
             )
 
         rows = result.mappings().all()
-        return [r['account_id'] for r in rows]
+        return [r['account_id'] for r in rows], None if is_admin else _earliest_expiry(rows)
@@ -1,31 +1,86 @@
 """
 Rate Limiting Middleware and Utilities
 
-Provides rate limiting for API endpoints using in-memory storage
-with optional Redis/Valkey backend for distributed deployments.
+Provides rate limiting for API endpoints using a sliding-window counter.
+Windows live in Valkey (one atomic Lua script per check) so limits hold
+across every worker of the deployment; when Valkey is unreachable, or with
+RATE_LIMIT_BACKEND=memory, the same algorithm runs in-process.
 """
 
 import time
-from typing import Optional, Dict
-from collections import defaultdict
-import asyncio
+from typing import Optional, Dict, Tuple
 
 import structlog
 from fastapi import Request, HTTPException, status
+from prometheus_client import Counter
 
 from backend.config.settings import get_settings
+from backend.services.cache_service import get_cache_service
 from backend.utils.client_ip import get_client_ip
 
 logger = structlog.get_logger(__name__)
 settings = get_settings()
 
+rate_limit_checks = Counter(
+    "rate_limit_checks_total",
+    "Rate limit decisions by backend and outcome",
+    labelnames=["backend", "outcome"],
+)
+
+# Sliding-window counter: the previous fixed window's count is weighted by
+# the share of it still inside the sliding window. Check-and-increment runs
+# atomically on the server, so concurrent workers cannot overshoot the limit.
+#
+# KEYS[1] current window counter, KEYS[2] previous window counter
+# ARGV[1] limit, ARGV[2] window seconds, ARGV[3] weight of the previous window
+_SLIDING_WINDOW_SCRIPT = """
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+local estimated = current + math.floor(previous * tonumber(ARGV[3]))
+if estimated >= tonumber(ARGV[1]) then
+  return {0, current, previous}
+end
+current = redis.call('INCR', KEYS[1])
+if current == 1 then
+  redis.call('EXPIRE', KEYS[1], 2 * tonumber(ARGV[2]))
+end
+return {1, current, previous}
+"""
+
+
+class _LocalWindow:
+    """Counts for the current and previous fixed window of one key."""
+
+    __slots__ = ("index", "current", "previous")
+
+    def __init__(self, index: int):
+        self.index = index
+        self.current = 0
+        self.previous = 0
+
+    def roll(self, index: int) -> None:
+        if index == self.index:
+            return
+        self.previous = self.current if index == self.index + 1 else 0
+        self.current = 0
+        self.index = index
+
 
 class RateLimiter:
     """
-    Simple rate limiter using sliding window algorithm.
-
-    Uses in-memory storage by default, suitable for single-instance deployments.
-    For multi-instance deployments, configure Valkey/Redis backend.
+    Rate limiter using the sliding-window counter algorithm.
+
+    Each key keeps two counters: the current fixed window and the previous
+    one. A request is allowed while
+    ``current + floor(previous * unexpired share of previous window)`` is
+    under the limit, which approximates a true sliding log in O(1) memory
+    per key.
+
+    Counters live in Valkey so every worker enforces one shared limit. If
+    Valkey is unavailable the limiter falls back to in-process counters
+    (fail-open to per-process limits, like LoginThrottle fails open).
+    The in-process path never awaits between reading and updating a key,
+    so it needs no lock.
     """
 
     def __init__(
@@ -46,9 +101,10 @@ class RateLimiter:
         self.window_seconds = window_seconds or settings.rate_limit_window
         self.use_org_key = use_org_key
 
-        # In-memory storage: {key: [(timestamp, count), ...]}
-        self._storage: Dict[str, list] = defaultdict(list)
-        self._lock = asyncio.Lock()
+        # In-process fallback storage: {key: _LocalWindow}
+        self._storage: Dict[str, _LocalWindow] = {}
+        # Window index of the last sweep of _storage
+        self._swept_index: Optional[int] = None
 
     def _get_client_key(self, request: Request, endpoint: str = "") -> str:
         """
@@ -85,6 +141,45 @@ class RateLimiter:
         # Fallback to user-level key for safety
         return self._get_client_key(request, endpoint)
 
+    def _window(self, now: float) -> Tuple[int, float]:
+        """Index of the current fixed window and the weight of the previous one."""
+        index = int(now // self.window_seconds)
+        elapsed = now - index * self.window_seconds
+        return index, 1.0 - elapsed / self.window_seconds
+
+    async def _check_valkey(self, key: str, index: int, weight: float) -> Optional[Tuple[bool, int, int]]:
+        """Atomic check-and-increment in Valkey; None when Valkey is unavailable."""
+        if settings.rate_limit_backend != "valkey":
+            return None
+        try:
+            cache = await get_cache_service()
+            reply = await cache.eval_script(
+                _SLIDING_WINDOW_SCRIPT,
+                keys=[f"{key}:{index}", f"{key}:{index - 1}"],
+                args=[self.requests_per_window, self.window_seconds, weight],
+            )
+        except Exception as e:
+            logger.warning("rate_limit_valkey_unavailable", error=str(e))
+            return None
+        if not isinstance(reply, (list, tuple)) or len(reply) != 3:
+            return None
+        allowed, current, previous = (int(value) for value in reply)
+        return bool(allowed), current, previous
+
+    def _check_local(self, key: str, index: int, weight: float) -> Tuple[bool, int, int]:
+        """In-process check-and-increment (no await, so atomic on the event loop)."""
+        if index != self._swept_index:
+            # Once per window, so keys that stop sending don't accumulate
+            self._sweep(index)
+        window = self._storage.get(key)
+        if window is None:
+            window = self._storage[key] = _LocalWindow(index)
+        window.roll(index)
+        if window.current + int(window.previous * weight) >= self.requests_per_window:
+            return False, window.current, window.previous
+        window.current += 1
+        return True, window.current, window.previous
+
     async def is_allowed(self, request: Request, endpoint: str = "") -> tuple[bool, dict]:
         """
         Check if request is allowed under rate limit.
@@ -102,62 +197,43 @@ class RateLimiter:
         else:
             key = self._get_client_key(request, endpoint)
 
-        current_time = time.time()
-        window_start = current_time - self.window_seconds
-
-        async with self._lock:
-            # Clean old entries outside the window
-            self._storage[key] = [
-                (ts, count) for ts, count in self._storage[key]
-                if ts > window_start
-            ]
-
-            # Count requests in current window
-            total_requests = sum(count for _, count in self._storage[key])
-
-            # Check if under limit
-            remaining = max(0, self.requests_per_window - total_requests)
-            reset_time = int(window_start + self.window_seconds)
-
-            rate_info = {
-                "limit": self.requests_per_window,
-                "remaining": remaining,
-                "reset": reset_time,
-                "window_seconds": self.window_seconds,
-            }
-
-            if total_requests >= self.requests_per_window:
-                logger.warning(
-                    "Rate limit exceeded",
-                    key=key,
-                    requests=total_requests,
-                    limit=self.requests_per_window,
-                )
-                return False, rate_info
-
-            # Record this request
-            self._storage[key].append((current_time, 1))
-            rate_info["remaining"] = remaining - 1
+        index, weight = self._window(time.time())
+
+        backend = "valkey"
+        result = await self._check_valkey(key, index, weight)
+        if result is None:
+            backend = "memory"
+            result = self._check_local(key, index, weight)
+        allowed, current, previous = result
+
+        estimated = current + int(previous * weight)
+        rate_info = {
+            "limit": self.requests_per_window,
+            "remaining": max(0, self.requests_per_window - estimated),
+            "reset": (index + 1) * self.window_seconds,
+            "window_seconds": self.window_seconds,
+        }
+
+        rate_limit_checks.labels(backend=backend, outcome="allowed" if allowed else "limited").inc()
+        if not allowed:
+            logger.warning(
+                "Rate limit exceeded",
+                key=key,
+                requests=estimated,
+                limit=self.requests_per_window,
+                backend=backend,
+            )
+        return allowed, rate_info
 
-            return True, rate_info
+    def _sweep(self, index: int) -> None:
+        for key in [k for k, window in self._storage.items() if window.index < index - 1]:
+            del self._storage[key]
+        self._swept_index = index
 
     async def cleanup(self):
-        """Remove expired entries to prevent memory growth."""
-        current_time = time.time()
-        window_start = current_time - self.window_seconds
-
-        async with self._lock:
-            keys_to_delete = []
-            for key in self._storage:
-                self._storage[key] = [
-                    (ts, count) for ts, count in self._storage[key]
-                    if ts > window_start
-                ]
-                if not self._storage[key]:
-                    keys_to_delete.append(key)
-
-            for key in keys_to_delete:
-                del self._storage[key]
+        """Remove in-process windows that no longer affect any decision."""
+        index, _ = self._window(time.time())
+        self._sweep(index)
 
 
 # Global rate limiter instances for different use cases
@@ -237,8 +313,8 @@ def _get_athena_export_per_user_limiter(per_user_limit: int) -> RateLimiter:
     """
     Get cached per-user limiter for Athena exports (Layer 1 of the two-layer design).
 
-    SECURITY (HIGH-32): RateLimiter._storage is INSTANCE-scoped (see line ~50:
-    self._storage = defaultdict(list)). Before this fix, check_athena_export_rate_limit()
+    SECURITY (HIGH-32): RateLimiter._storage (the in-process fallback) is
+    INSTANCE-scoped. Before this fix, check_athena_export_rate_limit()
     constructed a fresh RateLimiter on every request — so _storage was always empty,
     every user always had "0 prior requests", and the per-user limit NEVER fired.
     Layer 1 of the two-layer fairness design was a silent no-op; only the org-level
@@ -248,7 +324,7 @@ def _get_athena_export_per_user_limiter(per_user_limit: int) -> RateLimiter:
     Cache key is per_user_limit (int), NOT (user_id, endpoint):
       - _get_client_key() at line ~72 already keys _storage by {endpoint}:{ip}:{email}
         internally — one limiter instance correctly separates all users at a given limit.
-      - Keying by user_id would be unbounded memory (one RateLimiter + asyncio.Lock per
+      - Keying by user_id would be unbounded memory (one RateLimiter per
         user who ever hits the endpoint) with each limiter's _storage holding exactly
         one entry. Redundant.
       - Keying by limit bounds memory to the number of DISTINCT limit values
@@ -257,7 +333,8 @@ def _get_athena_export_per_user_limiter(per_user_limit: int) -> RateLimiter:
         is just a proxy for limit).
 
     Known tradeoff — if a user's limit changes mid-window (admin updates a DB override),
-    they move to a different cached limiter and their count resets. Acceptable: limit
+    they move to a different cached limiter and their in-process count resets (Valkey
+    windows are keyed by {endpoint}:{ip}:{email} alone, so they carry over). Acceptable: limit
     changes are rare manual admin actions, and the alternative ((user_id, endpoint)
     keying) would cache the STALE limit forever until process restart, which is worse.
     """
@@ -339,6 +416,85 @@ async def check_ingest_rate_limit(request: Request) -> dict:
     )
 
 
+# Per-user/role overrides resolved from Postgres:
+# {(org_id, user_id, role, endpoint): (override or None, monotonic expiry)}
+_limit_overrides: Dict[Tuple[str, Optional[str], str, str], Tuple[Optional[int], float]] = {}
+_MAX_CACHED_OVERRIDES = 10_000
+
+
+def invalidate_rate_limit_overrides(org_id: Optional[str] = None) -> None:
+    """
+    Drop cached overrides for one organization (or all) on this worker.
+
+    Other workers pick the change up within rate_limit_override_cache_ttl_seconds.
+    """
+    if org_id is None:
+        _limit_overrides.clear()
+        return
+    for key in [k for k in _limit_overrides if k[0] == str(org_id)]:
+        _limit_overrides.pop(key, None)
+
+
+async def _load_limit_override(
+    user_id: Optional[str],
+    org_id: str,
+    user_role: str,
+    endpoint: str,
+) -> Optional[int]:
+    """User-specific, then organization role-specific override from Postgres."""
+    from backend.services.database import get_database_service
+
+    db = await get_database_service()
+
+    async with db.engine.begin() as conn:
+        # PRIORITY 1: Check for user-specific override
+        if user_id:
+            result = await conn.execute(
+                """
+                SELECT requests_per_hour
+                FROM user_rate_limits
+                WHERE user_id = :user_id
+                  AND organization_id = :org_id
+                  AND endpoint = :endpoint
+                """,
+                {"user_id": user_id, "org_id": org_id, "endpoint": endpoint}
+            )
+            row = result.first()
+            if row:
+                logger.debug(
+                    "Using user-specific rate limit override",
+                    user_id=user_id,
+                    org_id=org_id,
+                    endpoint=endpoint,
+                    limit=row[0]
+                )
+                return row[0]
+
+        # PRIORITY 2: Check for organization role-specific override
+        result = await conn.execute(
+            """
+            SELECT requests_per_hour
+            FROM organization_rate_limits
+            WHERE organization_id = :org_id
+              AND endpoint = :endpoint
+              AND user_role = :role
+            """,
+            {"org_id": org_id, "endpoint": endpoint, "role": user_role}
+        )
+        row = result.first()
+        if row:
+            logger.debug(
+                "Using organization role-specific rate limit",
+                org_id=org_id,
+                endpoint=endpoint,
+                role=user_role,
+                limit=row[0]
+            )
+            return row[0]
+
+    return None
+
+
 async def get_per_user_limit(
     user_id: Optional[str],
     org_id: Optional[str],
@@ -355,6 +511,9 @@ async def get_per_user_limit(
     3. Tier-specific default from settings
     4. Conservative fallback (10/hour)
 
+    Database lookups (including "no override") are cached in-process for
+    rate_limit_override_cache_ttl_seconds; failed lookups are not cached.
+
     Args:
         user_id: User UUID (None if no user context)
         org_id: Organization UUID (None if no org context)
@@ -365,70 +524,39 @@ async def get_per_user_limit(
     Returns:
         Per-user rate limit (requests per hour)
     """
-    from backend.services.database import DatabaseService
+    settings = get_settings()
 
     if org_id:
-        try:
-            db = DatabaseService()
-            if not db.engine:
-                await db.initialize()
-
-            async with db.engine.begin() as conn:
-                # PRIORITY 1: Check for user-specific override
-                if user_id:
-                    result = await conn.execute(
-                        """
-                        SELECT requests_per_hour
-                        FROM user_rate_limits
-                        WHERE user_id = :user_id
-                          AND organization_id = :org_id
-                          AND endpoint = :endpoint
-                        """,
-                        {"user_id": user_id, "org_id": org_id, "endpoint": endpoint}
-                    )
-                    row = result.first()
-                    if row:
-                        logger.debug(
-                            "Using user-specific rate limit override",
-                            user_id=user_id,
-                            org_id=org_id,
-                            endpoint=endpoint,
-                            limit=row[0]
-                        )
-                        return row[0]
-
-                # PRIORITY 2: Check for organization role-specific override
-                result = await conn.execute(
-                    """
-                    SELECT requests_per_hour
-                    FROM organization_rate_limits
-                    WHERE organization_id = :org_id
-                      AND endpoint = :endpoint
-                      AND user_role = :role
-                    """,
-                    {"org_id": org_id, "endpoint": endpoint, "role": user_role}
+        cache_key = (str(org_id), user_id, user_role, endpoint)
+        cached = _limit_overrides.get(cache_key)
+        if cached is not None and cached[1] > time.monotonic():
+            override = cached[0]
+        else:
+            try:
+                override = await _load_limit_override(user_id, org_id, user_role, endpoint)
+                if len(_limit_overrides) >= _MAX_CACHED_OVERRIDES:
+                    now = time.monotonic()
+                    for key in [k for k, (_, expires) in _limit_overrides.items() if expires <= now]:
+                        del _limit_overrides[key]
+                    if len(_limit_overrides) >= _MAX_CACHED_OVERRIDES:
+                        _limit_overrides.clear()
+                _limit_overrides[cache_key] = (
+                    override,
+                    time.monotonic() + settings.rate_limit_override_cache_ttl_seconds,
                 )
-                row = result.first()
-                if row:
-                    logger.debug(
-                        "Using organization role-specific rate limit",
-                        org_id=org_id,
-                        endpoint=endpoint,
-                        role=user_role,
-                        limit=row[0]
-                    )
-                    return row[0]
-        except Exception as e:
-            logger.warning(
-                "Failed to fetch custom rate limit, using defaults",
-                error=str(e),
-                user_id=user_id,
-                org_id=org_id,
-                endpoint=endpoint
-            )
+            except Exception as e:
+                override = None
+                logger.warning(
+                    "Failed to fetch custom rate limit, using defaults",
+                    error=str(e),
+                    user_id=user_id,
+                    org_id=org_id,
+                    endpoint=endpoint
+                )
+        if override is not None:
+            return override
 
     # Fallback to tier-specific defaults from settings
-    settings = get_settings()
 
     # Build setting name: {endpoint}_per_user_limit_{tier}_{role}
     # Example: athena_export_per_user_limit_enterprise_admin
@@ -4,9 +4,10 @@ Pydantic models for multi-cloud data source ingestion and FOCUS normalization.
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
 from datetime import datetime, date
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
@@ -157,6 +158,68 @@ class NormalizedCostRecord(BaseModel):
         return value
 
 
+@dataclass
+class NormalizedCostBatch:
+    """
+    Column-oriented batch of normalized cost rows.
+
+    ``FocusNormalizer`` emits grouped results in this shape so large exports
+    never build one ``NormalizedCostRecord`` per group; the storage layer
+    reads the columns directly via :meth:`rows`. Every list has one entry
+    per row, and billing periods equal ``partition_month``.
+    """
+
+    provider_type: DataSourceProvider
+    partition_month: List[date] = field(default_factory=list)
+    account_or_project_id: List[Optional[str]] = field(default_factory=list)
+    service_name: List[str] = field(default_factory=list)
+    region: List[Optional[str]] = field(default_factory=list)
+    usage_quantity: List[float] = field(default_factory=list)
+    usage_unit: List[Optional[str]] = field(default_factory=list)
+    cost_amount: List[float] = field(default_factory=list)
+    currency: List[str] = field(default_factory=list)
+    record_count: List[int] = field(default_factory=list)
+
+    COLUMNS = (
+        "partition_month",
+        "account_or_project_id",
+        "service_name",
+        "region",
+        "usage_quantity",
+        "usage_unit",
+        "cost_amount",
+        "currency",
+        "record_count",
+    )
+
+    def __len__(self) -> int:
+        return len(self.partition_month)
+
+    def rows(self) -> Iterator[Tuple[Any, ...]]:
+        """Yield one tuple per row, in :attr:`COLUMNS` order."""
+        return zip(*(getattr(self, name) for name in self.COLUMNS))
+
+    def records(self) -> List[NormalizedCostRecord]:
+        """Materialise the batch as validated ``NormalizedCostRecord`` objects."""
+        return [
+            NormalizedCostRecord(
+                provider_type=self.provider_type,
+                billing_period_start=month,
+                billing_period_end=month,
+                partition_month=month,
+                account_or_project_id=account,
+                service_name=service,
+                region=region,
+                usage_quantity=quantity,
+                usage_unit=unit,
+                cost_amount=cost,
+                currency=currency,
+                tags={"aggregated_record_count": count},
+            )
+            for month, account, service, region, quantity, unit, cost, currency, count in self.rows()
+        ]
+
+
 class UnifiedSpendRow(BaseModel):
     provider_type: DataSourceProvider
     month: date
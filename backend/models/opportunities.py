@@ -174,9 +174,10 @@ class OpportunityListRequest(BaseModel):
 class OpportunityExportRequest(BaseModel):
     """Request model for exporting opportunities"""
     filter: Optional[OpportunityFilter] = Field(None, description="Filter criteria")
-    format: Literal["csv", "json", "excel"] = Field(default="csv", description="Export format")
+    format: Literal["csv", "json", "ndjson", "excel"] = Field(default="csv", description="Export format")
     include_evidence: bool = Field(default=False, description="Include detailed evidence")
     include_steps: bool = Field(default=True, description="Include implementation steps")
+    compress: bool = Field(default=False, description="Gzip the exported file")
 
 
 # Response Models
@@ -0,0 +1,141 @@
+"""
+Process pool for CPU-bound billing analysis.
+
+Pandas work over large CUR / billing exports holds the GIL for seconds at a
+time, so running it on a thread still starves the event loop and every
+other request in the worker. Analyses are instead dispatched to a small
+``ProcessPoolExecutor`` shared by the whole application.
+
+Frames cross the process boundary as Arrow IPC streams written into POSIX
+shared memory: the parent writes each shard once and the worker maps it,
+instead of pickling object columns through the executor pipe.
+
+Workers are started with ``spawn`` so they never inherit the parent's
+threads, sockets or connection pools.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Optional, TypeVar
+
+import pandas as pd
+import pyarrow as pa
+import structlog
+
+from backend.config.settings import get_settings
+
+logger = structlog.get_logger(__name__)
+settings = get_settings()
+
+T = TypeVar("T")
+
+_pool_lock = threading.Lock()
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_analysis_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the shared analysis pool, or ``None`` when it is disabled."""
+    global _pool
+    if settings.analysis_pool_workers <= 0:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor(
+                    max_workers=settings.analysis_pool_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                logger.info("Analysis process pool started", workers=settings.analysis_pool_workers)
+    return _pool
+
+
+def shutdown_analysis_pool() -> None:
+    """Shutdown the shared pool (call at application shutdown)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+async def run_in_analysis_pool(fn: Callable[..., T], *args: Any) -> T:
+    """
+    Run ``fn(*args)`` in the analysis pool without blocking the event loop.
+
+    ``fn`` and its arguments must be picklable. Falls back to a worker
+    thread when the pool is disabled.
+    """
+    pool = get_analysis_pool()
+    if pool is None:
+        return await asyncio.to_thread(fn, *args)
+    return await asyncio.get_running_loop().run_in_executor(pool, partial(fn, *args))
+
+
+# ---------------------------------------------------------------------------
+# Shared-memory frames
+# ---------------------------------------------------------------------------
+
+
+def share_frame(df: pd.DataFrame) -> SharedMemory:
+    """
+    Write ``df`` into a new shared-memory block as an Arrow IPC stream.
+
+    The caller owns the block and must ``close()`` and ``unlink()`` it once
+    the worker reading it has finished. Raises ``pyarrow.ArrowException``
+    for frames Arrow cannot represent (e.g. mixed-type object columns).
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sizer = pa.MockOutputStream()
+    with pa.ipc.new_stream(sizer, table.schema) as writer:
+        writer.write_table(table)
+
+    shm = SharedMemory(create=True, size=max(sizer.size(), 1))
+    try:
+        sink = pa.FixedSizeBufferWriter(pa.py_buffer(shm.buf))
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        sink.close()
+        del writer, sink
+    except BaseException:
+        release_frame(shm)
+        raise
+    return shm
+
+
+def release_frame(shm: SharedMemory) -> None:
+    """Free a block created by :func:`share_frame`."""
+    try:
+        shm.close()
+    finally:
+        shm.unlink()
+
+
+def apply_to_shared_frame(name: str, fn: Callable[[pd.DataFrame], T]) -> T:
+    """
+    Worker side of :func:`share_frame`: rebuild the frame and return ``fn(frame)``.
+
+    ``fn`` must not return anything that still references the frame's
+    buffers, since the mapping is closed before returning.
+    """
+    shm = SharedMemory(name=name)
+    try:
+        # Every Arrow object built over shm.buf must be gone before close().
+        reader = pa.ipc.open_stream(pa.py_buffer(shm.buf))
+        table = reader.read_all()
+        del reader
+        frame = table.to_pandas()
+        del table
+        result = fn(frame)
+        del frame
+        return result
+    finally:
+        try:
+            shm.close()
+        except BufferError:  # pragma: no cover - a view outlived fn; freed on GC
+            logger.debug("Shared frame still referenced; leaving mapping to GC", name=name)
@@ -1,7 +1,7 @@
 import re
 from typing import Dict, Optional
 
-from backend.utils.aws_session import create_aws_session
+from backend.utils.aws_session import get_aws_client
 from backend.utils.aws_constants import AwsService
 
 
@@ -27,8 +27,7 @@ def parse_arn(arn: str) -> Optional[Dict[str, str]]:
 
 
 def get_boto3_client(service: str, region: str):
-    session = create_aws_session(region_name=region or None)
-    return session.client(service)
+    return get_aws_client(service, region_name=region or None)
 
 
 def resolve_ec2_instance(parts: Dict[str, str]) -> Optional[Dict]:
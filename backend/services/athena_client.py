@@ -0,0 +1,386 @@
+"""
+Shared non-blocking Athena client.
+
+boto3 is synchronous, so calling ``start_query_execution`` /
+``get_query_execution`` / ``get_query_results`` from an ``async def`` handler
+stalls the whole uvicorn worker for the duration of each HTTPS round-trip.
+``AsyncAthenaClient`` moves every Athena call onto a small dedicated thread
+pool (sized to match the botocore connection pool) and bounds each call with
+a timeout, so one worker can keep many queries in flight without blocking
+other requests.
+
+All Athena executors share one process-wide instance via
+``get_async_athena_client()``. Completion polling uses the adaptive schedule
+in ``athena_polling``.
+
+``execute_query()`` adds repeat-query shortcuts for idempotent SELECTs:
+Athena's own ``ResultReuseConfiguration`` (bounded by a max age, and
+submitted to the configured workgroup when workgroups are enabled), plus a
+local memo from SQL hash to the last successful ``QueryExecutionId`` so an
+identical request goes straight to ``get_query_results`` without starting
+or polling anything.
+"""
+
+import asyncio
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+import structlog
+from botocore.config import Config
+
+from backend.config.settings import get_settings
+from backend.services.chat_stream_events import emit_event
+from backend.services.athena_polling import (
+    TERMINAL_STATES,
+    PollSchedule,
+    QueryClass,
+    canonicalize_sql,
+    deadline_for,
+    execution_time_stats,
+    sql_template_key,
+)
+from backend.utils.aws_session import create_aws_session, get_default_retry_config
+from backend.utils.aws_constants import AwsService
+
+logger = structlog.get_logger(__name__)
+
+# Progress messages for /chat/stream status events
+_ATHENA_STATE_MESSAGES = {
+    "QUEUED": "Query queued in Athena...",
+    "RUNNING": "Running query in Athena...",
+    "SUCCEEDED": "Query finished, reading results...",
+    "FAILED": "Athena query failed.",
+    "CANCELLED": "Athena query was cancelled.",
+}
+
+
+def is_idempotent_query(sql: str) -> bool:
+    """True for read-only SELECT / WITH statements (safe to reuse results)."""
+    return canonicalize_sql(sql or "").startswith(("select ", "with ", "("))
+
+
+def build_start_query_kwargs(
+    query_string: str,
+    database: str,
+    output_location: str,
+    reuse_results: bool = True,
+) -> Dict[str, Any]:
+    """
+    ``start_query_execution`` kwargs for a CUR query.
+
+    The workgroup is only set when ``athena_workgroup_enabled`` is on.
+    Result reuse is requested for idempotent SELECTs when
+    ``athena_result_reuse_max_age_minutes`` is positive.
+    """
+    settings = get_settings()
+    kwargs: Dict[str, Any] = {
+        "QueryString": query_string,
+        "QueryExecutionContext": {"Database": database},
+        "ResultConfiguration": {"OutputLocation": output_location},
+    }
+    if settings.athena_workgroup_enabled and settings.athena_workgroup:
+        kwargs["WorkGroup"] = settings.athena_workgroup
+    max_age = settings.athena_result_reuse_max_age_minutes
+    if reuse_results and max_age > 0 and is_idempotent_query(query_string):
+        kwargs["ResultReuseConfiguration"] = {
+            "ResultReuseByAgeConfiguration": {"Enabled": True, "MaxAgeInMinutes": max_age}
+        }
+    return kwargs
+
+
+class QueryExecutionMemo:
+    """Bounded map of SQL hash -> (QueryExecutionId, completed_at)."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(query_string: str, database: str) -> str:
+        canonical = f"{database}\n{canonicalize_sql(query_string)}"
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str, max_age_seconds: float) -> Optional[str]:
+        """Recent successful QueryExecutionId for ``key``, if younger than ``max_age_seconds``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            query_execution_id, completed_at = entry
+            if time.monotonic() - completed_at > max_age_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return query_execution_id
+
+    def remember(self, key: str, query_execution_id: str) -> None:
+        with self._lock:
+            self._entries[key] = (query_execution_id, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def forget(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class AsyncAthenaClient:
+    """
+    Async facade over a boto3 Athena client.
+
+    Each call is dispatched to a dedicated ``ThreadPoolExecutor`` whose size
+    matches the botocore ``max_pool_connections`` setting, so the number of
+    concurrent HTTPS calls is bounded by the pool and never touches the
+    default executor used by the rest of the app.
+    """
+
+    def __init__(
+        self,
+        client: Optional[Any] = None,
+        max_workers: Optional[int] = None,
+        call_timeout_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            client: Pre-built boto3 Athena client (mainly for tests). When
+                omitted, one is created lazily via ``create_aws_session``.
+            max_workers: Size of the dedicated I/O thread pool and the
+                botocore connection pool (defaults to settings).
+            call_timeout_seconds: Per-call timeout (defaults to settings).
+        """
+        settings = get_settings()
+        self.max_workers = max_workers or settings.athena_client_max_workers
+        self.call_timeout_seconds = (
+            call_timeout_seconds or settings.athena_client_call_timeout_seconds
+        )
+        self._client = client
+        self._client_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.execution_memo = QueryExecutionMemo(settings.athena_execution_memo_max_entries)
+
+    @property
+    def client(self) -> Any:
+        """Underlying boto3 Athena client (created on first use)."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._create_client()
+        return self._client
+
+    def _create_client(self) -> Any:
+        settings = get_settings()
+        config = get_default_retry_config(
+            max_attempts=3,
+            mode="adaptive",
+            max_pool_connections=self.max_workers,
+        ).merge(
+            Config(
+                connect_timeout=settings.athena_client_connect_timeout_seconds,
+                read_timeout=self.call_timeout_seconds,
+            )
+        )
+        client = create_aws_session().client(AwsService.ATHENA, config=config)
+        logger.info(
+            "async_athena_client_created",
+            max_workers=self.max_workers,
+            call_timeout_seconds=self.call_timeout_seconds,
+        )
+        return client
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._client_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="athena-io",
+                    )
+        return self._executor
+
+    async def _call(self, method: str, timeout: Optional[float] = None, **kwargs: Any) -> Dict[str, Any]:
+        """Run ``client.<method>(**kwargs)`` on the Athena I/O pool."""
+        loop = asyncio.get_running_loop()
+        func = functools.partial(getattr(self.client, method), **kwargs)
+        return await asyncio.wait_for(
+            loop.run_in_executor(self._get_executor(), func),
+            timeout=timeout or self.call_timeout_seconds,
+        )
+
+    async def start_query_execution(self, timeout: Optional[float] = None, **kwargs: Any) -> Dict[str, Any]:
+        """Non-blocking ``start_query_execution``; kwargs are passed through."""
+        return await self._call("start_query_execution", timeout=timeout, **kwargs)
+
+    async def get_query_execution(
+        self, query_execution_id: str, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Non-blocking ``get_query_execution``."""
+        return await self._call(
+            "get_query_execution", timeout=timeout, QueryExecutionId=query_execution_id
+        )
+
+    async def get_query_results(
+        self,
+        query_execution_id: str,
+        next_token: Optional[str] = None,
+        max_results: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Non-blocking ``get_query_results`` for a single page."""
+        kwargs: Dict[str, Any] = {"QueryExecutionId": query_execution_id}
+        if next_token:
+            kwargs["NextToken"] = next_token
+        if max_results:
+            kwargs["MaxResults"] = max_results
+        return await self._call("get_query_results", timeout=timeout, **kwargs)
+
+    async def wait_for_query(
+        self,
+        query_execution_id: str,
+        *,
+        query_class: QueryClass = QueryClass.INTERACTIVE,
+        template_key: Optional[str] = None,
+        deadline_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Poll until the query reaches a terminal state or the deadline passes.
+
+        Uses the adaptive ``PollSchedule`` (exponential backoff with jitter,
+        seeded by the template's historical engine time). Returns the last
+        ``get_query_execution`` response; if its state is not terminal the
+        deadline was reached.
+        """
+        schedule = PollSchedule(
+            deadline_seconds=deadline_seconds or deadline_for(query_class),
+            predicted_seconds=execution_time_stats.predict_seconds(template_key),
+        )
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        status_response: Dict[str, Any] = {}
+        polls = 0
+        last_state = None
+        while True:
+            delay = schedule.next_delay(loop.time() - started)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+            polls += 1
+            status_response = await self.get_query_execution(query_execution_id)
+            execution = status_response.get("QueryExecution", {})
+            state = execution.get("Status", {}).get("State")
+            if state != last_state:
+                emit_event(
+                    "status",
+                    stage="athena",
+                    state=state,
+                    message=_ATHENA_STATE_MESSAGES.get(state, f"Athena query {state}"),
+                )
+                last_state = state
+            if state in TERMINAL_STATES:
+                if state == "SUCCEEDED":
+                    execution_time_stats.record(template_key, execution)
+                break
+
+        logger.debug(
+            "athena_query_poll_finished",
+            query_execution_id=query_execution_id,
+            query_class=QueryClass(query_class).value,
+            polls=polls,
+            waited_seconds=round(loop.time() - started, 3),
+        )
+        return status_response
+
+    async def execute_query(
+        self,
+        query_string: str,
+        *,
+        database: str,
+        output_location: str,
+        query_class: QueryClass = QueryClass.INTERACTIVE,
+        deadline_seconds: Optional[float] = None,
+        reuse_results: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Start (or reuse) a query and wait for it.
+
+        Returns the final ``get_query_execution``-shaped response with
+        ``QueryExecution.QueryExecutionId`` always set; a non-terminal state
+        means the deadline was reached. When the same idempotent SQL
+        succeeded within the reuse max age, its QueryExecutionId is returned
+        immediately as SUCCEEDED without calling Athena.
+        """
+        max_age_seconds = get_settings().athena_result_reuse_max_age_minutes * 60
+        reuse = reuse_results and max_age_seconds > 0 and is_idempotent_query(query_string)
+        memo_key = QueryExecutionMemo.key(query_string, database) if reuse else None
+
+        if memo_key:
+            memoized_id = self.execution_memo.lookup(memo_key, max_age_seconds)
+            if memoized_id:
+                logger.debug("athena_execution_memo_hit", query_execution_id=memoized_id)
+                return {
+                    "QueryExecution": {
+                        "QueryExecutionId": memoized_id,
+                        "Status": {"State": "SUCCEEDED"},
+                    },
+                    "Memoized": True,
+                }
+
+        response = await self.start_query_execution(
+            **build_start_query_kwargs(query_string, database, output_location, reuse_results=reuse)
+        )
+        query_execution_id = response["QueryExecutionId"]
+        status_response = await self.wait_for_query(
+            query_execution_id,
+            query_class=query_class,
+            template_key=sql_template_key(query_string),
+            deadline_seconds=deadline_seconds,
+        )
+        execution = status_response.setdefault("QueryExecution", {})
+        execution.setdefault("QueryExecutionId", query_execution_id)
+
+        if execution.get("Status", {}).get("State") == "SUCCEEDED":
+            if memo_key:
+                self.execution_memo.remember(memo_key, query_execution_id)
+            reuse_info = execution.get("Statistics", {}).get("ResultReuseInformation", {})
+            if reuse_info.get("ReusedPreviousResult"):
+                logger.debug("athena_result_reused", query_execution_id=query_execution_id)
+        return status_response
+
+    def forget_execution(self, query_string: str, database: str) -> None:
+        """Drop a memoized QueryExecutionId (e.g. its results could not be read)."""
+        self.execution_memo.forget(QueryExecutionMemo.key(query_string, database))
+
+    def shutdown(self) -> None:
+        """Release the I/O thread pool (call at application shutdown)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Module-level singleton access
+_async_athena_client: Optional[AsyncAthenaClient] = None
+_singleton_lock = threading.Lock()
+
+
+def get_async_athena_client() -> AsyncAthenaClient:
+    """Get the process-wide ``AsyncAthenaClient`` shared by all executors."""
+    global _async_athena_client
+    if _async_athena_client is None:
+        with _singleton_lock:
+            if _async_athena_client is None:
+                _async_athena_client = AsyncAthenaClient()
+    return _async_athena_client
+
+
+def shutdown_async_athena_client() -> None:
+    """Shutdown the shared client (call at application shutdown)."""
+    global _async_athena_client
+    if _async_athena_client is not None:
+        _async_athena_client.shutdown()
+        _async_athena_client = None
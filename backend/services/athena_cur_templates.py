@@ -24,6 +24,7 @@ from backend.utils.sql_validation import (
     escape_like_pattern,
     ValidationError,
 )
+from backend.services.cur_partitions import CURPartitionScheme, cur_partition_catalog
 from backend.utils.sql_constants import (
     SQL_AND,
     SQL_OR,
@@ -42,7 +43,13 @@ class AthenaCURTemplates:
     Supports both standard AWS CUR column names and Glue-normalized lowercase names.
     """
     
-    def __init__(self, database: str, table: str, use_lowercase_columns: bool = True):
+    def __init__(
+        self,
+        database: str,
+        table: str,
+        use_lowercase_columns: bool = True,
+        partition_scheme: Optional[CURPartitionScheme] = None,
+    ):
         """
         Initialize with CUR database and table names.
         
@@ -51,11 +58,14 @@ class AthenaCURTemplates:
             table: CUR table name (e.g., 'cur_aasmaa_linked')
             use_lowercase_columns: If True, use lowercase column names (e.g., lineitem_usagestartdate)
                                    If False, use standard CUR names (e.g., line_item_usage_start_date)
+            partition_scheme: Explicit partition layout. When omitted, the layout
+                              discovered at startup (cur_partition_catalog) is used.
         """
         self.database = database
         self.table = table
         self.full_table = f"{database}.{table}"
         self.use_lowercase = use_lowercase_columns
+        self.partition_scheme = partition_scheme
         # Column name mappings - standard name -> actual CUR schema name
         # Note: Glue crawler keeps underscores, so most columns are unchanged
         # Key difference: product_product_name -> product_servicecode
@@ -278,9 +288,12 @@ class AthenaCURTemplates:
         """
         Build partition filter for date range.
 
-        Note: CUR tables partitioned by billing_period (YYYYMM format), not year/month separately.
-        Since date filtering is done via line_item_usage_start_date in WHERE clause,
-        we return a simple 1=1 to avoid partition column errors.
+        CUR tables are partitioned by billing month, either as ``billing_period``
+        or as ``year`` + ``month``. When the partition layout is known (passed in
+        or discovered at startup via cur_partition_catalog) this returns a
+        predicate covering every month in the range so Athena prunes all other
+        partitions. Until discovery completes, or for unpartitioned tables, it
+        returns 1=1 and date filtering relies on line_item_usage_start_date alone.
 
         SECURITY (CRIT-12 sibling): This method is the universal choke-point —
         every public query method in this class calls it with (start_date, end_date)
@@ -294,18 +307,20 @@ class AthenaCURTemplates:
             end_date: End date (YYYY-MM-DD)
 
         Returns:
-            Tuple of (where_clause, years, months) - returns 1=1 and empty lists
+            Tuple of (where_clause, years, months); 1=1 and empty lists when
+            no partition layout is known
 
         Raises:
             ValidationError: if either date is not strictly YYYY-MM-DD.
         """
-        # Validate-and-discard: we don't use the return value here, but the
-        # validation raises before the caller's f-string runs if input is malformed.
+        # Validate before anything is interpolated, by us or by the caller.
         validate_date(start_date)
         validate_date(end_date)
-        # Return 1=1 (always true) since we filter by date in WHERE clause
-        # and the table doesn't have year/month partitions
-        return "1=1", [], []
+
+        scheme = self.partition_scheme or cur_partition_catalog.get(self.database, self.table)
+        if scheme is None:
+            return "1=1", [], []
+        return scheme.predicate(start_date, end_date)
     
     def ec2_cost_by_instance_type(
         self,
@@ -575,6 +590,7 @@ WITH service_costs AS (
   FROM {self.full_table}
   WHERE CAST(line_item_usage_start_date AS DATE) >= DATE '{start_date}'
     AND CAST(line_item_usage_start_date AS DATE) <= DATE '{end_date}'
+    AND {partition_filter}
     {line_item_type_clause}
     {service_filter}
     {purchase_option_filter}
@@ -719,12 +735,16 @@ LIMIT 10;
         
         top_filter = ""
         if top_services_only and not service:  # Don't apply top filter if specific service requested
+            # The ranking reads the 30 days before end_date, which can start
+            # before start_date, so it needs partitions for its own window
+            lookback_start = date.fromisoformat(str(end_date)) - timedelta(days=30)
+            top_partition_filter, _, _ = self._build_partition_filter(lookback_start.isoformat(), end_date)
             top_filter = f"""
 AND product_product_name IN (
   SELECT product_product_name
   FROM {self.full_table}
   WHERE CAST(line_item_usage_start_date AS DATE) >= DATE '{end_date}' - INTERVAL '30' DAY
-    AND {partition_filter}
+    AND {top_partition_filter}
   GROUP BY 1
   ORDER BY SUM({effective_cost}) DESC
   LIMIT {top_services_only}
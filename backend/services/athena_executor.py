@@ -3,16 +3,23 @@ Enhanced Athena Query Executor - Executes queries using templates and returns st
 Integrates with AthenaCURTemplates for query generation
 """
 
-import asyncio
 import time
 from typing import Dict, List, Any, Optional, Tuple
 from botocore.exceptions import ClientError
 import structlog
 
 from backend.config.settings import get_settings
-from backend.utils.aws_session import create_aws_session, get_default_retry_config
+from backend.utils.aws_session import get_aws_client, get_default_retry_config
 from backend.utils.aws_constants import AwsService
+from backend.services.athena_client import build_start_query_kwargs, get_async_athena_client
+from backend.services.athena_polling import (
+    PollSchedule,
+    QueryClass,
+    deadline_for,
+)
 from backend.services.athena_cur_templates import AthenaCURTemplates
+from backend.services.athena_result_cache import athena_result_cache
+from backend.services.athena_result_reader import AthenaResultReader
 from backend.services.service_resolver import ServiceResolver, ResolutionResult
 from backend.agents.intent_classifier import IntentType
 from backend.utils.date_parser import date_parser
@@ -128,10 +135,14 @@ class EnhancedAthenaQueryExecutor:
                 max_pool_connections=50
             )
 
-            # Create session using default credential chain (IAM roles, env vars, etc.)
-            session = create_aws_session()
-            self.athena_client = session.client(AwsService.ATHENA, config=retry_config)
-            self.s3_client = session.client(AwsService.S3, config=retry_config)
+            # Athena calls go through the shared non-blocking client so they
+            # never run on the event loop thread
+            self._athena = get_async_athena_client()
+            self.athena_client = self._athena.client
+
+            # Shared client (default credential chain); reused across executors
+            self.s3_client = get_aws_client(AwsService.S3, config=retry_config)
+            self._reader = AthenaResultReader(self._athena, s3_client=self.s3_client)
             
             # Get database and table from settings (with validation)
             self.database = settings.aws_cur_database
@@ -797,25 +808,24 @@ class EnhancedAthenaQueryExecutor:
         try:
             sql = f"SELECT DISTINCT line_item_product_code FROM {self.database}.{self.table} WHERE line_item_product_code <> '' LIMIT 5000"
             response = self.athena_client.start_query_execution(
-                QueryString=sql,
-                QueryExecutionContext={'Database': self.database},
-                ResultConfiguration={'OutputLocation': self.output_location}
-                # WorkGroup removed - causes "Queries of this type are not supported" errors
+                **build_start_query_kwargs(sql, self.database, self.output_location)
             )
             qid = response['QueryExecutionId']
-            attempts = 0
-            while attempts < 30:
-                attempts += 1
-                time.sleep(1)
+            # Synchronous caller: same adaptive schedule, blocking sleeps
+            schedule = PollSchedule(deadline_seconds=deadline_for(QueryClass.METADATA))
+            started = time.monotonic()
+            while True:
+                delay = schedule.next_delay(time.monotonic() - started)
+                if delay is None:
+                    logger.warning("Timed out waiting for product code discovery query")
+                    return
+                time.sleep(delay)
                 status = self.athena_client.get_query_execution(QueryExecutionId=qid)['QueryExecution']['Status']['State']
                 if status == 'SUCCEEDED':
                     break
                 if status in ['FAILED','CANCELLED']:
                     logger.warning("Product code discovery query failed", status=status)
                     return
-            if attempts >= 30:
-                logger.warning("Timed out waiting for product code discovery query")
-                return
             # Fetch results
             results = self.athena_client.get_query_results(QueryExecutionId=qid)
             rows = results.get('ResultSet', {}).get('Rows', [])
@@ -986,106 +996,59 @@ class EnhancedAthenaQueryExecutor:
         start_date, end_date, metadata = date_parser._default_last_30_days()
         return start_date, end_date
     
-    async def _execute_athena_query(self, sql_query: str) -> List[Dict[str, Any]]:
+    async def _execute_athena_query(
+        self,
+        sql_query: str,
+        query_class: QueryClass = QueryClass.INTERACTIVE,
+        scope: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
         """Execute Athena query and wait for results"""
         try:
-            # Start query execution WITHOUT WorkGroup to avoid compatibility issues
-            # WorkGroups can have restrictive settings that block certain query types
-            kwargs = {
-                'QueryString': sql_query,
-                'QueryExecutionContext': {'Database': self.database},
-                'ResultConfiguration': {'OutputLocation': self.output_location}
-            }
-            # Do NOT use WorkGroup - it's causing "Queries of this type are not supported" errors
-            # if getattr(self, 'workgroup', None):
-            #     kwargs['WorkGroup'] = self.workgroup
-            
-            response = self.athena_client.start_query_execution(**kwargs)
+            cached = await athena_result_cache.get(sql_query, scope)
+            if cached is not None:
+                return cached
 
-            query_execution_id = response['QueryExecutionId']
-            logger.info(f"Started Athena query execution: {query_execution_id}")
-            
-            # Wait for query to complete
-            max_attempts = 30
-            attempt = 0
+            # WorkGroup is opt-in (ATHENA_WORKGROUP_ENABLED): restrictive
+            # workgroups have caused "Queries of this type are not supported"
+            # errors. Repeat SELECTs reuse recent results (Athena result reuse
+            # and the client's QueryExecutionId memo).
+            status_response = await self._athena.execute_query(
+                sql_query,
+                database=self.database,
+                output_location=self.output_location,
+                query_class=query_class,
+            )
+            query_execution_id = status_response['QueryExecution']['QueryExecutionId']
+            logger.info(f"Athena query execution: {query_execution_id}")
+            query_status = status_response.get('QueryExecution', {}).get('Status', {})
+            status = query_status.get('State')
             
-            while attempt < max_attempts:
-                attempt += 1
-                await asyncio.sleep(1)  # Wait 1 second between checks
-                
-                status_response = self.athena_client.get_query_execution(
-                    QueryExecutionId=query_execution_id
+            if status in ['FAILED', 'CANCELLED']:
+                reason = query_status.get('StateChangeReason', 'Unknown')
+                logger.error(f"Query {status}: {reason}")
+                return []
+            if status != 'SUCCEEDED':
+                logger.error(
+                    "Query timed out",
+                    query_execution_id=query_execution_id,
+                    deadline_seconds=deadline_for(query_class),
                 )
-                
-                status = status_response['QueryExecution']['Status']['State']
-                
-                if status == 'SUCCEEDED':
-                    logger.info(f"Query succeeded after {attempt} attempts")
-                    break
-                elif status in ['FAILED', 'CANCELLED']:
-                    reason = status_response['QueryExecution']['Status'].get('StateChangeReason', 'Unknown')
-                    logger.error(f"Query {status}: {reason}")
-                    return []
-            
-            if attempt >= max_attempts:
-                logger.error("Query timed out after 30 seconds")
                 return []
             
-            # Get query results
-            results = []
-            next_token = None
-            
-            while True:
-                if next_token:
-                    result_response = self.athena_client.get_query_results(
-                        QueryExecutionId=query_execution_id,
-                        NextToken=next_token
-                    )
-                else:
-                    result_response = self.athena_client.get_query_results(
-                        QueryExecutionId=query_execution_id
-                    )
-                
-                # Parse results
-                rows = result_response['ResultSet']['Rows']
-                
-                if not results:
-                    # First page - extract headers
-                    headers = [col['VarCharValue'] for col in rows[0]['Data']]
-                    rows = rows[1:]  # Skip header row
-                else:
-                    headers = list(results[0].keys()) if results else []
-                
-                # Convert rows to dictionaries
-                for row in rows:
-                    row_dict = {}
-                    for i, col in enumerate(row.get('Data', [])):
-                        value = col.get('VarCharValue')
-                        # Try to convert to appropriate type
-                        if value is not None:
-                            try:
-                                # Try numeric conversion
-                                if '.' in value:
-                                    value = float(value)
-                                elif value.isdigit():
-                                    value = int(value)
-                            except (ValueError, AttributeError):
-                                pass  # Keep as string
-                        row_dict[headers[i]] = value
-                    results.append(row_dict)
-                
-                # Check for more pages
-                next_token = result_response.get('NextToken')
-                if not next_token:
-                    break
+            # Stream the CSV output from S3, typed by result-set metadata
+            results = await self._reader.read_all(query_execution_id)
             
+            await athena_result_cache.put(sql_query, scope, results)
             return results
             
         except ClientError as e:
             logger.error(f"AWS Client error executing Athena query: {e}", exc_info=True)
+            # A memoized execution whose results have expired must not be reused
+            self._athena.forget_execution(sql_query, self.database)
             return []
         except Exception as e:
             logger.error(f"Error executing Athena query: {e}", exc_info=True)
+            self._athena.forget_execution(sql_query, self.database)
             return []
     
     def _generate_mock_data(self, intent: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -0,0 +1,206 @@
+"""
+Adaptive completion polling for Athena queries.
+
+Replaces the fixed one-second ``get_query_execution`` loop. Polling starts at
+tens of milliseconds and backs off exponentially with jitter, so sub-second
+queries return almost immediately while long scans do not hammer the API.
+When earlier runs of the same SQL template are known, the first wait jumps
+straight to the predicted completion time taken from Athena's
+``EngineExecutionTimeInMillis`` statistic.
+
+Overall deadlines are per ``QueryClass`` and configured in settings.
+"""
+
+import hashlib
+import random
+import re
+import threading
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from backend.config.settings import get_settings
+
+
+class QueryClass(str, Enum):
+    """Query classes with independently configurable deadlines."""
+
+    INTERACTIVE = "interactive"   # chat / API request path
+    BATCH = "batch"               # reports, exports, pattern mining
+    METADATA = "metadata"         # catalog / discovery lookups
+
+
+TERMINAL_STATES = frozenset({"SUCCEEDED", "FAILED", "CANCELLED"})
+
+# With a known template, the first probe lands at this fraction of the
+# predicted engine time (engine time varies run to run, so aiming exactly at
+# the mean misses about half the queries), and later waits are capped at
+# PREDICTED_MAX_DELAY of it.
+PREDICTED_FIRST_PROBE = 0.9
+PREDICTED_MAX_DELAY = 0.1
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def sql_template_key(sql: str) -> str:
+    """
+    Fingerprint a SQL statement with its literals stripped.
+
+    Two queries generated from the same template with different dates,
+    limits or account IDs share a key, so their execution times can be
+    used to predict each other.
+    """
+    shape = _STRING_LITERAL.sub("?", sql or "")
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _WHITESPACE.sub(" ", shape).strip().lower()
+    return hashlib.sha256(shape.encode("utf-8")).hexdigest()[:16]
+
+
+# Quoted literals/identifiers and comments; everything between them is
+# whitespace-collapsed and lower-cased.
+_SQL_TOKEN = re.compile(
+    r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|--[^\n]*|/\*.*?\*/",
+    re.DOTALL,
+)
+
+
+def canonicalize_sql(sql: str) -> str:
+    """
+    Canonical form of ``sql`` for cache addressing.
+
+    Comments are dropped, whitespace is collapsed and keywords/identifiers are
+    lower-cased (Athena identifiers are case-insensitive). String literals and
+    quoted identifiers are kept verbatim, so different date ranges or account
+    filters never share an entry.
+    """
+    out = ""
+
+    def _append_code(code: str) -> str:
+        code = _WHITESPACE.sub(" ", code.lower())
+        if out.endswith(" ") and code.startswith(" "):
+            code = code[1:]
+        return code
+
+    last = 0
+    for match in _SQL_TOKEN.finditer(sql):
+        token = match.group(0)
+        is_comment = token.startswith(("--", "/*"))
+        out += _append_code(sql[last:match.start()] + (" " if is_comment else ""))
+        if not is_comment:
+            out += token
+        last = match.end()
+    out += _append_code(sql[last:])
+    return out.strip().rstrip(";").strip()
+
+
+def deadline_for(query_class: QueryClass) -> float:
+    """Overall completion deadline (seconds) for a query class."""
+    settings = get_settings()
+    return {
+        QueryClass.INTERACTIVE: settings.athena_query_deadline_interactive_seconds,
+        QueryClass.BATCH: settings.athena_query_deadline_batch_seconds,
+        QueryClass.METADATA: settings.athena_query_deadline_metadata_seconds,
+    }[QueryClass(query_class)]
+
+
+class ExecutionTimeStats:
+    """
+    Exponentially weighted engine execution time per SQL template.
+
+    Bounded LRU so the map cannot grow with the number of distinct
+    LLM-generated queries.
+    """
+
+    def __init__(self, max_templates: int = 512, alpha: float = 0.3):
+        self.max_templates = max_templates
+        self.alpha = alpha
+        self._ewma: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def predict_seconds(self, template_key: Optional[str]) -> Optional[float]:
+        """Predicted engine time for ``template_key`` or None if unseen."""
+        if not template_key:
+            return None
+        with self._lock:
+            value = self._ewma.get(template_key)
+            if value is not None:
+                self._ewma.move_to_end(template_key)
+            return value
+
+    def record(self, template_key: Optional[str], query_execution: Dict[str, Any]) -> None:
+        """Fold a finished ``QueryExecution`` into the template's estimate."""
+        if not template_key:
+            return
+        millis = (query_execution.get("Statistics") or {}).get("EngineExecutionTimeInMillis")
+        if millis is None:
+            return
+        seconds = max(0.0, float(millis) / 1000.0)
+        with self._lock:
+            previous = self._ewma.get(template_key)
+            if previous is None:
+                self._ewma[template_key] = seconds
+            else:
+                self._ewma[template_key] = self.alpha * seconds + (1 - self.alpha) * previous
+            self._ewma.move_to_end(template_key)
+            while len(self._ewma) > self.max_templates:
+                self._ewma.popitem(last=False)
+
+
+class PollSchedule:
+    """
+    Delay sequence for one query's completion polling.
+
+    ``next_delay(elapsed)`` returns how long to sleep before the next
+    ``get_query_execution`` call, or None once the deadline has passed.
+    """
+
+    def __init__(
+        self,
+        deadline_seconds: float,
+        predicted_seconds: Optional[float] = None,
+        initial_delay: Optional[float] = None,
+        max_delay: Optional[float] = None,
+        multiplier: Optional[float] = None,
+        rng: Optional[random.Random] = None,
+    ):
+        settings = get_settings()
+        self.deadline_seconds = deadline_seconds
+        self.predicted_seconds = predicted_seconds
+        self.initial_delay = (
+            initial_delay if initial_delay is not None
+            else settings.athena_poll_initial_delay_ms / 1000.0
+        )
+        self.max_delay = max_delay if max_delay is not None else settings.athena_poll_max_delay_seconds
+        self.multiplier = multiplier if multiplier is not None else settings.athena_poll_backoff_multiplier
+        self._rng = rng or random
+        self.attempt = 0
+
+    def next_delay(self, elapsed: float) -> Optional[float]:
+        remaining = self.deadline_seconds - elapsed
+        if remaining <= 0:
+            return None
+
+        max_delay = self.max_delay
+        if self.predicted_seconds is not None:
+            first_probe = self.predicted_seconds * PREDICTED_FIRST_PROBE
+            if elapsed < first_probe:
+                # Sleep straight to just before the predicted finish; backoff
+                # starts afresh from there, so probing is densest where
+                # completion is likely.
+                return min(first_probe - elapsed, remaining)
+            # Runs that outlive the prediction are only slightly late, so keep
+            # the overshoot proportional to the expected runtime.
+            max_delay = min(max_delay, max(self.initial_delay, self.predicted_seconds * PREDICTED_MAX_DELAY))
+
+        base = min(self.initial_delay * (self.multiplier ** self.attempt), max_delay)
+        self.attempt += 1
+        # Equal jitter: keeps the backoff shape while de-synchronising
+        # concurrent pollers.
+        delay = base / 2 + self._rng.uniform(0, base / 2)
+        return min(delay, remaining)
+
+
+# Process-wide statistics shared by every executor
+execution_time_stats = ExecutionTimeStats()
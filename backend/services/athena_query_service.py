@@ -3,19 +3,21 @@ Athena Query Service - Generate and execute SQL queries for AWS CUR data
 Provides query generation, execution, and result export functionality
 """
 
-import asyncio
-import time
 import csv
 import json
 import io
 import re
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime, date, timedelta
 import structlog
 
 from backend.config.settings import get_settings
-from backend.utils.aws_session import create_aws_session
+from backend.utils.aws_session import get_aws_client
 from backend.utils.aws_constants import AwsService
+from backend.services.athena_client import build_start_query_kwargs, get_async_athena_client
+from backend.services.athena_polling import QueryClass
+from backend.services.athena_result_cache import athena_result_cache, result_scope
+from backend.services.athena_result_reader import AthenaResultReader
 from backend.utils.sql_validation import validate_service_code, validate_date, ValidationError
 from backend.utils.sql_constants import (
     build_sql_in_list,
@@ -91,9 +93,10 @@ class AthenaQueryService:
         try:
             # Use default credential chain (IAM roles, env vars, etc.)
             # SECURITY: No explicit credentials stored in memory
-            session = create_aws_session()
-            self.athena_client = session.client(AwsService.ATHENA)
-            self.s3_client = session.client(AwsService.S3)
+            self._athena = get_async_athena_client()
+            self.athena_client = self._athena.client
+            self.s3_client = get_aws_client(AwsService.S3)
+            self._reader = AthenaResultReader(self._athena, s3_client=self.s3_client)
 
             logger.info("Athena Query Service initialized successfully (using IAM credentials)")
             
@@ -101,6 +104,7 @@ class AthenaQueryService:
             logger.error(f"Failed to initialize Athena client: {e}")
             self.athena_client = None
             self.s3_client = None
+            self._reader = None
     
     async def generate_query_for_user_request(
         self,
@@ -637,7 +641,10 @@ ORDER BY
         self,
         sql_query: str,
         wait_for_completion: bool = True,
-        max_wait_seconds: int = 60
+        max_wait_seconds: Optional[float] = None,
+        scope: Optional[str] = None,
+        fetch_results: bool = True,
+        query_class: QueryClass = QueryClass.INTERACTIVE,
     ) -> Dict[str, Any]:
         """
         Execute Athena query and return results.
@@ -646,6 +653,14 @@ ORDER BY
             sql_query: SQL query to execute
             wait_for_completion: Whether to wait for query completion
             max_wait_seconds: Maximum time to wait for query completion
+                (defaults to the deadline of ``query_class``)
+            scope: Caller's account scope (see result_scope), part of the cache key
+            fetch_results: When False, a successful result carries
+                ``results=None`` and the caller streams rows by
+                ``query_execution_id`` (see ``stream_results_csv``). Cache
+                hits still return materialized results.
+            query_class: Deadline class; exports and streams pass
+                ``QueryClass.BATCH``
             
         Returns:
             Dict with query results or execution ID
@@ -657,67 +672,79 @@ ORDER BY
             }
         
         try:
+            if wait_for_completion:
+                cached = await athena_result_cache.get(sql_query, scope)
+                if cached is not None:
+                    return {
+                        "status": "success",
+                        "query_execution_id": None,
+                        "results": cached,
+                        "row_count": len(cached),
+                        "cached": True
+                    }
+
             athena_database = getattr(settings, "athena_database", None) or getattr(settings, "aws_cur_database", None) or "default"
             athena_output = getattr(settings, "athena_output_location", None) or f"s3://{settings.aws_s3_bucket}/query-results/"
 
-            # Start query execution
-            response = self.athena_client.start_query_execution(
-                QueryString=sql_query,
-                QueryExecutionContext={
-                    'Database': athena_database
-                },
-                ResultConfiguration={
-                    'OutputLocation': athena_output
+            if not wait_for_completion:
+                response = await self._athena.start_query_execution(
+                    **build_start_query_kwargs(sql_query, athena_database, athena_output)
+                )
+                query_execution_id = response['QueryExecutionId']
+                logger.info(f"Athena query started: {query_execution_id}")
+                return {
+                    "status": "running",
+                    "query_execution_id": query_execution_id
                 }
+            
+            # Start (or reuse) and wait (adaptive backoff bounded by the deadline)
+            status_response = await self._athena.execute_query(
+                sql_query,
+                database=athena_database,
+                output_location=athena_output,
+                query_class=query_class,
+                deadline_seconds=max_wait_seconds,
             )
+            query_execution_id = status_response['QueryExecution']['QueryExecutionId']
+            query_status = status_response.get('QueryExecution', {}).get('Status', {})
+            status = query_status.get('State')
             
-            query_execution_id = response['QueryExecutionId']
-            logger.info(f"Athena query started: {query_execution_id}")
+            if status == 'SUCCEEDED' and not fetch_results:
+                return {
+                    "status": "success",
+                    "query_execution_id": query_execution_id,
+                    "results": None
+                }
+
+            if status == 'SUCCEEDED':
+                # Get query results
+                results = await self._get_query_results(query_execution_id)
+                if results:
+                    await athena_result_cache.put(sql_query, scope, results)
+                else:
+                    # _get_query_results returns [] on read errors too, so
+                    # neither cache it nor keep reusing this execution
+                    self._athena.forget_execution(sql_query, athena_database)
+                return {
+                    "status": "success",
+                    "query_execution_id": query_execution_id,
+                    "results": results,
+                    "row_count": len(results) if results else 0
+                }
             
-            if not wait_for_completion:
+            if status in ['FAILED', 'CANCELLED']:
+                error_msg = query_status.get('StateChangeReason', 'Unknown error')
                 return {
-                    "status": "running",
-                    "query_execution_id": query_execution_id
+                    "status": "failed",
+                    "query_execution_id": query_execution_id,
+                    "error": error_msg
                 }
             
-            # Wait for query completion
-            start_time = time.time()
-            while True:
-                if time.time() - start_time > max_wait_seconds:
-                    return {
-                        "status": "timeout",
-                        "query_execution_id": query_execution_id,
-                        "message": "Query execution exceeded maximum wait time"
-                    }
-                
-                status_response = self.athena_client.get_query_execution(
-                    QueryExecutionId=query_execution_id
-                )
-                
-                status = status_response['QueryExecution']['Status']['State']
-                
-                if status == 'SUCCEEDED':
-                    # Get query results
-                    results = await self._get_query_results(query_execution_id)
-                    return {
-                        "status": "success",
-                        "query_execution_id": query_execution_id,
-                        "results": results,
-                        "row_count": len(results) if results else 0
-                    }
-                
-                elif status in ['FAILED', 'CANCELLED']:
-                    error_msg = status_response['QueryExecution']['Status'].get(
-                        'StateChangeReason', 'Unknown error'
-                    )
-                    return {
-                        "status": "failed",
-                        "query_execution_id": query_execution_id,
-                        "error": error_msg
-                    }
-                
-                # Still running, wait before checking again
-                await asyncio.sleep(2)
+            return {
+                "status": "timeout",
+                "query_execution_id": query_execution_id,
+                "message": "Query execution exceeded maximum wait time"
+            }
                 
         except Exception as e:
             logger.error(f"Error executing Athena query: {e}")
@@ -730,12 +757,12 @@ ORDER BY
         """Get results from completed Athena query"""
         try:
             results = []
-            paginator = self.athena_client.get_paginator('get_query_results')
-            
-            page_iterator = paginator.paginate(QueryExecutionId=query_execution_id)
-            
             headers = None
-            for page in page_iterator:
+            next_token = None
+            while True:
+                page = await self._athena.get_query_results(
+                    query_execution_id, next_token=next_token
+                )
                 for row in page['ResultSet']['Rows']:
                     row_data = [col.get('VarCharValue', '') for col in row['Data']]
                     
@@ -746,6 +773,10 @@ ORDER BY
                         # Create dict from row data
                         result_dict = dict(zip(headers, row_data))
                         results.append(result_dict)
+
+                next_token = page.get('NextToken')
+                if not next_token:
+                    break
             
             return results
             
@@ -791,6 +822,35 @@ ORDER BY
             logger.error(f"Error exporting to CSV: {e}")
             return "", "error.csv"
     
+    async def stream_results_csv(self, query_execution_id: str) -> AsyncIterator[str]:
+        """
+        Stream a finished query's results as CSV text chunks.
+
+        Reads the Athena output from S3 batch by batch, so exports never hold
+        the whole result set in memory.
+        """
+        header_written = False
+        async for columns, rows in self._reader.iter_batches(query_execution_id):
+            output = io.StringIO()
+            writer = csv.writer(output)
+            if not header_written:
+                writer.writerow([c.name for c in columns])
+                header_written = True
+            writer.writerows(rows)
+            yield output.getvalue()
+
+    async def stream_results_json(self, query_execution_id: str) -> AsyncIterator[str]:
+        """Stream a finished query's results as a JSON array, batch by batch."""
+        yield "["
+        first = True
+        async for columns, rows in self._reader.iter_batches(query_execution_id):
+            names = [c.name for c in columns]
+            chunk = ",".join(json.dumps(dict(zip(names, row)), default=str) for row in rows)
+            if chunk:
+                yield chunk if first else "," + chunk
+                first = False
+        yield "]"
+
     async def export_results_to_json(
         self,
         results: List[Dict[str, Any]],
@@ -822,7 +882,7 @@ ORDER BY
         sql_query: str,
         context: "RequestContext",
         wait_for_completion: bool = True,
-        max_wait_seconds: int = 60
+        max_wait_seconds: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Execute Athena query with account scoping validation.
@@ -837,7 +897,7 @@ ORDER BY
             sql_query: SQL query to execute
             context: RequestContext with user's allowed accounts
             wait_for_completion: Whether to wait for query completion
-            max_wait_seconds: Maximum time to wait
+            max_wait_seconds: Maximum time to wait (defaults to the interactive deadline)
 
         Returns:
             Dict with query results and scope information
@@ -880,7 +940,8 @@ ORDER BY
         result = await self.execute_query(
             sql_query=sql_query,
             wait_for_completion=wait_for_completion,
-            max_wait_seconds=max_wait_seconds
+            max_wait_seconds=max_wait_seconds,
+            scope=result_scope(context.allowed_account_ids, context.organization_id)
         )
 
         # Add scope metadata to result
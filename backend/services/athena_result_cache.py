@@ -0,0 +1,180 @@
+"""
+Result-set cache for Athena CUR queries.
+
+Identical questions ("top 5 services last month") re-run the same SQL on
+every chat turn, follow-up and scheduled report. Results are cached under a
+content address built from the canonicalized SQL and the caller's account
+scope, in two tiers:
+
+- an in-process LRU (no network hop), in front of
+- the shared Valkey ``CacheService`` (shared across workers).
+
+Entries are not expired on a blind TTL. Every key embeds the CUR freshness
+token from ``cur_partition_catalog`` (partition fingerprint + newest
+manifest), so when new CUR data lands the old entries simply stop matching;
+the local tier is cleared at that point and Valkey entries age out under a
+generous safety TTL. With no freshness signal (discovery has not run, or the
+table is unpartitioned and has no manifest), nothing is cached.
+
+Hit / miss / bytes-saved counters are registered with the default Prometheus
+registry and exported by the ``/metrics`` endpoint in main.py.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+import structlog
+from prometheus_client import Counter
+
+from backend.config.settings import get_settings
+from backend.services.athena_polling import canonicalize_sql
+from backend.services.cache_service import get_cache_service
+from backend.services.cur_partitions import cur_partition_catalog
+
+logger = structlog.get_logger(__name__)
+
+result_cache_hits = Counter(
+    "athena_result_cache_hits_total",
+    "Athena result-cache hits by tier",
+    labelnames=["tier"],
+)
+result_cache_misses = Counter(
+    "athena_result_cache_misses_total",
+    "Athena result-cache misses",
+)
+result_cache_bytes_saved = Counter(
+    "athena_result_cache_bytes_saved_total",
+    "Serialized result bytes served from cache instead of Athena",
+    labelnames=["tier"],
+)
+
+KEY_PREFIX = "athena:result:"
+
+def result_scope(
+    account_ids: Optional[Iterable[Any]] = None,
+    organization_id: Optional[Any] = None,
+) -> str:
+    """Stable scope string for a caller's organization and allowed accounts."""
+    accounts = ",".join(sorted({str(a) for a in (account_ids or []) if a}))
+    return f"org={organization_id or '-'};accounts={accounts or '*'}"
+
+
+class AthenaResultCache:
+    """Two-tier (in-process LRU + Valkey) cache of Athena result rows."""
+
+    def __init__(
+        self,
+        database: Optional[str] = None,
+        table: Optional[str] = None,
+        max_entries: Optional[int] = None,
+        max_entry_bytes: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self.database = database or settings.aws_cur_database
+        self.table = table or settings.aws_cur_table
+        self.max_entries = max_entries or settings.athena_result_cache_local_max_entries
+        self.max_entry_bytes = max_entry_bytes or settings.athena_result_cache_max_entry_bytes
+        self.ttl_seconds = ttl_seconds or settings.athena_result_cache_ttl_seconds
+        self._local: "OrderedDict[str, str]" = OrderedDict()
+        self._local_freshness: Optional[str] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return get_settings().athena_result_cache_enabled
+
+    def _freshness(self) -> Optional[str]:
+        token = cur_partition_catalog.freshness_token(self.database, self.table)
+        with self._lock:
+            if token != self._local_freshness:
+                # New CUR data landed: every local entry is stale
+                self._local.clear()
+                self._local_freshness = token
+        return token
+
+    def cache_key(self, sql: str, scope: Optional[str], freshness: str) -> str:
+        digest = hashlib.sha256(f"{scope or '*'}\n{canonicalize_sql(sql)}".encode("utf-8")).hexdigest()
+        return f"{KEY_PREFIX}{freshness}:{digest}"
+
+    def invalidate_local(self) -> None:
+        """Drop every in-process entry."""
+        with self._lock:
+            self._local.clear()
+
+    def _local_get(self, key: str) -> Optional[str]:
+        with self._lock:
+            payload = self._local.get(key)
+            if payload is not None:
+                self._local.move_to_end(key)
+            return payload
+
+    def _local_put(self, key: str, payload: str) -> None:
+        with self._lock:
+            self._local[key] = payload
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+    async def get(self, sql: str, scope: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
+        """Cached rows for ``sql`` under ``scope``, or None."""
+        if not self.enabled:
+            return None
+        freshness = self._freshness()
+        if freshness is None:
+            return None
+
+        key = self.cache_key(sql, scope, freshness)
+        payload = self._local_get(key)
+        tier = "local"
+        if payload is None:
+            tier = "valkey"
+            try:
+                cache = await get_cache_service()
+                payload = await cache.get(key)
+            except Exception as e:
+                logger.debug("athena_result_cache_get_failed", error=str(e))
+                payload = None
+            if payload is not None:
+                self._local_put(key, payload)
+
+        if payload is None:
+            result_cache_misses.inc()
+            return None
+
+        result_cache_hits.labels(tier=tier).inc()
+        result_cache_bytes_saved.labels(tier=tier).inc(len(payload))
+        logger.debug("athena_result_cache_hit", tier=tier, bytes=len(payload))
+        return json.loads(payload)
+
+    async def put(self, sql: str, scope: Optional[str], rows: List[Dict[str, Any]]) -> bool:
+        """Store ``rows`` for ``sql`` under ``scope``. Returns True if cached."""
+        if not self.enabled:
+            return False
+        freshness = self._freshness()
+        if freshness is None:
+            return False
+
+        try:
+            payload = json.dumps(rows, default=str, separators=(",", ":"))
+        except (TypeError, ValueError) as e:
+            logger.debug("athena_result_cache_serialize_failed", error=str(e))
+            return False
+        if len(payload) > self.max_entry_bytes:
+            return False
+
+        key = self.cache_key(sql, scope, freshness)
+        self._local_put(key, payload)
+        try:
+            cache = await get_cache_service()
+            await cache.set(key, payload, ttl_seconds=self.ttl_seconds)
+        except Exception as e:
+            logger.debug("athena_result_cache_set_failed", error=str(e))
+        return True
+
+
+# Module-level singleton
+athena_result_cache = AthenaResultCache()
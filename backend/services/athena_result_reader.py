@@ -0,0 +1,313 @@
+"""
+Streaming reader for Athena query results.
+
+Paging through ``get_query_results`` returns at most 1000 rows per call and
+every cell as a string, so large drill-downs and exports cost one API round
+trip per thousand rows plus per-cell type guessing. Athena already wrote the
+full result as CSV to the query's ``OutputLocation``; this reader streams
+that object from S3 in batches instead.
+
+Column types come from the result-set metadata (``ColumnInfo.Type``), not
+from sniffing the values. Rows are produced by async generators, so export
+endpoints can forward them without holding the whole result in memory.
+
+If the S3 object cannot be read (e.g. missing ``s3:GetObject`` on the
+results bucket), the reader falls back to paginating ``get_query_results``
+with the same typing.
+"""
+
+import asyncio
+import codecs
+import contextlib
+import csv
+import functools
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
+
+import structlog
+
+from backend.config.settings import get_settings
+from backend.services.athena_client import AsyncAthenaClient, get_async_athena_client
+from backend.services.query_result import ColumnarResult
+from backend.utils.aws_session import get_aws_client, get_default_retry_config
+from backend.utils.aws_constants import AwsService
+
+logger = structlog.get_logger(__name__)
+
+_INTEGER_TYPES = {"tinyint", "smallint", "integer", "int", "bigint"}
+_FLOAT_TYPES = {"double", "float", "real", "decimal"}
+
+
+@dataclass(frozen=True)
+class ResultColumn:
+    """Name and Athena type of one result column."""
+
+    name: str
+    type: str
+
+
+def _to_int(value: str) -> Optional[int]:
+    return int(value) if value != "" else None
+
+
+def _to_float(value: str) -> Optional[float]:
+    return float(value) if value != "" else None
+
+
+def _to_bool(value: str) -> Optional[bool]:
+    return value.lower() == "true" if value != "" else None
+
+
+def _identity(value: str) -> str:
+    return value
+
+
+def column_converter(athena_type: str) -> Callable[[str], Any]:
+    """Converter from the CSV text of a cell to its Python value."""
+    base = (athena_type or "varchar").lower().split("(")[0].strip()
+    if base in _INTEGER_TYPES:
+        return _to_int
+    if base in _FLOAT_TYPES:
+        return _to_float
+    if base == "boolean":
+        return _to_bool
+    # varchar/char/date/timestamp/json/arrays stay as text
+    return _identity
+
+
+def columns_from_metadata(result_set_metadata: Dict[str, Any]) -> List[ResultColumn]:
+    """Columns from a ``ResultSetMetadata`` block."""
+    return [
+        ResultColumn(name=info.get("Name") or info.get("Label", ""), type=info.get("Type", "varchar"))
+        for info in result_set_metadata.get("ColumnInfo", [])
+    ]
+
+
+def _split_s3_uri(uri: str) -> Tuple[str, str]:
+    if not uri.startswith("s3://"):
+        raise ValueError(f"Not an S3 URI: {uri}")
+    bucket, _, key = uri[len("s3://"):].partition("/")
+    return bucket, key
+
+
+# Stands in for SQL NULL between _mark_nulls() and the column converters
+_NULL = "\x00"
+
+
+def _mark_null_fields(line: str, at_start: bool, at_end: bool) -> str:
+    """Put ``_NULL`` in the empty fields of an unquoted stretch of a CSV line."""
+    body = line.rstrip("\r\n")
+    newline = line[len(body):]
+    # Twice, because str.replace does not see overlapping ",,," matches
+    body = body.replace(",,", "," + _NULL + ",").replace(",,", "," + _NULL + ",")
+    if at_start and (body.startswith(",") or (at_end and body == "")):
+        # Leading NULL, or a blank line: the row of a single NULL column
+        body = _NULL + body
+    if at_end and body.endswith(","):
+        body += _NULL
+    return body + newline
+
+
+def _mark_nulls(lines: Iterator[str]) -> Iterator[str]:
+    """
+    Tell SQL NULLs from empty strings in Athena's CSV output.
+
+    Athena quotes every non-NULL value (``""`` is an empty string) and writes
+    NULL as an empty unquoted field, which ``csv.reader`` would also read as
+    ``""`` on Python < 3.12. Only text outside quotes is rewritten, tracking
+    quote parity across the physical lines of multi-line values.
+    """
+    in_quotes = False
+    for line in lines:
+        parts = line.split('"')
+        last = len(parts) - 1
+        for i in range(0 if not in_quotes else 1, len(parts), 2):
+            parts[i] = _mark_null_fields(parts[i], at_start=i == 0, at_end=i == last)
+        if last % 2:
+            in_quotes = not in_quotes
+        yield '"'.join(parts)
+
+
+def _read_csv_batch(reader, batch_rows: int) -> List[List[str]]:
+    batch = []
+    for row in reader:
+        batch.append(row)
+        if len(batch) >= batch_rows:
+            break
+    return batch
+
+
+class AthenaResultReader:
+    """Stream typed rows of a finished Athena query."""
+
+    def __init__(
+        self,
+        athena: Optional[AsyncAthenaClient] = None,
+        s3_client: Optional[Any] = None,
+        batch_rows: Optional[int] = None,
+    ):
+        self._athena = athena
+        self._s3_client = s3_client
+        self.batch_rows = batch_rows or get_settings().athena_result_stream_batch_rows
+
+    @property
+    def athena(self) -> AsyncAthenaClient:
+        if self._athena is None:
+            self._athena = get_async_athena_client()
+        return self._athena
+
+    @property
+    def s3_client(self) -> Any:
+        if self._s3_client is None:
+            self._s3_client = get_aws_client(
+                AwsService.S3, config=get_default_retry_config(max_attempts=3, mode="adaptive")
+            )
+        return self._s3_client
+
+    async def describe(self, query_execution_id: str) -> Tuple[List[ResultColumn], Optional[str]]:
+        """Result columns and the S3 ``OutputLocation`` of a finished query."""
+        execution, first_page = await asyncio.gather(
+            self.athena.get_query_execution(query_execution_id),
+            self.athena.get_query_results(query_execution_id, max_results=1),
+        )
+        location = (
+            execution.get("QueryExecution", {}).get("ResultConfiguration", {}).get("OutputLocation")
+        )
+        columns = columns_from_metadata(first_page.get("ResultSet", {}).get("ResultSetMetadata", {}))
+        return columns, location
+
+    async def iter_batches(
+        self, query_execution_id: str, batch_rows: Optional[int] = None
+    ) -> AsyncIterator[Tuple[List[ResultColumn], List[List[Any]]]]:
+        """
+        Yield ``(columns, rows)`` batches, each row a list of typed values.
+
+        An empty result still yields one empty batch, so callers always get
+        the columns (e.g. for a CSV header).
+
+        Streams the CSV output from S3; falls back to ``get_query_results``
+        paging if S3 fails before the first batch.
+        """
+        batch_rows = batch_rows or self.batch_rows
+        columns, location = await self.describe(query_execution_id)
+        yielded = False
+        try:
+            if not location:
+                raise ValueError("query has no OutputLocation")
+            async for rows in self._iter_s3_batches(location, columns, batch_rows):
+                yielded = True
+                yield columns, rows
+            if not yielded:
+                yield columns, []
+            return
+        except Exception as e:
+            if yielded:
+                raise
+            logger.warning(
+                "athena_result_s3_stream_failed",
+                query_execution_id=query_execution_id,
+                error=str(e),
+            )
+
+        async for rows in self._iter_api_batches(query_execution_id, columns):
+            yielded = True
+            yield columns, rows
+        if not yielded:
+            yield columns, []
+
+    async def _iter_s3_batches(
+        self, location: str, columns: List[ResultColumn], batch_rows: int
+    ) -> AsyncIterator[List[List[Any]]]:
+        bucket, key = _split_s3_uri(location)
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(
+            None, functools.partial(self.s3_client.get_object, Bucket=bucket, Key=key)
+        )
+        body = response["Body"]
+        converters = [column_converter(c.type) for c in columns]
+        try:
+            reader = csv.reader(_mark_nulls(codecs.getreader("utf-8")(body)))
+            # First CSV line is the header
+            await loop.run_in_executor(None, next, reader, None)
+            while True:
+                raw = await loop.run_in_executor(None, _read_csv_batch, reader, batch_rows)
+                if not raw:
+                    break
+                yield [
+                    [None if v == _NULL else convert(v) for convert, v in zip(converters, row)]
+                    for row in raw
+                ]
+        finally:
+            body.close()
+
+    async def _iter_api_batches(
+        self, query_execution_id: str, columns: List[ResultColumn]
+    ) -> AsyncIterator[List[List[Any]]]:
+        converters = [column_converter(c.type) for c in columns]
+        next_token = None
+        header_skipped = False
+        while True:
+            page = await self.athena.get_query_results(query_execution_id, next_token=next_token)
+            rows = page["ResultSet"]["Rows"]
+            if not header_skipped:
+                rows = rows[1:]
+                header_skipped = True
+            if rows:
+                yield [
+                    [
+                        convert(cell["VarCharValue"]) if "VarCharValue" in cell else None
+                        for convert, cell in zip(converters, row.get("Data", []))
+                    ]
+                    for row in rows
+                ]
+            next_token = page.get("NextToken")
+            if not next_token:
+                break
+
+    async def iter_rows(self, query_execution_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """Yield one ``{column: value}`` dict per row."""
+        async for columns, rows in self.iter_batches(query_execution_id):
+            names = [c.name for c in columns]
+            for row in rows:
+                yield dict(zip(names, row))
+
+    async def read_all(
+        self, query_execution_id: str, max_rows: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """All rows as dicts, stopping after ``max_rows`` (default from settings)."""
+        max_rows = max_rows or get_settings().athena_result_max_rows
+        results: List[Dict[str, Any]] = []
+        async with contextlib.aclosing(self.iter_rows(query_execution_id)) as rows:
+            async for row in rows:
+                if len(results) >= max_rows:
+                    logger.warning(
+                        "athena_result_truncated",
+                        query_execution_id=query_execution_id,
+                        max_rows=max_rows,
+                    )
+                    break
+                results.append(row)
+        return results
+
+    async def read_columnar(
+        self, query_execution_id: str, max_rows: Optional[int] = None
+    ) -> ColumnarResult:
+        """All rows as a ``ColumnarResult``, without building per-row dicts."""
+        max_rows = max_rows or get_settings().athena_result_max_rows
+        names: List[str] = []
+        batches: List[List[List[Any]]] = []
+        remaining = max_rows
+        async with contextlib.aclosing(self.iter_batches(query_execution_id)) as stream:
+            async for columns, rows in stream:
+                names = [c.name for c in columns]
+                if len(rows) > remaining:
+                    batches.append(rows[:remaining])
+                    logger.warning(
+                        "athena_result_truncated",
+                        query_execution_id=query_execution_id,
+                        max_rows=max_rows,
+                    )
+                    break
+                batches.append(rows)
+                remaining -= len(rows)
+        return ColumnarResult.from_batches(names, batches)
@@ -6,7 +6,7 @@ Uses Valkey (Redis-compatible) as the backing store.
 """
 
 import hashlib
-from typing import Optional, Any
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 
 import structlog
@@ -45,6 +45,7 @@ class CacheService:
         """Initialize cache service (connection created on first use)"""
         self._settings = get_settings()
         self._available = VALKEY_AVAILABLE
+        self._scripts: Dict[str, Any] = {}
 
     @classmethod
     async def get_instance(cls) -> "CacheService":
@@ -297,6 +298,25 @@ class CacheService:
             logger.error("cache_get_failed", key=key, error=str(e))
             return None
 
+    async def get_many(self, keys: List[str]) -> List[Optional[str]]:
+        """
+        Get several cache values in one round trip (MGET).
+
+        Returns a value (or None) per key. Unlike ``get``, raises
+        ConnectionError when the cache is unavailable or the MGET fails, so
+        callers can tell missing keys from an outage.
+        """
+        if not keys:
+            return []
+        if self._client is None:
+            raise ConnectionError("cache not connected")
+
+        try:
+            return list(await self._client.mget(keys))
+        except Exception as e:
+            logger.error("cache_mget_failed", keys=len(keys), error=str(e))
+            raise ConnectionError(f"cache MGET failed: {e}") from e
+
     async def delete(self, key: str) -> bool:
         """
         Delete a cache value.
@@ -345,6 +365,28 @@ class CacheService:
             logger.error("cache_incr_failed", key=key, error=str(e))
             return None
 
+    async def eval_script(self, script: str, keys: List[str], args: List[Any]) -> Optional[Any]:
+        """
+        Run a Lua script atomically on the server.
+
+        Scripts are registered once per source and invoked with EVALSHA
+        (falling back to EVAL when the server's script cache was flushed).
+
+        Returns the script's reply, or None if the cache is unavailable.
+        """
+        if self._client is None:
+            return None
+
+        try:
+            registered = self._scripts.get(script)
+            if registered is None:
+                registered = self._client.register_script(script)
+                self._scripts[script] = registered
+            return await registered(keys=keys, args=args)
+        except Exception as e:
+            logger.error("cache_eval_failed", keys=keys, error=str(e))
+            return None
+
     async def ttl(self, key: str) -> Optional[int]:
         """
         Get remaining TTL on a key in seconds.
@@ -3,9 +3,11 @@ Chart Data Builder - Converts chart specifications into Chart.js-compatible data
 """
 
 from typing import Dict, List, Any, Optional
+import numpy as np
 import structlog
 
 from backend.services.column_constants import DIMENSION_VALUE, COST_USD
+from backend.services.query_result import ColumnarResult
 
 logger = structlog.get_logger(__name__)
 
@@ -56,6 +58,7 @@ class ChartDataBuilder:
                 data_count=len(data_results) if data_results else 0
             )
             return []
+        data_results = ColumnarResult.from_rows(data_results)
         
         logger.info(
             "Building charts",
@@ -302,28 +305,34 @@ class ChartDataBuilder:
         else:
             # Single series line chart - aggregate by x_field if there are duplicates
             # This handles cases where data has multiple rows per x-value (e.g., multiple services per month)
-            aggregated = {}
-            for row in data:
-                # Defensive check: verify fields exist
-                x_val = row.get(x_field)
-                y_val = row.get(y_field)
+            table = ColumnarResult.from_rows(data)
+            if table.is_numeric(y_field):
+                # Keep raw x values (as str) for accurate chronological sorting.
+                raw_labels, values = table.group_sum(x_field, y_field)
+                sorted_items = list(zip(raw_labels, values))
+            else:
+                aggregated = {}
+                for row in data:
+                    # Defensive check: verify fields exist
+                    x_val = row.get(x_field)
+                    y_val = row.get(y_field)
+                    
+                    if x_val is None or y_val is None:
+                        logger.warning(
+                            f"Missing chart field in row: x_field={x_field} (value={x_val}), "
+                            f"y_field={y_field} (value={y_val}), available_keys={list(row.keys())}"
+                        )
+                        continue  # Skip this row
+                    
+                    # Keep raw x values for accurate chronological sorting.
+                    raw_x = str(x_val)
+                    if raw_x in aggregated:
+                        aggregated[raw_x] += y_val
+                    else:
+                        aggregated[raw_x] = y_val
                 
-                if x_val is None or y_val is None:
-                    logger.warning(
-                        f"Missing chart field in row: x_field={x_field} (value={x_val}), "
-                        f"y_field={y_field} (value={y_val}), available_keys={list(row.keys())}"
-                    )
-                    continue  # Skip this row
-                
-                # Keep raw x values for accurate chronological sorting.
-                raw_x = str(x_val)
-                if raw_x in aggregated:
-                    aggregated[raw_x] += y_val
-                else:
-                    aggregated[raw_x] = y_val
-            
-            # Sort by x_field (important for time series)
-            sorted_items = sorted(aggregated.items(), key=lambda x: x[0])
+                # Sort by x_field (important for time series)
+                sorted_items = sorted(aggregated.items(), key=lambda x: x[0])
             labels = [self._format_chart_label(item[0], x_field) for item in sorted_items]
             values = [item[1] for item in sorted_items]
             
@@ -379,19 +388,17 @@ class ChartDataBuilder:
     ) -> Dict[str, Any]:
         """Build bar/column chart with smart aggregation based on query intent"""
         
-        # First, extract and convert all values
-        items = []
-        for row in data:
-            label = str(row.get(x_field, ""))
-            val = row.get(y_field, 0)
-            try:
-                value = float(val) if val is not None else 0
-            except (ValueError, TypeError):
-                value = 0
-            items.append({"label": label, "value": value})
+        # Extract labels/values column-wise and order by value descending
+        # (highest cost first); rows are only materialized for what is shown
+        table = ColumnarResult.from_rows(data)
+        order = table.order_desc(y_field)
+        all_labels = table.text(x_field)
+        all_values = np.nan_to_num(table.numeric(y_field), nan=0.0)
         
-        # Sort by value descending (highest cost first)
-        items.sort(key=lambda x: x["value"], reverse=True)
+        def _items(positions) -> List[Dict[str, Any]]:
+            return [{"label": all_labels[i], "value": float(all_values[i])} for i in positions]
+        
+        item_count = len(order)
         
         # Determine if this is a breakdown/drill-down query (user wants details)
         is_breakdown_query = False
@@ -414,23 +421,23 @@ class ChartDataBuilder:
         # Smart aggregation logic:
         # - For breakdown queries: Show up to 15 items (no "Others" aggregation)
         # - For top-level queries AND service breakdowns: Show top 5 + "Others" for clarity
-        should_aggregate = not is_breakdown_query and len(items) > 5
+        should_aggregate = not is_breakdown_query and item_count > 5
         
         if should_aggregate:
             # Top-level query: aggregate to top 5 + "Others"
-            top_5 = items[:5]
-            others_items = items[5:]
-            others_sum = sum(item["value"] for item in others_items)
-            others_count = len(others_items)
+            top_5 = _items(order[:5])
+            others_sum = float(all_values[order[5:]].sum())
+            others_count = item_count - 5
             
             # Track hidden items in conversation context for drill-down
             if conv_context:
+                others_items = _items(order[5:])
                 conv_context.last_shown_top_items = [item["label"] for item in top_5]
                 conv_context.last_hidden_items = others_items
                 conv_context.last_chart_aggregated = True
                 logger.info(
                     "Stored hidden items in conversation context for potential drill-down",
-                    hidden_count=len(others_items)
+                    hidden_count=others_count
                 )
             
             # Add "Others" as 6th item
@@ -441,14 +448,14 @@ class ChartDataBuilder:
             
             logger.info(
                 "BAR CHART: Aggregating for cleaner UI (top-level query)",
-                total_items=len(items),
+                total_items=item_count,
                 showing_top=5,
                 others_count=others_count,
                 others_total=round(others_sum, 2)
             )
-        elif is_breakdown_query and len(items) > 15:
+        elif is_breakdown_query and item_count > 15:
             # Breakdown query with too many items: show top 15 (no "Others")
-            items = items[:15]
+            items = _items(order[:15])
             labels = [item["label"] for item in items]
             values = [item["value"] for item in items]
             
@@ -464,6 +471,7 @@ class ChartDataBuilder:
             )
         else:
             # Show all items (breakdown query with reasonable count, or <= 5 items)
+            items = _items(order)
             labels = [item["label"] for item in items]
             values = [item["value"] for item in items]
             
@@ -737,14 +745,11 @@ class ChartDataBuilder:
         data: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Build pie chart"""
+        # Limit to top 10 for readability
+        data = data[:10]
         labels = [str(row.get(x_field, "")) for row in data]
         values = [row.get(y_field, 0) for row in data]
         
-        # Limit to top 10 for readability
-        if len(labels) > 10:
-            labels = labels[:10]
-            values = values[:10]
-        
         colors = [self.color_palette[i % len(self.color_palette)] for i in range(len(labels))]
         
         return {
@@ -6,6 +6,8 @@ Recommends 1-2 appropriate chart types with specifications
 from typing import Dict, List, Any, Optional
 import structlog
 
+from backend.services.query_result import ColumnarResult
+
 logger = structlog.get_logger(__name__)
 
 
@@ -141,6 +143,7 @@ class ChartRecommendationEngine:
         """
         if not data_results:
             return []
+        data_results = ColumnarResult.from_rows(data_results)
         
         # Check if user explicitly doesn't want charts
         if any(phrase in query.lower() for phrase in ["no chart", "no graph", "text only"]):
@@ -281,8 +284,7 @@ class ChartRecommendationEngine:
         for col in grouping_cols:
             if col in sample:
                 # Check if values repeat (indicating grouping)
-                values = set(r.get(col) for r in data_results)
-                if len(values) < len(data_results):
+                if ColumnarResult.from_rows(data_results).nunique(col) < len(data_results):
                     return True
         
         return False
@@ -0,0 +1,97 @@
+"""
+Progress events for the streaming chat endpoint.
+
+``/chat/stream`` runs the agent workflow as a task with a
+``ChatStreamEmitter`` bound in a context variable. Code anywhere below it
+(SQL generation, Athena polling, chart building, Bedrock token streams)
+calls ``emit_event()`` to push an event to the client as soon as it
+happens; with no emitter bound (``/chat``, scheduled reports, tests) the
+call is a no-op, so non-streaming callers are unaffected.
+
+Event types:
+
+- ``status``  – pipeline progress (``stage`` plus a human-readable message)
+- ``token``   – a Bedrock ``converse_stream`` text delta
+- ``results`` – table preview as soon as query rows exist
+- ``charts``  – Chart.js payloads as soon as they are built
+
+Time to the first frame of each event type is exported as the
+``chat_stream_ttfb_seconds`` histogram on ``/metrics``.
+"""
+
+import asyncio
+import contextlib
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+
+import structlog
+from prometheus_client import Histogram
+
+logger = structlog.get_logger(__name__)
+
+chat_stream_ttfb = Histogram(
+    "chat_stream_ttfb_seconds",
+    "Time from /chat/stream request to the first frame of each event type",
+    labelnames=["event"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2, 4, 8, 15, 30, 60),
+)
+
+Event = Tuple[str, Dict[str, Any]]
+
+_current_emitter: ContextVar[Optional["ChatStreamEmitter"]] = ContextVar(
+    "chat_stream_emitter", default=None
+)
+
+
+class ChatStreamEmitter:
+    """Queue of events produced by one streaming chat request."""
+
+    def __init__(self):
+        self._queue: "asyncio.Queue[Event]" = asyncio.Queue()
+        self._loop = asyncio.get_running_loop()
+
+    def emit(self, event_type: str, **payload: Any) -> None:
+        self._queue.put_nowait((event_type, payload))
+
+    def emit_threadsafe(self, event_type: str, **payload: Any) -> None:
+        """``emit`` from a worker thread (e.g. a Bedrock event-stream reader)."""
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, (event_type, payload))
+
+    async def events_until(self, task: "asyncio.Future[Any]") -> AsyncIterator[Event]:
+        """Yield events as they arrive until ``task`` finishes and the queue is drained."""
+        while True:
+            if task.done():
+                while not self._queue.empty():
+                    yield self._queue.get_nowait()
+                return
+            getter = asyncio.ensure_future(self._queue.get())
+            await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                yield getter.result()
+            else:
+                getter.cancel()
+
+
+@contextlib.contextmanager
+def bind_emitter(emitter: ChatStreamEmitter) -> Iterator[ChatStreamEmitter]:
+    """Make ``emitter`` current for code (and tasks) started inside the block."""
+    token = _current_emitter.set(emitter)
+    try:
+        yield emitter
+    finally:
+        _current_emitter.reset(token)
+
+
+def current_emitter() -> Optional[ChatStreamEmitter]:
+    return _current_emitter.get()
+
+
+def emit_event(event_type: str, **payload: Any) -> None:
+    """Push an event to the current stream, if any. Never raises."""
+    emitter = _current_emitter.get()
+    if emitter is None:
+        return
+    try:
+        emitter.emit(event_type, **payload)
+    except Exception as e:
+        logger.debug("chat_stream_emit_failed", event_type=event_type, error=str(e))
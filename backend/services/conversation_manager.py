@@ -14,7 +14,8 @@ Tables (from Alembic migrations):
 
 Notes:
 - Uses psycopg2 connection pooling for efficiency
-- Intentionally synchronous; FastAPI should run these in a threadpool if used in hot paths
+- Intentionally synchronous; FastAPI should run these in a threadpool if used in hot paths.
+  The /chat hot path uses the asyncio-native services/conversation_store.py instead.
 - Provides small, well-scoped transactions with proper error handling
 """
 
@@ -114,6 +115,121 @@ _OWNED_THREAD = (
 )
 
 
+def build_query_context(
+    intents: List[Dict[str, Any]],
+    messages: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """
+    Follow-up context from a thread's recent intents and messages (both newest
+    first): merged filters plus conversation history for the intent classifier.
+    """
+    context: Dict[str, Any] = {
+        "time_range": None,  # Changed from date_range to time_range for consistency with multi_agent_workflow
+        "services": [],
+        "regions": [],
+        "accounts": [],
+        "tags": {},
+        "exclude_line_item_types": None,
+        "include_line_item_types": None,
+        "purchase_options": None,
+        "platforms": None,
+        "database_engines": None,
+        "drill_level": 0,
+        "conversation_history": [],  # Add for intent classifier follow-up detection
+        "last_intent": None,  # Add for intent classifier follow-up detection
+        "last_query": None,  # Add for intent classifier context
+    }
+
+    def _merge_dims(dims: Dict[str, Any]):
+        if not dims:
+            return
+        tr = dims.get("time_range") or dims.get("date_range")
+        if tr and not context["time_range"]:
+            # CRITICAL FIX: Ensure time_range is a dict, not a JSON string (can happen from nested serialization)
+            if isinstance(tr, str):
+                try:
+                    context["time_range"] = json.loads(tr)
+                    logger.warning("Deserialized time_range from JSON string in context merge")
+                except:
+                    logger.error(f"Failed to parse time_range string from context: {tr[:100]}")
+                    context["time_range"] = {}
+            elif isinstance(tr, dict):
+                context["time_range"] = tr
+            else:
+                context["time_range"] = {}
+        for key in ("services", "regions", "accounts"):
+            vals = dims.get(key)
+            if vals:
+                existing = set(context[key])
+                for v in vals:
+                    if v not in existing:
+                        context[key].append(v)
+                        existing.add(v)
+        tag_filters = dims.get("tags") or {}
+        if tag_filters:
+            target_tag_dict = context.setdefault("tags", {})
+            for tag_key, tag_values in tag_filters.items():
+                normalized_values = tag_values if isinstance(tag_values, list) else [tag_values]
+                merged_values = set(target_tag_dict.get(tag_key, []))
+                for val in normalized_values:
+                    if val not in merged_values:
+                        merged_values.add(val)
+                target_tag_dict[tag_key] = list(merged_values)
+
+        for advanced_key in (
+            "exclude_line_item_types",
+            "include_line_item_types",
+            "purchase_options",
+            "platforms",
+            "database_engines",
+        ):
+            adv_vals = dims.get(advanced_key)
+            if not adv_vals:
+                continue
+            if isinstance(adv_vals, list):
+                existing_vals = set(context.get(advanced_key) or [])
+                for val in adv_vals:
+                    if val not in existing_vals:
+                        existing_vals.add(val)
+                context[advanced_key] = list(existing_vals)
+            else:
+                context[advanced_key] = adv_vals
+        dims_list = dims.get("dimensions") or []
+        if dims_list:
+            context["drill_level"] = max(context["drill_level"], len(dims_list))
+
+    for rec in intents:
+        _merge_dims(rec.get("extracted_dimensions") or {})
+
+    # Always check messages for additional dimensions (not just as fallback)
+    for msg in messages:
+        md = msg.get("metadata") or {}
+        _merge_dims(md.get("extracted_dimensions") or md)
+    
+    # Build conversation_history for intent classifier
+    # Include last 10 messages in chronological order
+    recent_msgs = sorted(messages[:10], key=lambda m: m.get("ordering_index", 0))
+    for msg in recent_msgs:
+        context["conversation_history"].append({
+            "role": msg.get("role", "user"),
+            "content": msg.get("content", "")
+        })
+    
+    # Get last intent and query from most recent intent record
+    if intents:
+        latest_intent = intents[0]
+        context["last_intent"] = latest_intent.get("intent_type")
+        # Try to find the corresponding user message
+        if messages:
+            # Find most recent user message
+            for msg in messages:
+                if msg.get("role") == "user":
+                    context["last_query"] = msg.get("content", "")
+                    break
+
+    return context
+
+
 class ConversationManager:
     """Thread-aware conversation persistence and context extraction."""
 
@@ -349,112 +465,7 @@ class ConversationManager:
     def get_context_for_query(self, thread_id: str, user_id: str) -> Dict[str, Any]:
         intents = self._fetch_recent_intents(thread_id, user_id, limit=25)
         messages = self._fetch_recent_messages(thread_id, user_id, limit=20)
-
-        context: Dict[str, Any] = {
-            "time_range": None,  # Changed from date_range to time_range for consistency with multi_agent_workflow
-            "services": [],
-            "regions": [],
-            "accounts": [],
-            "tags": {},
-            "exclude_line_item_types": None,
-            "include_line_item_types": None,
-            "purchase_options": None,
-            "platforms": None,
-            "database_engines": None,
-            "drill_level": 0,
-            "conversation_history": [],  # Add for intent classifier follow-up detection
-            "last_intent": None,  # Add for intent classifier follow-up detection
-            "last_query": None,  # Add for intent classifier context
-        }
-
-        def _merge_dims(dims: Dict[str, Any]):
-            if not dims:
-                return
-            tr = dims.get("time_range") or dims.get("date_range")
-            if tr and not context["time_range"]:
-                # CRITICAL FIX: Ensure time_range is a dict, not a JSON string (can happen from nested serialization)
-                if isinstance(tr, str):
-                    try:
-                        context["time_range"] = json.loads(tr)
-                        logger.warning("Deserialized time_range from JSON string in context merge")
-                    except:
-                        logger.error(f"Failed to parse time_range string from context: {tr[:100]}")
-                        context["time_range"] = {}
-                elif isinstance(tr, dict):
-                    context["time_range"] = tr
-                else:
-                    context["time_range"] = {}
-            for key in ("services", "regions", "accounts"):
-                vals = dims.get(key)
-                if vals:
-                    existing = set(context[key])
-                    for v in vals:
-                        if v not in existing:
-                            context[key].append(v)
-                            existing.add(v)
-            tag_filters = dims.get("tags") or {}
-            if tag_filters:
-                target_tag_dict = context.setdefault("tags", {})
-                for tag_key, tag_values in tag_filters.items():
-                    normalized_values = tag_values if isinstance(tag_values, list) else [tag_values]
-                    merged_values = set(target_tag_dict.get(tag_key, []))
-                    for val in normalized_values:
-                        if val not in merged_values:
-                            merged_values.add(val)
-                    target_tag_dict[tag_key] = list(merged_values)
-
-            for advanced_key in (
-                "exclude_line_item_types",
-                "include_line_item_types",
-                "purchase_options",
-                "platforms",
-                "database_engines",
-            ):
-                adv_vals = dims.get(advanced_key)
-                if not adv_vals:
-                    continue
-                if isinstance(adv_vals, list):
-                    existing_vals = set(context.get(advanced_key) or [])
-                    for val in adv_vals:
-                        if val not in existing_vals:
-                            existing_vals.add(val)
-                    context[advanced_key] = list(existing_vals)
-                else:
-                    context[advanced_key] = adv_vals
-            dims_list = dims.get("dimensions") or []
-            if dims_list:
-                context["drill_level"] = max(context["drill_level"], len(dims_list))
-
-        for rec in intents:
-            _merge_dims(rec.get("extracted_dimensions") or {})
-
-        # Always check messages for additional dimensions (not just as fallback)
-        for msg in messages:
-            md = msg.get("metadata") or {}
-            _merge_dims(md.get("extracted_dimensions") or md)
-        
-        # Build conversation_history for intent classifier
-        # Include last 10 messages in chronological order
-        recent_msgs = sorted(messages[:10], key=lambda m: m.get("ordering_index", 0))
-        for msg in recent_msgs:
-            context["conversation_history"].append({
-                "role": msg.get("role", "user"),
-                "content": msg.get("content", "")
-            })
-        
-        # Get last intent and query from most recent intent record
-        if intents:
-            latest_intent = intents[0]
-            context["last_intent"] = latest_intent.get("intent_type")
-            # Try to find the corresponding user message
-            if messages:
-                # Find most recent user message
-                for msg in messages:
-                    if msg.get("role") == "user":
-                        context["last_query"] = msg.get("content", "")
-                        break
-
-        return context
+        return build_query_context(intents, messages)
 
     def _fetch_recent_intents(self, thread_id: str, user_id: str, limit: int) -> List[Dict[str, Any]]:
         sql = (
@@ -0,0 +1,682 @@
+"""
+Asyncio-native conversation persistence for the chat hot path.
+
+``ConversationManager`` (psycopg2, synchronous) costs the ``/chat`` handler
+several blocking round trips per turn on the event loop. This store covers
+the same tables on the shared SQLAlchemy async engine from
+services/database.py:
+
+- ``write_records()`` persists messages, query intents and agent executions
+  for any number of threads in one transaction: one statement that locks
+  and ownership-checks the threads, then one multi-row INSERT per table.
+  Record ids are generated client-side, so an intent or execution can
+  reference a message written in the same batch.
+- ``get_context_for_query()`` fetches recent intents and messages in a
+  single ``UNION ALL`` query (replacing ``_fetch_recent_intents`` plus
+  ``_fetch_recent_messages``) and merges them with the same
+  ``build_query_context()`` as ``ConversationManager``.
+
+- Writes from request handlers go through ``enqueue()``. With the
+  write-behind buffer enabled (``conversation_write_buffer_enabled``), records
+  from many requests are coalesced and flushed via ``write_records()`` when
+  ``conversation_write_buffer_max_batch`` records are pending or every
+  ``conversation_write_buffer_flush_interval_ms``. Reads overlay records that
+  are still pending or in flight, so a thread always sees its own writes.
+  When ``conversation_write_buffer_max_pending`` is reached, ``enqueue()``
+  waits for the flusher (backpressure) instead of growing without bound; a
+  batch that keeps failing is dropped after ``_MAX_FLUSH_ATTEMPTS``. The
+  lifespan in main.py flushes the buffer on shutdown.
+
+Ownership (HIGH-14) is enforced as in ``ConversationManager``: writes lock
+the owning ``conversation_threads`` rows and raise ``PermissionError`` for
+threads the caller does not own; reads join through ``conversation_threads``
+and return nothing for non-owners.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import structlog
+from prometheus_client import Counter, Histogram
+from sqlalchemy import text
+
+from backend.config.settings import get_settings
+from backend.services.conversation_manager import build_query_context
+from backend.services.database import DatabaseService, get_database_service
+
+logger = structlog.get_logger(__name__)
+
+conversation_write_buffer_records = Counter(
+    "conversation_write_buffer_records_total",
+    "Conversation records leaving the write-behind buffer by outcome",
+    labelnames=["outcome"],
+)
+conversation_write_buffer_batch_size = Histogram(
+    "conversation_write_buffer_batch_size",
+    "Records per write-behind flush",
+    buckets=(1, 2, 5, 10, 25, 50, 100, 200, 500, 1000),
+)
+conversation_write_buffer_backpressure = Counter(
+    "conversation_write_buffer_backpressure_total",
+    "Enqueues that waited for the flusher because the buffer was full",
+)
+
+_MAX_FLUSH_ATTEMPTS = 3
+
+
+def _new_id() -> str:
+    return str(uuid.uuid4())
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _dumps(obj: Any) -> str:
+    return json.dumps(obj, default=str)
+
+
+def _loads(value: Any, default: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return json.loads(value) if value else default
+        except Exception:
+            return default
+    return value if value is not None else default
+
+
+@dataclass
+class MessageRecord:
+    """A ``conversation_messages`` row (ordering_index is assigned on insert)."""
+
+    thread_id: str
+    user_id: str
+    role: str
+    content: str
+    message_type: str
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    id: str = field(default_factory=_new_id)
+    created_at: datetime = field(default_factory=_utcnow)
+
+
+@dataclass
+class IntentRecord:
+    """A ``query_intents`` row."""
+
+    thread_id: str
+    user_id: str
+    message_id: Optional[str]
+    original_query: str
+    rewritten_query: Optional[str]
+    intent_type: str
+    intent_confidence: float
+    extracted_dimensions: Dict[str, Any] = field(default_factory=dict)
+    id: str = field(default_factory=_new_id)
+    created_at: datetime = field(default_factory=_utcnow)
+
+    def __post_init__(self):
+        self.intent_confidence = max(0.0, min(1.0, float(self.intent_confidence)))
+
+
+@dataclass
+class ExecutionRecord:
+    """An ``agent_executions`` row."""
+
+    thread_id: str
+    user_id: str
+    agent_name: str
+    agent_type: str
+    input_query: str
+    output_response: Dict[str, Any] = field(default_factory=dict)
+    tools_used: List[str] = field(default_factory=list)
+    execution_time_ms: int = 0
+    status: str = "success"
+    error_message: Optional[str] = None
+    message_id: Optional[str] = None
+    id: str = field(default_factory=_new_id)
+    created_at: datetime = field(default_factory=_utcnow)
+
+
+ConversationRecord = Union[MessageRecord, IntentRecord, ExecutionRecord]
+
+
+def _values_clause(rows: Sequence[Sequence[Any]], casts: Sequence[str], prefix: str) -> Tuple[str, Dict[str, Any]]:
+    """``(v1, v2), (...)`` with one typed bind parameter per cell."""
+    params: Dict[str, Any] = {}
+    tuples = []
+    for i, row in enumerate(rows):
+        cells = []
+        for j, (value, cast) in enumerate(zip(row, casts)):
+            name = f"{prefix}{i}_{j}"
+            params[name] = value
+            cells.append(f"CAST(:{name} AS {cast})")
+        tuples.append(f"({', '.join(cells)})")
+    return ", ".join(tuples), params
+
+
+_MESSAGE_CASTS = ("UUID", "UUID", "TEXT", "TEXT", "TEXT", "JSONB", "INTEGER", "TIMESTAMPTZ")
+_INTENT_CASTS = ("UUID", "UUID", "UUID", "TEXT", "TEXT", "TEXT", "DOUBLE PRECISION", "JSONB", "TIMESTAMPTZ")
+_EXECUTION_CASTS = (
+    "UUID", "UUID", "UUID", "TEXT", "TEXT", "TEXT", "JSONB", "JSONB", "INTEGER", "TEXT", "TEXT", "TIMESTAMPTZ",
+)
+
+
+def _message_insert(records: List[MessageRecord]) -> Tuple[str, Dict[str, Any]]:
+    # ordering_index continues each thread's sequence; the batch position
+    # within the thread (seq) keeps several new messages in order
+    seq: Dict[str, int] = {}
+    rows = []
+    for r in records:
+        seq[r.thread_id] = seq.get(r.thread_id, 0) + 1
+        rows.append((
+            r.id, r.thread_id, r.role, r.content, r.message_type, _dumps(r.metadata or {}),
+            seq[r.thread_id], r.created_at,
+        ))
+    values, params = _values_clause(rows, _MESSAGE_CASTS, "m")
+    sql = (
+        "INSERT INTO conversation_messages "
+        "(id, thread_id, role, content, message_type, metadata, ordering_index, created_at) "
+        "SELECT v.id, v.thread_id, v.role, v.content, v.message_type, v.metadata, "
+        "COALESCE((SELECT MAX(m.ordering_index) FROM conversation_messages m "
+        "WHERE m.thread_id = v.thread_id), 0) + v.seq, v.created_at "
+        f"FROM (VALUES {values}) AS v(id, thread_id, role, content, message_type, metadata, seq, created_at)"
+    )
+    return sql, params
+
+
+def _intent_insert(records: List[IntentRecord]) -> Tuple[str, Dict[str, Any]]:
+    rows = [
+        (
+            r.id, r.thread_id, r.message_id, r.original_query, r.rewritten_query, r.intent_type,
+            r.intent_confidence, _dumps(r.extracted_dimensions or {}), r.created_at,
+        )
+        for r in records
+    ]
+    values, params = _values_clause(rows, _INTENT_CASTS, "i")
+    sql = (
+        "INSERT INTO query_intents "
+        "(id, thread_id, message_id, original_query, rewritten_query, intent_type, "
+        "intent_confidence, extracted_dimensions, created_at) "
+        f"VALUES {values}"
+    )
+    return sql, params
+
+
+def _execution_insert(records: List[ExecutionRecord]) -> Tuple[str, Dict[str, Any]]:
+    rows = [
+        (
+            r.id, r.thread_id, r.message_id, r.agent_name, r.agent_type, r.input_query,
+            _dumps(r.output_response or {}), _dumps(r.tools_used or []), int(r.execution_time_ms),
+            r.status, r.error_message, r.created_at,
+        )
+        for r in records
+    ]
+    values, params = _values_clause(rows, _EXECUTION_CASTS, "e")
+    sql = (
+        "INSERT INTO agent_executions "
+        "(id, thread_id, message_id, agent_name, agent_type, input_query, output_response, "
+        "tools_used, execution_time_ms, status, error_message, created_at) "
+        f"VALUES {values}"
+    )
+    return sql, params
+
+
+_LOCK_THREADS_SQL = (
+    "SELECT CAST(thread_id AS TEXT) AS thread_id, user_id FROM conversation_threads "
+    "WHERE thread_id = ANY(CAST(:thread_ids AS UUID[])) ORDER BY thread_id FOR UPDATE"
+)
+
+_CONTEXT_SQL = """
+WITH owned AS (
+    SELECT thread_id FROM conversation_threads
+    WHERE thread_id = CAST(:thread_id AS UUID) AND user_id = :user_id
+)
+(SELECT 'intent' AS kind, CAST(qi.id AS TEXT) AS id, qi.intent_type, CAST(NULL AS TEXT) AS role, CAST(NULL AS TEXT) AS content,
+        qi.extracted_dimensions AS payload, CAST(NULL AS INTEGER) AS ordering_index, qi.created_at
+ FROM query_intents qi JOIN owned ON qi.thread_id = owned.thread_id
+ ORDER BY qi.created_at DESC LIMIT :intent_limit)
+UNION ALL
+(SELECT 'message', CAST(m.id AS TEXT), CAST(NULL AS TEXT), m.role, m.content,
+        m.metadata, m.ordering_index, m.created_at
+ FROM conversation_messages m JOIN owned ON m.thread_id = owned.thread_id
+ ORDER BY m.ordering_index DESC LIMIT :message_limit)
+"""
+
+
+class _UnwrittenRecords(Exception):
+    """Raised by ``ConversationWriteBuffer._write_batch`` when part of a batch was committed."""
+
+    def __init__(self, records: List["ConversationRecord"], cause: BaseException):
+        super().__init__(str(cause))
+        self.records = records
+
+
+class ConversationWriteBuffer:
+    """
+    Write-behind queue in front of ``AsyncConversationStore.write_records``.
+
+    A single flusher task (started on first enqueue) writes batches in
+    enqueue order, so messages keep their per-thread ordering.
+    """
+
+    def __init__(
+        self,
+        write,
+        max_batch: int = 200,
+        flush_interval_seconds: float = 0.25,
+        max_pending: int = 5000,
+    ):
+        self._write = write
+        self.max_batch = max(1, max_batch)
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_pending = max(self.max_batch, max_pending)
+        self._pending: List[ConversationRecord] = []
+        self._inflight: List[ConversationRecord] = []
+        self._attempts = 0
+        self._closing = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._room: Optional[asyncio.Condition] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+
+    def __len__(self) -> int:
+        return len(self._pending) + len(self._inflight)
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._room = asyncio.Condition()
+            self._flush_lock = asyncio.Lock()
+            self._task = None
+
+    def _ensure_flusher(self) -> None:
+        self._bind_loop()
+        if self._task is None or self._task.done():
+            self._task = self._loop.create_task(self._run())
+
+    async def enqueue(self, records: Iterable[ConversationRecord]) -> None:
+        records = list(records)
+        if not records:
+            return
+        self._ensure_flusher()
+        if len(self._pending) + len(records) > self.max_pending:
+            # Postgres is not keeping up: hold the caller until the flusher
+            # has drained (or dropped) enough to make room
+            conversation_write_buffer_backpressure.inc()
+            self._wakeup.set()
+            async with self._room:
+                await self._room.wait_for(
+                    lambda: not self._pending or len(self._pending) + len(records) <= self.max_pending
+                )
+        self._pending.extend(records)
+        if len(self._pending) >= self.max_batch:
+            self._wakeup.set()
+
+    def pending_for(self, thread_id: str, user_id: str) -> List[ConversationRecord]:
+        """Unflushed records of a thread written by ``user_id``, oldest first."""
+        return [
+            r for r in (*self._inflight, *self._pending)
+            if r.thread_id == thread_id and r.user_id == user_id
+        ]
+
+    async def _run(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            while self._pending and not self._closing:
+                if not await self._flush_batch():
+                    # Back off before retrying a failed batch
+                    await asyncio.sleep(self.flush_interval_seconds * (2 ** self._attempts))
+                    break
+                if len(self._pending) < self.max_batch:
+                    break
+
+    async def _flush_batch(self) -> bool:
+        async with self._flush_lock:
+            if not self._pending:
+                return True
+            batch = self._pending[:self.max_batch]
+            del self._pending[:len(batch)]
+            self._inflight = batch
+            try:
+                await self._write_batch(batch)
+                self._attempts = 0
+                conversation_write_buffer_batch_size.observe(len(batch))
+                conversation_write_buffer_records.labels(outcome="flushed").inc(len(batch))
+                return True
+            except Exception as e:
+                # Only records that were not committed go back on the queue;
+                # retrying committed ones would fail on their primary keys
+                unwritten = e.records if isinstance(e, _UnwrittenRecords) else batch
+                if len(unwritten) < len(batch):
+                    conversation_write_buffer_records.labels(outcome="flushed").inc(len(batch) - len(unwritten))
+                self._attempts += 1
+                if self._attempts >= _MAX_FLUSH_ATTEMPTS:
+                    logger.error(
+                        "Dropping conversation records after repeated flush failures",
+                        records=len(unwritten),
+                        attempts=self._attempts,
+                        error=str(e),
+                    )
+                    conversation_write_buffer_records.labels(outcome="dropped").inc(len(unwritten))
+                    self._attempts = 0
+                else:
+                    logger.warning("Conversation write-behind flush failed", records=len(unwritten), error=str(e))
+                    self._pending[:0] = unwritten
+                return False
+            finally:
+                self._inflight = []
+                async with self._room:
+                    self._room.notify_all()
+
+    async def _write_batch(self, batch: List[ConversationRecord]) -> None:
+        try:
+            await self._write(batch)
+        except PermissionError:
+            # One foreign thread rejects the whole transaction; retry per
+            # thread so other users' records are not lost with it
+            by_thread: Dict[str, List[ConversationRecord]] = {}
+            for record in batch:
+                by_thread.setdefault(record.thread_id, []).append(record)
+            unwritten: List[ConversationRecord] = []
+            error: Optional[Exception] = None
+            for thread_id, records in by_thread.items():
+                try:
+                    await self._write(records)
+                except PermissionError as e:
+                    logger.error("Rejected buffered conversation records", thread_id=thread_id, error=str(e))
+                    conversation_write_buffer_records.labels(outcome="rejected").inc(len(records))
+                except Exception as e:
+                    # Keep going: other threads' records can still be written
+                    unwritten.extend(records)
+                    error = e
+            if error is not None:
+                unwritten_ids = {id(r) for r in unwritten}
+                raise _UnwrittenRecords([r for r in batch if id(r) in unwritten_ids], error)
+
+    async def flush(self) -> None:
+        """Write everything pending now (drops batches that keep failing)."""
+        self._bind_loop()
+        while self._pending:
+            await self._flush_batch()
+
+    async def close(self) -> None:
+        """Stop the flusher task and flush what is left (application shutdown)."""
+        self._closing = True
+        try:
+            if self._task is not None and not self._task.done():
+                # Let the task finish its current batch rather than cancelling mid-write
+                self._wakeup.set()
+                await self._task
+            self._task = None
+            await self.flush()
+        finally:
+            self._closing = False
+
+
+class AsyncConversationStore:
+    """Conversation threads, messages, intents and executions on the async engine."""
+
+    def __init__(
+        self,
+        db: Optional[DatabaseService] = None,
+        write_buffer: Optional[ConversationWriteBuffer] = None,
+    ):
+        self._db = db
+        self.write_buffer = write_buffer
+
+    async def _engine(self):
+        if self._db is None:
+            self._db = await get_database_service()
+        elif self._db.engine is None:
+            await self._db.initialize()
+        return self._db.engine
+
+    # region Threads
+    async def create_thread(self, user_id: str, title: Optional[str] = None) -> str:
+        engine = await self._engine()
+        async with engine.begin() as conn:
+            result = await conn.execute(
+                text(
+                    "INSERT INTO conversation_threads (user_id, title, metadata) "
+                    "VALUES (:user_id, :title, CAST(:metadata AS JSONB)) RETURNING thread_id"
+                ),
+                {"user_id": user_id, "title": title, "metadata": "{}"},
+            )
+            return str(result.scalar())
+
+    async def get_thread_metadata(self, thread_id: str) -> Optional[Dict[str, Any]]:
+        """Thread row for ownership checks (unscoped by design, as in ConversationManager)."""
+        engine = await self._engine()
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                text(
+                    "SELECT CAST(thread_id AS TEXT) AS thread_id, user_id, title, metadata, "
+                    "created_at, updated_at, is_active "
+                    "FROM conversation_threads WHERE thread_id = CAST(:thread_id AS UUID)"
+                ),
+                {"thread_id": thread_id},
+            )
+            row = result.mappings().first()
+        if row is None:
+            return None
+        metadata = dict(row)
+        metadata["metadata"] = _loads(metadata.get("metadata"), {})
+        return metadata
+
+    # endregion
+
+    # region Writes
+    async def write_records(self, records: Iterable[ConversationRecord]) -> int:
+        """
+        Persist messages, intents and executions in one transaction.
+
+        Raises PermissionError (nothing written) if any record's user does
+        not own its thread. Returns the number of records written.
+        """
+        records = list(records)
+        if not records:
+            return 0
+        messages = [r for r in records if isinstance(r, MessageRecord)]
+        intents = [r for r in records if isinstance(r, IntentRecord)]
+        executions = [r for r in records if isinstance(r, ExecutionRecord)]
+        owners = {(r.thread_id, r.user_id) for r in records}
+        thread_ids = sorted({thread_id for thread_id, _ in owners})
+
+        engine = await self._engine()
+        async with engine.begin() as conn:
+            # HIGH-14 — lock the threads (ordering_index safety, as add_message)
+            # and verify ownership before any write
+            result = await conn.execute(text(_LOCK_THREADS_SQL), {"thread_ids": thread_ids})
+            owned_by = {str(row.thread_id): str(row.user_id) for row in result}
+            if any(owned_by.get(thread_id) != str(user_id) for thread_id, user_id in owners):
+                raise PermissionError(
+                    "HIGH-14: user_id does not own thread_id (or thread does not exist)"
+                )
+
+            for rows, build in (
+                (messages, _message_insert),
+                (intents, _intent_insert),
+                (executions, _execution_insert),
+            ):
+                if rows:
+                    sql, params = build(rows)
+                    await conn.execute(text(sql), params)
+
+        logger.debug(
+            "conversation_records_written",
+            threads=len(thread_ids),
+            messages=len(messages),
+            intents=len(intents),
+            executions=len(executions),
+        )
+        return len(records)
+
+    async def add_message(
+        self,
+        thread_id: str,
+        user_id: str,
+        role: str,
+        content: str,
+        message_type: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        record = MessageRecord(
+            thread_id=thread_id, user_id=user_id, role=role, content=content,
+            message_type=message_type, metadata=metadata or {},
+        )
+        await self.enqueue([record])
+        return record.id
+
+    async def enqueue(self, records: Iterable[ConversationRecord]) -> None:
+        """Write through the write-behind buffer when enabled, directly otherwise."""
+        if self.write_buffer is None:
+            await self.write_records(records)
+        else:
+            await self.write_buffer.enqueue(records)
+
+    async def close(self) -> None:
+        if self.write_buffer is not None:
+            await self.write_buffer.close()
+
+    # endregion
+
+    # region Reads
+    async def get_conversation_history(self, thread_id: str, user_id: str, limit: int = 10) -> List[Dict[str, Any]]:
+        engine = await self._engine()
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                text(
+                    "SELECT CAST(m.id AS TEXT) AS id, CAST(m.thread_id AS TEXT) AS thread_id, m.role, m.content, "
+                    "m.message_type, m.metadata, m.ordering_index, m.created_at, m.updated_at "
+                    "FROM conversation_messages m JOIN conversation_threads ct ON ct.thread_id = m.thread_id "
+                    "WHERE m.thread_id = CAST(:thread_id AS UUID) AND ct.user_id = :user_id "
+                    "ORDER BY m.ordering_index DESC LIMIT :limit"
+                ),
+                {"thread_id": thread_id, "user_id": user_id, "limit": limit},
+            )
+            rows = [dict(row) for row in result.mappings()]
+        rows.reverse()
+        for row in rows:
+            row["metadata"] = _loads(row.get("metadata"), {})
+        rows.extend(self._unflushed_messages(thread_id, user_id, rows))
+        return rows[-limit:] if limit else rows
+
+    def _unflushed_messages(
+        self, thread_id: str, user_id: str, stored: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Buffered messages not yet in ``stored``, numbered after its last ordering_index."""
+        if self.write_buffer is None:
+            return []
+        seen = {str(row.get("id")) for row in stored}
+        next_index = max((row.get("ordering_index") or 0 for row in stored), default=0)
+        unflushed = []
+        for r in self.write_buffer.pending_for(thread_id, user_id):
+            if isinstance(r, MessageRecord) and r.id not in seen:
+                next_index += 1
+                unflushed.append({
+                    "id": r.id,
+                    "thread_id": r.thread_id,
+                    "role": r.role,
+                    "content": r.content,
+                    "message_type": r.message_type,
+                    "metadata": r.metadata or {},
+                    "ordering_index": next_index,
+                    "created_at": r.created_at,
+                    "updated_at": r.created_at,
+                })
+        return unflushed
+
+    async def fetch_recent(
+        self, thread_id: str, user_id: str, intent_limit: int = 25, message_limit: int = 20
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Recent intents and messages of an owned thread (newest first), in one query."""
+        engine = await self._engine()
+        async with engine.connect() as conn:
+            result = await conn.execute(
+                text(_CONTEXT_SQL),
+                {
+                    "thread_id": thread_id,
+                    "user_id": user_id,
+                    "intent_limit": intent_limit,
+                    "message_limit": message_limit,
+                },
+            )
+            rows = list(result.mappings())
+
+        intents: List[Dict[str, Any]] = []
+        messages: List[Dict[str, Any]] = []
+        for row in rows:
+            if row["kind"] == "intent":
+                intents.append({
+                    "id": row["id"],
+                    "intent_type": row["intent_type"],
+                    "extracted_dimensions": _loads(row["payload"], {}) or {},
+                    "created_at": row["created_at"],
+                })
+            else:
+                messages.append({
+                    "id": row["id"],
+                    "role": row["role"],
+                    "content": row["content"],
+                    "metadata": _loads(row["payload"], {}) or {},
+                    "ordering_index": row["ordering_index"],
+                    "created_at": row["created_at"],
+                })
+        # Read-your-writes: include records still in the write-behind buffer
+        messages.extend(self._unflushed_messages(thread_id, user_id, messages))
+        if self.write_buffer is not None:
+            seen = {row["id"] for row in intents}
+            intents.extend(
+                {
+                    "id": r.id,
+                    "intent_type": r.intent_type,
+                    "extracted_dimensions": r.extracted_dimensions or {},
+                    "created_at": r.created_at,
+                }
+                for r in self.write_buffer.pending_for(thread_id, user_id)
+                if isinstance(r, IntentRecord) and r.id not in seen
+            )
+
+        # UNION ALL does not preserve the per-branch ORDER BY
+        intents.sort(key=lambda r: r["created_at"], reverse=True)
+        messages.sort(key=lambda r: r["ordering_index"] or 0, reverse=True)
+        return intents[:intent_limit], messages[:message_limit]
+
+    async def get_context_for_query(self, thread_id: str, user_id: str) -> Dict[str, Any]:
+        try:
+            intents, messages = await self.fetch_recent(thread_id, user_id)
+        except Exception as e:
+            logger.error("Failed to fetch conversation context", thread_id=thread_id, error=str(e))
+            intents, messages = [], []
+        return build_query_context(intents, messages)
+
+    # endregion
+
+
+def _default_write_buffer() -> Optional[ConversationWriteBuffer]:
+    settings = get_settings()
+    if not settings.conversation_write_buffer_enabled:
+        return None
+    return ConversationWriteBuffer(
+        conversation_store.write_records,
+        max_batch=settings.conversation_write_buffer_max_batch,
+        flush_interval_seconds=settings.conversation_write_buffer_flush_interval_ms / 1000,
+        max_pending=settings.conversation_write_buffer_max_pending,
+    )
+
+
+conversation_store = AsyncConversationStore()
+conversation_store.write_buffer = _default_write_buffer()
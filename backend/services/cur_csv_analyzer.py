@@ -14,8 +14,8 @@ findings flow into the same multi-tenant Opportunities dashboard as live
 signals, tagged ``source=cur_analysis``.
 
 The analyzer is deliberately dependency-light (pandas only — already in
-requirements) and never touches AWS, so it also runs when
-``DATABASE_ENABLED=false`` / demo deployments.
+requirements; pyarrow for the process-pool mode) and never touches AWS, so
+it also runs when ``DATABASE_ENABLED=false`` / demo deployments.
 """
 
 from __future__ import annotations
@@ -23,14 +23,19 @@ from __future__ import annotations
 import gzip
 import io
 import re
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, BinaryIO, Dict, List, Optional, Union
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from uuid import UUID, uuid4
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import structlog
 
 from backend.config.settings import get_settings
+from backend.services.analysis_pool import apply_to_shared_frame, release_frame, share_frame
 from backend.models.opportunities import OpportunityCategory, OpportunitySource
 
 logger = structlog.get_logger(__name__)
@@ -97,6 +102,140 @@ _REQUIRED_COLUMNS = (
     "line_item_unblended_cost",
 )
 
+# Every column a detector reads. Streaming uploads parse only these, so
+# wide CUR 2.0 exports (100+ columns) cost no more than narrow ones.
+_ANALYZED_COLUMNS = frozenset(
+    _NUMERIC_COLUMNS
+    + (
+        "line_item_usage_start_date",
+        "line_item_line_item_type",
+        "line_item_usage_type",
+        "line_item_product_code",
+        "line_item_resource_id",
+        "line_item_usage_account_id",
+        "product_region",
+        "product_instance_type",
+        "pricing_term",
+        "reservation_reservation_a_r_n",
+        "savings_plan_savings_plan_a_r_n",
+    )
+)
+
+_USAGE_LINE_ITEM_TYPES = ("Usage", "DiscountedUsage", "SavingsPlanCoveredUsage")
+
+# Pending per-chunk frames kept per aggregate before they are folded together.
+_MAX_PENDING_PARTIALS = 8
+
+_DATABASE_SERVICES = ("AmazonRDS", "AmazonElastiCache", "AmazonRedshift")
+
+# Cost-driver families, first match wins.
+_USAGE_FAMILIES = (
+    ("BoxUsage", "Compute (BoxUsage)"),
+    ("DataTransfer", "Data Transfer"),
+    ("EBS:Volume", "EBS Volumes"),
+    ("EBS:Snapshot", "EBS Snapshots"),
+    ("NatGateway", "NAT Gateway"),
+    ("LoadBalancer", "Load Balancer"),
+    ("Storage", "Storage"),
+)
+
+
+@dataclass(frozen=True)
+class _GroupSpec:
+    """A group-by sum over the shared pre-pass frame (see ``CURCSVAnalyzer._prepare``)."""
+
+    name: str
+    detector: str
+    mask: str
+    keys: Tuple[str, ...]
+    values: Tuple[Tuple[str, str], ...] = ()  # (output column, pre-pass column); empty counts rows
+    requires: Tuple[str, ...] = ()            # CUR columns without which the detector is skipped
+    dropna: bool = True
+
+
+_GROUP_SPECS: Tuple[_GroupSpec, ...] = (
+    _GroupSpec(
+        name="usage_type_cost_drivers",
+        detector="usage_type_cost_drivers",
+        mask="is_billable_usage",
+        keys=("usage_family",),
+        values=(("cost_usd", "cost"),),
+        requires=("line_item_usage_type",),
+    ),
+    _GroupSpec(
+        name="ri_unused_hours",
+        detector="ri_unused_hours",
+        mask="is_ri_fee",
+        keys=("reservation_arn", "service", "region"),
+        values=(("unused_cost", "ri_unused_cost"), ("unused_hours", "ri_unused_hours")),
+        requires=(
+            "reservation_reservation_a_r_n",
+            "reservation_unused_amortized_upfront_fee_for_billing_period",
+            "reservation_unused_recurring_fee",
+        ),
+    ),
+    _GroupSpec(
+        name="sp_unused_commitment",
+        detector="sp_unused_commitment",
+        mask="is_sp_fee",
+        keys=("sp_arn", "region"),
+        values=(("unused", "sp_unused"), ("committed", "sp_committed"), ("used", "sp_used")),
+        requires=(
+            "savings_plan_savings_plan_a_r_n",
+            "savings_plan_total_commitment_to_date",
+            "savings_plan_used_commitment",
+        ),
+    ),
+    _GroupSpec(
+        name="cross_region_data_transfer",
+        detector="cross_region_data_transfer",
+        mask="is_data_transfer",
+        keys=("region", "service"),
+        values=(("cost_usd", "cost"),),
+        requires=("line_item_usage_type", "line_item_product_code"),
+    ),
+    _GroupSpec(
+        name="idle_resources",
+        detector="idle_resources",
+        mask="is_idle_candidate",
+        keys=("resource_id", "service", "region"),
+        values=(("cost_usd", "cost"), ("usage_amount", "usage_amount")),
+        requires=("line_item_resource_id", "line_item_usage_amount"),
+    ),
+    _GroupSpec(
+        name="on_demand_steady_state_db",
+        detector="on_demand_steady_state_db",
+        mask="is_on_demand_db",
+        keys=("resource_id", "instance_type", "region", "service"),
+        values=(("run_hours", "usage_amount"), ("cost_usd", "cost")),
+        requires=("line_item_resource_id", "line_item_usage_amount", "line_item_product_code"),
+    ),
+    # Distinct (resource, day) pairs; active days are counted once merged.
+    _GroupSpec(
+        name="on_demand_steady_state_db_days",
+        detector="on_demand_steady_state_db",
+        mask="is_on_demand_db",
+        keys=("resource_id", "day"),
+        requires=(
+            "line_item_resource_id",
+            "line_item_usage_amount",
+            "line_item_product_code",
+            "line_item_usage_start_date",
+        ),
+        dropna=False,
+    ),
+    # Off-hours = 20:00–07:59 UTC. A "flat" profile (off-hours share ~ 50%)
+    # on workloads that *should* be batch is the scheduling signal.
+    _GroupSpec(
+        name="scheduling_candidates",
+        detector="scheduling_candidates",
+        mask="is_box_usage",
+        keys=("service",),
+        values=(("total", "cost"), ("off_hours", "off_hours_cost")),
+        requires=("line_item_usage_start_date", "line_item_usage_type"),
+    ),
+)
+
 
 def _canonicalise(col: str) -> str:
     """Normalise a CUR column header to canonical snake_case."""
@@ -118,6 +257,130 @@ def _canonicalise(col: str) -> str:
     return "_".join(p for p in snake_parts if p)
 
 
+def _category_flags(values: pd.Series, pattern: str, regex: bool = False) -> np.ndarray:
+    """Row mask for a categorical column, matching ``pattern`` once per category."""
+    categories = values.cat.categories.astype(str)
+    matches = np.asarray(categories.str.contains(pattern, regex=regex), dtype=bool)
+    # code -1 (missing) picks the trailing False
+    return np.append(matches, False)[values.cat.codes.to_numpy()]
+
+
+def _usage_families(usage_type: pd.Series) -> pd.Categorical:
+    """Classify a categorical usage-type column into ``_USAGE_FAMILIES``."""
+    categories = usage_type.cat.categories.astype(str)
+    labels = [family for _, family in _USAGE_FAMILIES] + ["Other"]
+    family_codes = np.select(
+        [np.asarray(categories.str.contains(needle, regex=False), dtype=bool) for needle, _ in _USAGE_FAMILIES],
+        range(len(_USAGE_FAMILIES)),
+        default=len(_USAGE_FAMILIES),
+    )
+    codes = np.append(family_codes, len(_USAGE_FAMILIES))[usage_type.cat.codes.to_numpy()]
+    return pd.Categorical.from_codes(codes, categories=labels)
+
+
+def shard_frame(df: pd.DataFrame, target_rows: int) -> Iterator[pd.DataFrame]:
+    """
+    Split normalised CUR rows into shards of whole (account, usage month) groups.
+
+    Groups are packed in order until a shard reaches ``target_rows``; a single
+    group larger than that stays one shard.
+    """
+    if df.empty:
+        return
+    keys = []
+    if "line_item_usage_account_id" in df.columns:
+        keys.append(df["line_item_usage_account_id"])
+    if "line_item_usage_start_date" in df.columns:
+        ts = df["line_item_usage_start_date"]
+        keys.append((ts.dt.year * 12 + ts.dt.month).rename("usage_month"))
+    if not keys:
+        yield df
+        return
+
+    group_ids = df.groupby(keys, observed=True, sort=False, dropna=False).ngroup().to_numpy()
+    sizes = np.bincount(group_ids)
+    shard_of_group = np.empty(len(sizes), dtype=np.int64)
+    shard, filled = 0, 0
+    for group, size in enumerate(sizes):
+        if filled and filled + size > target_rows:
+            shard, filled = shard + 1, 0
+        shard_of_group[group] = shard
+        filled += size
+
+    if shard == 0:
+        yield df
+        return
+    row_shards = shard_of_group[group_ids]
+    order = np.argsort(row_shards, kind="stable")
+    bounds = np.searchsorted(row_shards[order], np.arange(1, shard + 1))
+    for rows in np.split(order, bounds):
+        yield df.iloc[rows]
+
+
+def _aggregate_shared_shard(name: str) -> "CURPartialAggregates":
+    """Process-pool entry point: aggregate one shard written by ``share_frame``."""
+    return apply_to_shared_frame(name, CURCSVAnalyzer().aggregate)
+
+
+def _combine(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Sum partial group-by frames that share the same index levels."""
+    combined = pd.concat(frames)
+    levels = list(range(combined.index.nlevels))
+    return combined.groupby(level=levels, observed=True, sort=True, dropna=False).sum()
+
+
+class CURPartialAggregates:
+    """
+    Additive per-detector aggregates for a slice of CUR rows.
+
+    Every frame is a group-by sum keyed on the detector's group columns, so
+    aggregates built from separate chunks can be merged before thresholds
+    and ranking are applied in :meth:`CURCSVAnalyzer.finalize`.
+    """
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.total_cost = 0.0
+        self.period_start: Optional[pd.Timestamp] = None
+        self.period_end: Optional[pd.Timestamp] = None
+        self.account_ids: Set[str] = set()
+        self.failed: Set[str] = set()
+        self._frames: Dict[str, List[pd.DataFrame]] = {}
+
+    def add(self, name: str, frame: pd.DataFrame) -> None:
+        if frame.empty:
+            return
+        pending = self._frames.setdefault(name, [])
+        pending.append(frame)
+        if len(pending) > _MAX_PENDING_PARTIALS:
+            self._frames[name] = [_combine(pending)]
+
+    def frame(self, name: str) -> Optional[pd.DataFrame]:
+        pending = self._frames.get(name)
+        if not pending:
+            return None
+        if len(pending) > 1:
+            self._frames[name] = pending = [_combine(pending)]
+        return pending[0]
+
+    def merge(self, other: "CURPartialAggregates") -> None:
+        self.rows += other.rows
+        self.total_cost += other.total_cost
+        if other.period_start is not None:
+            self.period_start = (
+                other.period_start if self.period_start is None else min(self.period_start, other.period_start)
+            )
+        if other.period_end is not None:
+            self.period_end = (
+                other.period_end if self.period_end is None else max(self.period_end, other.period_end)
+            )
+        self.account_ids |= other.account_ids
+        self.failed |= other.failed
+        for name, frames in other._frames.items():
+            for frame in frames:
+                self.add(name, frame)
+
+
 class CURCSVAnalyzer:
     """
     Pandas-based CUR pattern miner for uploaded CSV exports.
@@ -180,6 +443,62 @@ class CURCSVAnalyzer:
 
         return CURCSVAnalyzer._normalise_dataframe(df)
 
+    @staticmethod
+    def iter_dataframes(
+        source: Union[bytes, BinaryIO, str],
+        filename: Optional[str] = None,
+        max_rows: Optional[int] = None,
+        chunksize: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream a CUR export as normalised DataFrame chunks.
+
+        Only the columns the detectors read are parsed, with fixed dtypes, and
+        gzip payloads are decompressed incrementally, so peak memory is bounded
+        by ``chunksize`` rather than by the size of the upload. The header is
+        validated before any rows are read.
+        """
+        chunksize = chunksize or settings.cur_upload_chunk_rows
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(bytes(source))
+        elif isinstance(source, str):
+            with open(source, "rb") as fh:
+                yield from CURCSVAnalyzer.iter_dataframes(fh, filename, max_rows, chunksize)
+            return
+
+        buf: BinaryIO = source
+        magic = buf.read(2)
+        buf.seek(0)
+        if (filename and filename.lower().endswith(".gz")) or magic == b"\x1f\x8b":
+            buf = gzip.GzipFile(fileobj=buf, mode="rb")
+
+        header = pd.read_csv(buf, nrows=0).columns
+        buf.seek(0)
+        usecols: List[str] = []
+        dtype: Dict[str, Any] = {}
+        seen: Set[str] = set()
+        for col in header:
+            canonical = _canonicalise(col)
+            if canonical not in _ANALYZED_COLUMNS or canonical in seen:
+                continue
+            seen.add(canonical)
+            usecols.append(col)
+            if canonical in _NUMERIC_COLUMNS:
+                dtype[col] = "float64"
+            elif canonical != "line_item_usage_start_date":
+                dtype[col] = "category"
+        missing = [c for c in _REQUIRED_COLUMNS if c not in seen]
+        if missing:
+            raise ValueError(
+                "Uploaded file does not look like an AWS CUR export — "
+                f"missing required column(s): {', '.join(missing)}"
+            )
+
+        reader = pd.read_csv(buf, usecols=usecols, dtype=dtype, chunksize=chunksize, nrows=max_rows)
+        with reader:
+            for chunk in reader:
+                yield CURCSVAnalyzer._normalise_dataframe(chunk)
+
     @staticmethod
     def _normalise_dataframe(df: pd.DataFrame) -> pd.DataFrame:
         df = df.rename(columns={c: _canonicalise(c) for c in df.columns})
@@ -208,50 +527,119 @@ class CURCSVAnalyzer:
         DataFrame and return both the raw opportunity list and a summary
         suitable for the API response body.
         """
-        if "line_item_usage_account_id" in df.columns and not self.account_id:
-            accounts = df["line_item_usage_account_id"].dropna().astype(str).unique()
-            if len(accounts) == 1:
-                self.account_id = accounts[0]
+        return self.finalize(self.aggregate(df))
+
+    def analyze_chunks(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        executor: Optional[Executor] = None,
+    ) -> Dict[str, Any]:
+        """
+        Streaming counterpart of :meth:`analyze` for :meth:`iter_dataframes`.
+
+        Each normalised chunk is reduced to partial aggregates as it arrives
+        and then dropped, so only one chunk of rows is held at a time. With
+        an ``executor`` (see ``analysis_pool.get_analysis_pool``) chunks are
+        split into account/month shards that are aggregated in worker
+        processes; thresholds still apply only once everything is merged.
+        """
+        aggregates = CURPartialAggregates()
+        if executor is None:
+            for chunk in chunks:
+                aggregates.merge(self.aggregate(chunk))
+        else:
+            self._aggregate_in_pool(chunks, executor, aggregates)
+        return self.finalize(aggregates)
+
+    def _aggregate_in_pool(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        executor: Executor,
+        aggregates: CURPartialAggregates,
+    ) -> None:
+        # Bound the shards held in shared memory to a couple per worker.
+        max_in_flight = max(2 * settings.analysis_pool_workers, 1)
+        in_flight: Dict[Future, Any] = {}
+
+        def collect(return_when: str) -> None:
+            done, _ = wait(in_flight, return_when=return_when)
+            for future in done:
+                release_frame(in_flight.pop(future))
+                aggregates.merge(future.result())
+
+        try:
+            for chunk in chunks:
+                for shard in shard_frame(chunk, settings.cur_analysis_shard_rows):
+                    try:
+                        shm = share_frame(shard)
+                    except pa.ArrowException:
+                        aggregates.merge(self.aggregate(shard))
+                        continue
+                    in_flight[executor.submit(_aggregate_shared_shard, shm.name)] = shm
+                    if len(in_flight) >= max_in_flight:
+                        collect(FIRST_COMPLETED)
+            while in_flight:
+                collect(FIRST_COMPLETED)
+        finally:
+            for future, shm in in_flight.items():
+                future.cancel()
+                release_frame(shm)
+
+    def aggregate(self, df: pd.DataFrame) -> CURPartialAggregates:
+        """Reduce normalised CUR rows to mergeable per-detector aggregates."""
+        aggregates = CURPartialAggregates()
+        aggregates.rows = int(len(df))
+        if "line_item_usage_account_id" in df.columns:
+            aggregates.account_ids = set(df["line_item_usage_account_id"].dropna().astype(str).unique())
+        if "line_item_usage_start_date" in df.columns:
+            ts = df["line_item_usage_start_date"].dropna()
+            if not ts.empty:
+                aggregates.period_start = ts.min()
+                aggregates.period_end = ts.max()
+
+        prepared = self._prepare(df)
+        aggregates.total_cost = float(prepared["cost"].to_numpy()[prepared["is_billable_usage"].to_numpy()].sum())
+
+        for spec in _GROUP_SPECS:
+            if spec.detector in aggregates.failed or not all(c in df.columns for c in spec.requires):
+                continue
+            try:
+                aggregates.add(spec.name, self._group(prepared, spec))
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.warning("CUR CSV detector failed", detector=spec.detector, error=str(exc))
+                aggregates.failed.add(spec.detector)
+        return aggregates
+
+    def finalize(self, aggregates: CURPartialAggregates) -> Dict[str, Any]:
+        """Apply thresholds and ranking to merged aggregates and build the result."""
+        if not self.account_id and len(aggregates.account_ids) == 1:
+            self.account_id = next(iter(aggregates.account_ids))
 
-        period_start, period_end, days = self._derive_period(df)
+        period_start, period_end, days = self._derive_period(aggregates)
 
         opportunities: List[Dict[str, Any]] = []
         detector_counts: Dict[str, int] = {}
 
-        for label, fn in (
-            ("usage_type_cost_drivers", self._detect_usage_type_cost_drivers),
-            ("ri_unused_hours", self._detect_ri_unused_hours),
-            ("sp_unused_commitment", self._detect_sp_unused_commitment),
-            ("cross_region_data_transfer", self._detect_cross_region_data_transfer),
-            ("idle_resources", self._detect_idle_resources),
-            ("on_demand_steady_state_db", self._detect_on_demand_steady_state_db),
-            ("scheduling_candidates", self._detect_scheduling_candidates),
-        ):
+        for label, detect in self._detectors():
+            if label in aggregates.failed:
+                detector_counts[label] = 0
+                continue
             try:
-                found = fn(df, days)
+                found = detect(aggregates, days)
                 detector_counts[label] = len(found)
                 opportunities.extend(found)
             except Exception as exc:  # pragma: no cover - defensive
                 logger.warning("CUR CSV detector failed", detector=label, error=str(exc))
                 detector_counts[label] = 0
 
-        total_cost = float(
-            df.loc[
-                df["line_item_line_item_type"].isin(
-                    ["Usage", "DiscountedUsage", "SavingsPlanCoveredUsage"]
-                ),
-                "line_item_unblended_cost",
-            ].sum()
-        )
-
         return {
             "opportunities": opportunities,
             "summary": {
-                "rows_analyzed": int(len(df)),
+                "rows_analyzed": aggregates.rows,
                 "period_start": period_start,
                 "period_end": period_end,
                 "period_days": days,
-                "total_unblended_cost_usd": round(total_cost, 2),
+                "total_unblended_cost_usd": round(aggregates.total_cost, 2),
                 "total_opportunities": len(opportunities),
                 "estimated_monthly_savings_usd": round(
                     sum(o.get("estimated_monthly_savings") or 0.0 for o in opportunities), 2
@@ -260,42 +648,138 @@ class CURCSVAnalyzer:
             },
         }
 
+    def _detectors(self):
+        return (
+            ("usage_type_cost_drivers", self._detect_usage_type_cost_drivers),
+            ("ri_unused_hours", self._detect_ri_unused_hours),
+            ("sp_unused_commitment", self._detect_sp_unused_commitment),
+            ("cross_region_data_transfer", self._detect_cross_region_data_transfer),
+            ("idle_resources", self._detect_idle_resources),
+            ("on_demand_steady_state_db", self._detect_on_demand_steady_state_db),
+            ("scheduling_candidates", self._detect_scheduling_candidates),
+        )
+
     # ------------------------------------------------------------------
-    # Detectors — each mirrors a CURPatternMiningTemplates query
+    # Shared pre-pass
     # ------------------------------------------------------------------
 
-    def _detect_usage_type_cost_drivers(self, df: pd.DataFrame, days: int) -> List[Dict[str, Any]]:
-        """Single ARCHITECTURE-category opportunity summarising the top cost-driver families."""
-        if "line_item_usage_type" not in df.columns:
-            return []
-        usage = df[df["line_item_line_item_type"].isin(
-            ["Usage", "DiscountedUsage", "SavingsPlanCoveredUsage"]
-        )].copy()
-        if usage.empty:
-            return []
+    @staticmethod
+    def _prepare(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compute everything the ``_GROUP_SPECS`` read in one pass over the chunk.
+
+        Group keys are categorical so each column is hashed once rather than
+        once per detector, and usage-type classification runs over the
+        distinct usage types instead of every row.
+        """
+        index = df.index
+
+        def column(name: str) -> pd.Series:
+            if name in df.columns:
+                return df[name]
+            return pd.Series(np.nan, index=index, dtype=object)
+
+        def numeric(name: str) -> pd.Series:
+            if name in df.columns:
+                return df[name]
+            return pd.Series(0.0, index=index)
+
+        def key(name: str) -> pd.Series:
+            return column(name).astype("category")
 
-        def family(ut: str) -> str:
-            ut = str(ut)
-            if "BoxUsage" in ut:
-                return "Compute (BoxUsage)"
-            if "DataTransfer" in ut:
-                return "Data Transfer"
-            if "EBS:Volume" in ut:
-                return "EBS Volumes"
-            if "EBS:Snapshot" in ut:
-                return "EBS Snapshots"
-            if "NatGateway" in ut:
-                return "NAT Gateway"
-            if "LoadBalancer" in ut:
-                return "Load Balancer"
-            if "Storage" in ut:
-                return "Storage"
-            return "Other"
-
-        usage["usage_family"] = usage["line_item_usage_type"].map(family)
-        grouped = (
-            usage.groupby("usage_family")["line_item_unblended_cost"].sum().sort_values(ascending=False)
+        def filled(values: pd.Series) -> pd.Series:
+            if "" not in values.cat.categories:
+                values = values.cat.add_categories("")
+            return values.fillna("")
+
+        line_type = key("line_item_line_item_type")
+        usage_type = key("line_item_usage_type")
+        service = key("line_item_product_code")
+        region = key("product_region")
+        resource_id = key("line_item_resource_id")
+        reservation_arn = key("reservation_reservation_a_r_n")
+        is_usage = line_type.eq("Usage").to_numpy()
+
+        if "line_item_usage_start_date" in df.columns:
+            ts = df["line_item_usage_start_date"]
+            hour = ts.dt.hour
+            day = ts.dt.floor("D")
+        else:
+            ts = pd.Series(pd.NaT, index=index, dtype="datetime64[ns, UTC]")
+            hour = pd.Series(np.nan, index=index)
+            day = ts
+        off_hours = ((hour >= 20) | (hour < 8)).to_numpy()
+
+        cost = df["line_item_unblended_cost"]
+        upfront = numeric("reservation_unused_amortized_upfront_fee_for_billing_period")
+        committed = numeric("savings_plan_total_commitment_to_date")
+        used = numeric("savings_plan_used_commitment")
+
+        return pd.DataFrame(
+            {
+                # masks
+                "is_billable_usage": line_type.isin(_USAGE_LINE_ITEM_TYPES).to_numpy(),
+                "is_ri_fee": line_type.eq("RIFee").to_numpy(),
+                "is_sp_fee": line_type.eq("SavingsPlanRecurringFee").to_numpy(),
+                "is_data_transfer": (
+                    is_usage
+                    & _category_flags(usage_type, "InterRegion|AWS-Out-Bytes|DataTransfer-Regional", regex=True)
+                    & service.notna().to_numpy()
+                    & (region.notna().to_numpy() if "product_region" in df.columns else True)
+                ),
+                "is_idle_candidate": is_usage & resource_id.ne("").to_numpy(),
+                "is_on_demand_db": (
+                    is_usage
+                    & service.isin(_DATABASE_SERVICES).to_numpy()
+                    & _category_flags(usage_type, "InstanceUsage")
+                    & filled(key("pricing_term")).isin(["", "OnDemand"]).to_numpy()
+                    & filled(reservation_arn).eq("").to_numpy()
+                ),
+                "is_box_usage": is_usage & _category_flags(usage_type, "BoxUsage") & ts.notna().to_numpy(),
+                # keys
+                "usage_family": _usage_families(usage_type),
+                "service": filled(service),
+                "region": filled(region),
+                "resource_id": resource_id,
+                "instance_type": filled(key("product_instance_type")),
+                "reservation_arn": reservation_arn,
+                "sp_arn": key("savings_plan_savings_plan_a_r_n"),
+                "day": day,
+                # values
+                "cost": cost,
+                "usage_amount": numeric("line_item_usage_amount"),
+                "off_hours_cost": cost.where(off_hours, 0.0),
+                "ri_unused_cost": upfront + numeric("reservation_unused_recurring_fee"),
+                "ri_unused_hours": numeric("reservation_unused_quantity"),
+                "sp_unused": (committed - used).clip(lower=0),
+                "sp_committed": committed,
+                "sp_used": used,
+            },
+            index=index,
         )
+
+    @staticmethod
+    def _group(prepared: pd.DataFrame, spec: _GroupSpec) -> pd.DataFrame:
+        keys = list(spec.keys)
+        columns = [c for _, c in spec.values]
+        rows = prepared.loc[prepared[spec.mask].to_numpy(), keys + columns]
+        grouped = rows.groupby(keys, observed=True, sort=True, dropna=spec.dropna)
+        if not spec.values:
+            return grouped.size().to_frame("rows")
+        return grouped[columns].sum().rename(columns={c: out for out, c in spec.values})
+
+    # ------------------------------------------------------------------
+    # Detectors — each mirrors a CURPatternMiningTemplates query. The
+    # row-level work is a ``_GroupSpec``; ``_detect_*`` turns the merged
+    # sums into findings.
+    # ------------------------------------------------------------------
+
+    def _detect_usage_type_cost_drivers(self, aggregates: CURPartialAggregates, days: int) -> List[Dict[str, Any]]:
+        """Single ARCHITECTURE-category opportunity summarising the top cost-driver families."""
+        frame = aggregates.frame("usage_type_cost_drivers")
+        if frame is None or frame.empty:
+            return []
+        grouped = frame["cost_usd"].sort_values(ascending=False)
         total = float(grouped.sum()) or 1.0
         breakdown = [
             {
@@ -332,37 +816,11 @@ class CURCSVAnalyzer:
             )
         ]
 
-    def _detect_ri_unused_hours(self, df: pd.DataFrame, days: int) -> List[Dict[str, Any]]:
-        cols = (
-            "reservation_reservation_a_r_n",
-            "reservation_unused_amortized_upfront_fee_for_billing_period",
-            "reservation_unused_recurring_fee",
-        )
-        if not all(c in df.columns for c in cols):
-            return []
-        ri = df[df["line_item_line_item_type"] == "RIFee"].copy()
-        if ri.empty:
+    def _detect_ri_unused_hours(self, aggregates: CURPartialAggregates, days: int) -> List[Dict[str, Any]]:
+        frame = aggregates.frame("ri_unused_hours")
+        if frame is None or frame.empty:
             return []
-        ri["unused_cost"] = (
-            ri["reservation_unused_amortized_upfront_fee_for_billing_period"]
-            + ri["reservation_unused_recurring_fee"]
-        )
-        if "reservation_unused_quantity" in ri.columns:
-            ri["unused_hours"] = ri["reservation_unused_quantity"]
-        else:
-            ri["unused_hours"] = 0.0
-        grouped = (
-            ri.groupby(
-                [
-                    "reservation_reservation_a_r_n",
-                    ri.get("line_item_product_code", pd.Series(index=ri.index, dtype=str)).fillna(""),
-                    ri.get("product_region", pd.Series(index=ri.index, dtype=str)).fillna(""),
-                ]
-            )[["unused_cost", "unused_hours"]]
-            .sum()
-            .reset_index()
-        )
-        grouped.columns = ["reservation_arn", "service", "region", "unused_cost", "unused_hours"]
+        grouped = frame.reset_index()
         grouped = grouped[grouped["unused_cost"] > self.min_ri_unused_cost].sort_values(
             "unused_cost", ascending=False
         )
@@ -404,31 +862,11 @@ class CURCSVAnalyzer:
             )
         return out
 
-    def _detect_sp_unused_commitment(self, df: pd.DataFrame, days: int) -> List[Dict[str, Any]]:
-        cols = (
-            "savings_plan_savings_plan_a_r_n",
-            "savings_plan_total_commitment_to_date",
-            "savings_plan_used_commitment",
-        )
-        if not all(c in df.columns for c in cols):
-            return []
-        sp = df[df["line_item_line_item_type"] == "SavingsPlanRecurringFee"].copy()
-        if sp.empty:
+    def _detect_sp_unused_commitment(self, aggregates: CURPartialAggregates, days: int) -> List[Dict[str, Any]]:
+        frame = aggregates.frame("sp_unused_commitment")
+        if frame is None or frame.empty:
             return []
-        sp["unused"] = (
-            sp["savings_plan_total_commitment_to_date"] - sp["savings_plan_used_commitment"]
-        ).clip(lower=0)
-        grouped = (
-            sp.groupby(
-                [
-                    "savings_plan_savings_plan_a_r_n",
-                    sp.get("product_region", pd.Series(index=sp.index, dtype=str)).fillna(""),
-                ]
-            )[["unused", "savings_plan_total_commitment_to_date", "savings_plan_used_commitment"]]
-            .sum()
-            .reset_index()
-        )
-        grouped.columns = ["sp_arn", "region", "unused", "committed", "used"]
+        grouped = frame.reset_index()
         grouped = grouped[grouped["unused"] > self.min_sp_unused_cost].sort_values(
             "unused", ascending=False
         )
@@ -473,32 +911,21 @@ class CURCSVAnalyzer:
             )
         return out
 
-    def _detect_cross_region_data_transfer(self, df: pd.DataFrame, days: int) -> List[Dict[str, Any]]:
-        if "line_item_usage_type" not in df.columns:
-            return []
-        mask = df["line_item_line_item_type"].eq("Usage") & df["line_item_usage_type"].astype(
-            str
-        ).str.contains("InterRegion|AWS-Out-Bytes|DataTransfer-Regional", regex=True, na=False)
-        dt = df[mask]
-        if dt.empty:
+    def _detect_cross_region_data_transfer(self, aggregates: CURPartialAggregates, days: int) -> List[Dict[str, Any]]:
+        frame = aggregates.frame("cross_region_data_transfer")
+        if frame is None or frame.empty:
             return []
-        region_col = "product_region" if "product_region" in dt.columns else None
-        group_cols = [c for c in (region_col, "line_item_product_code") if c]
-        grouped = (
-            dt.groupby(group_cols)["line_item_unblended_cost"].sum().reset_index()
-            if group_cols
-            else pd.DataFrame({"line_item_unblended_cost": [dt["line_item_unblended_cost"].sum()]})
-        )
-        grouped = grouped[grouped["line_item_unblended_cost"] > self.min_data_transfer_cost].sort_values(
-            "line_item_unblended_cost", ascending=False
+        grouped = frame.reset_index()
+        grouped = grouped[grouped["cost_usd"] > self.min_data_transfer_cost].sort_values(
+            "cost_usd", ascending=False
         )
 
         out: List[Dict[str, Any]] = []
         for _, row in grouped.head(self.max_findings_per_detector).iterrows():
-            cost = float(row["line_item_unblended_cost"])
+            cost = float(row["cost_usd"])
             monthly_cost = self._monthly(cost, days)
-            region = str(row[region_col]) if region_col else None
-            service = str(row.get("line_item_product_code", "AWSDataTransfer"))
+            region = str(row["region"]) or None
+            service = str(row["service"])
             out.append(
                 self._opportunity(
                     title=f"High cross-region data transfer in {region or 'multiple regions'} (${monthly_cost:.0f}/mo)",
@@ -531,31 +958,11 @@ class CURCSVAnalyzer:
             )
         return out
 
-    def _detect_idle_resources(self, df: pd.DataFrame, days: int) -> List[Dict[str, Any]]:
-        needed = ("line_item_resource_id", "line_item_usage_amount")
-        if not all(c in df.columns for c in needed):
-            return []
-        usage = df[
-            df["line_item_line_item_type"].eq("Usage")
-            & df["line_item_resource_id"].astype(str).str.len().gt(0)
-        ]
-        if usage.empty:
+    def _detect_idle_resources(self, aggregates: CURPartialAggregates, days: int) -> List[Dict[str, Any]]:
+        frame = aggregates.frame("idle_resources")
+        if frame is None or frame.empty:
             return []
-        agg = (
-            usage.groupby(
-                [
-                    "line_item_resource_id",
-                    usage.get("line_item_product_code", pd.Series(index=usage.index, dtype=str)).fillna(""),
-                    usage.get("product_region", pd.Series(index=usage.index, dtype=str)).fillna(""),
-                ]
-            )
-            .agg(
-                cost_usd=("line_item_unblended_cost", "sum"),
-                usage_amount=("line_item_usage_amount", "sum"),
-            )
-            .reset_index()
-        )
-        agg.columns = ["resource_id", "service", "region", "cost_usd", "usage_amount"]
+        agg = frame.reset_index()
         idle = agg[(agg["usage_amount"] == 0) & (agg["cost_usd"] > self.min_idle_cost)].sort_values(
             "cost_usd", ascending=False
         )
@@ -594,51 +1001,20 @@ class CURCSVAnalyzer:
             )
         return out
 
-    def _detect_on_demand_steady_state_db(self, df: pd.DataFrame, days: int) -> List[Dict[str, Any]]:
-        needed = ("line_item_resource_id", "line_item_usage_amount", "line_item_product_code")
-        if not all(c in df.columns for c in needed):
-            return []
-        db = df[
-            df["line_item_line_item_type"].eq("Usage")
-            & df["line_item_product_code"].isin(["AmazonRDS", "AmazonElastiCache", "AmazonRedshift"])
-            & df.get("line_item_usage_type", pd.Series(index=df.index, dtype=str))
-            .astype(str)
-            .str.contains("InstanceUsage", na=False)
-        ].copy()
-        if db.empty:
+    def _detect_on_demand_steady_state_db(self, aggregates: CURPartialAggregates, days: int) -> List[Dict[str, Any]]:
+        frame = aggregates.frame("on_demand_steady_state_db")
+        if frame is None or frame.empty:
             return []
-        # On-demand only: pricing_term blank/OnDemand AND no reservation ARN.
-        if "pricing_term" in db.columns:
-            db = db[db["pricing_term"].fillna("").isin(["", "OnDemand"])]
-        if "reservation_reservation_a_r_n" in db.columns:
-            db = db[db["reservation_reservation_a_r_n"].fillna("") == ""]
-        if db.empty:
-            return []
-
-        if "line_item_usage_start_date" in db.columns:
-            db["__day"] = db["line_item_usage_start_date"].dt.date
-            day_count = db.groupby("line_item_resource_id")["__day"].nunique()
+        days_seen = aggregates.frame("on_demand_steady_state_db_days")
+        if days_seen is not None:
+            pairs = days_seen.index.to_frame(index=False)
+            day_count = pairs.groupby("resource_id", observed=True)["day"].nunique()
         else:
             day_count = None
 
-        agg = (
-            db.groupby(
-                [
-                    "line_item_resource_id",
-                    db.get("product_instance_type", pd.Series(index=db.index, dtype=str)).fillna(""),
-                    db.get("product_region", pd.Series(index=db.index, dtype=str)).fillna(""),
-                    "line_item_product_code",
-                ]
-            )
-            .agg(
-                run_hours=("line_item_usage_amount", "sum"),
-                cost_usd=("line_item_unblended_cost", "sum"),
-            )
-            .reset_index()
-        )
-        agg.columns = ["resource_id", "instance_type", "region", "service", "run_hours", "cost_usd"]
+        agg = frame.reset_index()
         agg["active_days"] = (
-            agg["resource_id"].map(day_count) if day_count is not None else float(max(days, 1))
+            agg["resource_id"].astype(object).map(day_count) if day_count is not None else float(max(days, 1))
         )
         agg["active_days"] = agg["active_days"].fillna(float(max(days, 1))).clip(lower=1)
         agg["avg_hours_per_day"] = agg["run_hours"] / agg["active_days"]
@@ -689,29 +1065,17 @@ class CURCSVAnalyzer:
             )
         return out
 
-    def _detect_scheduling_candidates(self, df: pd.DataFrame, days: int) -> List[Dict[str, Any]]:
-        if "line_item_usage_start_date" not in df.columns or "line_item_usage_type" not in df.columns:
+    def _detect_scheduling_candidates(self, aggregates: CURPartialAggregates, days: int) -> List[Dict[str, Any]]:
+        frame = aggregates.frame("scheduling_candidates")
+        if frame is None or frame.empty:
             return []
-        compute = df[
-            df["line_item_line_item_type"].eq("Usage")
-            & df["line_item_usage_type"].astype(str).str.contains("BoxUsage", na=False)
-            & df["line_item_usage_start_date"].notna()
-        ].copy()
-        if compute.empty:
-            return []
-        compute["__hour"] = compute["line_item_usage_start_date"].dt.hour
-        # Off-hours = 20:00–07:59 UTC. A "flat" profile (off-hours share ~ 50%)
-        # on workloads that *should* be batch is the scheduling signal.
-        off_mask = (compute["__hour"] >= 20) | (compute["__hour"] < 8)
-        by_service = compute.groupby(
-            compute.get("line_item_product_code", pd.Series(index=compute.index, dtype=str)).fillna("Unknown")
-        )
         out: List[Dict[str, Any]] = []
-        for service, grp in by_service:
-            total = float(grp["line_item_unblended_cost"].sum())
+        for service, row in frame.iterrows():
+            service = str(service) or "Unknown"
+            total = float(row["total"])
             if total <= self.min_idle_cost:
                 continue
-            off = float(grp.loc[off_mask.loc[grp.index], "line_item_unblended_cost"].sum())
+            off = float(row["off_hours"])
             share = off / total if total else 0.0
             if share < self.scheduling_off_hours_share:
                 continue
@@ -757,14 +1121,11 @@ class CURCSVAnalyzer:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _derive_period(df: pd.DataFrame) -> tuple[Optional[str], Optional[str], int]:
-        if "line_item_usage_start_date" in df.columns:
-            ts = df["line_item_usage_start_date"].dropna()
-            if not ts.empty:
-                start = ts.min()
-                end = ts.max()
-                days = max(1, (end - start).days + 1)
-                return start.date().isoformat(), end.date().isoformat(), days
+    def _derive_period(aggregates: CURPartialAggregates) -> tuple[Optional[str], Optional[str], int]:
+        start, end = aggregates.period_start, aggregates.period_end
+        if start is not None and end is not None:
+            days = max(1, (end - start).days + 1)
+            return start.date().isoformat(), end.date().isoformat(), days
         return None, None, 30
 
     @staticmethod
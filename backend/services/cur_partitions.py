@@ -0,0 +1,328 @@
+"""
+CUR partition discovery and partition-pruning predicates.
+
+The CUR table is partitioned by billing month, either as a single
+``billing_period`` column (CUR 2.0 / Data Exports, ``2025-01``) or as
+``year`` + ``month`` columns (legacy CUR, ``year=2025/month=1``). Filtering
+on ``line_item_usage_start_date`` alone does not prune partitions, so every
+query scans the whole table.
+
+At startup the partition layout is discovered once (Glue ``GetTable`` /
+``GetPartitions``, falling back to Athena ``SHOW PARTITIONS``) and cached in
+``cur_partition_catalog``. ``CURPartitionScheme.predicate()`` then turns a
+start/end date range into the matching partition predicate, which the CUR
+templates and TextToSQLService inject alongside their date filters.
+
+The predicate always covers every month in the range, not just partitions
+seen at discovery time, so a partition that lands after discovery is still
+read.
+
+The catalog also tracks the newest CUR manifest in ``cur_s3_prefix`` so
+``freshness_token()`` changes both when a new partition appears and when AWS
+re-delivers data for an existing month. Result caches key on it, so
+discovery keeps running when pruning is disabled; only ``get()`` (the
+pruning side) is switched off.
+"""
+
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import structlog
+
+from backend.config.settings import get_settings
+from backend.utils.aws_session import get_aws_client
+from backend.utils.aws_constants import AwsService
+
+logger = structlog.get_logger(__name__)
+
+BILLING_PERIOD = "billing_period"
+YEAR = "year"
+MONTH = "month"
+
+_NUMERIC_TYPES = {"int", "integer", "bigint", "smallint", "tinyint"}
+
+
+def _months_between(start_date: date, end_date: date) -> List[Tuple[int, int]]:
+    """Inclusive list of (year, month) covering ``start_date``..``end_date``."""
+    if end_date < start_date:
+        start_date, end_date = end_date, start_date
+    months = []
+    year, month = start_date.year, start_date.month
+    while (year, month) <= (end_date.year, end_date.month):
+        months.append((year, month))
+        month += 1
+        if month > 12:
+            year, month = year + 1, 1
+    return months
+
+
+def _as_date(value) -> date:
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+@dataclass(frozen=True)
+class CURPartitionScheme:
+    """Partition layout of one CUR table."""
+
+    keys: Tuple[str, ...]
+    values: FrozenSet[Tuple[str, ...]] = frozenset()
+    numeric_keys: FrozenSet[str] = frozenset()
+    billing_period_compact: bool = False   # 202501 instead of 2025-01
+    month_zero_padded: bool = False        # month=01 instead of month=1
+    discovered_at: float = 0.0
+
+    @classmethod
+    def from_partitions(
+        cls,
+        keys: List[str],
+        values: List[Tuple[str, ...]],
+        numeric_keys: Optional[List[str]] = None,
+    ) -> Optional["CURPartitionScheme"]:
+        """Build a scheme from partition keys and sample values, or None if unsupported."""
+        lowered = tuple(k.lower() for k in keys)
+        if BILLING_PERIOD in lowered:
+            supported = (BILLING_PERIOD,)
+        elif YEAR in lowered and MONTH in lowered:
+            supported = (YEAR, MONTH)
+        else:
+            return None
+
+        positions = [lowered.index(k) for k in supported]
+        projected = frozenset(tuple(v[i] for i in positions) for v in values if len(v) == len(lowered))
+
+        billing_period_compact = False
+        month_zero_padded = False
+        for value in projected:
+            if supported == (BILLING_PERIOD,):
+                billing_period_compact = "-" not in value[0]
+            else:
+                month_zero_padded = len(value[1]) == 2 and value[1].startswith("0")
+                if month_zero_padded:
+                    break
+
+        return cls(
+            keys=supported,
+            values=projected,
+            numeric_keys=frozenset(k.lower() for k in (numeric_keys or []) if k.lower() in supported),
+            billing_period_compact=billing_period_compact,
+            month_zero_padded=month_zero_padded,
+            discovered_at=time.time(),
+        )
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable hash of the discovered partitions; changes when a new one lands."""
+        joined = "|".join(sorted("/".join(v) for v in self.values))
+        return hashlib.sha256(f"{self.keys}:{joined}".encode("utf-8")).hexdigest()[:16]
+
+    def _literal(self, key: str, value: str) -> str:
+        return value if key in self.numeric_keys else f"'{value}'"
+
+    def predicate(self, start_date, end_date) -> Tuple[str, List[str], List[str]]:
+        """
+        Partition predicate covering ``start_date``..``end_date``.
+
+        Returns:
+            Tuple of (where_clause, years, months) as strings in the
+            partition's own format.
+        """
+        months = _months_between(_as_date(start_date), _as_date(end_date))
+        years = sorted({str(y) for y, _ in months})
+
+        if self.keys == (BILLING_PERIOD,):
+            fmt = "{:04d}{:02d}" if self.billing_period_compact else "{:04d}-{:02d}"
+            periods = [fmt.format(y, m) for y, m in months]
+            in_list = ", ".join(self._literal(BILLING_PERIOD, p) for p in periods)
+            return f"{BILLING_PERIOD} IN ({in_list})", years, periods
+
+        month_fmt = "{:02d}" if self.month_zero_padded else "{:d}"
+        by_year: Dict[str, List[str]] = {}
+        for y, m in months:
+            by_year.setdefault(str(y), []).append(month_fmt.format(m))
+        clauses = []
+        for y, month_values in by_year.items():
+            in_list = ", ".join(self._literal(MONTH, mv) for mv in month_values)
+            clauses.append(f"({YEAR} = {self._literal(YEAR, y)} AND {MONTH} IN ({in_list}))")
+        clause = clauses[0] if len(clauses) == 1 else "(" + " OR ".join(clauses) + ")"
+        all_months = [mv for values in by_year.values() for mv in values]
+        return clause, years, all_months
+
+
+class CURPartitionCatalog:
+    """Process-wide cache of discovered CUR partition schemes."""
+
+    def __init__(self):
+        self._schemes: Dict[str, CURPartitionScheme] = {}
+        self._manifest_markers: Dict[str, str] = {}
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    def _key(database: str, table: str) -> str:
+        return f"{database}.{table}".lower()
+
+    def get(self, database: str, table: str) -> Optional[CURPartitionScheme]:
+        """
+        Scheme to prune ``database.table`` with: None until discovered, or
+        when ``cur_partition_pruning_enabled`` is off (discovery still runs
+        then, for ``freshness_token``).
+        """
+        if not get_settings().cur_partition_pruning_enabled:
+            return None
+        return self._schemes.get(self._key(database, table))
+
+    def set(self, database: str, table: str, scheme: Optional[CURPartitionScheme]) -> None:
+        key = self._key(database, table)
+        if scheme is None:
+            self._schemes.pop(key, None)
+        else:
+            self._schemes[key] = scheme
+
+    def freshness_token(self, database: str, table: str) -> Optional[str]:
+        """
+        Token that changes whenever new CUR data lands for ``database.table``.
+
+        Combines the partition fingerprint with the newest manifest seen.
+        None when neither is known, i.e. there is no invalidation signal.
+        """
+        key = self._key(database, table)
+        scheme = self._schemes.get(key)
+        manifest = self._manifest_markers.get(key)
+        if scheme is None and manifest is None:
+            return None
+        return f"{scheme.fingerprint if scheme else '-'}:{manifest or '-'}"
+
+    async def discover(self, database: str, table: str) -> Optional[CURPartitionScheme]:
+        """Discover and cache the partition layout of ``database.table``."""
+        scheme = None
+        try:
+            loop = asyncio.get_running_loop()
+            scheme = await loop.run_in_executor(None, self._discover_via_glue, database, table)
+        except Exception as e:
+            logger.warning("cur_partition_glue_discovery_failed", error=str(e))
+            try:
+                scheme = await self._discover_via_show_partitions(database, table)
+            except Exception as e2:
+                logger.warning("cur_partition_show_partitions_failed", error=str(e2))
+                return self.get(database, table)
+
+        self.set(database, table, scheme)
+        await self._refresh_manifest_marker(database, table)
+        logger.info(
+            "cur_partitions_discovered",
+            table=f"{database}.{table}",
+            keys=list(scheme.keys) if scheme else [],
+            partitions=len(scheme.values) if scheme else 0,
+        )
+        return scheme
+
+    async def _refresh_manifest_marker(self, database: str, table: str) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+            marker = await loop.run_in_executor(None, self._latest_manifest_marker)
+        except Exception as e:
+            logger.debug("cur_manifest_marker_failed", error=str(e))
+            return
+        if marker:
+            self._manifest_markers[self._key(database, table)] = marker
+
+    @staticmethod
+    def _latest_manifest_marker() -> Optional[str]:
+        """Key + LastModified of the newest ``*Manifest.json`` under the CUR prefix."""
+        settings = get_settings()
+        if not settings.cur_s3_bucket or "${" in settings.cur_s3_bucket:
+            return None
+        s3 = get_aws_client(AwsService.S3)
+        latest = None
+        paginator = s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=settings.cur_s3_bucket, Prefix=settings.cur_s3_prefix):
+            for obj in page.get("Contents", []):
+                if not obj["Key"].endswith("Manifest.json"):
+                    continue
+                if latest is None or obj["LastModified"] > latest["LastModified"]:
+                    latest = obj
+        if latest is None:
+            return None
+        stamp = hashlib.sha256(f"{latest['Key']}@{latest['LastModified']}".encode("utf-8"))
+        return stamp.hexdigest()[:16]
+
+    @staticmethod
+    def _discover_via_glue(database: str, table: str) -> Optional[CURPartitionScheme]:
+        glue = get_aws_client(AwsService.GLUE)
+        table_meta = glue.get_table(DatabaseName=database, Name=table)["Table"]
+        partition_keys = table_meta.get("PartitionKeys") or []
+        keys = [k["Name"] for k in partition_keys]
+        numeric = [k["Name"] for k in partition_keys if (k.get("Type") or "").lower() in _NUMERIC_TYPES]
+
+        values: List[Tuple[str, ...]] = []
+        paginator = glue.get_paginator("get_partitions")
+        for page in paginator.paginate(DatabaseName=database, TableName=table, ExcludeColumnSchema=True):
+            values.extend(tuple(p.get("Values") or []) for p in page.get("Partitions", []))
+        return CURPartitionScheme.from_partitions(keys, values, numeric)
+
+    @staticmethod
+    async def _discover_via_show_partitions(database: str, table: str) -> Optional[CURPartitionScheme]:
+        from backend.services.athena_client import get_async_athena_client
+        from backend.services.athena_polling import QueryClass
+
+        settings = get_settings()
+        athena = get_async_athena_client()
+        response = await athena.start_query_execution(
+            QueryString=f"SHOW PARTITIONS {database}.{table}",
+            QueryExecutionContext={"Database": database},
+            ResultConfiguration={"OutputLocation": settings.athena_output_location},
+        )
+        qid = response["QueryExecutionId"]
+        status = await athena.wait_for_query(qid, query_class=QueryClass.METADATA)
+        if status.get("QueryExecution", {}).get("Status", {}).get("State") != "SUCCEEDED":
+            raise RuntimeError("SHOW PARTITIONS did not succeed")
+
+        keys: List[str] = []
+        values: List[Tuple[str, ...]] = []
+        next_token = None
+        while True:
+            page = await athena.get_query_results(qid, next_token=next_token)
+            for row in page["ResultSet"]["Rows"]:
+                data = row.get("Data") or []
+                spec = data[0].get("VarCharValue", "") if data else ""
+                parts = [p.split("=", 1) for p in spec.split("/") if "=" in p]
+                if not parts:
+                    continue
+                if not keys:
+                    keys = [k for k, _ in parts]
+                values.append(tuple(v for _, v in parts))
+            next_token = page.get("NextToken")
+            if not next_token:
+                break
+        return CURPartitionScheme.from_partitions(keys, values)
+
+    async def run_refresh_loop(self, database: str, table: str, interval_seconds: float) -> None:
+        """Discover now, then re-discover every ``interval_seconds``."""
+        while True:
+            await self.discover(database, table)
+            await asyncio.sleep(interval_seconds)
+
+    def start_background_refresh(self, database: str, table: str, interval_seconds: float) -> None:
+        """Schedule discovery + periodic refresh without blocking startup."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(
+                self.run_refresh_loop(database, table, interval_seconds)
+            )
+
+    async def stop_background_refresh(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+
+# Module-level singleton
+cur_partition_catalog = CURPartitionCatalog()
@@ -39,6 +39,7 @@ from backend.config.settings import get_settings
 from backend.models.opportunities import OpportunityCategory, OpportunitySource
 from backend.services.athena_cur_templates import CURPatternMiningTemplates
 from backend.services.athena_executor import EnhancedAthenaQueryExecutor
+from backend.services.athena_polling import QueryClass
 from backend.utils.aws_constants import AwsService
 from backend.utils.aws_session import create_aws_session
 
@@ -177,7 +178,7 @@ class CURPatternMiningSignalsService:
 
     async def _run(self, sql: str) -> List[Dict[str, Any]]:
         # ``_execute_athena_query`` already handles polling + error logging.
-        return await self._executor._execute_athena_query(sql)
+        return await self._executor._execute_athena_query(sql, query_class=QueryClass.BATCH)
 
     async def _get_available_columns(self) -> Set[str]:
         if self._available_columns_cache is not None:
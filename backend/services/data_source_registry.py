@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import hashlib
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Protocol, Sequence, Tuple
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Tuple
 from uuid import UUID, uuid4
 
 import structlog
@@ -26,8 +27,9 @@ from backend.models.data_sources import (
     DataSourceStatus,
     DataSourceTestResponse,
     DataSourceUploadResponse,
-    NormalizedCostRecord,
+    NormalizedCostBatch,
 )
+from backend.services.analysis_pool import run_in_analysis_pool
 from backend.services.database import DatabaseService
 from backend.services.focus_normalizer import FocusNormalizer
 from backend.services.provider_connectors import (
@@ -46,6 +48,41 @@ class ProviderConnector(Protocol):
     def load_dataframe(self, content: bytes, filename: str, max_rows: int) -> pd.DataFrame: ...
 
 
+_PARTITION_COLUMNS = (
+    "id",
+    "organization_id",
+    "data_source_id",
+    "run_id",
+    "provider_type",
+    "partition_month",
+    "billing_period_start",
+    "billing_period_end",
+    "account_or_project_id",
+    "service_name",
+    "region",
+    "usage_quantity",
+    "usage_unit",
+    "cost_amount",
+    "currency",
+    "tags",
+    "created_at",
+)
+
+
+def _load_and_normalize(
+    connector: ProviderConnector,
+    normalizer: FocusNormalizer,
+    provider: DataSourceProvider,
+    content: bytes,
+    filename: str,
+    max_rows: int,
+) -> Tuple[int, NormalizedCostBatch, List[str]]:
+    """Parse and normalise an upload; runs in the analysis process pool."""
+    df = connector.load_dataframe(content=content, filename=filename, max_rows=max_rows)
+    batch, validation_errors = normalizer.normalize_batch(provider=provider, df=df)
+    return int(len(df.index)), batch, validation_errors
+
+
 class DataSourceRegistryService:
     def __init__(self, organization_id: UUID):
         self.organization_id = organization_id
@@ -151,6 +188,7 @@ class DataSourceRegistryService:
             "CREATE INDEX IF NOT EXISTS idx_data_source_runs_org ON data_source_runs (organization_id, data_source_id, created_at)",
             "CREATE INDEX IF NOT EXISTS idx_normalized_cost_org_month ON normalized_cost_partitions (organization_id, partition_month)",
             "CREATE INDEX IF NOT EXISTS idx_normalized_cost_provider ON normalized_cost_partitions (organization_id, provider_type, service_name)",
+            "CREATE INDEX IF NOT EXISTS idx_normalized_cost_source_month ON normalized_cost_partitions (data_source_id, partition_month)",
         ]
 
         engine = self.db.engine
@@ -415,8 +453,15 @@ class DataSourceRegistryService:
             source_file_id=source_file_id,
         )
 
-        df = connector.load_dataframe(content=content, filename=filename, max_rows=settings.f001_upload_max_rows)
-        records, validation_errors = self.normalizer.normalize(provider=provider, df=df)
+        records_read, records, validation_errors = await run_in_analysis_pool(
+            _load_and_normalize,
+            connector,
+            self.normalizer,
+            provider,
+            content,
+            filename,
+            settings.f001_upload_max_rows,
+        )
 
         await self._store_normalized_records(data_source_id=data_source_id, run_id=run_id, records=records)
         final_status = DataSourceRunStatus.COMPLETED if records else DataSourceRunStatus.FAILED
@@ -424,7 +469,7 @@ class DataSourceRegistryService:
         await self._finish_run(
             run_id=run_id,
             status=final_status,
-            records_read=int(len(df.index)),
+            records_read=records_read,
             records_normalized=len(records),
             validation_errors=validation_errors,
             run_metadata={
@@ -435,7 +480,7 @@ class DataSourceRegistryService:
 
         await self._audit(actor_id, "data_source_upload_ingested", "data_source", data_source_id, {
             "run_id": str(run_id),
-            "records_read": int(len(df.index)),
+            "records_read": records_read,
             "records_normalized": len(records),
             "status": final_status.value,
         })
@@ -446,7 +491,7 @@ class DataSourceRegistryService:
             status=final_status,
             file_name=filename,
             file_checksum=checksum,
-            records_read=int(len(df.index)),
+            records_read=records_read,
             records_normalized=len(records),
             validation_errors=validation_errors,
         )
@@ -638,54 +683,77 @@ class DataSourceRegistryService:
         self,
         data_source_id: UUID,
         run_id: UUID,
-        records: Sequence[NormalizedCostRecord],
+        records: NormalizedCostBatch,
     ) -> None:
+        """
+        Swap in ``records`` as this source's rows for every month they cover.
+
+        Existing rows for those (source, month) partitions are deleted and the
+        batch is bulk-loaded with binary ``COPY`` in the same transaction, so
+        re-ingesting an export replaces its months instead of appending and
+        readers never see a half-loaded month. A transaction-scoped advisory
+        lock serialises concurrent loads of the same source.
+        """
         if not records:
             return
 
-        query = text(
-            """
-            INSERT INTO normalized_cost_partitions (
-                id, organization_id, data_source_id, run_id, provider_type,
-                partition_month, billing_period_start, billing_period_end,
-                account_or_project_id, service_name, region,
-                usage_quantity, usage_unit, cost_amount, currency, tags,
-                created_at
-            ) VALUES (
-                :id, :organization_id, :data_source_id, :run_id, :provider_type,
-                :partition_month, :billing_period_start, :billing_period_end,
-                :account_or_project_id, :service_name, :region,
-                :usage_quantity, :usage_unit, :cost_amount, :currency, :tags::jsonb,
-                :created_at
-            )
-            """
-        )
-        now = datetime.now(timezone.utc)
+        months = sorted(set(records.partition_month))
         engine = await self._engine()
         async with engine.begin() as conn:
-            for rec in records:
-                await conn.execute(
-                    query,
-                    {
-                        "id": uuid4(),
-                        "organization_id": self.organization_id,
-                        "data_source_id": data_source_id,
-                        "run_id": run_id,
-                        "provider_type": rec.provider_type.value,
-                        "partition_month": rec.partition_month,
-                        "billing_period_start": rec.billing_period_start,
-                        "billing_period_end": rec.billing_period_end,
-                        "account_or_project_id": rec.account_or_project_id,
-                        "service_name": rec.service_name,
-                        "region": rec.region,
-                        "usage_quantity": rec.usage_quantity,
-                        "usage_unit": rec.usage_unit,
-                        "cost_amount": rec.cost_amount,
-                        "currency": rec.currency,
-                        "tags": rec.tags,
-                        "created_at": now,
-                    },
-                )
+            await conn.execute(
+                text("SELECT pg_advisory_xact_lock(hashtext(:lock_key))"),
+                {"lock_key": f"normalized_cost_partitions:{data_source_id}"},
+            )
+            await conn.execute(
+                text(
+                    """
+                    DELETE FROM normalized_cost_partitions
+                    WHERE organization_id = :organization_id
+                        AND data_source_id = :data_source_id
+                        AND partition_month = ANY(:months)
+                    """
+                ),
+                {"organization_id": self.organization_id, "data_source_id": data_source_id, "months": months},
+            )
+            # The statements above opened the transaction on the underlying
+            # asyncpg connection, so the COPY commits or rolls back with them.
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                "normalized_cost_partitions",
+                records=self._partition_rows(data_source_id, run_id, records),
+                columns=_PARTITION_COLUMNS,
+            )
+
+    def _partition_rows(
+        self,
+        data_source_id: UUID,
+        run_id: UUID,
+        records: NormalizedCostBatch,
+    ) -> Iterator[Tuple[Any, ...]]:
+        """Rows for ``copy_records_to_table`` in ``_PARTITION_COLUMNS`` order."""
+        now = datetime.now(timezone.utc)
+        provider_type = records.provider_type.value
+        for month, account, service, region, quantity, unit, cost, currency, count in records.rows():
+            yield (
+                uuid4(),
+                self.organization_id,
+                data_source_id,
+                run_id,
+                provider_type,
+                month,
+                month,
+                month,
+                account,
+                service,
+                region,
+                # Binary COPY has no implicit casts: NUMERIC wants Decimal, JSONB wants text
+                Decimal(repr(quantity)),
+                unit,
+                Decimal(repr(cost)),
+                currency,
+                f'{{"aggregated_record_count": {int(count)}}}',
+                now,
+            )
 
     async def _get_source_row(self, data_source_id: UUID) -> Optional[Dict[str, Any]]:
         await self._ensure_db()
@@ -271,4 +271,30 @@ class DatabaseService:
     async def close(self):
         """Close database connections"""
         if self.engine:
-            await self.engine.dispose()
\ No newline at end of file
+            await self.engine.dispose()
+
+# Process-wide service: one async engine (and connection pool) per worker,
+# shared by the request hot paths instead of a DatabaseService per caller.
+_shared_service: Optional[DatabaseService] = None
+_shared_init_lock: Optional[asyncio.Lock] = None
+
+
+def shared_database_service() -> DatabaseService:
+    """The process-wide DatabaseService (not necessarily initialized yet)."""
+    global _shared_service
+    if _shared_service is None:
+        _shared_service = DatabaseService()
+    return _shared_service
+
+
+async def get_database_service() -> DatabaseService:
+    """The process-wide DatabaseService, initialized on first use."""
+    global _shared_init_lock
+    service = shared_database_service()
+    if service.engine is None:
+        if _shared_init_lock is None:
+            _shared_init_lock = asyncio.Lock()
+        async with _shared_init_lock:
+            if service.engine is None:
+                await service.initialize()
+    return service
@@ -7,23 +7,36 @@ UPS confidence is marginal (< threshold).
 Design:
 - Load sentence-transformers model once (lazy singleton)
 - Maintain canonical examples per intent
-- Provide route_intent(query) -> {intent, similarity_map}
+- Encode the exemplars once into a single contiguous, unit-normalized matrix
+  (``ExemplarIndex``); scoring a query is one matrix-vector product plus a
+  per-intent max. Warmed at startup, optionally persisted as a memory-mapped
+  ``.npy`` under ``embedding_router_index_dir`` keyed by model name and
+  exemplar hash, so restarts skip re-encoding.
+- Provide route_intent(query) -> {intent: similarity} and route_intents(queries)
+  for batch scoring (UPS evaluator)
 - Expose adjust(intent, ups_confidence) to raise confidence if embedding strongly supports selection
 
 NOTE: For performance in container environments, consider switching to a smaller model later.
 """
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import threading
+from dataclasses import dataclass
 from functools import lru_cache
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 import structlog
 
+from backend.config.settings import get_settings
+
 try:
-    from sentence_transformers import SentenceTransformer, util
+    from sentence_transformers import SentenceTransformer
 except Exception:  # pragma: no cover - model import errors
     SentenceTransformer = None  # type: ignore
-    util = None  # type: ignore
 
 logger = structlog.get_logger(__name__)
 
@@ -107,30 +120,137 @@ def _load_model():
     return _model
 
 
+@dataclass(frozen=True)
+class ExemplarIndex:
+    """Unit-normalized exemplar embeddings, grouped into one row block per intent."""
+
+    intents: Tuple[str, ...]
+    starts: np.ndarray  # first row of each intent's block
+    matrix: np.ndarray  # (n_exemplars, dim) float32, C-contiguous
+
+    def score(self, query_vectors: np.ndarray) -> np.ndarray:
+        """(n_queries, n_intents) max cosine similarity per intent."""
+        sims = np.atleast_2d(query_vectors).astype(np.float32, copy=False) @ self.matrix.T
+        return np.maximum.reduceat(sims, self.starts, axis=1)
+
+    def as_maps(self, scores: np.ndarray) -> List[Dict[str, float]]:
+        return [
+            {intent: float(value) for intent, value in zip(self.intents, row)}
+            for row in scores
+        ]
+
+
+_index_lock = threading.Lock()
+_index: Optional[ExemplarIndex] = None
+
+
+def _exemplar_layout() -> Tuple[Tuple[str, ...], np.ndarray, List[str]]:
+    intents, starts, sentences = [], [], []
+    for intent, examples in _INTENT_EXAMPLES.items():
+        if not examples:
+            continue
+        intents.append(intent)
+        starts.append(len(sentences))
+        sentences.extend(examples)
+    return tuple(intents), np.asarray(starts, dtype=np.intp), sentences
+
+
+def exemplar_fingerprint() -> str:
+    """Hash of the model name and exemplar set; changes invalidate persisted matrices."""
+    payload = json.dumps([_MODEL_NAME, _INTENT_EXAMPLES], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _index_path(directory: str) -> str:
+    return os.path.join(directory, f"{_MODEL_NAME.replace('/', '__')}-{exemplar_fingerprint()}.npy")
+
+
+def _load_persisted(path: str, rows: int) -> Optional[np.ndarray]:
+    try:
+        matrix = np.load(path, mmap_mode="r")
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable exemplar matrix", path=path, error=str(e))
+        return None
+    if matrix.ndim != 2 or matrix.shape[0] != rows or matrix.dtype != np.float32:
+        logger.warning("Ignoring exemplar matrix with unexpected shape", path=path, shape=matrix.shape)
+        return None
+    return matrix
+
+
+def _persist(path: str, matrix: np.ndarray) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, matrix)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not persist exemplar matrix", path=path, error=str(e))
+
+
+def build_exemplar_index(model=None, directory: Optional[str] = None) -> ExemplarIndex:
+    """Encode (or memory-map) the exemplar matrix."""
+    intents, starts, sentences = _exemplar_layout()
+    path = _index_path(directory) if directory else None
+    matrix = _load_persisted(path, len(sentences)) if path else None
+    if matrix is None:
+        model = model or _load_model()
+        matrix = np.ascontiguousarray(
+            model.encode(sentences, convert_to_numpy=True, normalize_embeddings=True),
+            dtype=np.float32,
+        )
+        if path:
+            _persist(path, matrix)
+        logger.info("Encoded intent exemplars", exemplars=len(sentences), intents=len(intents))
+    return ExemplarIndex(intents=intents, starts=starts, matrix=matrix)
+
+
+def get_exemplar_index() -> Optional[ExemplarIndex]:
+    """Process-wide exemplar index, built on first use; None without the model."""
+    global _index
+    if SentenceTransformer is None:
+        return None
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = build_exemplar_index(directory=get_settings().embedding_router_index_dir)
+    return _index
+
+
+def warm_exemplar_index() -> bool:
+    """Load the model and exemplar matrix ahead of the first query (startup hook)."""
+    try:
+        return get_exemplar_index() is not None
+    except Exception as e:
+        logger.warning("Embedding router warm-up failed", error=str(e))
+        return False
+
+
+def route_intents(queries: Sequence[str]) -> List[Dict[str, float]]:
+    """Similarity scores per intent for each query, encoded in one batch."""
+    if not queries:
+        return []
+    index = get_exemplar_index()
+    if index is None:
+        logger.warning("SentenceTransformer not available; returning empty similarity map")
+        return [{} for _ in queries]
+    vectors = _load_model().encode(list(queries), convert_to_numpy=True, normalize_embeddings=True)
+    return index.as_maps(index.score(vectors))
+
+
 def route_intent(query: str) -> Dict[str, float]:
     """Return similarity scores per intent for the given query."""
+    return route_intents([query])[0]
+
+
+def encode(texts: List[str]):
+    """Unit-length embeddings (numpy, one row per text), or None without the model."""
     if SentenceTransformer is None:
-        logger.warning("SentenceTransformer not available; returning empty similarity map")
-        return {}
+        return None
     model = _load_model()
-    # Build corpus of exemplar sentences with mapping
-    corpus_sentences: List[str] = []
-    corpus_labels: List[str] = []
-    for intent, examples in _INTENT_EXAMPLES.items():
-        for ex in examples:
-            corpus_sentences.append(ex)
-            corpus_labels.append(intent)
-    query_emb = model.encode(query, convert_to_tensor=True)
-    corpus_emb = model.encode(corpus_sentences, convert_to_tensor=True)
-    sims = util.cos_sim(query_emb, corpus_emb)[0]  # shape: (len(corpus))
-    # Aggregate max similarity per intent
-    intent_scores: Dict[str, float] = {}
-    for idx, sim in enumerate(sims):
-        intent = corpus_labels[idx]
-        score = float(sim)
-        if intent not in intent_scores or score > intent_scores[intent]:
-            intent_scores[intent] = score
-    return intent_scores
+    return model.encode(texts, convert_to_numpy=True, normalize_embeddings=True)
 
 
 def choose_intent(similarity_map: Dict[str, float]) -> Tuple[str, float]:
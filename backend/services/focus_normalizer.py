@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import date
 from typing import Any, List, Optional, Tuple, cast
 
 import pandas as pd
 
-from backend.models.data_sources import DataSourceProvider, NormalizedCostRecord
+from backend.models.data_sources import DataSourceProvider, NormalizedCostBatch, NormalizedCostRecord
 
 
 class FocusNormalizer:
@@ -51,6 +50,15 @@ class FocusNormalizer:
         provider: DataSourceProvider,
         df: pd.DataFrame,
     ) -> Tuple[List[NormalizedCostRecord], List[str]]:
+        batch, errors = self.normalize_batch(provider, df)
+        return batch.records(), errors
+
+    def normalize_batch(
+        self,
+        provider: DataSourceProvider,
+        df: pd.DataFrame,
+    ) -> Tuple[NormalizedCostBatch, List[str]]:
+        """Like :meth:`normalize`, but returns the grouped rows column-wise."""
         if provider == DataSourceProvider.AWS_CUR:
             return self._normalize_aws(df)
         if provider == DataSourceProvider.AZURE_EXPORT:
@@ -59,7 +67,8 @@ class FocusNormalizer:
             return self._normalize_generic(provider, df)
         return self._normalize_generic(DataSourceProvider.GENERIC_COST, df)
 
-    def _normalize_aws(self, df: pd.DataFrame) -> Tuple[List[NormalizedCostRecord], List[str]]:
+    def _normalize_aws(self, df: pd.DataFrame) -> Tuple[NormalizedCostBatch, List[str]]:
+        provider = DataSourceProvider.AWS_CUR
         errors: List[str] = []
         required = [
             "line_item_usage_start_date",
@@ -68,7 +77,7 @@ class FocusNormalizer:
         ]
         missing = [c for c in required if c not in df.columns]
         if missing:
-            return [], [f"Missing required AWS CUR columns: {', '.join(missing)}"]
+            return NormalizedCostBatch(provider), [f"Missing required AWS CUR columns: {', '.join(missing)}"]
 
         work = df.copy()
         work["_usage_start"] = pd.to_datetime(work["line_item_usage_start_date"], errors="coerce", utc=True)
@@ -88,44 +97,24 @@ class FocusNormalizer:
         mask = work["_usage_start"].notna().to_numpy()
         work = work[mask]
         if work.empty:
-            return [], errors or ["No valid rows after date validation"]
+            return NormalizedCostBatch(provider), errors or ["No valid rows after date validation"]
 
-        work["_partition_month"] = work["_usage_start"].apply(
-            lambda ts: date(int(getattr(ts, "year")), int(getattr(ts, "month")), 1)
-        )
+        work["_partition_month"] = self._partition_month(work["_usage_start"])
 
         grouped = (
             work.groupby(["_partition_month", "_service", "_account", "_region"], dropna=False)
             .agg(cost_amount=("_cost", "sum"), usage_quantity=("_quantity", "sum"), record_count=("_cost", "count"))
             .reset_index()
         )
-
-        out: List[NormalizedCostRecord] = []
-        for _, row in grouped.iterrows():
-            month = row["_partition_month"]
-            out.append(
-                NormalizedCostRecord(
-                    provider_type=DataSourceProvider.AWS_CUR,
-                    billing_period_start=month,
-                    billing_period_end=month,
-                    partition_month=month,
-                    account_or_project_id=self._str_or_none(row["_account"]),
-                    service_name=str(row["_service"]),
-                    region=self._str_or_none(row["_region"]),
-                    usage_quantity=float(row["usage_quantity"]),
-                    usage_unit=None,
-                    cost_amount=float(row["cost_amount"]),
-                    currency="USD",
-                    tags={"aggregated_record_count": int(row["record_count"])},
-                )
-            )
-        return out, errors
+        grouped["_currency"] = "USD"
+        grouped["_unit"] = None
+        return self._to_batch(provider, grouped), errors
 
     def _normalize_generic(
         self,
         provider: DataSourceProvider,
         df: pd.DataFrame,
-    ) -> Tuple[List[NormalizedCostRecord], List[str]]:
+    ) -> Tuple[NormalizedCostBatch, List[str]]:
         aliases = self._ALIASES[provider]
         errors: List[str] = []
 
@@ -140,11 +129,11 @@ class FocusNormalizer:
         date_col = pick("usage_start")
 
         if cost_col is None:
-            return [], ["Missing required cost column"]
+            return NormalizedCostBatch(provider), ["Missing required cost column"]
         if svc_col is None:
-            return [], ["Missing required service column"]
+            return NormalizedCostBatch(provider), ["Missing required service column"]
         if date_col is None:
-            return [], ["Missing required usage/date column"]
+            return NormalizedCostBatch(provider), ["Missing required usage/date column"]
 
         currency_col = pick("currency", "USD")
         account_col = pick("account", "")
@@ -170,37 +159,39 @@ class FocusNormalizer:
         mask = work["_usage_start"].notna().to_numpy()
         work = work[mask]
         if work.empty:
-            return [], errors or ["No valid rows after date validation"]
+            return NormalizedCostBatch(provider), errors or ["No valid rows after date validation"]
 
-        work["_partition_month"] = work["_usage_start"].apply(
-            lambda ts: date(int(getattr(ts, "year")), int(getattr(ts, "month")), 1)
-        )
+        work["_partition_month"] = self._partition_month(work["_usage_start"])
         grouped = (
             work.groupby(["_partition_month", "_service", "_account", "_region", "_currency", "_unit"], dropna=False)
             .agg(cost_amount=("_cost", "sum"), usage_quantity=("_quantity", "sum"), record_count=("_cost", "count"))
             .reset_index()
         )
+        return self._to_batch(provider, grouped), errors
 
-        out: List[NormalizedCostRecord] = []
-        for _, row in grouped.iterrows():
-            month: date = row["_partition_month"]
-            out.append(
-                NormalizedCostRecord(
-                    provider_type=provider,
-                    billing_period_start=month,
-                    billing_period_end=month,
-                    partition_month=month,
-                    account_or_project_id=self._str_or_none(row["_account"]),
-                    service_name=str(row["_service"]),
-                    region=self._str_or_none(row["_region"]),
-                    usage_quantity=float(row["usage_quantity"]),
-                    usage_unit=self._str_or_none(row["_unit"]),
-                    cost_amount=float(row["cost_amount"]),
-                    currency=self._str_or_none(row["_currency"]) or "USD",
-                    tags={"aggregated_record_count": int(row["record_count"])},
-                )
-            )
-        return out, errors
+    @staticmethod
+    def _partition_month(usage_start: pd.Series) -> pd.Series:
+        """Truncate UTC timestamps to their calendar month."""
+        return usage_start.dt.tz_localize(None).dt.to_period("M")
+
+    @classmethod
+    def _to_batch(cls, provider: DataSourceProvider, grouped: pd.DataFrame) -> NormalizedCostBatch:
+        services = cls._str_or_none_column(grouped["_service"])
+        if any(s is None for s in services):
+            raise ValueError("service_name is required")
+        currencies = cls._str_or_none_column(grouped["_currency"])
+        return NormalizedCostBatch(
+            provider_type=provider,
+            partition_month=grouped["_partition_month"].dt.start_time.dt.date.tolist(),
+            account_or_project_id=cls._str_or_none_column(grouped["_account"]),
+            service_name=services,
+            region=cls._str_or_none_column(grouped["_region"]),
+            usage_quantity=grouped["usage_quantity"].astype(float).tolist(),
+            usage_unit=cls._str_or_none_column(grouped["_unit"]),
+            cost_amount=grouped["cost_amount"].astype(float).tolist(),
+            currency=[c or "USD" for c in currencies],
+            record_count=grouped["record_count"].astype(int).tolist(),
+        )
 
     @staticmethod
     def _str_or_none(v: Any) -> Optional[str]:
@@ -209,6 +200,12 @@ class FocusNormalizer:
         s = str(v).strip()
         return s if s else None
 
+    @staticmethod
+    def _str_or_none_column(values: pd.Series) -> List[Optional[str]]:
+        """Vectorised :meth:`_str_or_none` over a grouped key column."""
+        text = values.astype(str).str.strip()
+        return text.where(values.notna() & text.ne(""), None).tolist()
+
     @staticmethod
     def _series_or_default(df: pd.DataFrame, column: str, default: Any) -> pd.Series:
         if column in df.columns:
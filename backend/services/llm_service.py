@@ -12,6 +12,7 @@ from botocore.exceptions import ClientError, BotoCoreError
 
 from backend.utils.aws_session import create_aws_session
 from backend.utils.aws_constants import AwsService
+from backend.services.chat_stream_events import ChatStreamEmitter, current_emitter
 
 try:
     from ..config.settings import get_settings
@@ -352,9 +353,16 @@ class BedrockLLMService:
     async def _invoke_bedrock(
         self,
         messages: List[Dict[str, str]],
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        stream_tokens: bool = False
     ) -> str:
-        """Invoke Bedrock model using Converse API with fallback to InvokeModel."""
+        """
+        Invoke Bedrock model using Converse API with fallback to InvokeModel.
+
+        With ``stream_tokens`` and a /chat/stream emitter bound, the call uses
+        ``converse_stream`` and forwards each text delta as a ``token`` event
+        while still returning the full text.
+        """
         bedrock_messages = self._convert_to_bedrock_messages(messages, context)
         if not bedrock_messages:
             raise ValueError("At least one message with content is required for Bedrock invocation")
@@ -373,28 +381,50 @@ class BedrockLLMService:
             elif "max_tokens" in self.model_kwargs:
                 del self.model_kwargs["max_tokens"]
 
+        def _converse_request() -> Dict[str, Any]:
+            request_payload: Dict[str, Any] = {
+                "modelId": self.model_id,
+                "messages": bedrock_messages,
+            }
+            if inference_config:
+                request_payload["inferenceConfig"] = inference_config
+            additional_fields = {
+                key: value for key, value in self.model_kwargs.items()
+                if key not in {"temperature", "top_p", "max_tokens", "p", "stop_sequences", "stopWords", "response_format"}
+            }
+            # Do NOT set response_format on Converse (it caused ValidationException);
+            # we will set it on InvokeModel payload instead.
+            if additional_fields:
+                request_payload["additionalModelRequestFields"] = additional_fields
+            return request_payload
+
         async def _call_converse() -> Dict[str, Any]:
             loop = asyncio.get_running_loop()
 
             def _do_call() -> Dict[str, Any]:
-                request_payload: Dict[str, Any] = {
-                    "modelId": self.model_id,
-                    "messages": bedrock_messages,
-                }
-                if inference_config:
-                    request_payload["inferenceConfig"] = inference_config
-                additional_fields = {
-                    key: value for key, value in self.model_kwargs.items()
-                    if key not in {"temperature", "top_p", "max_tokens", "p", "stop_sequences", "stopWords", "response_format"}
-                }
-                # Do NOT set response_format on Converse (it caused ValidationException);
-                # we will set it on InvokeModel payload instead.
-                if additional_fields:
-                    request_payload["additionalModelRequestFields"] = additional_fields
-                return self.bedrock_client.converse(**request_payload)
+                return self.bedrock_client.converse(**_converse_request())
 
             return await loop.run_in_executor(None, _do_call)
 
+        streamed: List[str] = []
+
+        async def _call_converse_stream(emitter: ChatStreamEmitter) -> str:
+            loop = asyncio.get_running_loop()
+
+            def _do_stream() -> str:
+                response = self.bedrock_client.converse_stream(**_converse_request())
+                for event in response.get("stream") or []:
+                    error_key = next((key for key in event if key.endswith("Exception")), None)
+                    if error_key:
+                        raise RuntimeError(f"{error_key}: {event[error_key].get('message', '')}")
+                    delta = event.get("contentBlockDelta", {}).get("delta", {}).get("text")
+                    if delta:
+                        streamed.append(delta)
+                        emitter.emit_threadsafe("token", text=delta)
+                return "".join(streamed).strip()
+
+            return await loop.run_in_executor(None, _do_stream)
+
         async def _call_invoke() -> Dict[str, Any]:
             loop = asyncio.get_running_loop()
 
@@ -463,6 +493,19 @@ class BedrockLLMService:
             for prefix in ("apac.", "us.", "eu.", "global.")
         )
 
+        emitter = current_emitter() if stream_tokens else None
+        if self.use_converse_api and emitter is not None:
+            try:
+                text = await _call_converse_stream(emitter)
+                if text:
+                    logger.info("Bedrock converse_stream call succeeded for model %s", self.model_id)
+                    return text
+            except Exception as stream_error:
+                if streamed:
+                    # Client already saw part of the answer; let the caller handle it
+                    raise
+                logger.warning(f"Bedrock converse_stream failed, using non-streaming converse: {stream_error}")
+
         if self.use_converse_api:
             try:
                 response = await _call_converse()
@@ -13,6 +13,7 @@ import structlog
 from datetime import datetime
 
 from backend.services.database import DatabaseService
+from backend.services.request_context_cache import request_context_cache
 from backend.utils.encryption import get_field_encryptor
 from backend.utils.sql_validation import (
     validate_date,
@@ -89,7 +90,9 @@ class MultiAccountService:
             account_name=account_name,
             business_unit=business_unit
         )
-        
+
+        # Admins and organization-wide scopes see every active account
+        await request_context_cache.invalidate_all()
         return result
     
     async def _validate_account_access(
@@ -352,6 +355,7 @@ class MultiAccountService:
             WHERE account_id = $3
         """
         await self.db.execute(query, status, error_message, account_id)
+        await request_context_cache.invalidate_all()
     
     async def grant_account_access(
         self,
@@ -398,6 +402,7 @@ class MultiAccountService:
             user_email=user_email,
             access_level=access_level
         )
+        await request_context_cache.invalidate_user(user_email=user_email)
     
     async def list_user_accounts(
         self,
@@ -3,14 +3,39 @@ Opportunities Service
 
 Data access layer for opportunities table operations.
 Handles CRUD, filtering, sorting, and aggregations.
+
+Connections come from a bounded, process-wide psycopg2 pool. The hot
+list/get/stats reads run as named prepared statements, PREPAREd once per
+pooled connection and reused, so repeat requests skip parse and plan.
+Every public method has an ``*_async`` variant that runs it on a worker
+thread, so FastAPI endpoints never block the event loop on Postgres.
+
+Dashboard statistics are aggregated in a single GROUPING SETS pass and kept
+per organization in ``opportunity_stats``; writes refresh the affected
+organization's row in their own transaction.
+
+Exports stream from a server-side cursor in bounded batches and are encoded
+(CSV, NDJSON or JSON, optionally gzipped) chunk by chunk.
 """
 
+import asyncio
+import csv
+import hashlib
+import io
+import zlib
 import psycopg2
-from psycopg2.extras import RealDictCursor
-from typing import List, Dict, Any, Optional, Tuple
+import psycopg2.extensions
+from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+from collections import OrderedDict
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import List, Dict, Any, AsyncIterator, Iterator, Optional, Tuple
 from uuid import UUID
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 import json
+import re
+import threading
 import structlog
 
 from backend.config.settings import get_settings
@@ -29,6 +54,187 @@ from backend.models.opportunities import (
 logger = structlog.get_logger(__name__)
 settings = get_settings()
 
+# Signals merged per staged statement during ingestion, and rows per
+# execute_values page while staging them.
+_INGEST_CHUNK_SIZE = 10_000
+_STAGE_PAGE_SIZE = 1_000
+
+# Signal keys become column names in the ingest SQL
+_COLUMN_PATTERN = re.compile(r'^[a-z_][a-z0-9_]*$')
+
+
+# Named prepared statements kept per pooled connection (LRU beyond this)
+_MAX_PREPARED_PER_CONNECTION = 64
+
+# Columns faceted by the stats and list aggregations, in GROUPING() order
+_STATS_FACETS = ('status', 'category', 'service', 'source', 'effort_level')
+_LIST_FACETS = ('status', 'category', 'service')
+
+
+class _PreparingConnection(psycopg2.extensions.connection):
+    """psycopg2 connection that remembers the statements it has PREPAREd."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared: "OrderedDict[str, str]" = OrderedDict()
+
+
+_pool_lock = threading.Lock()
+_pool: Optional[ThreadedConnectionPool] = None
+_pool_slots: Optional[threading.BoundedSemaphore] = None
+_export_slots: Optional[threading.BoundedSemaphore] = None
+
+
+def _get_pool() -> ThreadedConnectionPool:
+    """Initialize and return the process-wide opportunities connection pool."""
+    global _pool, _pool_slots
+    if _pool is not None:
+        return _pool
+    with _pool_lock:
+        if _pool is None:
+            max_connections = settings.opportunities_db_pool_max_connections
+            # ThreadedConnectionPool raises when exhausted; callers wait for a slot instead
+            _pool_slots = threading.BoundedSemaphore(max_connections)
+            _pool = ThreadedConnectionPool(
+                minconn=1,
+                maxconn=max_connections,
+                host=settings.postgres_host,
+                port=settings.postgres_port,
+                database=settings.postgres_db,
+                user=settings.postgres_user,
+                password=settings.postgres_password,
+                application_name="aasmaa-opportunities",
+                connection_factory=_PreparingConnection,
+            )
+            logger.info("Initialized PostgreSQL ThreadedConnectionPool for OpportunitiesService")
+    return _pool
+
+
+def _get_export_slots() -> threading.BoundedSemaphore:
+    """Slots for streamed exports, kept apart from the pool so slow downloads can't starve it."""
+    global _export_slots
+    if _export_slots is not None:
+        return _export_slots
+    with _pool_lock:
+        if _export_slots is None:
+            _export_slots = threading.BoundedSemaphore(settings.opportunities_export_max_connections)
+    return _export_slots
+
+
+def _positional(query: str) -> str:
+    """psycopg2 ``%s`` placeholders as PREPARE's ``$n`` parameters."""
+    counter = iter(range(1, query.count('%s') + 1))
+    return re.sub(r'%s|%%', lambda m: f"${next(counter)}" if m.group() == '%s' else '%', query)
+
+
+def _facet_query(facets: Tuple[str, ...], where_clause: str) -> str:
+    """Grand total plus a count per value of each facet, in one scan."""
+    return f"""
+        SELECT
+            GROUPING({', '.join(facets)}) AS grouping_mask,
+            {', '.join(f'{facet}::text AS {facet}' for facet in facets)},
+            COUNT(*) AS count,
+            COUNT(*) FILTER (WHERE status = 'open') AS open_count,
+            COALESCE(SUM(estimated_monthly_savings), 0) AS total_monthly,
+            COALESCE(SUM(estimated_monthly_savings) FILTER (WHERE status = 'open'), 0) AS potential_monthly,
+            COALESCE(SUM(estimated_monthly_savings) FILTER (WHERE status = 'implemented'), 0) AS implemented_monthly
+        FROM opportunities
+        WHERE {where_clause}
+        GROUP BY GROUPING SETS ((), {', '.join(f'({facet})' for facet in facets)})
+    """
+
+
+def _split_facets(
+    rows: List[Dict[str, Any]],
+    facets: Tuple[str, ...],
+) -> Tuple[Dict[str, Any], Dict[str, Dict[Any, int]]]:
+    """Split a ``_facet_query`` result into the grand-total row and per-facet counts."""
+    grand_total = (1 << len(facets)) - 1
+    totals: Dict[str, Any] = {}
+    counts: Dict[str, Dict[Any, int]] = {facet: {} for facet in facets}
+    for row in rows:
+        mask = row['grouping_mask']
+        if mask == grand_total:
+            totals = row
+            continue
+        # GROUPING() sets the bit of every column that was aggregated away
+        for position, facet in enumerate(facets):
+            if not mask & (1 << (len(facets) - 1 - position)):
+                counts[facet][row[facet]] = row['count']
+                break
+    return totals, counts
+
+
+def _by_count(counts: Dict[Any, int], limit: Optional[int] = None) -> Dict[Any, int]:
+    ordered = sorted(counts.items(), key=lambda item: item[1], reverse=True)
+    return dict(ordered[:limit] if limit else ordered)
+
+
+def _csv_value(value: Any) -> Any:
+    # Flatten complex fields
+    if isinstance(value, (dict, list)):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _encode_csv(columns: List[str], rows: List[Dict[str, Any]], first: bool) -> str:
+    output = io.StringIO()
+    writer = csv.writer(output)
+    if first:
+        writer.writerow(columns)
+    writer.writerows([_csv_value(row[column]) for column in columns] for row in rows)
+    return output.getvalue()
+
+
+def _encode_ndjson(columns: List[str], rows: List[Dict[str, Any]], first: bool) -> str:
+    return ''.join(json.dumps(row, default=_json_default) + '\n' for row in rows)
+
+
+def _encode_json(columns: List[str], rows: List[Dict[str, Any]], first: bool) -> str:
+    body = ','.join(json.dumps(row, default=_json_default) for row in rows)
+    if first:
+        return '[' + body
+    return ',' + body if body else ''
+
+
+# Export format -> (batch encoder, closing text)
+_EXPORT_ENCODERS = {
+    'csv': (_encode_csv, ''),
+    'ndjson': (_encode_ndjson, ''),
+    'json': (_encode_json, ']'),
+}
+
+
+async def gzip_chunks(chunks: AsyncIterator[str], level: int = 6) -> AsyncIterator[bytes]:
+    """Gzip a stream of text chunks on the fly."""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    try:
+        async for chunk in chunks:
+            data = compressor.compress(chunk.encode('utf-8'))
+            if data:
+                yield data
+        yield compressor.flush()
+    finally:
+        await chunks.aclose()
+
+
+def _signal_row(signal: Dict[str, Any], columns: Tuple[str, ...]) -> Tuple[Any, ...]:
+    """Signal values in column order, with dicts/lists encoded as JSON."""
+    return tuple(
+        json.dumps(value) if isinstance(value, (dict, list)) else value
+        for value in (signal[column] for column in columns)
+    )
+
 
 class OpportunitiesService:
     """
@@ -46,17 +252,92 @@ class OpportunitiesService:
     def __init__(self, organization_id: Optional[UUID] = None):
         """Initialize service with optional organization scoping"""
         self.organization_id = organization_id
-        self.db_config = {
-            'host': settings.postgres_host,
-            'port': settings.postgres_port,
-            'database': settings.postgres_db,
-            'user': settings.postgres_user,
-            'password': settings.postgres_password
-        }
 
-    def _get_connection(self):
-        """Get database connection"""
-        return psycopg2.connect(**self.db_config)
+    @contextmanager
+    def _connection(self) -> Iterator[psycopg2.extensions.connection]:
+        """
+        Borrow a pooled connection for one unit of work.
+
+        Uncommitted work is rolled back before the connection goes back to
+        the pool; a connection that raised a database error is discarded.
+        """
+        pool = _get_pool()
+        if not _pool_slots.acquire(timeout=settings.opportunities_db_pool_timeout_seconds):
+            raise PoolError("Timed out waiting for an opportunities database connection")
+        conn = None
+        try:
+            conn = pool.getconn()
+            yield conn
+        except psycopg2.Error:
+            if conn is not None:
+                pool.putconn(conn, close=True)
+                conn = None
+            raise
+        finally:
+            if conn is not None:
+                try:
+                    if conn.status != psycopg2.extensions.STATUS_READY:
+                        conn.rollback()
+                    pool.putconn(conn)
+                except psycopg2.Error:
+                    pool.putconn(conn, close=True)
+            _pool_slots.release()
+
+    @contextmanager
+    def _export_connection(self) -> Iterator[psycopg2.extensions.connection]:
+        """
+        Open a dedicated, unpooled connection for one streamed export.
+
+        An export holds its connection while the client downloads, so it
+        takes one of ``opportunities_export_max_connections`` export slots
+        instead of a pooled connection. The connection is closed on exit.
+        """
+        slots = _get_export_slots()
+        if not slots.acquire(timeout=settings.opportunities_db_pool_timeout_seconds):
+            raise PoolError("Timed out waiting for an opportunities export connection")
+        try:
+            conn = psycopg2.connect(
+                host=settings.postgres_host,
+                port=settings.postgres_port,
+                database=settings.postgres_db,
+                user=settings.postgres_user,
+                password=settings.postgres_password,
+                application_name="aasmaa-opportunities-export",
+            )
+            try:
+                yield conn
+            finally:
+                conn.close()
+        finally:
+            slots.release()
+
+    def _execute_prepared(self, cur, query: str, params: List[Any]) -> None:
+        """
+        Execute a hot read as a named prepared statement on this connection.
+
+        Falls back to a plain execute when prepared statements are disabled
+        (e.g. behind a transaction-pooling PgBouncer).
+        """
+        prepared = getattr(cur.connection, 'prepared', None)
+        if prepared is None or not settings.opportunities_db_prepared_statements:
+            cur.execute(query, params)
+            return
+
+        name = prepared.get(query)
+        if name is None:
+            name = f"opp_{hashlib.sha1(query.encode('utf-8')).hexdigest()[:16]}"
+            cur.execute(f"PREPARE {name} AS {_positional(query)}")
+            prepared[query] = name
+            if len(prepared) > _MAX_PREPARED_PER_CONNECTION:
+                _, evicted = prepared.popitem(last=False)
+                cur.execute(f"DEALLOCATE {evicted}")
+        else:
+            prepared.move_to_end(query)
+
+        if params:
+            cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+        else:
+            cur.execute(f"EXECUTE {name}")
 
     def _validate_ownership(
         self,
@@ -257,97 +538,49 @@ class OpportunitiesService:
             Paginated list response with aggregations
         """
         try:
-            conn = self._get_connection()
-            cur = conn.cursor(cursor_factory=RealDictCursor)
-
-            params = []
-            where_clause = self._build_where_clause(filter, params)
-            order_clause = self._get_order_clause(sort)
-
-            # Get total count
-            count_query = f"SELECT COUNT(*) FROM opportunities WHERE {where_clause}"
-            cur.execute(count_query, params)
-            total = cur.fetchone()['count']
-
-            # Calculate pagination
-            offset = (page - 1) * page_size
-            total_pages = (total + page_size - 1) // page_size if total > 0 else 0
-
-            # Get items
-            items_query = f"""
-                SELECT
-                    id, title, service, category, status,
-                    estimated_monthly_savings, priority_score,
-                    effort_level, risk_level, resource_id, region,
-                    first_detected_at, last_seen_at
-                FROM opportunities
-                WHERE {where_clause}
-                ORDER BY {order_clause}
-                LIMIT %s OFFSET %s
-            """
-            cur.execute(items_query, params + [page_size, offset])
-            items = [OpportunitySummary(**dict(row)) for row in cur.fetchall()]
-
-            # Get aggregations if requested
-            total_monthly_savings = None
-            status_counts = None
-            category_counts = None
-            service_counts = None
-
-            if include_aggregations:
-                # Reset params for aggregation queries
-                agg_params = []
-                agg_where = self._build_where_clause(filter, agg_params)
-
-                # Total savings
-                savings_query = f"""
-                    SELECT COALESCE(SUM(estimated_monthly_savings), 0) as total
+            with self._connection() as conn:
+                cur = conn.cursor(cursor_factory=RealDictCursor)
+
+                params = []
+                where_clause = self._build_where_clause(filter, params)
+                order_clause = self._get_order_clause(sort)
+
+                # Get items
+                offset = (page - 1) * page_size
+                items_query = f"""
+                    SELECT
+                        id, title, service, category, status,
+                        estimated_monthly_savings, priority_score,
+                        effort_level, risk_level, resource_id, region,
+                        first_detected_at, last_seen_at
                     FROM opportunities
-                    WHERE {agg_where}
+                    WHERE {where_clause}
+                    ORDER BY {order_clause}
+                    LIMIT %s OFFSET %s
                 """
-                cur.execute(savings_query, agg_params)
-                total_monthly_savings = float(cur.fetchone()['total'])
-
-                # Status counts
-                agg_params = []
-                agg_where = self._build_where_clause(filter, agg_params)
-                status_query = f"""
-                    SELECT status::text, COUNT(*) as count
-                    FROM opportunities
-                    WHERE {agg_where}
-                    GROUP BY status
-                """
-                cur.execute(status_query, agg_params)
-                status_counts = {row['status']: row['count'] for row in cur.fetchall()}
-
-                # Category counts
-                agg_params = []
-                agg_where = self._build_where_clause(filter, agg_params)
-                category_query = f"""
-                    SELECT category::text, COUNT(*) as count
-                    FROM opportunities
-                    WHERE {agg_where}
-                    GROUP BY category
-                """
-                cur.execute(category_query, agg_params)
-                category_counts = {row['category']: row['count'] for row in cur.fetchall()}
-
-                # Service counts
-                agg_params = []
-                agg_where = self._build_where_clause(filter, agg_params)
-                service_query = f"""
-                    SELECT service, COUNT(*) as count
-                    FROM opportunities
-                    WHERE {agg_where}
-                    GROUP BY service
-                    ORDER BY count DESC
-                    LIMIT 10
-                """
-                cur.execute(service_query, agg_params)
-                service_counts = {row['service']: row['count'] for row in cur.fetchall()}
+                self._execute_prepared(cur, items_query, params + [page_size, offset])
+                items = [OpportunitySummary(**dict(row)) for row in cur.fetchall()]
+
+                # Total count, plus the aggregations in the same pass if requested
+                total_monthly_savings = None
+                status_counts = None
+                category_counts = None
+                service_counts = None
+
+                if include_aggregations:
+                    self._execute_prepared(cur, _facet_query(_LIST_FACETS, where_clause), params)
+                    totals, counts = _split_facets(cur.fetchall(), _LIST_FACETS)
+                    total = totals['count']
+                    total_monthly_savings = float(totals['total_monthly'])
+                    status_counts = counts['status']
+                    category_counts = counts['category']
+                    service_counts = _by_count(counts['service'], limit=10)
+                else:
+                    count_query = f"SELECT COUNT(*) FROM opportunities WHERE {where_clause}"
+                    self._execute_prepared(cur, count_query, params)
+                    total = cur.fetchone()['count']
 
-            cur.close()
-            conn.close()
+            total_pages = (total + page_size - 1) // page_size if total > 0 else 0
 
             return OpportunityListResponse(
                 items=items,
@@ -386,27 +619,24 @@ class OpportunitiesService:
             HTTPException: 403 if user doesn't have permission
         """
         try:
-            conn = self._get_connection()
-            cur = conn.cursor(cursor_factory=RealDictCursor)
+            with self._connection() as conn:
+                cur = conn.cursor(cursor_factory=RealDictCursor)
 
-            query = """
-                SELECT *
-                FROM opportunities
-                WHERE id = %s
-            """
-
-            params = [str(opportunity_id)]
+                query = """
+                    SELECT *
+                    FROM opportunities
+                    WHERE id = %s
+                """
 
-            # Add organization scoping if set
-            if self.organization_id:
-                query += " AND organization_id = %s"
-                params.append(str(self.organization_id))
+                params = [str(opportunity_id)]
 
-            cur.execute(query, params)
-            row = cur.fetchone()
+                # Add organization scoping if set
+                if self.organization_id:
+                    query += " AND organization_id = %s"
+                    params.append(str(self.organization_id))
 
-            cur.close()
-            conn.close()
+                self._execute_prepared(cur, query, params)
+                row = cur.fetchone()
 
             if not row:
                 return None
@@ -433,36 +663,34 @@ class OpportunitiesService:
             Created opportunity
         """
         try:
-            conn = self._get_connection()
-            cur = conn.cursor(cursor_factory=RealDictCursor)
-
-            # Add organization_id if set
-            if self.organization_id and 'organization_id' not in data:
-                data['organization_id'] = str(self.organization_id)
-
-            # Build insert query dynamically
-            columns = list(data.keys())
-            placeholders = ['%s'] * len(columns)
-            values = []
-
-            for col in columns:
-                val = data[col]
-                if isinstance(val, (dict, list)):
-                    val = json.dumps(val)
-                values.append(val)
-
-            query = f"""
-                INSERT INTO opportunities ({', '.join(columns)})
-                VALUES ({', '.join(placeholders)})
-                RETURNING *
-            """
-
-            cur.execute(query, values)
-            row = cur.fetchone()
-            conn.commit()
+            with self._connection() as conn:
+                cur = conn.cursor(cursor_factory=RealDictCursor)
+
+                # Add organization_id if set
+                if self.organization_id and 'organization_id' not in data:
+                    data['organization_id'] = str(self.organization_id)
+
+                # Build insert query dynamically
+                columns = list(data.keys())
+                placeholders = ['%s'] * len(columns)
+                values = []
+
+                for col in columns:
+                    val = data[col]
+                    if isinstance(val, (dict, list)):
+                        val = json.dumps(val)
+                    values.append(val)
+
+                query = f"""
+                    INSERT INTO opportunities ({', '.join(columns)})
+                    VALUES ({', '.join(placeholders)})
+                    RETURNING *
+                """
 
-            cur.close()
-            conn.close()
+                cur.execute(query, values)
+                row = cur.fetchone()
+                self._refresh_stats(cur, [row['organization_id']])
+                conn.commit()
 
             logger.info(f"Created opportunity: {row['id']}")
             return OpportunityDetail(**dict(row))
@@ -492,60 +720,57 @@ class OpportunitiesService:
             HTTPException: 403 if user doesn't have permission
         """
         try:
-            conn = self._get_connection()
-            cur = conn.cursor(cursor_factory=RealDictCursor)
+            with self._connection() as conn:
+                cur = conn.cursor(cursor_factory=RealDictCursor)
 
-            # First, fetch the opportunity to validate ownership
-            fetch_query = "SELECT * FROM opportunities WHERE id = %s"
-            fetch_params = [str(opportunity_id)]
+                # First, fetch the opportunity to validate ownership
+                fetch_query = "SELECT * FROM opportunities WHERE id = %s"
+                fetch_params = [str(opportunity_id)]
 
-            if self.organization_id:
-                fetch_query += " AND organization_id = %s"
-                fetch_params.append(str(self.organization_id))
+                if self.organization_id:
+                    fetch_query += " AND organization_id = %s"
+                    fetch_params.append(str(self.organization_id))
 
-            cur.execute(fetch_query, fetch_params)
-            existing = cur.fetchone()
+                cur.execute(fetch_query, fetch_params)
+                existing = cur.fetchone()
 
-            if not existing:
-                cur.close()
-                conn.close()
-                return None
-
-            # Validate ownership if user_id provided
-            if user_id:
-                self._validate_ownership(dict(existing), user_id)
+                if not existing:
+                    return None
 
-            # Build update query
-            set_clauses = []
-            values = []
+                # Validate ownership if user_id provided
+                if user_id:
+                    self._validate_ownership(dict(existing), user_id)
 
-            for col, val in data.items():
-                set_clauses.append(f"{col} = %s")
-                if isinstance(val, (dict, list)):
-                    val = json.dumps(val)
-                values.append(val)
+                # Build update query
+                set_clauses = []
+                values = []
 
-            values.append(str(opportunity_id))
+                for col, val in data.items():
+                    set_clauses.append(f"{col} = %s")
+                    if isinstance(val, (dict, list)):
+                        val = json.dumps(val)
+                    values.append(val)
 
-            query = f"""
-                UPDATE opportunities
-                SET {', '.join(set_clauses)}
-                WHERE id = %s
-            """
+                values.append(str(opportunity_id))
 
-            # Add organization scoping
-            if self.organization_id:
-                query += " AND organization_id = %s"
-                values.append(str(self.organization_id))
+                query = f"""
+                    UPDATE opportunities
+                    SET {', '.join(set_clauses)}
+                    WHERE id = %s
+                """
 
-            query += " RETURNING *"
+                # Add organization scoping
+                if self.organization_id:
+                    query += " AND organization_id = %s"
+                    values.append(str(self.organization_id))
 
-            cur.execute(query, values)
-            row = cur.fetchone()
-            conn.commit()
+                query += " RETURNING *"
 
-            cur.close()
-            conn.close()
+                cur.execute(query, values)
+                row = cur.fetchone()
+                if row:
+                    self._refresh_stats(cur, [row['organization_id']])
+                conn.commit()
 
             if not row:
                 return None
@@ -613,34 +838,35 @@ class OpportunitiesService:
             Tuple of (updated_count, failed_count, errors)
         """
         try:
-            conn = self._get_connection()
-            cur = conn.cursor()
-
-            id_strings = [str(oid) for oid in opportunity_ids]
-            placeholders = build_sql_placeholders(len(id_strings))
-
-            query = f"""
-                UPDATE opportunities
-                SET status = %s,
-                    status_reason = %s,
-                    status_changed_by = %s,
-                    status_changed_at = CURRENT_TIMESTAMP
-                WHERE id IN ({placeholders})
-            """
+            with self._connection() as conn:
+                cur = conn.cursor(cursor_factory=RealDictCursor)
+
+                id_strings = [str(oid) for oid in opportunity_ids]
+                placeholders = build_sql_placeholders(len(id_strings))
+
+                query = f"""
+                    UPDATE opportunities
+                    SET status = %s,
+                        status_reason = %s,
+                        status_changed_by = %s,
+                        status_changed_at = CURRENT_TIMESTAMP
+                    WHERE id IN ({placeholders})
+                """
 
-            params = [status.value, reason, changed_by] + id_strings
+                params = [status.value, reason, changed_by] + id_strings
 
-            # Add organization scoping
-            if self.organization_id:
-                query += " AND organization_id = %s"
-                params.append(str(self.organization_id))
+                # Add organization scoping
+                if self.organization_id:
+                    query += " AND organization_id = %s"
+                    params.append(str(self.organization_id))
 
-            cur.execute(query, params)
-            updated = cur.rowcount
-            conn.commit()
+                query += " RETURNING organization_id"
 
-            cur.close()
-            conn.close()
+                cur.execute(query, params)
+                touched = {row['organization_id'] for row in cur.fetchall()}
+                updated = cur.rowcount
+                self._refresh_stats(cur, touched)
+                conn.commit()
 
             failed = len(opportunity_ids) - updated
             errors = []
@@ -674,43 +900,40 @@ class OpportunitiesService:
             HTTPException: 403 if user doesn't have permission
         """
         try:
-            conn = self._get_connection()
-            cur = conn.cursor(cursor_factory=RealDictCursor)
+            with self._connection() as conn:
+                cur = conn.cursor(cursor_factory=RealDictCursor)
 
-            # First, fetch the opportunity to validate ownership
-            fetch_query = "SELECT * FROM opportunities WHERE id = %s"
-            fetch_params = [str(opportunity_id)]
+                # First, fetch the opportunity to validate ownership
+                fetch_query = "SELECT * FROM opportunities WHERE id = %s"
+                fetch_params = [str(opportunity_id)]
 
-            if self.organization_id:
-                fetch_query += " AND organization_id = %s"
-                fetch_params.append(str(self.organization_id))
+                if self.organization_id:
+                    fetch_query += " AND organization_id = %s"
+                    fetch_params.append(str(self.organization_id))
 
-            cur.execute(fetch_query, fetch_params)
-            existing = cur.fetchone()
-
-            if not existing:
-                cur.close()
-                conn.close()
-                return False
+                cur.execute(fetch_query, fetch_params)
+                existing = cur.fetchone()
 
-            # Validate ownership if user_id provided
-            if user_id:
-                self._validate_ownership(dict(existing), user_id)
+                if not existing:
+                    return False
 
-            # Perform deletion
-            delete_query = "DELETE FROM opportunities WHERE id = %s"
-            delete_params = [str(opportunity_id)]
+                # Validate ownership if user_id provided
+                if user_id:
+                    self._validate_ownership(dict(existing), user_id)
 
-            if self.organization_id:
-                delete_query += " AND organization_id = %s"
-                delete_params.append(str(self.organization_id))
+                # Perform deletion
+                delete_query = "DELETE FROM opportunities WHERE id = %s"
+                delete_params = [str(opportunity_id)]
 
-            cur.execute(delete_query, delete_params)
-            deleted = cur.rowcount > 0
-            conn.commit()
+                if self.organization_id:
+                    delete_query += " AND organization_id = %s"
+                    delete_params.append(str(self.organization_id))
 
-            cur.close()
-            conn.close()
+                cur.execute(delete_query, delete_params)
+                deleted = cur.rowcount > 0
+                if deleted:
+                    self._refresh_stats(cur, [existing['organization_id']])
+                conn.commit()
 
             if deleted:
                 logger.info(
@@ -728,209 +951,371 @@ class OpportunitiesService:
         """
         Get statistics summary for opportunities.
 
+        Organization-scoped stats are read from the precomputed
+        ``opportunity_stats`` row. A missing row, or one older than
+        ``opportunities_stats_max_age_seconds``, is recomputed and stored.
+
         Returns:
             Statistics with counts and aggregations
         """
         try:
-            conn = self._get_connection()
-            cur = conn.cursor(cursor_factory=RealDictCursor)
-
-            org_filter = ""
-            params = []
-
-            if self.organization_id:
-                org_filter = "WHERE organization_id = %s"
-                params = [str(self.organization_id)]
-
-            # Total counts
-            cur.execute(f"""
-                SELECT
-                    COUNT(*) as total_opportunities,
-                    COUNT(*) FILTER (WHERE status = 'open') as open_opportunities,
-                    COALESCE(SUM(estimated_monthly_savings) FILTER (WHERE status = 'open'), 0) as potential_monthly,
-                    COALESCE(SUM(estimated_monthly_savings) FILTER (WHERE status = 'implemented'), 0) as implemented_monthly
-                FROM opportunities
-                {org_filter}
-            """, params)
-            totals = cur.fetchone()
-
-            # Status counts
-            cur.execute(f"""
-                SELECT status::text, COUNT(*) as count
-                FROM opportunities
-                {org_filter}
-                GROUP BY status
-            """, params)
-            by_status = {row['status']: row['count'] for row in cur.fetchall()}
-
-            # Category counts
-            cur.execute(f"""
-                SELECT category::text, COUNT(*) as count
-                FROM opportunities
-                {org_filter}
-                GROUP BY category
-            """, params)
-            by_category = {row['category']: row['count'] for row in cur.fetchall()}
-
-            # Service counts
-            cur.execute(f"""
-                SELECT service, COUNT(*) as count
-                FROM opportunities
-                {org_filter}
-                GROUP BY service
-                ORDER BY count DESC
-            """, params)
-            by_service = {row['service']: row['count'] for row in cur.fetchall()}
-
-            # Source counts
-            cur.execute(f"""
-                SELECT source::text, COUNT(*) as count
-                FROM opportunities
-                {org_filter}
-                GROUP BY source
-            """, params)
-            by_source = {row['source']: row['count'] for row in cur.fetchall()}
-
-            # Effort level counts
-            cur.execute(f"""
-                SELECT effort_level, COUNT(*) as count
-                FROM opportunities
-                {org_filter}
-                GROUP BY effort_level
-            """, params)
-            by_effort = {row['effort_level'] or 'unknown': row['count'] for row in cur.fetchall()}
-
-            # Top opportunities
-            cur.execute(f"""
-                SELECT
-                    id, title, service, category, status,
-                    estimated_monthly_savings, priority_score,
-                    effort_level, risk_level, resource_id, region,
-                    first_detected_at, last_seen_at
-                FROM opportunities
-                {org_filter + ' AND ' if org_filter else 'WHERE '} status = 'open'
-                ORDER BY estimated_monthly_savings DESC NULLS LAST
-                LIMIT 10
-            """, params)
-            top_opportunities = [OpportunitySummary(**dict(row)) for row in cur.fetchall()]
-
-            cur.close()
-            conn.close()
-
-            return OpportunitiesStats(
-                total_opportunities=totals['total_opportunities'],
-                open_opportunities=totals['open_opportunities'],
-                total_potential_monthly_savings=float(totals['potential_monthly']),
-                total_potential_annual_savings=float(totals['potential_monthly']) * 12,
-                implemented_savings_monthly=float(totals['implemented_monthly']),
-                implemented_savings_annual=float(totals['implemented_monthly']) * 12,
-                by_status=by_status,
-                by_category=by_category,
-                by_service=by_service,
-                by_source=by_source,
-                by_effort_level=by_effort,
-                top_opportunities=top_opportunities
-            )
+            with self._connection() as conn:
+                cur = conn.cursor(cursor_factory=RealDictCursor)
+
+                if not self.organization_id:
+                    return self._compute_stats(cur, None)
+
+                self._execute_prepared(cur, """
+                    SELECT stats
+                    FROM opportunity_stats
+                    WHERE organization_id = %s
+                      AND refreshed_at > CURRENT_TIMESTAMP - make_interval(secs => %s)
+                """, [str(self.organization_id), settings.opportunities_stats_max_age_seconds])
+                row = cur.fetchone()
+                if row:
+                    return OpportunitiesStats(**row['stats'])
+
+                stats = self._refresh_stats(cur, [self.organization_id]).get(str(self.organization_id))
+                conn.commit()
+                return stats or self._compute_stats(cur, self.organization_id)
 
         except Exception as e:
             logger.error(f"Error getting stats: {e}", exc_info=True)
             raise
 
+    def _compute_stats(self, cur, organization_id: Optional[Any]) -> OpportunitiesStats:
+        """Aggregate stats straight from the opportunities table."""
+        where_clause = "organization_id = %s" if organization_id else "1=1"
+        params = [str(organization_id)] if organization_id else []
+
+        self._execute_prepared(cur, _facet_query(_STATS_FACETS, where_clause), params)
+        totals, counts = _split_facets(cur.fetchall(), _STATS_FACETS)
+
+        self._execute_prepared(cur, f"""
+            SELECT
+                id, title, service, category, status,
+                estimated_monthly_savings, priority_score,
+                effort_level, risk_level, resource_id, region,
+                first_detected_at, last_seen_at
+            FROM opportunities
+            WHERE {where_clause} AND status = 'open'
+            ORDER BY estimated_monthly_savings DESC NULLS LAST
+            LIMIT 10
+        """, params)
+        top_opportunities = [OpportunitySummary(**dict(row)) for row in cur.fetchall()]
+
+        potential_monthly = float(totals['potential_monthly'])
+        implemented_monthly = float(totals['implemented_monthly'])
+        return OpportunitiesStats(
+            total_opportunities=totals['count'],
+            open_opportunities=totals['open_count'],
+            total_potential_monthly_savings=potential_monthly,
+            total_potential_annual_savings=potential_monthly * 12,
+            implemented_savings_monthly=implemented_monthly,
+            implemented_savings_annual=implemented_monthly * 12,
+            by_status=counts['status'],
+            by_category=counts['category'],
+            by_service=_by_count(counts['service']),
+            by_source=counts['source'],
+            by_effort_level={
+                effort or 'unknown': count for effort, count in counts['effort_level'].items()
+            },
+            top_opportunities=top_opportunities
+        )
+
+    def _refresh_stats(self, cur, organization_ids) -> Dict[str, OpportunitiesStats]:
+        """
+        Recompute and store the stats row of each organization a write touched.
+
+        Called inside the writer's transaction, after its changes, so the row
+        commits with them. The per-organization advisory lock serializes
+        refreshes until commit, so a later writer's recompute sees the earlier
+        writer's rows. A failed refresh is logged and leaves the previous row
+        to age out instead of failing the write.
+        """
+        refreshed = {}
+        for organization_id in sorted({str(o) for o in organization_ids if o}):
+            try:
+                cur.execute("SAVEPOINT refresh_stats")
+                cur.execute(
+                    "SELECT pg_advisory_xact_lock(hashtext(%s))",
+                    [f"opportunity_stats:{organization_id}"],
+                )
+                stats = self._compute_stats(cur, organization_id)
+                cur.execute("""
+                    INSERT INTO opportunity_stats (organization_id, stats, refreshed_at)
+                    VALUES (%s, %s, clock_timestamp())
+                    ON CONFLICT (organization_id) DO UPDATE
+                    SET stats = EXCLUDED.stats, refreshed_at = EXCLUDED.refreshed_at
+                """, [organization_id, stats.model_dump_json()])
+                cur.execute("RELEASE SAVEPOINT refresh_stats")
+                refreshed[organization_id] = stats
+            except Exception as e:
+                cur.execute("ROLLBACK TO SAVEPOINT refresh_stats")
+                logger.warning(
+                    "Opportunity stats refresh failed",
+                    organization_id=organization_id,
+                    error=str(e),
+                )
+        return refreshed
+
     def ingest_signals(self, signals: List[Dict[str, Any]]) -> OpportunityIngestResult:
         """
         Ingest optimization signals and create/update opportunities.
 
+        Signals are merged set-wise rather than one round trip per signal:
+        they are grouped by column set, staged into a temp table with
+        ``execute_values`` in chunks of ``_INGEST_CHUNK_SIZE``, and each chunk
+        is merged with one statement that refreshes ``last_seen_at`` on
+        opportunities already known by ``source_id`` and inserts the rest
+        (``INSERT ... ON CONFLICT ... RETURNING (xmax = 0)``). A chunk that
+        fails is retried signal by signal so errors are attributed as before.
+        Signals with keys that are not ``opportunities`` columns are counted
+        as errors before staging, since the stage table is built from them.
+
         Args:
             signals: List of signal dictionaries from AWS APIs
 
         Returns:
             Ingest result with counts
         """
-        try:
-            conn = self._get_connection()
-            cur = conn.cursor(cursor_factory=RealDictCursor)
-
-            new_count = 0
-            updated_count = 0
-            skipped_count = 0
-            error_count = 0
-            error_details = []
-
-            for signal in signals:
-                try:
-                    source_id = signal.get('source_id')
-
-                    if source_id:
-                        # Check for existing opportunity by source_id
+        new_count = 0
+        updated_count = 0
+        skipped_count = 0
+        error_count = 0
+        error_details = []
+
+        candidates: List[Tuple[Tuple[str, ...], Dict[str, Any]]] = []
+        for signal in signals:
+            columns = tuple(sorted(signal.keys()))
+            invalid = [c for c in columns if not _COLUMN_PATTERN.match(c)]
+            if invalid:
+                error_count += 1
+                error_details.append(f"Invalid signal field(s): {', '.join(invalid)}")
+                continue
+            candidates.append((columns, signal))
+
+        if candidates:
+            try:
+                with self._connection() as conn:
+                    cur = conn.cursor(cursor_factory=RealDictCursor)
+                    cur.execute("""
+                        SELECT column_name
+                        FROM information_schema.columns
+                        WHERE table_schema = current_schema() AND table_name = 'opportunities'
+                    """)
+                    known_columns = {row['column_name'] for row in cur.fetchall()}
+
+                    # A source_id seen earlier in the batch updates that opportunity
+                    seen_source_ids = set()
+                    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+                    for columns, signal in candidates:
+                        unknown = [c for c in columns if c not in known_columns]
+                        if unknown:
+                            error_count += 1
+                            error_details.append(f"Unknown signal field(s): {', '.join(unknown)}")
+                            continue
+                        source_id = signal.get('source_id')
+                        if source_id:
+                            if source_id in seen_source_ids:
+                                updated_count += 1
+                                continue
+                            seen_source_ids.add(source_id)
+                        groups.setdefault(columns, []).append(signal)
+
+                    for group_index, (columns, group) in enumerate(groups.items()):
+                        stage = f"opportunity_signal_stage_{group_index}"
+                        column_list = ', '.join(columns)
                         cur.execute(
-                            "SELECT id FROM opportunities WHERE source_id = %s",
-                            [source_id]
+                            f"CREATE TEMP TABLE {stage} ON COMMIT DROP AS "
+                            f"SELECT {column_list} FROM opportunities WITH NO DATA"
                         )
-                        existing = cur.fetchone()
-
-                        if existing:
-                            # Update last_seen_at
-                            cur.execute(
-                                "UPDATE opportunities SET last_seen_at = CURRENT_TIMESTAMP WHERE id = %s",
-                                [existing['id']]
-                            )
-                            updated_count += 1
-                            continue
-
-                    # Create new opportunity
-                    columns = list(signal.keys())
-                    values = []
-
-                    for col in columns:
-                        val = signal[col]
-                        if isinstance(val, (dict, list)):
-                            val = json.dumps(val)
-                        values.append(val)
+                        for offset in range(0, len(group), _INGEST_CHUNK_SIZE):
+                            chunk = group[offset:offset + _INGEST_CHUNK_SIZE]
+                            rows = [_signal_row(signal, columns) for signal in chunk]
+                            try:
+                                cur.execute("SAVEPOINT ingest_chunk")
+                                new, updated = self._merge_staged(cur, stage, columns, rows)
+                                cur.execute("RELEASE SAVEPOINT ingest_chunk")
+                                new_count += new
+                                updated_count += updated
+                            except Exception as e:
+                                cur.execute("ROLLBACK TO SAVEPOINT ingest_chunk")
+                                logger.warning(
+                                    "Bulk signal merge failed, retrying individually",
+                                    signals=len(rows),
+                                    error=str(e),
+                                )
+                                for row in rows:
+                                    try:
+                                        cur.execute("SAVEPOINT ingest_signal")
+                                        new, updated = self._merge_staged(cur, stage, columns, [row])
+                                        cur.execute("RELEASE SAVEPOINT ingest_signal")
+                                        new_count += new
+                                        updated_count += updated
+                                    except Exception as signal_error:
+                                        cur.execute("ROLLBACK TO SAVEPOINT ingest_signal")
+                                        error_count += 1
+                                        error_details.append(str(signal_error))
+                                        logger.warning(f"Error ingesting signal: {signal_error}")
+
+                    # Only inserted rows change the facets, and they carry the signal's organization
+                    self._refresh_stats(
+                        cur,
+                        {self.organization_id}
+                        | {signal.get('organization_id') for group in groups.values() for signal in group},
+                    )
+                    conn.commit()
+
+            except Exception as e:
+                logger.error(f"Error ingesting signals: {e}", exc_info=True)
+                raise
+
+        logger.info(
+            f"Ingested signals: {new_count} new, {updated_count} updated, "
+            f"{skipped_count} skipped, {error_count} errors"
+        )
 
-                    placeholders = ['%s'] * len(columns)
+        return OpportunityIngestResult(
+            total_signals=len(signals),
+            new_opportunities=new_count,
+            updated_opportunities=updated_count,
+            skipped=skipped_count,
+            errors=error_count,
+            error_details=error_details if error_details else None,
+            ingested_at=datetime.now(timezone.utc)
+        )
 
-                    query = f"""
-                        INSERT INTO opportunities ({', '.join(columns)})
-                        VALUES ({', '.join(placeholders)})
-                        ON CONFLICT (source, source_id) WHERE source_id IS NOT NULL
-                        DO UPDATE SET last_seen_at = CURRENT_TIMESTAMP
-                        RETURNING id, (xmax = 0) as is_new
-                    """
+    def _merge_staged(
+        self,
+        cur,
+        stage: str,
+        columns: Tuple[str, ...],
+        rows: List[Tuple[Any, ...]],
+    ) -> Tuple[int, int]:
+        """
+        Stage rows and merge them into opportunities in one statement.
 
-                    cur.execute(query, values)
-                    result = cur.fetchone()
+        Returns (new, updated) counts.
+        """
+        column_list = ', '.join(columns)
+        cur.execute(f"TRUNCATE {stage}")
+        execute_values(
+            cur,
+            f"INSERT INTO {stage} ({column_list}) VALUES %s",
+            rows,
+            page_size=_STAGE_PAGE_SIZE,
+        )
 
-                    if result and result.get('is_new'):
-                        new_count += 1
-                    else:
-                        updated_count += 1
+        if 'source_id' in columns:
+            touched_cte = f"""
+                touched AS (
+                    UPDATE opportunities o
+                    SET last_seen_at = CURRENT_TIMESTAMP
+                    FROM {stage} s
+                    WHERE s.source_id IS NOT NULL AND o.source_id = s.source_id
+                    RETURNING o.source_id
+                ),"""
+            insert_filter = """
+                WHERE s.source_id IS NULL
+                   OR NOT EXISTS (SELECT 1 FROM opportunities o WHERE o.source_id = s.source_id)"""
+            touched_count = "(SELECT COUNT(DISTINCT source_id) FROM touched)"
+        else:
+            touched_cte = ""
+            insert_filter = ""
+            touched_count = "0"
+
+        cur.execute(
+            f"""
+            WITH {touched_cte}
+            merged AS (
+                INSERT INTO opportunities ({column_list})
+                SELECT {', '.join(f's.{c}' for c in columns)}
+                FROM {stage} s{insert_filter}
+                ON CONFLICT (source, source_id) WHERE source_id IS NOT NULL
+                DO UPDATE SET last_seen_at = CURRENT_TIMESTAMP
+                RETURNING (xmax = 0) AS is_new
+            )
+            SELECT
+                COUNT(*) FILTER (WHERE is_new) AS new_count,
+                COUNT(*) FILTER (WHERE NOT is_new) + {touched_count} AS updated_count
+            FROM merged
+            """
+        )
+        counts = cur.fetchone()
+        return counts['new_count'], counts['updated_count']
+
+    @staticmethod
+    def _export_columns(include_evidence: bool, include_steps: bool) -> List[str]:
+        """Select columns based on export options"""
+        columns = [
+            "id", "account_id", "title", "description", "category", "source",
+            "service", "resource_id", "resource_name", "resource_type", "region",
+            "estimated_monthly_savings", "estimated_annual_savings",
+            "savings_percentage", "current_monthly_cost", "projected_monthly_cost",
+            "effort_level", "risk_level", "status", "status_reason",
+            "priority_score", "confidence_score", "tags",
+            "first_detected_at", "last_seen_at", "deep_link"
+        ]
+
+        if include_steps:
+            columns.append("implementation_steps")
+
+        if include_evidence:
+            columns.extend(["evidence", "api_trace", "cur_validation_sql"])
+
+        return columns
+
+    def iter_export_batches(
+        self,
+        filter: Optional[OpportunityFilter] = None,
+        include_evidence: bool = False,
+        include_steps: bool = True
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield opportunities for export in batches of ``opportunities_export_fetch_size``.
 
-                except Exception as e:
-                    error_count += 1
-                    error_details.append(str(e))
-                    logger.warning(f"Error ingesting signal: {e}")
+        Rows are read through a named (server-side) cursor, so only one batch
+        is in memory at a time however large the result. The cursor runs on
+        a dedicated export connection (see :meth:`_export_connection`), which
+        is closed as soon as the cursor is drained, before the last batch is
+        yielded, or when the generator is closed.
 
-            conn.commit()
-            cur.close()
-            conn.close()
+        Args:
+            filter: Filter criteria
+            include_evidence: Include detailed evidence data
+            include_steps: Include implementation steps
 
-            logger.info(
-                f"Ingested signals: {new_count} new, {updated_count} updated, "
-                f"{skipped_count} skipped, {error_count} errors"
-            )
+        Yields:
+            Lists of opportunity dictionaries for export
+        """
+        params = []
+        where_clause = self._build_where_clause(filter, params)
+        columns = self._export_columns(include_evidence, include_steps)
+        fetch_size = settings.opportunities_export_fetch_size
+
+        query = f"""
+            SELECT {', '.join(columns)}
+            FROM opportunities
+            WHERE {where_clause}
+            ORDER BY estimated_monthly_savings DESC NULLS LAST
+        """
 
-            return OpportunityIngestResult(
-                total_signals=len(signals),
-                new_opportunities=new_count,
-                updated_opportunities=updated_count,
-                skipped=skipped_count,
-                errors=error_count,
-                error_details=error_details if error_details else None,
-                ingested_at=datetime.now(timezone.utc)
-            )
+        try:
+            with self._export_connection() as conn:
+                with conn.cursor(name="opportunities_export", cursor_factory=RealDictCursor) as cur:
+                    cur.itersize = fetch_size
+                    cur.execute(query, params)
+                    while True:
+                        rows = cur.fetchmany(fetch_size)
+                        if len(rows) < fetch_size:
+                            break
+                        yield [dict(row) for row in rows]
+            if rows:
+                yield [dict(row) for row in rows]
 
         except Exception as e:
-            logger.error(f"Error ingesting signals: {e}", exc_info=True)
+            logger.error(f"Error exporting opportunities: {e}", exc_info=True)
             raise
 
     def export_opportunities(
@@ -942,6 +1327,8 @@ class OpportunitiesService:
         """
         Export opportunities for download.
 
+        Materializes the whole result; use :meth:`stream_export` for files.
+
         Args:
             filter: Filter criteria
             include_evidence: Include detailed evidence data
@@ -950,48 +1337,96 @@ class OpportunitiesService:
         Returns:
             List of opportunity dictionaries for export
         """
-        try:
-            conn = self._get_connection()
-            cur = conn.cursor(cursor_factory=RealDictCursor)
-
-            params = []
-            where_clause = self._build_where_clause(filter, params)
-
-            # Select columns based on export options
-            columns = [
-                "id", "account_id", "title", "description", "category", "source",
-                "service", "resource_id", "resource_name", "resource_type", "region",
-                "estimated_monthly_savings", "estimated_annual_savings",
-                "savings_percentage", "current_monthly_cost", "projected_monthly_cost",
-                "effort_level", "risk_level", "status", "status_reason",
-                "priority_score", "confidence_score", "tags",
-                "first_detected_at", "last_seen_at", "deep_link"
-            ]
-
-            if include_steps:
-                columns.append("implementation_steps")
-
-            if include_evidence:
-                columns.extend(["evidence", "api_trace", "cur_validation_sql"])
-
-            query = f"""
-                SELECT {', '.join(columns)}
-                FROM opportunities
-                WHERE {where_clause}
-                ORDER BY estimated_monthly_savings DESC NULLS LAST
-            """
+        return [
+            row
+            for batch in self.iter_export_batches(filter, include_evidence, include_steps)
+            for row in batch
+        ]
 
-            cur.execute(query, params)
-            rows = cur.fetchall()
+    async def stream_export(
+        self,
+        format: str,
+        filter: Optional[OpportunityFilter] = None,
+        include_evidence: bool = False,
+        include_steps: bool = True
+    ) -> AsyncIterator[str]:
+        """
+        Start an export and return its body as an async iterator of text chunks.
 
-            cur.close()
-            conn.close()
+        The query runs and its first batch is fetched before this returns, so
+        database errors surface here rather than midway through a response.
+        Each later batch is fetched on a worker thread and encoded on its own.
 
-            return [dict(row) for row in rows]
+        Args:
+            format: ``csv``, ``ndjson`` or ``json`` (one JSON array)
+            filter: Filter criteria
+            include_evidence: Include detailed evidence data
+            include_steps: Include implementation steps
 
-        except Exception as e:
-            logger.error(f"Error exporting opportunities: {e}", exc_info=True)
-            raise
+        Returns:
+            Async iterator of encoded chunks
+        """
+        encode, closing = _EXPORT_ENCODERS[format]
+        columns = self._export_columns(include_evidence, include_steps)
+        batches = self.iter_export_batches(filter, include_evidence, include_steps)
+        first = await asyncio.to_thread(next, batches, None)
+        return self._encode_export(encode, closing, columns, batches, first)
+
+    @staticmethod
+    async def _encode_export(encode, closing, columns, batches, batch) -> AsyncIterator[str]:
+        try:
+            yield encode(columns, batch or [], True)
+            while batch:
+                batch = await asyncio.to_thread(next, batches, None)
+                if batch:
+                    yield encode(columns, batch, False)
+            if closing:
+                yield closing
+        finally:
+            await asyncio.to_thread(batches.close)
+
+    # Async variants: run the blocking call on a worker thread so request
+    # handlers don't stall the event loop while waiting on Postgres.
+
+    async def list_opportunities_async(self, *args, **kwargs) -> OpportunityListResponse:
+        """Non-blocking :meth:`list_opportunities`."""
+        return await asyncio.to_thread(self.list_opportunities, *args, **kwargs)
+
+    async def get_opportunity_async(self, *args, **kwargs) -> Optional[OpportunityDetail]:
+        """Non-blocking :meth:`get_opportunity`."""
+        return await asyncio.to_thread(self.get_opportunity, *args, **kwargs)
+
+    async def create_opportunity_async(self, *args, **kwargs) -> OpportunityDetail:
+        """Non-blocking :meth:`create_opportunity`."""
+        return await asyncio.to_thread(self.create_opportunity, *args, **kwargs)
+
+    async def update_opportunity_async(self, *args, **kwargs) -> Optional[OpportunityDetail]:
+        """Non-blocking :meth:`update_opportunity`."""
+        return await asyncio.to_thread(self.update_opportunity, *args, **kwargs)
+
+    async def update_status_async(self, *args, **kwargs) -> Optional[OpportunityDetail]:
+        """Non-blocking :meth:`update_status`."""
+        return await asyncio.to_thread(self.update_status, *args, **kwargs)
+
+    async def bulk_update_status_async(self, *args, **kwargs) -> Tuple[int, int, List[Dict[str, str]]]:
+        """Non-blocking :meth:`bulk_update_status`."""
+        return await asyncio.to_thread(self.bulk_update_status, *args, **kwargs)
+
+    async def delete_opportunity_async(self, *args, **kwargs) -> bool:
+        """Non-blocking :meth:`delete_opportunity`."""
+        return await asyncio.to_thread(self.delete_opportunity, *args, **kwargs)
+
+    async def get_stats_async(self, *args, **kwargs) -> OpportunitiesStats:
+        """Non-blocking :meth:`get_stats`."""
+        return await asyncio.to_thread(self.get_stats, *args, **kwargs)
+
+    async def ingest_signals_async(self, *args, **kwargs) -> OpportunityIngestResult:
+        """Non-blocking :meth:`ingest_signals`."""
+        return await asyncio.to_thread(self.ingest_signals, *args, **kwargs)
+
+    async def export_opportunities_async(self, *args, **kwargs) -> List[Dict[str, Any]]:
+        """Non-blocking :meth:`export_opportunities`."""
+        return await asyncio.to_thread(self.export_opportunities, *args, **kwargs)
 
 
 # Singleton instance
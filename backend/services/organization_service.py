@@ -11,6 +11,7 @@ import structlog
 
 from backend.services.database import DatabaseService
 from backend.services.request_context import RequestContext
+from backend.services.request_context_cache import request_context_cache
 from backend.services.rbac_permission_service import get_rbac_service
 
 logger = structlog.get_logger(__name__)
@@ -131,7 +132,7 @@ class OrganizationService:
                 owner_id=str(owner_user_id),
             )
 
-            return {
+            created = {
                 'id': str(org_id),
                 'name': name,
                 'slug': slug,
@@ -143,6 +144,9 @@ class OrganizationService:
                 'created_at': org_row['created_at'].isoformat(),
             }
 
+        await request_context_cache.invalidate_user(owner_user_id)
+        return created
+
     async def get_user_organizations(
         self,
         user_id: UUID,
@@ -281,7 +285,8 @@ class OrganizationService:
                 org_id=str(org_id),
             )
 
-            return True
+        await request_context_cache.invalidate_user(user_id)
+        return True
 
     async def add_member(
         self,
@@ -359,13 +364,16 @@ class OrganizationService:
                 added_by=context.user_email,
             )
 
-            return {
+            added = {
                 'user_id': str(target_user_id),
                 'email': user_email,
                 'role': role,
                 'organization_id': str(context.organization_id),
             }
 
+        await request_context_cache.invalidate_user(target_user_id, user_email)
+        return added
+
     async def remove_member(
         self,
         context: RequestContext,
@@ -433,7 +441,8 @@ class OrganizationService:
                 removed_by=context.user_email,
             )
 
-            return True
+        await request_context_cache.invalidate_user(user_id)
+        return True
 
     async def update_member_role(
         self,
@@ -497,7 +506,8 @@ class OrganizationService:
                 updated_by=context.user_email,
             )
 
-            return True
+        await request_context_cache.invalidate_user(user_id)
+        return True
 
     async def list_members(
         self,
@@ -128,6 +128,11 @@ class QueryNormalizer:
 
         return normalized, metadata
 
+    def canonical_text(self, query: str) -> str:
+        """Deterministic normalization only (no LLM), lower-cased; for cache keys."""
+        normalized, _ = self._apply_deterministic_rules(query or "")
+        return normalized.lower()
+
     def _update_cache(self, key: str, value: Tuple[str, NormalizationMetadata]) -> None:
         if key in self._cache:
             self._cache[key] = value
@@ -5,8 +5,283 @@ This standardizes the response format across Athena, Cost Explorer, and any futu
 enabling loose coupling between data layer, business logic, and presentation layer.
 """
 from __future__ import annotations
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional
+from functools import cached_property
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+
+# Columns summed (first present per row) into QueryResult.total_cost
+COST_FIELDS = ["cost_usd", "total_cost", "cost", "unblended_cost"]
+
+# Integers beyond this lose precision in float64 and stay in a plain list
+_MAX_EXACT_INT = 2 ** 53
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value) if value is not None else np.nan
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _typed_column(values: List[Any]) -> Tuple[Union[np.ndarray, List[Any]], Union[bool, np.ndarray]]:
+    """
+    Store a column as a float64 array (NULL -> NaN) when every non-null value
+    is an int or float, otherwise as the original list.
+
+    Returns the storage and which cells were ints (True for all, False for
+    none, or a mask for mixed columns) so row views hand back the same types.
+    """
+    has_int = has_float = False
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            return values, False
+        if isinstance(value, int):
+            if abs(value) > _MAX_EXACT_INT:
+                return values, False
+            has_int = True
+        elif isinstance(value, float):
+            has_float = True
+        else:
+            return values, False
+    if not (has_int or has_float):
+        return values, False
+    array = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    if not has_float:
+        return array, True
+    if not has_int:
+        return array, False
+    return array, np.fromiter((isinstance(v, int) for v in values), dtype=bool, count=len(values))
+
+
+class ColumnarResult(Sequence):
+    """
+    Column-oriented table of query result rows.
+
+    Numeric columns are float64 arrays (NULL as NaN), other columns plain
+    lists, with ``index`` mapping column name to position. Indexing, slicing
+    and iteration yield ordinary ``dict`` rows built on access, so code
+    written against ``List[Dict]`` keeps working; aggregations (sums,
+    group-by, top-N ordering, distinct counts) run on the arrays.
+    """
+
+    def __init__(
+        self,
+        columns: List[str],
+        values: List[Union[np.ndarray, List[Any]]],
+        length: int,
+        int_cells: Optional[List[Union[bool, np.ndarray]]] = None,
+        present: Optional[Dict[str, np.ndarray]] = None,
+    ):
+        self.columns = list(columns)
+        self.index = {name: pos for pos, name in enumerate(self.columns)}
+        self._values = values
+        self._int_cells = int_cells or [False] * len(self.columns)
+        # Only for columns some rows lack entirely (not merely NULL)
+        self._present = present or {}
+        self._length = length
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: List[str],
+        column_values: List[List[Any]],
+        present: Optional[Dict[str, np.ndarray]] = None,
+    ) -> "ColumnarResult":
+        values, int_cells = [], []
+        for column in column_values:
+            stored, ints = _typed_column(column)
+            values.append(stored)
+            int_cells.append(ints)
+        length = len(column_values[0]) if column_values else 0
+        return cls(columns, values, length, int_cells, present)
+
+    @classmethod
+    def from_rows(cls, rows: Union["ColumnarResult", Iterable[Dict[str, Any]]]) -> "ColumnarResult":
+        """Build from dict rows; a ``ColumnarResult`` is returned unchanged."""
+        if isinstance(rows, ColumnarResult):
+            return rows
+        rows = rows if isinstance(rows, list) else list(rows)
+        names: Dict[str, None] = {}
+        for row in rows:
+            for key in row:
+                if key not in names:
+                    names[key] = None
+        columns = list(names)
+        present = {}
+        if any(len(row) != len(columns) for row in rows):
+            for name in columns:
+                mask = np.fromiter((name in row for row in rows), dtype=bool, count=len(rows))
+                if not mask.all():
+                    present[name] = mask
+        column_values = [[row.get(name) for row in rows] for name in columns]
+        result = cls.from_columns(columns, column_values, present)
+        result._length = len(rows)
+        return result
+
+    @classmethod
+    def from_batches(cls, columns: List[str], batches: Iterable[List[List[Any]]]) -> "ColumnarResult":
+        """Build from batches of positional rows (e.g. ``AthenaResultReader`` output)."""
+        column_values: List[List[Any]] = [[] for _ in columns]
+        for batch in batches:
+            for pos, cells in enumerate(zip(*batch)):
+                column_values[pos].extend(cells)
+        return cls.from_columns(columns, column_values)
+
+    # Sequence of dict rows
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return ColumnarResult(
+                self.columns,
+                [column[key] for column in self._values],
+                len(range(*key.indices(self._length))),
+                [ints[key] if isinstance(ints, np.ndarray) else ints for ints in self._int_cells],
+                {name: mask[key] for name, mask in self._present.items()},
+            )
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("row index out of range")
+        return self._row(key)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for i in range(self._length):
+            yield self._row(i)
+
+    def __repr__(self) -> str:
+        return f"ColumnarResult(rows={self._length}, columns={self.columns})"
+
+    def _cell(self, pos: int, i: int) -> Any:
+        column = self._values[pos]
+        if not isinstance(column, np.ndarray):
+            return column[i]
+        value = column[i]
+        if np.isnan(value):
+            return None
+        ints = self._int_cells[pos]
+        if ints is True or (isinstance(ints, np.ndarray) and ints[i]):
+            return int(value)
+        return float(value)
+
+    def _row(self, i: int) -> Dict[str, Any]:
+        row = {}
+        for pos, name in enumerate(self.columns):
+            mask = self._present.get(name)
+            if mask is not None and not mask[i]:
+                continue
+            row[name] = self._cell(pos, i)
+        return row
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialize every row as a dict (for JSON responses)."""
+        return list(self)
+
+    # Column access and aggregations
+
+    def has_column(self, name: str) -> bool:
+        return name in self.index
+
+    def is_numeric(self, name: str) -> bool:
+        pos = self.index.get(name)
+        return pos is not None and isinstance(self._values[pos], np.ndarray)
+
+    def numeric(self, name: str) -> np.ndarray:
+        """Column as float64; NULL, missing and non-numeric cells are NaN."""
+        pos = self.index.get(name)
+        if pos is None:
+            return np.full(self._length, np.nan)
+        column = self._values[pos]
+        if isinstance(column, np.ndarray):
+            return column
+        return np.fromiter((_to_float(v) for v in column), dtype=np.float64, count=self._length)
+
+    def text(self, name: str, default: str = "") -> List[str]:
+        """Column as ``str`` labels; rows without the column get ``default``."""
+        pos = self.index.get(name)
+        if pos is None:
+            return [default] * self._length
+        mask = self._present.get(name)
+        return [
+            default if mask is not None and not mask[i] else str(self._cell(pos, i))
+            for i in range(self._length)
+        ]
+
+    def sum(self, name: str) -> float:
+        """Sum of a column, treating NULL and non-numeric cells as 0."""
+        return float(np.nansum(self.numeric(name)))
+
+    def first_present_sum(self, names: Iterable[str], skip_null: bool = True) -> float:
+        """
+        Sum over rows of the first of ``names`` each row has.
+
+        With ``skip_null`` a NULL or non-numeric cell falls through to the
+        next name; otherwise it counts as 0 and ends the search for that row.
+        """
+        counted = np.zeros(self._length, dtype=bool)
+        total = 0.0
+        for name in names:
+            if name not in self.index:
+                continue
+            values = self.numeric(name)
+            usable = ~counted
+            mask = self._present.get(name)
+            if mask is not None:
+                usable &= mask
+            if skip_null:
+                usable &= ~np.isnan(values)
+            total += float(np.nansum(values[usable]))
+            counted |= usable
+        return total
+
+    def group_sum(self, key: str, value: str) -> Tuple[List[str], List[float]]:
+        """
+        Sum ``value`` per distinct ``str(key)``, sorted by key.
+
+        Rows where either column is NULL or missing are skipped.
+        """
+        pos = self.index.get(key)
+        if pos is None:
+            return [], []
+        values = self.numeric(value)
+        keys = np.array(self.text(key, default="None"), dtype=object)
+        valid = ~np.isnan(values)
+        raw = self._values[pos]
+        if isinstance(raw, np.ndarray):
+            valid &= ~np.isnan(raw)
+        else:
+            valid &= np.fromiter((v is not None for v in raw), dtype=bool, count=self._length)
+        mask = self._present.get(key)
+        if mask is not None:
+            valid &= mask
+        if not valid.any():
+            return [], []
+        unique, inverse = np.unique(keys[valid].astype(str), return_inverse=True)
+        sums = np.bincount(inverse, weights=values[valid], minlength=len(unique))
+        return unique.tolist(), sums.tolist()
+
+    def order_desc(self, name: str) -> np.ndarray:
+        """Row positions by ``name`` descending (NULL as 0), ties in original order."""
+        values = np.nan_to_num(self.numeric(name), nan=0.0)
+        return np.argsort(-values, kind="stable")
+
+    def nunique(self, name: str) -> int:
+        """Number of distinct values (NULL and missing count as one value)."""
+        pos = self.index.get(name)
+        if pos is None:
+            return 1 if self._length else 0
+        column = self._values[pos]
+        if isinstance(column, np.ndarray):
+            nulls = np.isnan(column)
+            return len(np.unique(column[~nulls])) + (1 if nulls.any() else 0)
+        return len(set(column))
 
 
 @dataclass
@@ -48,7 +323,7 @@ class QueryResult:
     """
     
     # Core data
-    data: List[Dict[str, Any]]  # Table rows
+    data: List[Dict[str, Any]]  # Table rows (or a ColumnarResult)
     metadata: ResultMetadata
     
     # Computed totals
@@ -65,16 +340,14 @@ class QueryResult:
         self.is_empty = self.row_count == 0
         
         # Auto-compute total_cost from data if not explicitly set
+        # (first usable cost field per row, summed column-wise)
         if self.total_cost == 0 and self.data:
-            cost_fields = ["cost_usd", "total_cost", "cost", "unblended_cost"]
-            for row in self.data:
-                for field in cost_fields:
-                    if field in row and row[field] is not None:
-                        try:
-                            self.total_cost += float(row[field])
-                            break  # Only count once per row
-                        except (ValueError, TypeError):
-                            pass
+            self.total_cost = self.columnar.first_present_sum(COST_FIELDS)
+
+    @cached_property
+    def columnar(self) -> ColumnarResult:
+        """Column-oriented view of ``data`` for vectorized aggregation."""
+        return ColumnarResult.from_rows(self.data)
     
     @property
     def has_data(self) -> bool:
@@ -89,7 +362,7 @@ class QueryResult:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
-            "data": self.data,
+            "data": self.data.to_dicts() if isinstance(self.data, ColumnarResult) else self.data,
             "total_cost": self.total_cost,
             "row_count": self.row_count,
             "is_empty": self.is_empty,
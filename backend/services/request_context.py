@@ -62,6 +62,8 @@ class RequestContext:
 
     # Account scoping - these are the AWS 12-digit account IDs the user can access
     allowed_account_ids: List[str] = field(default_factory=list)
+    # Earliest expiry of the account grants behind allowed_account_ids (None if none expire)
+    allowed_accounts_expire_at: Optional[datetime] = None
 
     # Active saved view (if any)
     active_saved_view: Optional[SavedViewInfo] = None
@@ -0,0 +1,368 @@
+"""
+Two-tier cache of the account-scoping RequestContext.
+
+AccountScopingMiddleware otherwise loads the user row, organization, active
+saved view, allowed accounts and permissions from Postgres on every
+authenticated request. Loaded contexts are kept per user email:
+
+- Local tier: in-process LRU with a short TTL
+  (``request_context_cache_local_ttl_seconds``), holding the objects.
+- Valkey tier: the serialized context, shared across workers
+  (``request_context_cache_ttl_seconds``).
+
+Each entry is stamped with the scope versions it was built under: a global
+version, its organization's, its user id's and its email's. A warm hit costs
+one Valkey MGET of those versions and no database round trip. Writers that
+change scope call ``invalidate_user`` / ``invalidate_organization`` /
+``invalidate_all`` after committing; that replaces the version with a fresh
+token, so every worker's copies stop matching. The version is replaced once
+more after ``_REBUMP_DELAY_SECONDS`` so a load that read the old rows just
+before the change cannot stay cached under the new version. Version keys
+outlive the entries stamped with them, so an expired version can never
+revalidate a stale entry. When the versions cannot be read (Valkey down or
+MGET failing) the request is a miss and nothing is cached, since another
+worker's invalidation would be invisible.
+
+Contexts whose active saved view or earliest account grant has expired are
+never served from cache; grant expiry also caps the Valkey entry's TTL, since
+no writer invalidates when a grant lapses.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import math
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+import structlog
+from prometheus_client import Counter
+
+from backend.config.settings import get_settings
+from backend.services.cache_service import get_cache_service
+from backend.services.request_context import OrganizationInfo, RequestContext, SavedViewInfo
+
+logger = structlog.get_logger(__name__)
+
+request_context_cache_hits = Counter(
+    "request_context_cache_hits_total",
+    "Request contexts served from cache by tier",
+    labelnames=["tier"],
+)
+request_context_cache_misses = Counter(
+    "request_context_cache_misses_total",
+    "Request contexts loaded from Postgres",
+)
+
+KEY_PREFIX = "request_context:"
+_VERSION_PREFIX = f"{KEY_PREFIX}version:"
+_GLOBAL = "global"
+_REBUMP_DELAY_SECONDS = 2.0
+
+Versions = Tuple[str, ...]
+
+
+def _version_keys(user_email: str, user_id: Any, organization_id: Any) -> List[str]:
+    return [
+        f"{_VERSION_PREFIX}{_GLOBAL}",
+        f"{_VERSION_PREFIX}org:{organization_id or '-'}",
+        f"{_VERSION_PREFIX}user:{user_id}",
+        f"{_VERSION_PREFIX}email:{user_email.lower()}",
+    ]
+
+
+def _uuid(value: Any) -> Optional[UUID]:
+    return UUID(value) if value else None
+
+
+def _datetime(value: Any) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def context_to_payload(context: RequestContext) -> Dict[str, Any]:
+    """JSON-safe form of the cacheable (per-user, not per-request) fields."""
+    org = context.organization_info
+    view = context.active_saved_view
+    return {
+        "user_id": str(context.user_id),
+        "user_email": context.user_email,
+        "is_admin": context.is_admin,
+        "organization_id": str(context.organization_id) if context.organization_id else None,
+        "organization_name": context.organization_name,
+        "organization_info": None if org is None else {
+            "id": str(org.id),
+            "name": org.name,
+            "slug": org.slug,
+            "subscription_tier": org.subscription_tier,
+            "settings": org.settings,
+            "saved_view_default_expiration_days": org.saved_view_default_expiration_days,
+        },
+        "allowed_account_ids": list(context.allowed_account_ids),
+        "allowed_accounts_expire_at": _isoformat(context.allowed_accounts_expire_at),
+        "active_saved_view": None if view is None else {
+            "id": str(view.id),
+            "name": view.name,
+            "account_ids": [str(a) for a in view.account_ids or []],
+            "default_time_range": view.default_time_range,
+            "filters": view.filters,
+            "is_personal": view.is_personal,
+            "expires_at": _isoformat(view.expires_at),
+        },
+        "effective_time_range": context.effective_time_range,
+        "effective_filters": context.effective_filters,
+        "org_role": context.org_role,
+    }
+
+
+def context_from_payload(payload: Dict[str, Any]) -> RequestContext:
+    org = payload.get("organization_info")
+    view = payload.get("active_saved_view")
+    return RequestContext(
+        user_id=UUID(payload["user_id"]),
+        user_email=payload["user_email"],
+        is_admin=payload["is_admin"],
+        organization_id=_uuid(payload.get("organization_id")),
+        organization_name=payload.get("organization_name"),
+        organization_info=None if org is None else OrganizationInfo(
+            id=UUID(org["id"]),
+            name=org["name"],
+            slug=org["slug"],
+            subscription_tier=org["subscription_tier"],
+            settings=org["settings"] or {},
+            saved_view_default_expiration_days=org["saved_view_default_expiration_days"],
+        ),
+        allowed_account_ids=list(payload.get("allowed_account_ids") or []),
+        allowed_accounts_expire_at=_datetime(payload.get("allowed_accounts_expire_at")),
+        active_saved_view=None if view is None else SavedViewInfo(
+            id=UUID(view["id"]),
+            name=view["name"],
+            account_ids=[UUID(a) for a in view["account_ids"]],
+            default_time_range=view["default_time_range"],
+            filters=view["filters"],
+            is_personal=view["is_personal"],
+            expires_at=_datetime(view["expires_at"]),
+        ),
+        effective_time_range=payload.get("effective_time_range"),
+        effective_filters=payload.get("effective_filters"),
+        org_role=payload.get("org_role") or "member",
+    )
+
+
+def _seconds_left(expires_at: Optional[datetime]) -> Optional[float]:
+    if expires_at is None:
+        return None
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    return (expires_at - datetime.now(timezone.utc)).total_seconds()
+
+
+def _view_expired(context: RequestContext) -> bool:
+    view = context.active_saved_view
+    left = _seconds_left(view.expires_at if view is not None else None)
+    return left is not None and left <= 0
+
+
+def _grants_expired(context: RequestContext) -> bool:
+    left = _seconds_left(context.allowed_accounts_expire_at)
+    return left is not None and left <= 0
+
+
+def _expired(context: RequestContext) -> bool:
+    return _view_expired(context) or _grants_expired(context)
+
+
+class _LocalEntry:
+    __slots__ = ("context", "versions", "expires_at")
+
+    def __init__(self, context: RequestContext, versions: Versions, expires_at: float):
+        self.context = context
+        self.versions = versions
+        self.expires_at = expires_at
+
+
+class RequestContextCache:
+    """In-process TTL/LRU + Valkey cache of RequestContext keyed by user email."""
+
+    def __init__(
+        self,
+        local_ttl_seconds: Optional[int] = None,
+        local_max_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+    ):
+        settings = get_settings()
+        self.local_ttl_seconds = local_ttl_seconds or settings.request_context_cache_local_ttl_seconds
+        self.local_max_entries = local_max_entries or settings.request_context_cache_local_max_entries
+        self.ttl_seconds = ttl_seconds or settings.request_context_cache_ttl_seconds
+        self._local: "OrderedDict[str, _LocalEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._rebumps: Set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        return get_settings().request_context_cache_enabled
+
+    @staticmethod
+    def _entry_key(user_email: str) -> str:
+        return f"{KEY_PREFIX}entry:{user_email.lower()}"
+
+    async def _current_versions(self, user_email: str, user_id: Any, organization_id: Any) -> Versions:
+        # Raises when Valkey is unreachable: a missing key means "never bumped",
+        # but an outage must not look like that or revoked scope stays cached
+        cache = await get_cache_service()
+        values = await cache.get_many(_version_keys(user_email, user_id, organization_id))
+        return tuple(value or "0" for value in values)
+
+    def _local_get(self, user_email: str) -> Optional[_LocalEntry]:
+        key = user_email.lower()
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return entry
+
+    def _local_put(self, user_email: str, context: RequestContext, versions: Versions) -> None:
+        key = user_email.lower()
+        with self._lock:
+            self._local[key] = _LocalEntry(context, versions, time.monotonic() + self.local_ttl_seconds)
+            self._local.move_to_end(key)
+            while len(self._local) > self.local_max_entries:
+                self._local.popitem(last=False)
+
+    def _local_drop(self, predicate) -> None:
+        with self._lock:
+            for key in [k for k, entry in self._local.items() if predicate(entry.context)]:
+                del self._local[key]
+
+    @staticmethod
+    def _for_request(context: RequestContext, request_id: Optional[UUID]) -> RequestContext:
+        # Handlers may mutate what they are given; never hand out the cached object
+        fresh = copy.deepcopy(context)
+        fresh.request_id = request_id
+        return fresh
+
+    async def get(self, user_email: str, request_id: Optional[UUID] = None) -> Optional[RequestContext]:
+        """Cached context for ``user_email`` if still current, else None."""
+        if not self.enabled:
+            return None
+        try:
+            entry = self._local_get(user_email)
+            if entry is not None and not _expired(entry.context):
+                context = entry.context
+                current = await self._current_versions(user_email, context.user_id, context.organization_id)
+                if current == entry.versions:
+                    request_context_cache_hits.labels(tier="local").inc()
+                    return self._for_request(context, request_id)
+
+            cache = await get_cache_service()
+            raw = await cache.get(self._entry_key(user_email))
+            if raw is not None:
+                stored = json.loads(raw)
+                context = context_from_payload(stored["context"])
+                versions = tuple(stored["versions"])
+                current = await self._current_versions(user_email, context.user_id, context.organization_id)
+                if current == versions and not _expired(context):
+                    self._local_put(user_email, context, versions)
+                    request_context_cache_hits.labels(tier="valkey").inc()
+                    return self._for_request(context, request_id)
+        except Exception as e:
+            logger.debug("request_context_cache_get_failed", error=str(e))
+
+        request_context_cache_misses.inc()
+        return None
+
+    async def versions_for(self, user_email: str, user_id: Any, organization_id: Any) -> Optional[Versions]:
+        """Scope versions to stamp on a context just loaded from Postgres."""
+        if not self.enabled:
+            return None
+        try:
+            return await self._current_versions(user_email, user_id, organization_id)
+        except Exception as e:
+            logger.debug("request_context_cache_versions_failed", error=str(e))
+            return None
+
+    async def put(self, context: RequestContext, versions: Versions) -> None:
+        """Store a freshly loaded context under the versions read right after loading it."""
+        if not self.enabled or _expired(context):
+            return
+        # The caller keeps using ``context`` for its own request
+        self._local_put(context.user_email, copy.deepcopy(context), versions)
+        try:
+            cache = await get_cache_service()
+            payload = json.dumps(
+                {"context": context_to_payload(context), "versions": list(versions)},
+                default=str,
+            )
+            ttl_seconds = self.ttl_seconds
+            grants_left = _seconds_left(context.allowed_accounts_expire_at)
+            if grants_left is not None:
+                ttl_seconds = max(1, min(ttl_seconds, math.ceil(grants_left)))
+            await cache.set(self._entry_key(context.user_email), payload, ttl_seconds=ttl_seconds)
+        except Exception as e:
+            logger.debug("request_context_cache_put_failed", error=str(e))
+
+    async def _bump(self, key: str) -> None:
+        cache = await get_cache_service()
+        # Outlive every entry stamped with the previous version
+        if not await cache.set(key, uuid.uuid4().hex, ttl_seconds=2 * self.ttl_seconds):
+            raise ConnectionError(f"could not bump {key}")
+
+    async def _rebump_later(self, keys: List[str]) -> None:
+        await asyncio.sleep(_REBUMP_DELAY_SECONDS)
+        try:
+            for key in keys:
+                await self._bump(key)
+        except Exception as e:
+            logger.warning("request_context_cache_rebump_failed", error=str(e))
+
+    async def _invalidate(self, keys: List[str]) -> None:
+        try:
+            for key in keys:
+                await self._bump(key)
+        except Exception as e:
+            logger.warning("request_context_cache_invalidate_failed", keys=keys, error=str(e))
+        task = asyncio.get_running_loop().create_task(self._rebump_later(keys))
+        self._rebumps.add(task)
+        task.add_done_callback(self._rebumps.discard)
+
+    async def invalidate_user(self, user_id: Any = None, user_email: Optional[str] = None) -> None:
+        """Scope of one user changed (membership, role, active view, default org, grants)."""
+        email = user_email.lower() if user_email else None
+        self._local_drop(
+            lambda c: (user_id is not None and str(c.user_id) == str(user_id))
+            or (email is not None and c.user_email.lower() == email)
+        )
+        keys = []
+        if user_id is not None:
+            keys.append(f"{_VERSION_PREFIX}user:{user_id}")
+        if email is not None:
+            keys.append(f"{_VERSION_PREFIX}email:{email}")
+        await self._invalidate(keys)
+
+    async def invalidate_organization(self, organization_id: Any) -> None:
+        """Scope of every member of an organization changed (shared views, org settings)."""
+        self._local_drop(lambda c: str(c.organization_id) == str(organization_id))
+        await self._invalidate([f"{_VERSION_PREFIX}org:{organization_id}"])
+
+    async def invalidate_all(self) -> None:
+        """Scope of users in unknown organizations changed (account status, view expiry sweep)."""
+        with self._lock:
+            self._local.clear()
+        await self._invalidate([f"{_VERSION_PREFIX}{_GLOBAL}"])
+
+
+request_context_cache = RequestContextCache()
@@ -178,7 +178,7 @@ class ResponseBuilder:
         summary = self.summary_generator.format_response(
             intent=spec.intent,
             query=query_text,
-            data_results=result.data,
+            data_results=result.columnar,
             extracted_params=extracted_params,
             insights=None,
             chart_data=None,
@@ -209,14 +209,14 @@ class ResponseBuilder:
         query_type = self._intent_to_query_type(spec.intent)
         chart_specs = self.chart_builder["recommendation"].recommend_charts(
             intent=query_type,
-            data_results=result.data,
+            data_results=result.columnar,
             extracted_params=extracted_params
         )
         
         # Build chart data
         charts_with_data = self.chart_builder["data"].build_chart_data(
             chart_specs=chart_specs,
-            data_results=result.data,
+            data_results=result.columnar,
             conv_context=None
         )
         
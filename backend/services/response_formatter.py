@@ -10,6 +10,7 @@ import structlog
 from backend.utils.date_parser import date_parser
 from backend.agents.intent_classifier import IntentType
 from backend.services.column_constants import SERVICE, RESOURCE_TYPE
+from backend.services.query_result import ColumnarResult
 
 logger = structlog.get_logger(__name__)
 
@@ -51,6 +52,9 @@ class aasmaaResponseFormatter:
         Returns:
             Markdown-formatted response string
         """
+        # Column-oriented view: aggregations below run on arrays, row access stays dict-like
+        data_results = ColumnarResult.from_rows(data_results)
+
         # Prefer metadata from QuerySpec if available
         if spec and hasattr(spec, 'metadata'):
             params_metadata = {**extracted_params.get("metadata", {}), **spec.metadata}
@@ -430,7 +434,7 @@ class aasmaaResponseFormatter:
             # Optimization summary (savings focused)
             savings_field = self._detect_savings_field(data_results[0])
             if savings_field:
-                total_savings = sum(r.get(savings_field, 0) or 0 for r in data_results)
+                total_savings = ColumnarResult.from_rows(data_results).sum(savings_field)
                 top_item = data_results[0]
                 driver = top_item.get("family") or top_item.get("service") or top_item.get("dimension_value", "top opportunity")
                 top_savings = top_item.get(savings_field, 0) or 0
@@ -474,32 +478,16 @@ class aasmaaResponseFormatter:
                 return key
         return None
 
-    def _safe_number(self, value: Any) -> float:
-        try:
-            if value is None:
-                return 0.0
-            return float(value)
-        except (TypeError, ValueError):
-            return 0.0
-
-    def _sum_costs(self, data_results: List[Dict[str, Any]]) -> float:
+    def _sum_costs(self, data_results: Union[List[Dict[str, Any]], ColumnarResult]) -> float:
         if not data_results:
             return 0.0
-        field = self._detect_cost_field(data_results[0])
+        table = ColumnarResult.from_rows(data_results)
+        field = self._detect_cost_field(table[0])
         if field:
-            return round(sum(self._safe_number(row.get(field)) for row in data_results), 2)
-        total = 0.0
-        for row in data_results:
-            value = next(
-                (
-                    self._safe_number(row.get(key))
-                    for key in row.keys()
-                    if isinstance(key, str) and "cost" in key.lower()
-                ),
-                0.0,
-            )
-            total += value
-        return round(total, 2)
+            return round(table.sum(field), 2)
+        # No typed cost column: first "*cost*" column each row has, NULL as 0
+        cost_keys = [key for key in table.columns if isinstance(key, str) and "cost" in key.lower()]
+        return round(table.first_present_sum(cost_keys, skip_null=False), 2)
     
     def _format_period_suffix(self, params: Dict[str, Any]) -> str:
         """Format period for summary sentences"""
@@ -1284,7 +1272,7 @@ class aasmaaResponseFormatter:
         elif intent == IntentType.OPTIMIZATION:
             savings_field = self._detect_savings_field(data_results[0])
             if savings_field:
-                total_savings = sum(r.get(savings_field, 0) or 0 for r in data_results)
+                total_savings = ColumnarResult.from_rows(data_results).sum(savings_field)
                 top_three = data_results[:3]
                 contributions = [
                     f"{item.get('family', item.get('service', 'opportunity'))}: ${item.get(savings_field, 0):,.2f}"
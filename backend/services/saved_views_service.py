@@ -11,6 +11,7 @@ import structlog
 
 from backend.services.database import DatabaseService
 from backend.services.request_context import RequestContext
+from backend.services.request_context_cache import request_context_cache
 from backend.services.rbac_permission_service import get_rbac_service
 
 logger = structlog.get_logger(__name__)
@@ -226,7 +227,9 @@ class SavedViewsService:
                 updated_by=context.user_email,
             )
 
-            return await self.get_saved_view(context, view_id)
+        # Members whose active view this is carry its accounts and filters
+        await request_context_cache.invalidate_organization(context.organization_id)
+        return await self.get_saved_view(context, view_id)
 
     async def delete_saved_view(
         self,
@@ -272,7 +275,8 @@ class SavedViewsService:
                 deleted_by=context.user_email,
             )
 
-            return True
+        await request_context_cache.invalidate_organization(context.organization_id)
+        return True
 
     async def list_saved_views(
         self,
@@ -486,7 +490,8 @@ class SavedViewsService:
                 org_id=str(context.organization_id),
             )
 
-            return True
+        await request_context_cache.invalidate_user(context.user_id, context.user_email)
+        return True
 
     async def cleanup_expired_views(self) -> int:
         """
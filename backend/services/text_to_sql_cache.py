@@ -0,0 +1,257 @@
+"""
+Cache of LLM text-to-SQL generations.
+
+Many users in an organization ask the same questions ("what did we spend on
+EC2 last month"), and every one of them costs a Bedrock call in
+``TextToSQLService.generate_sql``. Generations are cached under the
+question's canonical form:
+
+- deterministic ``query_normalizer`` rules (whitespace, cost synonyms),
+  lower-cased, trailing punctuation dropped;
+- the time expression recognised by ``date_parser`` replaced with its
+  period type (``last month`` / ``November 2025`` -> ``<period:calendar_month_full>``).
+
+The generated SQL is stored as a template: on a hit the caller re-binds the
+currently requested dates into it, so a "last month" entry keeps working as
+last month moves. Keys also carry a schema version (hash of the prompt and
+CUR table), so prompt or schema changes start a fresh keyspace.
+
+Lookup order:
+
+1. exact canonical match - in-process LRU, then the shared Valkey
+   ``CacheService``;
+2. embedding similarity over the in-process entries, using the
+   ``embedding_intent_router`` model. A near-duplicate is only accepted above
+   ``text_to_sql_cache_similarity_threshold`` and when its period type and
+   anchor tokens (service names, numbers such as "top 10") match exactly, so
+   "EC2 cost" never reuses the SQL for "S3 cost". Without
+   sentence-transformers this tier is skipped.
+
+Hit / miss counters are exported by the ``/metrics`` endpoint in main.py.
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+import structlog
+from prometheus_client import Counter
+
+from backend.config.settings import get_settings
+from backend.services.cache_service import get_cache_service
+from backend.services.query_normalizer import query_normalizer
+from backend.utils.date_parser import date_parser
+
+logger = structlog.get_logger(__name__)
+
+text_to_sql_cache_hits = Counter(
+    "text_to_sql_cache_hits_total",
+    "Text-to-SQL generations served from cache by tier",
+    labelnames=["tier"],
+)
+text_to_sql_cache_misses = Counter(
+    "text_to_sql_cache_misses_total",
+    "Text-to-SQL cache misses (Bedrock called)",
+)
+
+KEY_PREFIX = "text_to_sql:"
+
+_TRAILING_PUNCTUATION = re.compile(r"[\s?.!]+$")
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9_\-]*")
+
+
+def schema_version(*parts: str) -> str:
+    """Short stable hash of the prompt/schema inputs that shape generated SQL."""
+    digest = hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+    return digest[:16]
+
+
+def canonical_query(user_query: str) -> Tuple[str, str]:
+    """``(canonical text, period type)`` for a natural-language question."""
+    text = _TRAILING_PUNCTUATION.sub("", query_normalizer.canonical_text(user_query))
+    period = "default"
+    try:
+        _, _, metadata = date_parser.parse_time_range(text)
+    except Exception:
+        metadata = {}
+    pattern = metadata.get("pattern_matched")
+    if pattern and metadata.get("source") != "default":
+        period = str(metadata.get("period_type") or "explicit")
+        text = re.sub(pattern, f"<period:{period}>", text, count=1, flags=re.IGNORECASE)
+    return text, period
+
+
+def _service_words() -> FrozenSet[str]:
+    # Deferred: athena_executor pulls in the Athena client stack
+    from backend.services.athena_executor import SERVICE_NAME_TO_PRODUCT_CODE
+
+    return frozenset(name for name in SERVICE_NAME_TO_PRODUCT_CODE if " " not in name)
+
+
+def anchor_tokens(canonical: str) -> FrozenSet[str]:
+    """Tokens a near-duplicate must share exactly: service names and anything with a digit."""
+    services = _service_words()
+    return frozenset(
+        token for token in _TOKEN.findall(canonical)
+        if token in services or any(ch.isdigit() for ch in token)
+    )
+
+
+@dataclass
+class _IndexEntry:
+    version: str
+    period: str
+    anchors: FrozenSet[str]
+    vector: Any
+
+
+class TextToSQLCache:
+    """Exact (LRU + Valkey) and embedding-similarity cache of SQL generations."""
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        similarity_threshold: Optional[float] = None,
+    ):
+        settings = get_settings()
+        self.max_entries = max_entries or settings.text_to_sql_cache_local_max_entries
+        self.ttl_seconds = ttl_seconds or settings.text_to_sql_cache_ttl_seconds
+        self.similarity_threshold = (
+            similarity_threshold
+            if similarity_threshold is not None
+            else settings.text_to_sql_cache_similarity_threshold
+        )
+        self._local: "OrderedDict[str, str]" = OrderedDict()
+        self._index: Dict[str, _IndexEntry] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return get_settings().text_to_sql_cache_enabled
+
+    @staticmethod
+    def cache_key(canonical: str, version: str) -> str:
+        digest = hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+        return f"{KEY_PREFIX}{version}:{digest}"
+
+    def invalidate_local(self) -> None:
+        """Drop every in-process entry and the embedding index."""
+        with self._lock:
+            self._local.clear()
+            self._index.clear()
+
+    def _local_get(self, key: str) -> Optional[str]:
+        with self._lock:
+            payload = self._local.get(key)
+            if payload is not None:
+                self._local.move_to_end(key)
+            return payload
+
+    def _local_put(self, key: str, payload: str, entry: Optional[_IndexEntry] = None) -> None:
+        with self._lock:
+            self._local[key] = payload
+            self._local.move_to_end(key)
+            if entry is not None:
+                self._index[key] = entry
+            while len(self._local) > self.max_entries:
+                evicted, _ = self._local.popitem(last=False)
+                self._index.pop(evicted, None)
+
+    async def _embed(self, text: str) -> Optional[Any]:
+        try:
+            from backend.services.embedding.embedding_intent_router import encode
+
+            vectors = await asyncio.to_thread(encode, [text])
+        except Exception as e:
+            logger.debug("text_to_sql_cache_embed_failed", error=str(e))
+            return None
+        return None if vectors is None else vectors[0]
+
+    def _nearest(self, vector: Any, version: str, period: str, anchors: FrozenSet[str]) -> Optional[Tuple[str, float]]:
+        best_key, best_score = None, -1.0
+        with self._lock:
+            candidates = [
+                (key, entry.vector) for key, entry in self._index.items()
+                if entry.version == version and entry.period == period and entry.anchors == anchors
+            ]
+        for key, candidate in candidates:
+            score = float(candidate @ vector)
+            if score > best_score:
+                best_key, best_score = key, score
+        if best_key is None or best_score < self.similarity_threshold:
+            return None
+        return best_key, best_score
+
+    async def get(self, user_query: str, version: str) -> Optional[Dict[str, Any]]:
+        """Cached generation for ``user_query`` (with ``cache_tier`` added), or None."""
+        if not self.enabled:
+            return None
+        canonical, period = canonical_query(user_query)
+        key = self.cache_key(canonical, version)
+
+        tier = "local"
+        payload = self._local_get(key)
+        if payload is None:
+            tier = "valkey"
+            try:
+                cache = await get_cache_service()
+                payload = await cache.get(key)
+            except Exception as e:
+                logger.debug("text_to_sql_cache_get_failed", error=str(e))
+                payload = None
+            if payload is not None:
+                self._local_put(key, payload)
+
+        similarity = None
+        if payload is None and self._index:
+            vector = await self._embed(canonical)
+            if vector is not None:
+                nearest = self._nearest(vector, version, period, anchor_tokens(canonical))
+                if nearest is not None:
+                    tier = "embedding"
+                    similar_key, similarity = nearest
+                    payload = self._local_get(similar_key)
+
+        if payload is None:
+            text_to_sql_cache_misses.inc()
+            return None
+
+        text_to_sql_cache_hits.labels(tier=tier).inc()
+        logger.info("text_to_sql_cache_hit", tier=tier, similarity=similarity)
+        entry = json.loads(payload)
+        entry["cache_tier"] = tier
+        return entry
+
+    async def put(self, user_query: str, version: str, generation: Dict[str, Any]) -> bool:
+        """Store a generation (SQL template plus LLM metadata). Returns True if cached."""
+        if not self.enabled:
+            return False
+        canonical, period = canonical_query(user_query)
+        key = self.cache_key(canonical, version)
+        try:
+            payload = json.dumps(generation, default=str, separators=(",", ":"))
+        except (TypeError, ValueError) as e:
+            logger.debug("text_to_sql_cache_serialize_failed", error=str(e))
+            return False
+
+        vector = await self._embed(canonical)
+        entry = None
+        if vector is not None:
+            entry = _IndexEntry(version=version, period=period, anchors=anchor_tokens(canonical), vector=vector)
+        self._local_put(key, payload, entry)
+        try:
+            cache = await get_cache_service()
+            await cache.set(key, payload, ttl_seconds=self.ttl_seconds)
+        except Exception as e:
+            logger.debug("text_to_sql_cache_set_failed", error=str(e))
+        return True
+
+
+# Module-level singleton
+text_to_sql_cache = TextToSQLCache()
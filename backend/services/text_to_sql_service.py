@@ -17,6 +17,8 @@ from backend.utils.sql_constants import build_sql_in_list, format_display_list
 from backend.utils.sql_validation import ValidationError
 from backend.services.rbac_permission_service import get_rbac_service
 from backend.utils.date_parser import date_parser
+from backend.services.cur_partitions import cur_partition_catalog
+from backend.services.text_to_sql_cache import schema_version, text_to_sql_cache
 
 if TYPE_CHECKING:
     from backend.services.request_context import RequestContext
@@ -590,6 +592,12 @@ User: "show me RDS costs for September 2025 per resource"
 Now generate the query for the user's request. Return ONLY the JSON, no markdown formatting.
 """
 
+# Parsed LLM fields stored by the generation cache (SQL is kept as a date template)
+_CACHED_GENERATION_FIELDS = ("sql", "explanation", "result_columns", "query_type", "chart_suggestions")
+# Bump when the rules for what may be cached change, so old entries are not served
+_GENERATION_CACHE_FORMAT = "literal-bounds-v2"
+_PROMPT_VERSION = schema_version(CUR_SCHEMA_CONTEXT, TEXT_TO_SQL_PROMPT, _GENERATION_CACHE_FORMAT)
+
 
 class TextToSQLService:
     """Pure LLM-based text-to-SQL service for AWS CUR queries."""
@@ -625,6 +633,17 @@ class TextToSQLService:
         r"(?P<suffix>')",
         re.IGNORECASE,
     )
+    _PARTITION_PREDICATE_PATTERN = re.compile(
+        r"\b(?:billing_period|year|month)\s*(?:=|IN\b)",
+        re.IGNORECASE,
+    )
+    _JOIN_PATTERN = re.compile(r"\bJOIN\b", re.IGNORECASE)
+    _DATE_LITERAL_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+    # Windows computed in SQL are not touched by _apply_resolved_time_range
+    _RELATIVE_DATE_PATTERN = re.compile(
+        r"\b(?:CURRENT_DATE|CURRENT_TIMESTAMP|LOCALTIMESTAMP|INTERVAL|DATE_ADD|DATE_SUB)\b|\bNOW\s*\(",
+        re.IGNORECASE,
+    )
 
     def _normalize_chart_suggestions(
         self,
@@ -739,6 +758,17 @@ class TextToSQLService:
             - metadata: Dict with explanation, result_columns, query_type
         """
         try:
+            cache_version = self._generation_cache_version(conversation_history, previous_context)
+            if cache_version:
+                cached = await text_to_sql_cache.get(user_query, cache_version)
+                if cached:
+                    sql_query, metadata = self._finalize_generation(
+                        user_query, previous_context, cached, generated_via="text_to_sql_cache"
+                    )
+                    if metadata.get("status") == "ok":
+                        metadata["cache_tier"] = cached.get("cache_tier")
+                        return sql_query, metadata
+
             # Calculate common date ranges
             current_date = datetime.now().strftime("%Y-%m-%d")
             start_date_30d = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
@@ -975,6 +1005,7 @@ class TextToSQLService:
                   }
                   resolved_time_range = self._resolve_requested_time_range(user_query, previous_context)
                   sql_query = self._apply_resolved_time_range(sql_query, resolved_time_range)
+                  sql_query = self._inject_partition_filters(sql_query)
                   metadata["explanation"] = self._normalize_explanation_time_range(
                       metadata.get("explanation", ""),
                       resolved_time_range,
@@ -992,7 +1023,6 @@ class TextToSQLService:
                 }
                 return "", metadata
             
-            sql_query = response_data.get("sql", "")
             # Minimal schema validation to avoid malformed payloads
             if not isinstance(response_data.get("result_columns", []), list) or not response_data.get("query_type"):
                 logger.error(
@@ -1009,74 +1039,15 @@ class TextToSQLService:
                 }
                 return "", metadata
             
-            resolved_time_range = self._resolve_requested_time_range(user_query, previous_context)
-            sql_query = self._apply_resolved_time_range(sql_query, resolved_time_range)
-
-            # Extract time period and filters from SQL
-            time_period_info = self._extract_time_period_from_sql(sql_query)
-            scope_info = self._extract_scope_from_sql(sql_query, user_query)
-            filters_info = self._extract_filters_from_sql(sql_query)
-            normalized_chart_suggestions = self._normalize_chart_suggestions(
-                response_data.get("chart_suggestions", []),
-                response_data.get("result_columns", []),
-                response_data.get("query_type", "unknown"),
-            )
-            
-            metadata = {
-                "explanation": self._normalize_explanation_time_range(
-                  response_data.get("explanation", ""),
-                  resolved_time_range,
-                ),
-                "result_columns": response_data.get("result_columns", []),
-                "query_type": response_data.get("query_type", "unknown"),
-                "chart_suggestions": normalized_chart_suggestions,
-                "generated_via": "text_to_sql_llm",
-                "time_period": time_period_info,
-                "scope": scope_info,
-              "filters": filters_info,
-              "status": "ok"
-            }
-            
-            if not sql_query:
-              # Ask for clarification instead of returning unrelated fallback
-              metadata.update({
-                "status": "needs_clarification",
-                "clarification": [
-                  "I couldn't extract a valid SQL from your request. Do you want costs for the last 30 days or a specific month?",
-                  "Should I break it down by service, resource, or over time?"
-                ]
-              })
-              return "", metadata
-            
-            logger.info(
-                "SQL generation successful",
-                query_type=metadata["query_type"],
-                sql_length=len(sql_query),
-                result_columns=metadata["result_columns"],
-                time_period=time_period_info,
-                scope=scope_info
+            sql_query, metadata = self._finalize_generation(
+                user_query, previous_context, response_data, generated_via="text_to_sql_llm"
             )
-
-            # SECURITY: Validate LLM-generated SQL before execution
-            if sql_query:
-                try:
-                    self._validate_generated_sql(sql_query)
-                except ValidationError as e:
-                    logger.error(
-                        "SQL validation failed for LLM-generated query",
-                        error=str(e),
-                        sql_preview=sql_query[:200]
-                    )
-                    # Return error instead of malicious SQL
-                    metadata.update({
-                        "status": "validation_failed",
-                        "clarification": [
-                        "Try asking with a specific time period, such as 'last 7 days' or 'last month'.",
-                        "You can also ask for a breakdown, for example 'cost by service for last 30 days'."
-                        ]
-                    })
-                    return "", metadata
-
+            if cache_version and metadata.get("status") == "ok" and self._is_rebindable_sql(response_data.get("sql", "")):
+                await text_to_sql_cache.put(
+                    user_query,
+                    cache_version,
+                    {field: response_data.get(field) for field in _CACHED_GENERATION_FIELDS},
+                )
             return sql_query, metadata
             
         except Exception as e:
@@ -1103,6 +1074,133 @@ class TextToSQLService:
             }
             return "", metadata
 
+    def _finalize_generation(
+        self,
+        user_query: str,
+        previous_context: Optional[Dict[str, Any]],
+        response_data: Dict[str, Any],
+        generated_via: str,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Turn a parsed LLM (or cached) generation into executable SQL and metadata.
+
+        Binds the requested time range, adds partition predicates, derives
+        display metadata and validates the SQL.
+        """
+        sql_query = response_data.get("sql", "")
+        resolved_time_range = self._resolve_requested_time_range(user_query, previous_context)
+        sql_query = self._apply_resolved_time_range(sql_query, resolved_time_range)
+        sql_query = self._inject_partition_filters(sql_query)
+
+        # Extract time period and filters from SQL
+        time_period_info = self._extract_time_period_from_sql(sql_query)
+        scope_info = self._extract_scope_from_sql(sql_query, user_query)
+        filters_info = self._extract_filters_from_sql(sql_query)
+        normalized_chart_suggestions = self._normalize_chart_suggestions(
+            response_data.get("chart_suggestions", []),
+            response_data.get("result_columns", []),
+            response_data.get("query_type", "unknown"),
+        )
+        
+        metadata = {
+            "explanation": self._normalize_explanation_time_range(
+              response_data.get("explanation", ""),
+              resolved_time_range,
+            ),
+            "result_columns": response_data.get("result_columns", []),
+            "query_type": response_data.get("query_type", "unknown"),
+            "chart_suggestions": normalized_chart_suggestions,
+            "generated_via": generated_via,
+            "time_period": time_period_info,
+            "scope": scope_info,
+          "filters": filters_info,
+          "status": "ok"
+        }
+        
+        if not sql_query:
+          # Ask for clarification instead of returning unrelated fallback
+          metadata.update({
+            "status": "needs_clarification",
+            "clarification": [
+              "I couldn't extract a valid SQL from your request. Do you want costs for the last 30 days or a specific month?",
+              "Should I break it down by service, resource, or over time?"
+            ]
+          })
+          return "", metadata
+        
+        logger.info(
+            "SQL generation successful",
+            query_type=metadata["query_type"],
+            sql_length=len(sql_query),
+            result_columns=metadata["result_columns"],
+            time_period=time_period_info,
+            scope=scope_info
+        )
+
+        # SECURITY: Validate LLM-generated SQL before execution
+        if sql_query:
+            try:
+                self._validate_generated_sql(sql_query)
+            except ValidationError as e:
+                logger.error(
+                    "SQL validation failed for LLM-generated query",
+                    error=str(e),
+                    sql_preview=sql_query[:200]
+                )
+                # Return error instead of malicious SQL
+                metadata.update({
+                    "status": "validation_failed",
+                    "clarification": [
+                    "Try asking with a specific time period, such as 'last 7 days' or 'last month'.",
+                    "You can also ask for a breakdown, for example 'cost by service for last 30 days'."
+                    ]
+                })
+                return "", metadata
+
+        return sql_query, metadata
+
+    def _generation_cache_version(
+        self,
+        conversation_history: Optional[List[Dict[str, str]]],
+        previous_context: Optional[Dict[str, Any]],
+    ) -> Optional[str]:
+        """
+        Cache keyspace for this request, or None when it must not be cached.
+
+        Follow-ups are excluded: conversation history and the previous
+        service/time range are part of the prompt, so the same words can mean
+        different SQL.
+        """
+        context = previous_context or {}
+        if conversation_history or context.get("last_service") or context.get("last_time_range"):
+            return None
+        return schema_version(
+            _PROMPT_VERSION,
+            settings.aws_cur_database or "cost_and_usage_db",
+            settings.aws_cur_table or "costandusagereport",
+        )
+
+    def _is_rebindable_sql(self, sql_query: str) -> bool:
+        """
+        True if the SQL's time window is exactly two literal bounds that
+        ``_apply_resolved_time_range`` re-binds.
+
+        The cache key only carries the period type ("last 4 months" and
+        "last 6 months" share one), so SQL with no literal bounds, or with a
+        window computed from CURRENT_DATE / INTERVAL / DATE_ADD, would be
+        served unchanged for a different window.
+        """
+        if not sql_query or self._RELATIVE_DATE_PATTERN.search(sql_query):
+            return False
+        dates = len(self._DATE_LITERAL_PATTERN.findall(sql_query))
+        between = len(self._DATE_BETWEEN_PATTERN.findall(sql_query))
+        starts = len(self._DATE_START_PATTERN.findall(sql_query))
+        ends = len(self._DATE_END_PATTERN.findall(sql_query))
+        return dates == 2 and (
+            (between == 1 and starts == 0 and ends == 0)
+            or (between == 0 and starts == 1 and ends == 1)
+        )
+
     def _resolve_requested_time_range(
         self,
         user_query: str,
@@ -1163,6 +1261,49 @@ class TextToSQLService:
 
         return sql_query
 
+    def _inject_partition_filters(self, sql_query: str) -> str:
+        """
+        Add CUR partition predicates next to each usage-date filter.
+
+        The partition predicate for a date range is implied by that range, so
+        AND-ing it onto the date filter never changes results; it only lets
+        Athena prune billing months outside the range. Skipped when the layout
+        is not yet discovered, when the SQL already filters on partition
+        columns, or when it joins (unqualified partition columns would be
+        ambiguous).
+        """
+        if not sql_query:
+            return sql_query
+
+        cur_database = settings.aws_cur_database or "cost_and_usage_db"
+        cur_table = settings.aws_cur_table or "costandusagereport"
+        scheme = cur_partition_catalog.get(cur_database, cur_table)
+        if scheme is None:
+            return sql_query
+        if self._PARTITION_PREDICATE_PATTERN.search(sql_query) or self._JOIN_PATTERN.search(sql_query):
+            return sql_query
+
+        try:
+            if self._DATE_BETWEEN_PATTERN.search(sql_query):
+                def _with_partition(match: "re.Match") -> str:
+                    predicate, _, _ = scheme.predicate(match.group("start"), match.group("end"))
+                    return f"{match.group(0)} AND {predicate}"
+
+                return self._DATE_BETWEEN_PATTERN.sub(_with_partition, sql_query)
+
+            start_matches = list(self._DATE_START_PATTERN.finditer(sql_query))
+            end_matches = list(self._DATE_END_PATTERN.finditer(sql_query))
+            if len(start_matches) == 1 and len(end_matches) == 1:
+                predicate, _, _ = scheme.predicate(
+                    start_matches[0].group("date"), end_matches[0].group("date")
+                )
+                end = end_matches[0].end()
+                return f"{sql_query[:end]} AND {predicate}{sql_query[end:]}"
+        except ValueError:
+            logger.warning("Skipping partition injection for unparseable date range")
+
+        return sql_query
+
     def _normalize_explanation_time_range(
         self,
         explanation: str,
@@ -38,6 +38,7 @@ class AwsService:
 
     # Analytics & Query
     ATHENA = "athena"
+    GLUE = "glue"
 
     # Cost Management
     COST_EXPLORER = "ce"
@@ -18,13 +18,26 @@ Credential Resolution Order (boto3 default chain):
 5. Assume role provider
 6. Container credential provider (ECS)
 7. Instance metadata service (EC2)
+
+Client reuse:
+``get_aws_client()`` returns process-wide clients from ``aws_client_registry``,
+keyed by (service, region, role ARN, config). boto3 clients are thread-safe;
+sharing them skips credential resolution and TLS setup on every request and
+keeps one urllib3 pool per endpoint sized by ``get_default_retry_config``.
+Clients for an assumed role use refreshable STS credentials that botocore
+renews ahead of expiry. ``create_aws_client()`` still builds a fresh client.
 """
 
+import threading
 import warnings
-from typing import Optional, Any
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import boto3
+import botocore.session
 from botocore.config import Config
+from botocore.credentials import RefreshableCredentials
+from prometheus_client import Counter
+from prometheus_client.core import REGISTRY, GaugeMetricFamily
 import structlog
 
 from backend.utils.aws_constants import (
@@ -259,3 +272,207 @@ def verify_aws_credentials() -> dict:
             "method": "default_credential_chain",
             "error": str(e),
         }
+
+
+# Session name recorded in CloudTrail for roles assumed by the client registry
+_ROLE_SESSION_NAME = "aasmaa-client-registry"
+_ROLE_SESSION_SECONDS = 3600
+
+aws_client_registry_requests = Counter(
+    "aws_client_registry_requests_total",
+    "AWS client lookups in the process-wide registry",
+    labelnames=["service", "result"],
+)
+
+
+def _resolve_region(region_name: Optional[str]) -> str:
+    if region_name:
+        return region_name
+    try:
+        from backend.config.settings import get_settings
+        return get_settings().aws_region
+    except Exception:
+        return DEFAULT_AWS_REGION
+
+
+def _config_key(config: Optional[Config]) -> Optional[str]:
+    if config is None:
+        return None
+    return repr(sorted(config._user_provided_options.items()))
+
+
+class AwsClientRegistry:
+    """
+    Process-wide boto3 clients keyed by (service, region, role ARN, config).
+
+    Every client is built on ``get_default_retry_config()`` (pool size and
+    retries) merged with the caller's config. Sessions come from
+    ``create_aws_session()``, so the default credential chain applies;
+    clients for ``role_arn`` use STS AssumeRole credentials that refresh
+    themselves before they expire.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple[str, str, Optional[str], Optional[str]], Any] = {}
+        self._sessions: Dict[Tuple[str, Optional[str]], boto3.Session] = {}
+
+    def get_client(
+        self,
+        service_name: str,
+        region_name: Optional[str] = None,
+        role_arn: Optional[str] = None,
+        config: Optional[Config] = None,
+    ) -> Any:
+        region = _resolve_region(region_name)
+        key = (service_name, region, role_arn, _config_key(config))
+        client = self._clients.get(key)
+        if client is not None:
+            aws_client_registry_requests.labels(service=service_name, result="hit").inc()
+            return client
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                aws_client_registry_requests.labels(service=service_name, result="miss").inc()
+                pooled = get_default_retry_config()
+                if config is not None:
+                    pooled = pooled.merge(config)
+                # region_name must be explicit: the pooled config carries the
+                # settings region, which would otherwise win over the session's
+                client = self._session(region, role_arn).client(
+                    service_name, region_name=region, config=pooled
+                )
+                self._clients[key] = client
+                logger.debug("aws_client_registered", service=service_name, region=region, role=bool(role_arn))
+            else:
+                aws_client_registry_requests.labels(service=service_name, result="hit").inc()
+        return client
+
+    def _session(self, region: str, role_arn: Optional[str]) -> boto3.Session:
+        # Called with self._lock held; boto3 sessions are not thread-safe, so
+        # they are only used here to build clients
+        session = self._sessions.get((region, role_arn))
+        if session is None:
+            if role_arn:
+                session = _assumed_role_session(region, role_arn)
+            else:
+                session = create_aws_session(region_name=region)
+            self._sessions[(region, role_arn)] = session
+        return session
+
+    def clear(self) -> None:
+        """Drop all cached clients and sessions (tests, credential rotation)."""
+        with self._lock:
+            self._clients.clear()
+            self._sessions.clear()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def pool_usage(self) -> List[Dict[str, Any]]:
+        """Connection pool usage per registered client (urllib3 pools behind botocore)."""
+        with self._lock:
+            clients = list(self._clients.items())
+        usage = []
+        for (service, region, _role, _config), client in clients:
+            in_use = idle = 0
+            try:
+                max_size = client.meta.config.max_pool_connections
+                manager = client._endpoint.http_session._manager
+                for pool_key in list(manager.pools.keys()):
+                    pool = manager.pools.get(pool_key)
+                    if pool is None:
+                        continue
+                    in_use += pool.pool.maxsize - pool.pool.qsize()
+                    idle += sum(1 for conn in list(pool.pool.queue) if conn is not None)
+            except Exception:
+                continue
+            usage.append({
+                "service": service,
+                "region": region,
+                "in_use": in_use,
+                "idle": idle,
+                "max": max_size,
+            })
+        return usage
+
+
+def _assumed_role_session(region: str, role_arn: str) -> boto3.Session:
+    """Session whose credentials are re-assumed by botocore before expiry."""
+    sts = create_aws_session(region_name=region).client(AwsService.STS, region_name=region)
+
+    def _refresh() -> Dict[str, str]:
+        credentials = sts.assume_role(
+            RoleArn=role_arn,
+            RoleSessionName=_ROLE_SESSION_NAME,
+            DurationSeconds=_ROLE_SESSION_SECONDS,
+        )["Credentials"]
+        logger.info("aws_role_credentials_refreshed", expiration=str(credentials["Expiration"]))
+        return {
+            "access_key": credentials["AccessKeyId"],
+            "secret_key": credentials["SecretAccessKey"],
+            "token": credentials["SessionToken"],
+            "expiry_time": credentials["Expiration"].isoformat(),
+        }
+
+    botocore_session = botocore.session.get_session()
+    botocore_session._credentials = RefreshableCredentials.create_from_metadata(
+        metadata=_refresh(),
+        refresh_using=_refresh,
+        method="sts-assume-role",
+    )
+    botocore_session.set_config_variable("region", region)
+    return boto3.Session(botocore_session=botocore_session)
+
+
+class _PoolUsageCollector:
+    """Scrape-time gauges for the registry's connection pools."""
+
+    def __init__(self, registry: AwsClientRegistry):
+        self._registry = registry
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        clients = GaugeMetricFamily("aws_client_registry_clients", "Cached AWS clients in the registry")
+        clients.add_metric([], len(self._registry))
+        yield clients
+
+        connections = GaugeMetricFamily(
+            "aws_client_pool_connections",
+            "AWS client HTTP connections by state (in_use, idle, max)",
+            labels=["service", "region", "state"],
+        )
+        for usage in self._registry.pool_usage():
+            for state in ("in_use", "idle", "max"):
+                connections.add_metric([usage["service"], usage["region"], state], usage[state])
+        yield connections
+
+
+aws_client_registry = AwsClientRegistry()
+REGISTRY.register(_PoolUsageCollector(aws_client_registry))
+
+
+def get_aws_client(
+    service_name: str,
+    region_name: Optional[str] = None,
+    role_arn: Optional[str] = None,
+    config: Optional[Config] = None,
+) -> Any:
+    """
+    Shared AWS service client from the process-wide registry.
+
+    Args:
+        service_name: AWS service name (e.g., 's3', 'athena', 'ce')
+        region_name: AWS region (defaults to settings.aws_region)
+        role_arn: Optional IAM role to assume (credentials refresh automatically)
+        config: Optional botocore Config merged over the default pool/retry config
+
+    Returns:
+        boto3 service client (do not mutate; it is shared across requests)
+
+    Example:
+        s3 = get_aws_client(AwsService.S3)
+        ce = get_aws_client(AwsService.COST_EXPLORER, region_name=COST_EXPLORER_REGION)
+    """
+    return aws_client_registry.get_client(
+        service_name, region_name=region_name, role_arn=role_arn, config=config
+    )
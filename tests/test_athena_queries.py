@@ -8,7 +8,7 @@ from backend.services.athena_query_service import AthenaQueryService
 
 @pytest.fixture
 def executor():
-    with patch('backend.services.athena_executor.create_aws_session'):
+    with patch('backend.services.athena_executor.get_aws_client'):
         executor = EnhancedAthenaQueryExecutor()
         executor.templates = MagicMock()
         # Mock the actual Athena query execution to prevent real AWS calls
@@ -87,7 +87,7 @@ async def test_comparison_query_generation_with_date_objects(executor):
 
 @pytest.mark.asyncio
 async def test_athena_query_service_filters_removed():
-    with patch('backend.services.athena_query_service.create_aws_session'):
+    with patch('backend.services.athena_query_service.get_aws_client'):
         service = AthenaQueryService()
         time_range = {"start_date": "2023-01-01", "end_date": "2023-01-31"}
         
@@ -25,6 +25,14 @@ from fastapi import BackgroundTasks
 from backend.services.request_context import RequestContext
 
 
+def _mock_conversation_store():
+    store = MagicMock()
+    store.add_message = AsyncMock(return_value="msg-123")
+    store.get_context_for_query = AsyncMock(return_value={})
+    store.enqueue = AsyncMock()
+    return store
+
+
 class TestAthenaQueryInResponse:
     """Test that athena_query field is properly included in responses"""
 
@@ -95,7 +103,8 @@ class TestAthenaQueryInResponse:
             "athena_query": "SELECT line_item_usage_account_id, SUM(line_item_unblended_cost) AS total_cost FROM cost_data WHERE line_item_usage_start_date >= date_add('day', -30, current_date) GROUP BY line_item_usage_account_id"
         }
 
-        with patch('api.chat.conversation_manager', mock_conv_manager):
+        with patch('api.chat.conversation_manager', mock_conv_manager), \
+                patch('api.chat.conversation_store', _mock_conversation_store()):
             with patch('api.chat.execute_multi_agent_query', new_callable=AsyncMock) as mock_execute:
                 mock_execute.return_value = mock_multi_agent_response
 
@@ -146,7 +155,8 @@ class TestAthenaQueryInResponse:
             # Note: No athena_query field
         }
 
-        with patch('api.chat.conversation_manager', mock_conv_manager):
+        with patch('api.chat.conversation_manager', mock_conv_manager), \
+                patch('api.chat.conversation_store', _mock_conversation_store()):
             with patch('api.chat.execute_multi_agent_query', new_callable=AsyncMock) as mock_execute:
                 mock_execute.return_value = mock_multi_agent_response
 
@@ -137,7 +137,7 @@ class TestHistoricalAvailabilityAuthentication:
         self, mock_request, context_authenticated
     ):
         """Should allow access for authenticated users"""
-        with patch('backend.api.analytics.create_aws_client') as mock_client:
+        with patch('backend.api.analytics.get_aws_client') as mock_client:
             # Mock Cost Explorer response
             mock_ce = MagicMock()
             mock_ce.get_cost_and_usage.return_value = {
@@ -163,7 +163,7 @@ class TestHistoricalAvailabilityAuthentication:
         self, mock_request, context_authenticated
     ):
         """Should log user access for audit trail"""
-        with patch('backend.api.analytics.create_aws_client') as mock_client:
+        with patch('backend.api.analytics.get_aws_client') as mock_client:
             with patch('backend.api.analytics.logger') as mock_logger:
                 mock_ce = MagicMock()
                 mock_ce.get_cost_and_usage.return_value = {
@@ -617,7 +617,7 @@ class TestHistoricalAvailabilityScoping:
         is present AND carries EXACTLY the context's allowed_account_ids.
         Substring-checking would miss a Filter that's present but wrong.
         """
-        with patch("backend.api.analytics.create_aws_client") as mock_client:
+        with patch("backend.api.analytics.get_aws_client") as mock_client:
             mock_ce = MagicMock()
             mock_ce.get_cost_and_usage.return_value = {"ResultsByTime": []}
             mock_client.return_value = mock_ce
@@ -645,11 +645,11 @@ class TestHistoricalAvailabilityScoping:
     ):
         """
         Fail-closed ordering. A zero-scope user gets 403, and the CE client
-        is NEVER constructed. If we see create_aws_client called, the scope
+        is NEVER constructed. If we see get_aws_client called, the scope
         check is in the wrong place (inside the try, where the broad
         Exception handler would swallow the 403 as a 500).
         """
-        with patch("backend.api.analytics.create_aws_client") as mock_client:
+        with patch("backend.api.analytics.get_aws_client") as mock_client:
             with pytest.raises(HTTPException) as exc:
                 await check_historical_data_availability(
                     mock_request, context_no_accounts
@@ -846,7 +846,7 @@ class TestBackgroundTaskScoping:
         Two CE calls in the task (monthly + daily). BOTH must pass Filter.
         A partial fix that only scopes one is still a full leak on the other.
         """
-        with patch("backend.api.analytics.create_aws_client") as mock_client:
+        with patch("backend.api.analytics.get_aws_client") as mock_client:
             mock_ce = MagicMock()
             mock_ce.get_cost_and_usage.return_value = {"ResultsByTime": []}
             mock_client.return_value = mock_ce
@@ -882,7 +882,7 @@ class TestBackgroundTaskScoping:
         (between the prefix and the dates — not appended as an afterthought
         where a prefix-scan `analytics:monthly:*` would still clash).
         """
-        with patch("backend.api.analytics.create_aws_client") as mock_client:
+        with patch("backend.api.analytics.get_aws_client") as mock_client:
             mock_ce = MagicMock()
             mock_ce.get_cost_and_usage.return_value = {"ResultsByTime": []}
             mock_client.return_value = mock_ce
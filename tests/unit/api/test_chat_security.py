@@ -40,7 +40,18 @@ from backend.services.request_context import RequestContext
 # ---------------------------------------------------------------------------
 
 @pytest.fixture
-def mock_conversation_manager():
+def mock_conversation_store():
+    """Mock async conversation store (history reads and buffered writes)"""
+    with patch('backend.api.chat.conversation_store') as mock_store:
+        mock_store.add_message = AsyncMock(return_value="msg-1")
+        mock_store.get_context_for_query = AsyncMock(return_value={})
+        mock_store.get_conversation_history = AsyncMock(return_value=[])
+        mock_store.enqueue = AsyncMock()
+        yield mock_store
+
+
+@pytest.fixture
+def mock_conversation_manager(mock_conversation_store):
     """Mock conversation manager for testing"""
     with patch('backend.api.chat.conversation_manager') as mock_cm:
         yield mock_cm
@@ -177,13 +188,13 @@ class TestGetConversationOwnership:
 
     @pytest.mark.asyncio
     async def test_allows_access_when_user_is_owner(
-        self, mock_conversation_manager, sample_thread_metadata, sample_request_context
+        self, mock_conversation_manager, mock_conversation_store, sample_thread_metadata, sample_request_context
     ):
         """Should allow access when user owns the conversation"""
         # Set same user_id in thread metadata
         sample_thread_metadata['user_id'] = str(sample_request_context.user_id)
         mock_conversation_manager.get_thread_metadata.return_value = sample_thread_metadata
-        mock_conversation_manager.get_conversation_history.return_value = [
+        mock_conversation_store.get_conversation_history.return_value = [
             {'id': '1', 'role': 'user', 'content': 'Hello'}
         ]
 
@@ -194,18 +205,18 @@ class TestGetConversationOwnership:
         assert result['count'] == 1
         # HIGH-14: service layer now receives user_id — defense-in-depth beneath
         # the require_conversation_owner() check at the top of the handler.
-        mock_conversation_manager.get_conversation_history.assert_called_once_with(
+        mock_conversation_store.get_conversation_history.assert_called_once_with(
             'test-thread-123', user_id=str(sample_request_context.user_id), limit=100
         )
 
     @pytest.mark.asyncio
     async def test_logs_successful_access(
-        self, mock_conversation_manager, sample_thread_metadata, sample_request_context
+        self, mock_conversation_manager, mock_conversation_store, sample_thread_metadata, sample_request_context
     ):
         """Should log info when conversation is successfully accessed"""
         sample_thread_metadata['user_id'] = str(sample_request_context.user_id)
         mock_conversation_manager.get_thread_metadata.return_value = sample_thread_metadata
-        mock_conversation_manager.get_conversation_history.return_value = []
+        mock_conversation_store.get_conversation_history.return_value = []
 
         with patch('backend.api.chat.logger') as mock_logger:
             await get_conversation('test-thread-123', 100, sample_request_context)
@@ -402,7 +413,7 @@ class TestEndToEndSecurityFlow:
 
     @pytest.mark.asyncio
     async def test_complete_security_flow_unauthorized_access(
-        self, mock_conversation_manager, sample_thread_metadata
+        self, mock_conversation_manager, mock_conversation_store, sample_thread_metadata
     ):
         """Test complete flow: user tries to access another user's conversation"""
         # Setup: Thread belongs to user A
@@ -424,18 +435,18 @@ class TestEndToEndSecurityFlow:
         assert exc_info.value.status_code == 403
 
         # Verify no messages were retrieved
-        mock_conversation_manager.get_conversation_history.assert_not_called()
+        mock_conversation_store.get_conversation_history.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_complete_security_flow_authorized_access(
-        self, mock_conversation_manager, sample_thread_metadata
+        self, mock_conversation_manager, mock_conversation_store, sample_thread_metadata
     ):
         """Test complete flow: user accesses their own conversation"""
         # Setup: Thread belongs to user
         owner_id = uuid4()
         sample_thread_metadata['user_id'] = str(owner_id)
         mock_conversation_manager.get_thread_metadata.return_value = sample_thread_metadata
-        mock_conversation_manager.get_conversation_history.return_value = [
+        mock_conversation_store.get_conversation_history.return_value = [
             {'id': '1', 'role': 'user', 'content': 'My query'}
         ]
 
@@ -451,7 +462,7 @@ class TestEndToEndSecurityFlow:
         # Verify success
         assert result['conversation_id'] == 'test-thread-123'
         assert len(result['messages']) == 1
-        mock_conversation_manager.get_conversation_history.assert_called_once()
+        mock_conversation_store.get_conversation_history.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -583,8 +594,8 @@ class TestChatStreamTenantIsolation:
         assert kwargs["query"] == chat_request_no_conversation.message
         assert kwargs["conversation_id"] == "new-thread-001"
         # Response stream shape
-        assert "'type': 'start'" in body
-        assert "'type': 'complete'" in body
+        assert '"type": "start"' in body
+        assert '"type": "complete"' in body
 
     @pytest.mark.asyncio
     async def test_stream_new_thread_owned_by_authenticated_user(
@@ -270,7 +270,7 @@ class TestAnalyticsExceptionSanitisation:
             allowed_account_ids=["111111111111"],
         )
 
-        with patch('backend.api.analytics.create_aws_client', return_value=mock_client):
+        with patch('backend.api.analytics.get_aws_client', return_value=mock_client):
             with patch('backend.api.analytics.logger') as mock_log:
                 from backend.api.analytics import check_historical_data_availability
                 with pytest.raises(HTTPException) as exc_info:
@@ -305,7 +305,7 @@ class TestAnalyticsExceptionSanitisation:
             allowed_account_ids=["111111111111"],
         )
 
-        with patch('backend.api.analytics.create_aws_client', return_value=mock_client):
+        with patch('backend.api.analytics.get_aws_client', return_value=mock_client):
             with patch('backend.api.analytics.logger') as mock_log:
                 from backend.api.analytics import check_historical_data_availability
                 with pytest.raises(HTTPException) as exc_info:
@@ -190,7 +190,7 @@ class TestLLMCheckSanitisation:
         mock_client = Mock()
         mock_client.invoke_model = Mock(side_effect=Exception(secret))
 
-        with patch('backend.utils.aws_session.create_aws_client', return_value=mock_client):
+        with patch('backend.utils.aws_session.get_aws_client', return_value=mock_client):
             with patch.dict('sys.modules', {
                 'config': Mock(),
                 'config.settings': Mock(get_settings=Mock(return_value=Mock(
@@ -218,7 +218,7 @@ class TestLLMCheckSanitisation:
         mock_client = Mock()
         mock_client.invoke_model = Mock(return_value=mock_response)
 
-        with patch('backend.utils.aws_session.create_aws_client', return_value=mock_client):
+        with patch('backend.utils.aws_session.get_aws_client', return_value=mock_client):
             with patch.dict('sys.modules', {
                 'config': Mock(),
                 'config.settings': Mock(get_settings=Mock(return_value=Mock(
@@ -260,7 +260,10 @@ def _patch_settings():
 
 
 def _healthy_aws_mocks():
-    """Return (session_mock, athena, s3, ce) all returning success."""
+    """Return (session_mock, athena, s3, ce) all returning success.
+
+    ``session_mock.client`` doubles as the ``get_aws_client`` stand-in.
+    """
     mock_athena = Mock()
     mock_athena.list_work_groups = Mock(return_value={})
     mock_athena.get_database = Mock(return_value={})
@@ -299,7 +302,7 @@ class TestAWSServicesCheckSanitisation:
         mock_athena.list_work_groups = Mock(side_effect=error)
 
         with _patch_settings():
-            with patch('backend.utils.aws_session.create_aws_session', return_value=mock_session):
+            with patch('backend.utils.aws_session.get_aws_client', side_effect=mock_session.client):
                 with patch('backend.api.health.logger'):
                     result = await _check_aws_services()
 
@@ -323,7 +326,7 @@ class TestAWSServicesCheckSanitisation:
         mock_s3.head_bucket = Mock(side_effect=error)
 
         with _patch_settings():
-            with patch('backend.utils.aws_session.create_aws_session', return_value=mock_session):
+            with patch('backend.utils.aws_session.get_aws_client', side_effect=mock_session.client):
                 with patch('backend.api.health.logger'):
                     result = await _check_aws_services()
 
@@ -351,7 +354,7 @@ class TestAWSServicesCheckSanitisation:
         mock_athena.start_query_execution = Mock(side_effect=Exception("no db"))
 
         with _patch_settings():
-            with patch('backend.utils.aws_session.create_aws_session', return_value=mock_session):
+            with patch('backend.utils.aws_session.get_aws_client', side_effect=mock_session.client):
                 with patch('backend.api.health.logger'):
                     result = await _check_aws_services()
 
@@ -366,7 +369,7 @@ class TestAWSServicesCheckSanitisation:
         mock_session, mock_athena, mock_s3, mock_ce = _healthy_aws_mocks()
 
         with _patch_settings():
-            with patch('backend.utils.aws_session.create_aws_session', return_value=mock_session):
+            with patch('backend.utils.aws_session.get_aws_client', side_effect=mock_session.client):
                 with patch('backend.api.health.logger'):
                     with patch('asyncio.sleep', new_callable=AsyncMock):
                         result = await _check_aws_services()
@@ -381,7 +384,7 @@ class TestAWSServicesCheckSanitisation:
         mock_session, mock_athena, mock_s3, mock_ce = _healthy_aws_mocks()
 
         with _patch_settings():
-            with patch('backend.utils.aws_session.create_aws_session', return_value=mock_session):
+            with patch('backend.utils.aws_session.get_aws_client', side_effect=mock_session.client):
                 with patch('backend.api.health.logger'):
                     with patch('asyncio.sleep', new_callable=AsyncMock):
                         result = await _check_aws_services()
@@ -406,7 +409,7 @@ class TestAWSServicesCheckSanitisation:
         })
 
         with _patch_settings():
-            with patch('backend.utils.aws_session.create_aws_session', return_value=mock_session):
+            with patch('backend.utils.aws_session.get_aws_client', side_effect=mock_session.client):
                 with patch('backend.api.health.logger') as mock_log:
                     with patch('asyncio.sleep', new_callable=AsyncMock):
                         result = await _check_aws_services()
@@ -432,7 +435,7 @@ class TestAWSServicesCheckSanitisation:
         mock_ce.get_cost_and_usage = Mock(side_effect=error)
 
         with _patch_settings():
-            with patch('backend.utils.aws_session.create_aws_session', return_value=mock_session):
+            with patch('backend.utils.aws_session.get_aws_client', side_effect=mock_session.client):
                 with patch('backend.api.health.logger'):
                     with patch('asyncio.sleep', new_callable=AsyncMock):
                         result = await _check_aws_services()
@@ -447,7 +450,7 @@ class TestAWSServicesCheckSanitisation:
         secret = "NoCredentialsError: Unable to locate credentials in /home/deploy/.aws"
 
         with _patch_settings():
-            with patch('backend.utils.aws_session.create_aws_session', side_effect=Exception(secret)):
+            with patch('backend.utils.aws_session.get_aws_client', side_effect=Exception(secret)):
                 with patch('backend.api.health.logger') as mock_log:
                     result = await _check_aws_services()
 
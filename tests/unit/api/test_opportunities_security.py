@@ -92,7 +92,7 @@ class TestGetOpportunityOwnership:
         with patch('backend.api.opportunities.get_service') as mock_get_service:
 
             mock_service = Mock(spec=OpportunitiesService)
-            mock_service.get_opportunity.return_value = None
+            mock_service.get_opportunity_async.return_value = None
             mock_get_service.return_value = mock_service
 
             opportunity_id = uuid4()
@@ -101,7 +101,7 @@ class TestGetOpportunityOwnership:
                 await get_opportunity(mock_request, opportunity_id, mock_request_context)
 
             assert exc_info.value.status_code == 404
-            mock_service.get_opportunity.assert_called_once_with(
+            mock_service.get_opportunity_async.assert_called_once_with(
                 opportunity_id,
                 user_id=mock_request_context.user_id
             )
@@ -115,7 +115,7 @@ class TestGetOpportunityOwnership:
 
             # Service will raise HTTPException when ownership validation fails
             mock_service = Mock(spec=OpportunitiesService)
-            mock_service.get_opportunity.side_effect = HTTPException(
+            mock_service.get_opportunity_async.side_effect = HTTPException(
                 status_code=403,
                 detail="Access denied. You can only access opportunities you created."
             )
@@ -140,7 +140,7 @@ class TestGetOpportunityOwnership:
         with patch('backend.api.opportunities.get_service') as mock_get_service:
 
             mock_service = Mock(spec=OpportunitiesService)
-            mock_service.get_opportunity.return_value = OpportunityDetail(**sample_opportunity)
+            mock_service.get_opportunity_async.return_value = OpportunityDetail(**sample_opportunity)
             mock_get_service.return_value = mock_service
 
             opportunity_id = sample_opportunity['id']
@@ -150,7 +150,7 @@ class TestGetOpportunityOwnership:
             assert result is not None
             assert result.id == opportunity_id
             assert result.title == sample_opportunity['title']
-            mock_service.get_opportunity.assert_called_once_with(
+            mock_service.get_opportunity_async.assert_called_once_with(
                 opportunity_id,
                 user_id=mock_request_context.user_id
             )
@@ -167,7 +167,7 @@ class TestUpdateOpportunityOwnership:
         with patch('backend.api.opportunities.get_service') as mock_get_service:
 
             mock_service = Mock(spec=OpportunitiesService)
-            mock_service.update_opportunity.return_value = None
+            mock_service.update_opportunity_async.return_value = None
             mock_get_service.return_value = mock_service
 
             opportunity_id = uuid4()
@@ -187,7 +187,7 @@ class TestUpdateOpportunityOwnership:
 
             # Service will raise HTTPException when ownership validation fails
             mock_service = Mock(spec=OpportunitiesService)
-            mock_service.update_opportunity.side_effect = HTTPException(
+            mock_service.update_opportunity_async.side_effect = HTTPException(
                 status_code=403,
                 detail="Access denied. You can only access opportunities you created."
             )
@@ -214,7 +214,7 @@ class TestUpdateOpportunityOwnership:
         with patch('backend.api.opportunities.get_service') as mock_get_service:
 
             mock_service = Mock(spec=OpportunitiesService)
-            mock_service.update_opportunity.return_value = OpportunityDetail(**sample_opportunity)
+            mock_service.update_opportunity_async.return_value = OpportunityDetail(**sample_opportunity)
             mock_get_service.return_value = mock_service
 
             opportunity_id = sample_opportunity['id']
@@ -224,7 +224,7 @@ class TestUpdateOpportunityOwnership:
 
             assert result is not None
             assert result.title == "Updated Title"
-            mock_service.update_opportunity.assert_called_once()
+            mock_service.update_opportunity_async.assert_called_once()
 
 
 class TestDeleteOpportunityOwnership:
@@ -238,7 +238,7 @@ class TestDeleteOpportunityOwnership:
         with patch('backend.api.opportunities.get_service') as mock_get_service:
 
             mock_service = Mock(spec=OpportunitiesService)
-            mock_service.delete_opportunity.return_value = False
+            mock_service.delete_opportunity_async.return_value = False
             mock_get_service.return_value = mock_service
 
             opportunity_id = uuid4()
@@ -257,7 +257,7 @@ class TestDeleteOpportunityOwnership:
 
             # Service will raise HTTPException when ownership validation fails
             mock_service = Mock(spec=OpportunitiesService)
-            mock_service.delete_opportunity.side_effect = HTTPException(
+            mock_service.delete_opportunity_async.side_effect = HTTPException(
                 status_code=403,
                 detail="Access denied. You can only access opportunities you created."
             )
@@ -279,7 +279,7 @@ class TestDeleteOpportunityOwnership:
         with patch('backend.api.opportunities.get_service') as mock_get_service:
 
             mock_service = Mock(spec=OpportunitiesService)
-            mock_service.delete_opportunity.return_value = True
+            mock_service.delete_opportunity_async.return_value = True
             mock_get_service.return_value = mock_service
 
             opportunity_id = uuid4()
@@ -287,7 +287,7 @@ class TestDeleteOpportunityOwnership:
             result = await delete_opportunity(mock_request, opportunity_id, mock_request_context)
 
             assert result.status_code == 204
-            mock_service.delete_opportunity.assert_called_once_with(
+            mock_service.delete_opportunity_async.assert_called_once_with(
                 opportunity_id,
                 user_id=mock_request_context.user_id
             )
@@ -305,7 +305,7 @@ class TestUpdateStatusOwnership:
 
             # Service will raise HTTPException when ownership validation fails
             mock_service = Mock(spec=OpportunitiesService)
-            mock_service.update_status.side_effect = HTTPException(
+            mock_service.update_status_async.side_effect = HTTPException(
                 status_code=403,
                 detail="Access denied. You can only access opportunities you created."
             )
@@ -335,7 +335,7 @@ class TestUpdateStatusOwnership:
         with patch('backend.api.opportunities.get_service') as mock_get_service:
 
             mock_service = Mock(spec=OpportunitiesService)
-            mock_service.update_status.return_value = OpportunityDetail(**sample_opportunity)
+            mock_service.update_status_async.return_value = OpportunityDetail(**sample_opportunity)
             mock_get_service.return_value = mock_service
 
             opportunity_id = sample_opportunity['id']
@@ -421,7 +421,7 @@ class TestEndToEndOwnershipFlow:
         with patch('backend.api.opportunities.get_service') as mock_get_service:  # bob_context passed directly to handler
 
             mock_service = Mock(spec=OpportunitiesService)
-            mock_service.get_opportunity.side_effect = HTTPException(
+            mock_service.get_opportunity_async.side_effect = HTTPException(
                 status_code=403,
                 detail="Access denied. You can only access opportunities you created."
             )
@@ -451,21 +451,21 @@ class TestEndToEndOwnershipFlow:
             mock_get_service.return_value = mock_service
 
             # Test GET
-            mock_service.get_opportunity.return_value = OpportunityDetail(**alice_opportunity)
+            mock_service.get_opportunity_async.return_value = OpportunityDetail(**alice_opportunity)
             result = await get_opportunity(mock_request, alice_opportunity['id'], alice_context)
             assert result.id == alice_opportunity['id']
 
             # Test UPDATE
             updated_opportunity = alice_opportunity.copy()
             updated_opportunity['title'] = "Updated by Alice"
-            mock_service.update_opportunity.return_value = OpportunityDetail(**updated_opportunity)
+            mock_service.update_opportunity_async.return_value = OpportunityDetail(**updated_opportunity)
 
             update_data = OpportunityUpdate(title="Updated by Alice")
             result = await update_opportunity(mock_request, alice_opportunity['id'], update_data, alice_context)
             assert result.title == "Updated by Alice"
 
             # Test DELETE
-            mock_service.delete_opportunity.return_value = True
+            mock_service.delete_opportunity_async.return_value = True
             result = await delete_opportunity(mock_request, alice_opportunity['id'], alice_context)
             assert result.status_code == 204
 
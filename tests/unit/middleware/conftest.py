@@ -0,0 +1,15 @@
+import pytest
+
+import backend.middleware.rate_limiting as rate_limiting
+
+
+@pytest.fixture(autouse=True)
+def _in_process_rate_limits(monkeypatch):
+    """
+    Keep rate-limit windows in-process and start without cached overrides,
+    so tests never share counters through a Valkey that happens to be running.
+    """
+    monkeypatch.setattr(rate_limiting.settings, "rate_limit_backend", "memory")
+    rate_limiting.invalidate_rate_limit_overrides()
+    yield
+    rate_limiting.invalidate_rate_limit_overrides()
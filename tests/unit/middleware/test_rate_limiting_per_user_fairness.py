@@ -59,7 +59,7 @@ class TestPerUserLimitRetrieval:
         assert free == 3         # Free members
 
     @pytest.mark.asyncio
-    @patch('backend.services.database.DatabaseService')
+    @patch('backend.services.database.get_database_service', new_callable=AsyncMock)
     async def test_uses_custom_limit_from_database(self, mock_db_service):
         """Should use organization-specific override from database if available"""
         # Mock database to return custom limit
@@ -89,7 +89,7 @@ class TestPerUserLimitRetrieval:
         assert limit == 150
 
     @pytest.mark.asyncio
-    @patch('backend.services.database.DatabaseService')
+    @patch('backend.services.database.get_database_service', new_callable=AsyncMock)
     async def test_fallback_to_default_on_database_error(self, mock_db_service):
         """Should fallback to settings default if database query fails"""
         # Mock database to raise exception
@@ -657,7 +657,8 @@ class TestHigh32PerUserLimitEngagesAcrossRequests:
         # Exactly one key for bob; that key has 4 recorded hits
         keys = [k for k in cached._storage if "bob@example.com" in k]
         assert len(keys) == 1, f"Expected one storage key for bob, got: {list(cached._storage)}"
-        assert len(cached._storage[keys[0]]) == 4
+        window = cached._storage[keys[0]]
+        assert window.current + window.previous == 4
 
     @pytest.mark.asyncio
     async def test_users_with_same_limit_share_limiter_but_not_quota(
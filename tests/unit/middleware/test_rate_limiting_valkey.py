@@ -0,0 +1,184 @@
+"""
+Tests for the Valkey-backed sliding-window rate limiter and override caching.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+import backend.middleware.rate_limiting as rl_module
+from backend.middleware.rate_limiting import (
+    RateLimiter,
+    _LocalWindow,
+    get_per_user_limit,
+    invalidate_rate_limit_overrides,
+)
+
+
+class _FakeValkey:
+    """Applies the sliding-window script's semantics to a dict, like the server would."""
+
+    def __init__(self):
+        self.counters = {}
+        self.calls = []
+
+    async def eval_script(self, script, keys, args):
+        self.calls.append((keys, args))
+        current_key, previous_key = keys
+        limit, _, weight = args
+        current = self.counters.get(current_key, 0)
+        previous = self.counters.get(previous_key, 0)
+        if current + int(previous * weight) >= limit:
+            return [0, current, previous]
+        self.counters[current_key] = current + 1
+        return [1, current + 1, previous]
+
+
+@pytest.fixture
+def valkey(monkeypatch):
+    fake = _FakeValkey()
+    monkeypatch.setattr(rl_module.settings, "rate_limit_backend", "valkey")
+    with patch.object(rl_module, "get_cache_service", AsyncMock(return_value=fake)):
+        yield fake
+
+
+@pytest.fixture
+def request_for():
+    def build(email="alice@example.com"):
+        request = Mock()
+        request.client = Mock(host="203.0.113.7")
+        request.headers = {}
+        request.state = Mock()
+        request.state.auth_user = Mock(email=email, is_authenticated=True)
+        return request
+
+    with patch("backend.utils.client_ip.get_settings", return_value=Mock(trusted_proxy_count=1)):
+        yield build
+
+
+class TestValkeyBackend:
+
+    @pytest.mark.asyncio
+    async def test_workers_share_one_limit(self, valkey, request_for):
+        worker_a = RateLimiter(requests_per_window=3, window_seconds=60)
+        worker_b = RateLimiter(requests_per_window=3, window_seconds=60)
+        request = request_for()
+
+        assert (await worker_a.is_allowed(request, "test"))[0] is True
+        assert (await worker_b.is_allowed(request, "test"))[0] is True
+        assert (await worker_a.is_allowed(request, "test"))[0] is True
+        allowed, info = await worker_b.is_allowed(request, "test")
+
+        assert allowed is False
+        assert info["remaining"] == 0
+        assert worker_a._storage == {} and worker_b._storage == {}
+
+    @pytest.mark.asyncio
+    async def test_keys_name_current_and_previous_window(self, valkey, request_for):
+        limiter = RateLimiter(requests_per_window=5, window_seconds=60)
+        with patch.object(rl_module.time, "time", return_value=6015.0):
+            _, info = await limiter.is_allowed(request_for(), "test")
+
+        (keys, args), = valkey.calls
+        assert keys[0].endswith(":100") and keys[1].endswith(":99")
+        assert keys[0].startswith("rate_limit:test:203.0.113.7:alice@example.com")
+        assert args == [5, 60, pytest.approx(0.75)]
+        assert info["reset"] == 6060
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_local_windows_when_unavailable(self, monkeypatch, request_for):
+        monkeypatch.setattr(rl_module.settings, "rate_limit_backend", "valkey")
+        unavailable = Mock(eval_script=AsyncMock(return_value=None))
+        limiter = RateLimiter(requests_per_window=2, window_seconds=60)
+        with patch.object(rl_module, "get_cache_service", AsyncMock(return_value=unavailable)):
+            assert (await limiter.is_allowed(request_for(), "test"))[0] is True
+            assert (await limiter.is_allowed(request_for(), "test"))[0] is True
+            assert (await limiter.is_allowed(request_for(), "test"))[0] is False
+        assert len(limiter._storage) == 1
+
+    @pytest.mark.asyncio
+    async def test_local_windows_of_idle_keys_are_swept(self, monkeypatch, request_for):
+        monkeypatch.setattr(rl_module.settings, "rate_limit_backend", "memory")
+        limiter = RateLimiter(requests_per_window=2, window_seconds=60)
+        with patch.object(rl_module.time, "time", return_value=6000.0):
+            await limiter.is_allowed(request_for(), "idle")
+        with patch.object(rl_module.time, "time", return_value=6200.0):
+            await limiter.is_allowed(request_for(), "active")
+
+        assert [k.split(":")[1] for k in limiter._storage] == ["active"]
+
+
+class TestSlidingWindowCounter:
+
+    @pytest.mark.asyncio
+    async def test_previous_window_is_weighted(self, request_for):
+        limiter = RateLimiter(requests_per_window=4, window_seconds=60)
+        request = request_for()
+        with patch.object(rl_module.time, "time", return_value=59.0):
+            for _ in range(4):
+                assert (await limiter.is_allowed(request, "test"))[0] is True
+
+        # 15s into the next window, 3/4 of the previous window still counts
+        with patch.object(rl_module.time, "time", return_value=75.0):
+            assert (await limiter.is_allowed(request, "test"))[0] is True
+            assert (await limiter.is_allowed(request, "test"))[0] is False
+
+        # Two windows later the old counts no longer apply
+        with patch.object(rl_module.time, "time", return_value=185.0):
+            allowed, info = await limiter.is_allowed(request, "test")
+        assert allowed is True and info["remaining"] == 3
+
+    @pytest.mark.asyncio
+    async def test_cleanup_drops_stale_windows(self, request_for):
+        limiter = RateLimiter(requests_per_window=4, window_seconds=60)
+        with patch.object(rl_module.time, "time", return_value=10.0):
+            await limiter.is_allowed(request_for("old@example.com"), "test")
+        with patch.object(rl_module.time, "time", return_value=130.0):
+            await limiter.is_allowed(request_for("new@example.com"), "test")
+            await limiter.cleanup()
+        assert [k for k in limiter._storage] == ["rate_limit:test:203.0.113.7:new@example.com"]
+
+    def test_roll_carries_only_the_adjacent_window(self):
+        window = _LocalWindow(5)
+        window.current = 7
+        window.roll(6)
+        assert (window.current, window.previous) == (0, 7)
+        window.roll(9)
+        assert (window.current, window.previous) == (0, 0)
+
+
+class TestOverrideCache:
+
+    @pytest.mark.asyncio
+    async def test_override_is_read_once_per_ttl(self):
+        load = AsyncMock(return_value=150)
+        with patch.object(rl_module, "_load_limit_override", load):
+            for _ in range(5):
+                assert await get_per_user_limit("u1", "org-1", "enterprise", "admin", "athena_export") == 150
+        assert load.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_override_is_cached_too(self):
+        load = AsyncMock(return_value=None)
+        with patch.object(rl_module, "_load_limit_override", load):
+            await get_per_user_limit("u1", "org-1", "enterprise", "member", "athena_export")
+            limit = await get_per_user_limit("u1", "org-1", "enterprise", "member", "athena_export")
+        assert limit == 50
+        assert load.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidation_rereads_the_organization(self):
+        load = AsyncMock(side_effect=[150, 200, 40])
+        with patch.object(rl_module, "_load_limit_override", load):
+            await get_per_user_limit("u1", "org-1", "enterprise", "admin", "athena_export")
+            await get_per_user_limit("u1", "org-2", "enterprise", "admin", "athena_export")
+            invalidate_rate_limit_overrides("org-1")
+            assert await get_per_user_limit("u1", "org-1", "enterprise", "admin", "athena_export") == 40
+            assert await get_per_user_limit("u1", "org-2", "enterprise", "admin", "athena_export") == 200
+        assert load.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        load = AsyncMock(side_effect=[Exception("database unavailable"), 150])
+        with patch.object(rl_module, "_load_limit_override", load):
+            assert await get_per_user_limit("u1", "org-1", "enterprise", "admin", "athena_export") == 100
+            assert await get_per_user_limit("u1", "org-1", "enterprise", "admin", "athena_export") == 150
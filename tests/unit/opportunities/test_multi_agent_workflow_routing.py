@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, patch
 
@@ -88,3 +89,59 @@ async def test_execute_multi_agent_query_routes_drilldown_to_text_to_sql():
     mock_optimizer.process_query.assert_not_awaited()
     assert result["message"] == "CloudWatch by region"
     assert result["charts"]
+
+
+@pytest.mark.asyncio
+async def test_confident_cost_analysis_skips_classification():
+    tr = _make_time_range_result()
+    mock_optimizer = AsyncMock()
+
+    with patch("backend.agents.multi_agent_workflow.merge_time_range", return_value=tr), \
+         patch("backend.agents.multi_agent_workflow.get_optimization_agent", return_value=mock_optimizer), \
+         patch("backend.agents.execute_query_v2.execute_query_simple", new=AsyncMock(return_value={"message": "ok"})) as mock_execute:
+        await execute_multi_agent_query(
+            query="Break down AmazonCloudWatch costs by region",
+            conversation_id="conv-1",
+        )
+
+    mock_optimizer.is_optimization_query_async.assert_not_awaited()
+    assert mock_execute.await_args.kwargs["sql_generation"] is None
+
+
+@pytest.mark.asyncio
+async def test_speculative_sql_generation_handed_to_text_to_sql():
+    tr = _make_time_range_result()
+    mock_optimizer = AsyncMock()
+    mock_optimizer.is_optimization_query_async.return_value = False
+    generated = ("what did we spend", "SELECT 1", {"query_type": "summary"})
+
+    with patch("backend.agents.multi_agent_workflow.merge_time_range", return_value=tr), \
+         patch("backend.agents.multi_agent_workflow.get_optimization_agent", return_value=mock_optimizer), \
+         patch("backend.agents.execute_query_v2.generate_sql_for_query", new=AsyncMock(return_value=generated)) as mock_generate, \
+         patch("backend.agents.execute_query_v2.execute_query_simple", new=AsyncMock(return_value={"message": "ok"})) as mock_execute:
+        await execute_multi_agent_query(query="what did we spend", conversation_id="conv-1")
+
+    mock_optimizer.is_optimization_query_async.assert_awaited_once()
+    assert await mock_execute.await_args.kwargs["sql_generation"] == generated
+    mock_generate.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_speculative_sql_generation_cancelled_for_optimization():
+    tr = _make_time_range_result()
+    mock_optimizer = AsyncMock()
+    mock_optimizer.is_optimization_query_async.return_value = True
+    mock_optimizer.process_query.return_value = {"message": "optimization"}
+    never_finishes = AsyncMock(side_effect=lambda *a, **k: asyncio.sleep(3600))
+
+    with patch("backend.agents.multi_agent_workflow.merge_time_range", return_value=tr), \
+         patch("backend.agents.multi_agent_workflow.get_optimization_agent", return_value=mock_optimizer), \
+         patch("backend.agents.execute_query_v2.generate_sql_for_query", new=never_finishes), \
+         patch("backend.agents.execute_query_v2.execute_query_simple", new=AsyncMock()) as mock_execute:
+        result = await execute_multi_agent_query(query="where am I wasting money", conversation_id="conv-1")
+
+    mock_execute.assert_not_awaited()
+    assert result["message"] == "optimization"
+    await asyncio.sleep(0)
+    tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    assert all(t.cancelled() or t.done() for t in tasks)
@@ -0,0 +1,177 @@
+"""
+Tests for streaming opportunity exports.
+"""
+
+import gzip
+import json
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from psycopg2.pool import PoolError
+from unittest.mock import Mock, patch
+
+from backend.services import opportunities_service as module
+from backend.services.opportunities_service import OpportunitiesService, gzip_chunks
+
+
+class _NamedCursor:
+    def __init__(self, db, name):
+        self.db = db
+        self.name = name
+        self.itersize = None
+        self._rows = iter(db.rows)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.db.cursor_closed = True
+
+    def execute(self, sql, params=None):
+        self.db.statements.append(sql)
+
+    def fetchmany(self, size):
+        self.db.fetches.append(size)
+        return [row for _, row in zip(range(size), self._rows)]
+
+
+class _FakeDatabase:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+        self.fetches = []
+        self.cursor_names = []
+        self.cursor_closed = False
+        self.released = False
+
+    def cursor(self, name=None, cursor_factory=None):
+        self.cursor_names.append(name)
+        return _NamedCursor(self, name)
+
+
+def _row(i):
+    row = {column: None for column in OpportunitiesService._export_columns(False, True)}
+    row.update(
+        id=f"opp-{i}",
+        title=f"Idle volume {i}",
+        estimated_monthly_savings=Decimal("12.50"),
+        tags=["storage"],
+        first_detected_at=datetime(2026, 1, 2, tzinfo=timezone.utc),
+    )
+    return row
+
+
+@pytest.fixture
+def db(monkeypatch):
+    fake = _FakeDatabase([_row(i) for i in range(5)])
+
+    @contextmanager
+    def connection(self):
+        try:
+            yield fake
+        finally:
+            fake.released = True
+
+    monkeypatch.setattr(module.settings, "opportunities_export_fetch_size", 2)
+    with patch.object(OpportunitiesService, "_export_connection", connection):
+        yield fake
+
+
+async def _body(chunks):
+    return "".join([chunk async for chunk in chunks])
+
+
+def test_batches_come_from_a_server_side_cursor(db):
+    batches = list(OpportunitiesService().iter_export_batches())
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert db.cursor_names == ["opportunities_export"]
+    assert set(db.fetches) == {2}
+    assert db.cursor_closed and db.released
+
+
+def test_connection_is_released_once_the_cursor_is_drained(db):
+    batches = OpportunitiesService().iter_export_batches()
+
+    assert len(next(batches)) == 2 and len(next(batches)) == 2
+    assert not db.released
+    assert len(next(batches)) == 1
+    assert db.released
+
+
+def test_exports_do_not_take_pooled_connections(monkeypatch):
+    monkeypatch.setattr(module.settings, "opportunities_db_pool_timeout_seconds", 0.01)
+    pool_slots = threading.BoundedSemaphore(1)
+    with patch.object(module, "_export_slots", threading.BoundedSemaphore(1)), \
+            patch.object(module, "_pool_slots", pool_slots), \
+            patch.object(module.psycopg2, "connect", return_value=Mock()) as connect:
+        service = OpportunitiesService()
+        with service._export_connection() as conn:
+            with pytest.raises(PoolError):
+                with service._export_connection():
+                    pass
+            assert pool_slots.acquire(blocking=False)
+
+        conn.close.assert_called_once()
+        assert connect.call_count == 1
+        assert module._export_slots.acquire(blocking=False)
+
+
+@pytest.mark.asyncio
+async def test_csv_stream(db):
+    body = await _body(await OpportunitiesService().stream_export("csv"))
+
+    lines = body.splitlines()
+    assert lines[0].startswith("id,account_id,title")
+    assert len(lines) == 6
+    assert "2026-01-02T00:00:00+00:00" in lines[1]
+    assert "['storage']" in lines[1]
+
+
+@pytest.mark.asyncio
+async def test_json_stream_is_one_array(db):
+    body = await _body(await OpportunitiesService().stream_export("json"))
+
+    rows = json.loads(body)
+    assert [row["id"] for row in rows] == [f"opp-{i}" for i in range(5)]
+    assert rows[0]["estimated_monthly_savings"] == 12.5
+
+
+@pytest.mark.asyncio
+async def test_ndjson_stream_has_one_row_per_line(db):
+    body = await _body(await OpportunitiesService().stream_export("ndjson"))
+
+    assert [json.loads(line)["id"] for line in body.splitlines()] == [f"opp-{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("format, expected", [("csv", 1), ("json", "[]"), ("ndjson", "")])
+async def test_empty_export(db, format, expected):
+    db.rows = []
+    body = await _body(await OpportunitiesService().stream_export(format))
+
+    if format == "csv":
+        assert len(body.splitlines()) == expected
+    else:
+        assert body == expected
+
+
+@pytest.mark.asyncio
+async def test_abandoned_stream_returns_the_connection(db):
+    chunks = await OpportunitiesService().stream_export("csv")
+    await chunks.__anext__()
+    await chunks.aclose()
+
+    assert db.released
+    assert len(db.fetches) == 1
+
+
+@pytest.mark.asyncio
+async def test_gzip_round_trip(db):
+    chunks = await OpportunitiesService().stream_export("ndjson")
+    compressed = b"".join([chunk async for chunk in gzip_chunks(chunks)])
+
+    assert len(gzip.decompress(compressed).decode("utf-8").splitlines()) == 5
@@ -0,0 +1,186 @@
+"""
+Tests for set-based signal ingestion in OpportunitiesService.
+
+A fake cursor plays the database: staged rows land in per-stage lists and the
+merge statement is answered from an in-memory set of known source_ids, so the
+tests can check counts and round trips without Postgres.
+"""
+
+import pytest
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from backend.services import opportunities_service as module
+from backend.services.opportunities_service import OpportunitiesService
+
+
+class _FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self._result = None
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        self.db.statements.append(sql)
+        if "information_schema.columns" in sql:
+            self._rows = [{"column_name": c} for c in self.db.columns]
+        elif "WITH" in sql and "merged AS" in sql:
+            self._result = self.db.merge(sql)
+        elif sql.startswith("TRUNCATE"):
+            self.db.staged = []
+
+    def fetchone(self):
+        return self._result
+
+    def fetchall(self):
+        return self._rows
+
+    def close(self):
+        pass
+
+
+class _FakeConnection:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self, cursor_factory=None):
+        return _FakeCursor(self.db)
+
+    def commit(self):
+        self.db.committed = True
+
+    def close(self):
+        pass
+
+
+class _FakeDatabase:
+    def __init__(self, existing_source_ids=(), fail_on=None):
+        self.existing = set(existing_source_ids)
+        self.fail_on = fail_on
+        self.columns = {
+            "id", "organization_id", "title", "category", "source", "source_id",
+            "service", "region", "evidence", "last_seen_at",
+        }
+        self.statements = []
+        self.staged = []
+        self.committed = False
+        self.connections = 0
+
+    def connect(self):
+        self.connections += 1
+        return _FakeConnection(self)
+
+    def stage(self, cur, sql, rows, page_size=None):
+        self.statements.append(sql)
+        self.staged = list(rows)
+
+    def merge(self, sql):
+        if self.fail_on is not None and any(self.fail_on in map(str, row) for row in self.staged):
+            raise ValueError(f"invalid input for {self.fail_on}")
+        columns = sql.split("INSERT INTO opportunities (")[1].split(")")[0].split(", ")
+        new = updated = 0
+        for row in self.staged:
+            source_id = dict(zip(columns, row)).get("source_id")
+            if source_id and source_id in self.existing:
+                updated += 1
+            else:
+                new += 1
+                if source_id:
+                    self.existing.add(source_id)
+        return {"new_count": new, "updated_count": updated}
+
+
+@pytest.fixture
+def db():
+    fake = _FakeDatabase()
+
+    @contextmanager
+    def connection(self):
+        yield fake.connect()
+
+    with patch.object(OpportunitiesService, "_connection", connection), \
+            patch.object(module, "execute_values", fake.stage):
+        yield fake
+
+
+def _signal(source_id, **extra):
+    signal = {
+        "title": f"Idle {source_id}",
+        "category": "idle_resources",
+        "source": "cloudwatch",
+        "source_id": source_id,
+        "service": "EC2",
+        "evidence": {"cpu_p95": 1.2},
+    }
+    signal.update(extra)
+    return signal
+
+
+def _merges(db):
+    return [sql for sql in db.statements if "merged AS" in sql]
+
+
+class TestIngestSignals:
+
+    def test_one_merge_per_column_set(self, db):
+        db.existing = {"known"}
+        signals = [_signal("a"), _signal("known"), _signal("b"), _signal("c", region="us-east-1")]
+
+        result = OpportunitiesService().ingest_signals(signals)
+
+        assert (result.total_signals, result.new_opportunities, result.updated_opportunities) == (4, 3, 1)
+        assert result.errors == 0 and result.error_details is None
+        assert len(_merges(db)) == 2
+        assert db.connections == 1 and db.committed
+        assert "RETURNING (xmax = 0) AS is_new" in _merges(db)[0]
+
+    def test_duplicate_source_ids_count_as_updates(self, db):
+        result = OpportunitiesService().ingest_signals([_signal("a"), _signal("a"), _signal("a")])
+
+        assert (result.new_opportunities, result.updated_opportunities) == (1, 2)
+        assert len(db.staged) == 1
+
+    def test_json_fields_are_encoded(self, db):
+        OpportunitiesService().ingest_signals([_signal("a")])
+        (row,) = db.staged
+        assert '{"cpu_p95": 1.2}' in row
+
+    def test_large_batches_are_chunked(self, db):
+        with patch.object(module, "_INGEST_CHUNK_SIZE", 1000):
+            result = OpportunitiesService().ingest_signals([_signal(f"s-{i}") for i in range(2500)])
+
+        assert result.new_opportunities == 2500
+        assert len(_merges(db)) == 3
+
+    def test_failed_chunk_is_retried_per_signal(self, db):
+        db.fail_on = "bad"
+        result = OpportunitiesService().ingest_signals([_signal("a"), _signal("bad"), _signal("b")])
+
+        assert (result.new_opportunities, result.errors) == (2, 1)
+        assert "invalid input for bad" in result.error_details[0]
+        assert "ROLLBACK TO SAVEPOINT ingest_chunk" in db.statements
+        assert db.statements.count("ROLLBACK TO SAVEPOINT ingest_signal") == 1
+
+    def test_unsafe_field_names_are_rejected(self, db):
+        result = OpportunitiesService().ingest_signals([_signal("a", **{"title) VALUES ('x'); --": 1})])
+
+        assert (result.new_opportunities, result.errors) == (0, 1)
+        assert db.connections == 0
+
+    def test_unknown_fields_fail_only_their_signal(self, db):
+        signals = [_signal("a"), _signal("b", not_a_column="x"), _signal("b"), _signal("c")]
+
+        result = OpportunitiesService().ingest_signals(signals)
+
+        assert (result.new_opportunities, result.updated_opportunities, result.errors) == (3, 0, 1)
+        assert result.error_details == ["Unknown signal field(s): not_a_column"]
+        assert not any("not_a_column" in sql for sql in db.statements[1:])
+        assert db.committed
+
+    def test_signals_without_source_id_skip_the_lookup(self, db):
+        signal = _signal("unused")
+        del signal["source_id"]
+        OpportunitiesService().ingest_signals([signal])
+
+        (merge,) = _merges(db)
+        assert "touched AS" not in merge
@@ -0,0 +1,131 @@
+"""
+Tests for OpportunitiesService connection pooling, prepared hot queries and
+the async variants.
+"""
+
+import threading
+from collections import OrderedDict
+from unittest.mock import Mock, patch
+
+import psycopg2
+import pytest
+from psycopg2.pool import PoolError
+
+from backend.services import opportunities_service as module
+from backend.services.opportunities_service import OpportunitiesService, _positional
+
+
+class _FakePool:
+    def __init__(self, conn):
+        self.conn = conn
+        self.returned = []
+
+    def getconn(self):
+        return self.conn
+
+    def putconn(self, conn, close=False):
+        self.returned.append((conn, close))
+
+
+class _RecordingCursor:
+    def __init__(self, connection):
+        self.connection = connection
+        self.statements = []
+
+    def execute(self, sql, params=None):
+        self.statements.append((sql, params))
+
+
+@pytest.fixture
+def pool():
+    conn = Mock(status=psycopg2.extensions.STATUS_IN_TRANSACTION)
+    fake = _FakePool(conn)
+    with patch.object(module, "_get_pool", return_value=fake), \
+            patch.object(module, "_pool_slots", threading.BoundedSemaphore(1)):
+        yield fake
+
+
+def _prepared_cursor():
+    return _RecordingCursor(Mock(prepared=OrderedDict()))
+
+
+def test_positional_placeholders():
+    query = "SELECT * FROM o WHERE a = %s AND b ILIKE 'x%%' AND c IN (%s, %s)"
+    assert _positional(query) == "SELECT * FROM o WHERE a = $1 AND b ILIKE 'x%' AND c IN ($2, $3)"
+
+
+class TestConnection:
+
+    def test_connection_is_rolled_back_and_returned(self, pool):
+        with OpportunitiesService()._connection() as conn:
+            assert conn is pool.conn
+
+        pool.conn.rollback.assert_called_once()
+        assert pool.returned == [(pool.conn, False)]
+        assert module._pool_slots.acquire(blocking=False)
+
+    def test_broken_connection_is_discarded(self, pool):
+        with pytest.raises(psycopg2.OperationalError):
+            with OpportunitiesService()._connection():
+                raise psycopg2.OperationalError("server closed the connection")
+
+        assert pool.returned == [(pool.conn, True)]
+        assert module._pool_slots.acquire(blocking=False)
+
+    def test_exhausted_pool_times_out(self, pool, monkeypatch):
+        monkeypatch.setattr(module.settings, "opportunities_db_pool_timeout_seconds", 0.01)
+        service = OpportunitiesService()
+        with service._connection():
+            with pytest.raises(PoolError):
+                with service._connection():
+                    pass
+
+
+class TestPreparedStatements:
+
+    def test_prepared_once_per_connection(self):
+        cur = _prepared_cursor()
+        service = OpportunitiesService()
+        query = "SELECT COUNT(*) FROM opportunities WHERE organization_id = %s"
+
+        service._execute_prepared(cur, query, ["org-1"])
+        service._execute_prepared(cur, query, ["org-2"])
+
+        (prepare, _), (first, first_params), (second, second_params) = cur.statements
+        assert prepare.startswith("PREPARE opp_") and prepare.endswith("organization_id = $1")
+        name = prepare.split()[1]
+        assert first == second == f"EXECUTE {name} (%s)"
+        assert (first_params, second_params) == (["org-1"], ["org-2"])
+
+    def test_least_recently_used_statements_are_deallocated(self):
+        cur = _prepared_cursor()
+        service = OpportunitiesService()
+        with patch.object(module, "_MAX_PREPARED_PER_CONNECTION", 2):
+            for i in range(3):
+                service._execute_prepared(cur, f"SELECT {i}", [])
+
+        assert len(cur.connection.prepared) == 2
+        assert any(sql.startswith("DEALLOCATE opp_") for sql, _ in cur.statements)
+
+    def test_disabled_runs_plain_queries(self, monkeypatch):
+        monkeypatch.setattr(module.settings, "opportunities_db_prepared_statements", False)
+        cur = _prepared_cursor()
+
+        OpportunitiesService()._execute_prepared(cur, "SELECT %s", [1])
+
+        assert cur.statements == [("SELECT %s", [1])]
+
+
+@pytest.mark.asyncio
+async def test_async_variant_runs_off_the_event_loop():
+    service = OpportunitiesService()
+    caller = threading.get_ident()
+    seen = []
+
+    def get_stats():
+        seen.append(threading.get_ident())
+        return "stats"
+
+    with patch.object(service, "get_stats", get_stats):
+        assert await service.get_stats_async() == "stats"
+    assert seen and seen[0] != caller
@@ -0,0 +1,187 @@
+"""
+Tests for the single-pass opportunity statistics and the per-organization
+opportunity_stats summary rows.
+"""
+
+from contextlib import contextmanager
+from uuid import uuid4
+
+import pytest
+from unittest.mock import patch
+
+from backend.services import opportunities_service as module
+from backend.services.opportunities_service import (
+    OpportunitiesService,
+    _LIST_FACETS,
+    _STATS_FACETS,
+    _facet_query,
+    _split_facets,
+)
+
+
+def _facet_rows(facets=_STATS_FACETS):
+    """What the GROUPING SETS query returns for 2 open EC2 + 1 implemented RDS."""
+    every = (1 << len(facets)) - 1
+
+    def row(count, facet=None, value=None, **totals):
+        base = {f: None for f in facets}
+        mask = every
+        if facet is not None:
+            base[facet] = value
+            mask ^= 1 << (len(facets) - 1 - facets.index(facet))
+        base.update(totals, grouping_mask=mask, count=count)
+        return base
+
+    rows = [
+        row(3, open_count=2, total_monthly=350, potential_monthly=300, implemented_monthly=50),
+        row(2, "status", "open"),
+        row(1, "status", "implemented"),
+        row(3, "category", "rightsizing"),
+        row(1, "service", "RDS"),
+        row(2, "service", "EC2"),
+    ]
+    if "source" in facets:
+        rows += [row(3, "source", "cost_explorer"), row(3, "effort_level", None)]
+    return rows
+
+
+class _FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self.connection = object()
+        self.rowcount = 0
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        self.db.statements.append(sql)
+        if "GROUPING SETS" in sql:
+            self._rows = _facet_rows(_STATS_FACETS if "source" in sql.split("FROM")[0] else _LIST_FACETS)
+        elif "FROM opportunity_stats" in sql:
+            self._rows = [{"stats": self.db.stored}] if self.db.stored else []
+        elif "INSERT INTO opportunity_stats" in sql:
+            self.db.stored_for.append(params[0])
+        elif "RETURNING organization_id" in sql:
+            self._rows = [{"organization_id": org} for org in self.db.touched]
+            self.rowcount = len(self._rows)
+        else:
+            self._rows = []
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return list(self._rows)
+
+
+class _FakeConnection:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self, cursor_factory=None):
+        return _FakeCursor(self.db)
+
+    def commit(self):
+        self.db.commits += 1
+
+
+class _FakeDatabase:
+    def __init__(self):
+        self.statements = []
+        self.stored = None
+        self.stored_for = []
+        self.touched = []
+        self.commits = 0
+
+
+@pytest.fixture
+def db():
+    fake = _FakeDatabase()
+
+    @contextmanager
+    def connection(self):
+        yield _FakeConnection(fake)
+
+    with patch.object(OpportunitiesService, "_connection", connection):
+        yield fake
+
+
+def _aggregations(db):
+    return [sql for sql in db.statements if "FROM opportunities" in sql and "GROUP BY" in sql]
+
+
+def test_facet_query_is_one_grouping_sets_pass():
+    query = _facet_query(_LIST_FACETS, "1=1")
+    assert "GROUPING(status, category, service)" in query
+    assert "GROUP BY GROUPING SETS ((), (status), (category), (service))" in query
+
+
+def test_split_facets():
+    totals, counts = _split_facets(_facet_rows(), _STATS_FACETS)
+
+    assert totals["count"] == 3
+    assert counts["status"] == {"open": 2, "implemented": 1}
+    assert counts["service"] == {"RDS": 1, "EC2": 2}
+    assert counts["effort_level"] == {None: 3}
+
+
+class TestGetStats:
+
+    def test_unscoped_stats_aggregate_in_one_pass(self, db):
+        stats = OpportunitiesService().get_stats()
+
+        assert len(_aggregations(db)) == 1
+        assert (stats.total_opportunities, stats.open_opportunities) == (3, 2)
+        assert stats.total_potential_annual_savings == 3600
+        assert list(stats.by_service) == ["EC2", "RDS"]
+        assert stats.by_effort_level == {"unknown": 3}
+        assert db.stored_for == []
+
+    def test_summary_row_is_served_without_aggregating(self, db):
+        db.stored = OpportunitiesService()._compute_stats(_FakeCursor(db), None).model_dump(mode="json")
+        db.statements.clear()
+
+        stats = OpportunitiesService(organization_id=uuid4()).get_stats()
+
+        assert stats.total_opportunities == 3
+        assert _aggregations(db) == []
+
+    def test_missing_summary_row_is_computed_and_stored(self, db):
+        org_id = uuid4()
+        stats = OpportunitiesService(organization_id=org_id).get_stats()
+
+        assert stats.total_opportunities == 3
+        assert db.stored_for == [str(org_id)]
+        assert any("pg_advisory_xact_lock" in sql for sql in db.statements)
+        assert db.commits == 1
+
+
+class TestSummaryRefresh:
+
+    def test_bulk_status_change_refreshes_touched_organizations(self, db):
+        org_a, org_b = str(uuid4()), str(uuid4())
+        db.touched = [org_a, org_b, org_a]
+
+        updated, failed, _ = OpportunitiesService().bulk_update_status(
+            [uuid4(), uuid4(), uuid4()], module.OpportunityStatus.DISMISSED
+        )
+
+        assert (updated, failed) == (3, 0)
+        assert db.stored_for == sorted([org_a, org_b])
+        assert db.commits == 1
+
+    def test_failed_refresh_does_not_fail_the_write(self, db):
+        service = OpportunitiesService()
+        cur = _FakeCursor(db)
+        with patch.object(service, "_compute_stats", side_effect=ValueError("boom")):
+            assert service._refresh_stats(cur, [uuid4()]) == {}
+        assert "ROLLBACK TO SAVEPOINT refresh_stats" in db.statements
+
+
+def test_list_aggregations_share_one_query(db):
+    result = OpportunitiesService().list_opportunities(page_size=2)
+
+    assert len(_aggregations(db)) == 1
+    assert not any(sql.startswith("SELECT COUNT(*)") for sql in db.statements)
+    assert (result.total, result.total_pages) == (3, 2)
+    assert result.total_monthly_savings == 350
+    assert result.status_counts == {"open": 2, "implemented": 1}
@@ -0,0 +1,114 @@
+"""
+Tests for backend/services/analysis_pool.py and the process-pool mode of
+CURCSVAnalyzer.analyze_chunks().
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import pandas as pd
+import pytest
+
+from backend.services import analysis_pool, cur_csv_analyzer
+from backend.services.analysis_pool import apply_to_shared_frame, release_frame, share_frame
+from backend.services.cur_csv_analyzer import CURCSVAnalyzer, shard_frame
+
+
+@pytest.fixture
+def cur_chunks(tmp_path):
+    """Two accounts over two months, read back through the streaming reader."""
+    hours = pd.date_range("2025-01-20", periods=24 * 20, freq="h", tz="UTC")
+    rows = []
+    for account in ("111111111111", "222222222222"):
+        for ts in hours:
+            rows.append(
+                {
+                    "lineItem/UsageAccountId": account,
+                    "lineItem/UsageStartDate": ts.isoformat(),
+                    "lineItem/LineItemType": "Usage",
+                    "lineItem/ProductCode": "AmazonEC2",
+                    "lineItem/UsageType": "BoxUsage:m5.large",
+                    "lineItem/ResourceId": f"i-{account[:4]}",
+                    "lineItem/UsageAmount": 1.0,
+                    "lineItem/UnblendedCost": 0.5,
+                    "product/region": "us-east-1",
+                }
+            )
+    path = tmp_path / "cur.csv"
+    pd.DataFrame(rows).to_csv(path, index=False)
+    return lambda: CURCSVAnalyzer.iter_dataframes(str(path), chunksize=300)
+
+
+def _findings(result):
+    return sorted((o["title"], o["estimated_monthly_savings"]) for o in result["opportunities"])
+
+
+class TestSharedFrames:
+    def test_round_trip_preserves_dtypes(self):
+        df = pd.DataFrame(
+            {
+                "kind": pd.Categorical(["Usage", "RIFee", None]),
+                "cost": [1.5, 2.0, 0.0],
+                "ts": pd.to_datetime(["2025-01-01", "2025-01-02", None], utc=True),
+            }
+        )
+        shm = share_frame(df)
+        try:
+            out = apply_to_shared_frame(shm.name, lambda frame: frame.copy())
+        finally:
+            release_frame(shm)
+
+        pd.testing.assert_frame_equal(out, df)
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=shm.name)
+
+
+class TestShardFrame:
+    def test_account_month_groups_stay_whole(self, cur_chunks):
+        df = pd.concat(list(cur_chunks()), ignore_index=True)
+        shards = list(shard_frame(df, target_rows=100))
+
+        assert sum(len(s) for s in shards) == len(df)
+        seen = set()
+        for shard in shards:
+            keys = set(
+                zip(
+                    shard["line_item_usage_account_id"].astype(str),
+                    shard["line_item_usage_start_date"].dt.month,
+                )
+            )
+            assert not keys & seen
+            seen |= keys
+        assert len(seen) == 4
+
+    def test_small_frames_are_not_split(self, cur_chunks):
+        df = next(cur_chunks())
+        assert len(list(shard_frame(df, target_rows=len(df)))) == 1
+
+
+class TestPooledAnalysis:
+    def test_pooled_matches_serial(self, cur_chunks, monkeypatch):
+        monkeypatch.setattr(cur_csv_analyzer.settings, "cur_analysis_shard_rows", 100)
+        serial = CURCSVAnalyzer().analyze_chunks(cur_chunks())
+        with ThreadPoolExecutor(2) as pool:
+            pooled = CURCSVAnalyzer().analyze_chunks(cur_chunks(), executor=pool)
+
+        assert pooled["summary"] == serial["summary"]
+        assert _findings(pooled) == _findings(serial)
+
+    def test_worker_processes(self, cur_chunks):
+        serial = CURCSVAnalyzer().analyze_chunks(cur_chunks())
+        with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            pooled = CURCSVAnalyzer().analyze_chunks(cur_chunks(), executor=pool)
+
+        assert pooled["summary"] == serial["summary"]
+
+
+@pytest.mark.asyncio
+async def test_disabled_pool_runs_in_a_thread(monkeypatch):
+    monkeypatch.setattr(analysis_pool.settings, "analysis_pool_workers", 0)
+    assert analysis_pool.get_analysis_pool() is None
+    assert await analysis_pool.run_in_analysis_pool(sum, [1, 2, 3]) == 6
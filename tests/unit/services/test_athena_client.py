@@ -0,0 +1,225 @@
+"""
+Tests for the shared non-blocking Athena client.
+
+Verifies that Athena API calls run on the dedicated I/O pool rather than the
+event loop, respect per-call timeouts, and can overlap.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from backend.services import athena_client as athena_client_module
+from backend.services.athena_client import (
+    AsyncAthenaClient,
+    QueryExecutionMemo,
+    build_start_query_kwargs,
+    get_async_athena_client,
+    shutdown_async_athena_client,
+)
+
+
+class _SlowAthena:
+    """Stub boto3 Athena client whose calls block like a real HTTPS round-trip."""
+
+    def __init__(self, delay: float = 0.1):
+        self.delay = delay
+        self.threads = []
+
+    def start_query_execution(self, **kwargs):
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self.delay)
+        return {"QueryExecutionId": "qid-1"}
+
+    def get_query_execution(self, QueryExecutionId):
+        time.sleep(self.delay)
+        return {"QueryExecution": {"Status": {"State": "SUCCEEDED"}}}
+
+    def get_query_results(self, **kwargs):
+        self.last_results_kwargs = kwargs
+        return {"ResultSet": {"Rows": []}}
+
+
+class TestAsyncAthenaClient:
+
+    @pytest.mark.asyncio
+    async def test_calls_run_on_dedicated_pool(self):
+        stub = _SlowAthena(delay=0)
+        client = AsyncAthenaClient(client=stub, max_workers=2, call_timeout_seconds=5)
+        try:
+            response = await client.start_query_execution(QueryString="SELECT 1")
+        finally:
+            client.shutdown()
+
+        assert response == {"QueryExecutionId": "qid-1"}
+        assert stub.threads[0].startswith("athena-io")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_overlap(self):
+        stub = _SlowAthena(delay=0.2)
+        client = AsyncAthenaClient(client=stub, max_workers=10, call_timeout_seconds=5)
+        try:
+            started = time.monotonic()
+            await asyncio.gather(*(client.get_query_execution(f"q{i}") for i in range(10)))
+            elapsed = time.monotonic() - started
+        finally:
+            client.shutdown()
+
+        # Serial execution would take ~2s
+        assert elapsed < 1.0
+
+    @pytest.mark.asyncio
+    async def test_event_loop_not_blocked(self):
+        stub = _SlowAthena(delay=0.3)
+        client = AsyncAthenaClient(client=stub, max_workers=2, call_timeout_seconds=5)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        try:
+            await client.get_query_execution("q1")
+        finally:
+            task.cancel()
+            client.shutdown()
+
+        assert ticks > 5
+
+    @pytest.mark.asyncio
+    async def test_per_call_timeout(self):
+        stub = _SlowAthena(delay=0.5)
+        client = AsyncAthenaClient(client=stub, max_workers=1, call_timeout_seconds=5)
+        try:
+            with pytest.raises(asyncio.TimeoutError):
+                await client.get_query_execution("q1", timeout=0.05)
+        finally:
+            client.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_get_query_results_passes_paging_arguments(self):
+        stub = _SlowAthena(delay=0)
+        client = AsyncAthenaClient(client=stub, max_workers=1, call_timeout_seconds=5)
+        try:
+            await client.get_query_results("q1", next_token="tok", max_results=1000)
+        finally:
+            client.shutdown()
+
+        assert stub.last_results_kwargs == {
+            "QueryExecutionId": "q1",
+            "NextToken": "tok",
+            "MaxResults": 1000,
+        }
+
+
+class TestSharedClient:
+
+    def test_singleton_is_shared(self):
+        with patch.object(athena_client_module, "_async_athena_client", None):
+            first = get_async_athena_client()
+            second = get_async_athena_client()
+            assert first is second
+            shutdown_async_athena_client()
+
+    def test_client_created_via_session_factory_with_pool_config(self):
+        mock_session = MagicMock()
+        with patch("backend.services.athena_client.create_aws_session", return_value=mock_session):
+            client = AsyncAthenaClient(max_workers=7, call_timeout_seconds=3)
+            _ = client.client
+
+        args, kwargs = mock_session.client.call_args
+        assert args[0] == "athena"
+        assert kwargs["config"].max_pool_connections == 7
+        assert kwargs["config"].read_timeout == 3
+
+
+class TestResultReuse:
+
+    def test_select_requests_result_reuse(self):
+        kwargs = build_start_query_kwargs("SELECT 1", "db", "s3://out/")
+        assert kwargs["ResultReuseConfiguration"]["ResultReuseByAgeConfiguration"]["Enabled"] is True
+        assert "WorkGroup" not in kwargs
+
+    def test_non_select_never_reuses(self):
+        kwargs = build_start_query_kwargs("SHOW PARTITIONS db.cur", "db", "s3://out/")
+        assert "ResultReuseConfiguration" not in kwargs
+
+    def test_workgroup_is_opt_in(self):
+        settings = MagicMock(
+            athena_workgroup_enabled=True,
+            athena_workgroup="finops",
+            athena_result_reuse_max_age_minutes=0,
+        )
+        with patch.object(athena_client_module, "get_settings", return_value=settings):
+            kwargs = build_start_query_kwargs("SELECT 1", "db", "s3://out/")
+        assert kwargs["WorkGroup"] == "finops"
+        assert "ResultReuseConfiguration" not in kwargs
+
+    def test_memo_expires(self):
+        memo = QueryExecutionMemo(max_entries=2)
+        key = QueryExecutionMemo.key("SELECT 1", "db")
+        memo.remember(key, "q1")
+        assert memo.lookup(key, max_age_seconds=60) == "q1"
+        assert memo.lookup(key, max_age_seconds=0) is None
+
+    def test_memo_key_ignores_formatting(self):
+        assert QueryExecutionMemo.key("SELECT  1;", "db") == QueryExecutionMemo.key("select 1", "db")
+        assert QueryExecutionMemo.key("SELECT 1", "db") != QueryExecutionMemo.key("SELECT 1", "other")
+
+    @pytest.mark.asyncio
+    async def test_repeat_query_skips_start_and_poll(self):
+        stub = _SlowAthena(delay=0)
+        stub.start_query_execution = MagicMock(wraps=stub.start_query_execution)
+        client = AsyncAthenaClient(client=stub, max_workers=2, call_timeout_seconds=5)
+        try:
+            first = await client.execute_query("SELECT 1", database="db", output_location="s3://out/")
+            second = await client.execute_query("select 1", database="db", output_location="s3://out/")
+        finally:
+            client.shutdown()
+
+        assert first["QueryExecution"]["QueryExecutionId"] == "qid-1"
+        assert second["QueryExecution"]["QueryExecutionId"] == "qid-1"
+        assert second["Memoized"] is True
+        assert stub.start_query_execution.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_forgotten_execution_is_rerun(self):
+        stub = _SlowAthena(delay=0)
+        stub.start_query_execution = MagicMock(wraps=stub.start_query_execution)
+        client = AsyncAthenaClient(client=stub, max_workers=2, call_timeout_seconds=5)
+        try:
+            await client.execute_query("SELECT 1", database="db", output_location="s3://out/")
+            client.forget_execution("SELECT 1", "db")
+            await client.execute_query("SELECT 1", database="db", output_location="s3://out/")
+        finally:
+            client.shutdown()
+
+        assert stub.start_query_execution.call_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [ValueError("bad CSV"), ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")])
+async def test_executor_forgets_memo_when_results_cannot_be_read(error):
+    from backend.services.athena_executor import EnhancedAthenaQueryExecutor
+
+    executor = EnhancedAthenaQueryExecutor.__new__(EnhancedAthenaQueryExecutor)
+    executor.database = "db"
+    executor.output_location = "s3://out/"
+    executor._athena = MagicMock()
+    executor._athena.execute_query = AsyncMock(
+        return_value={"QueryExecution": {"QueryExecutionId": "qid-1", "Status": {"State": "SUCCEEDED"}}}
+    )
+    executor._reader = MagicMock()
+    executor._reader.read_all = AsyncMock(side_effect=error)
+
+    with patch("backend.services.athena_executor.athena_result_cache.get", AsyncMock(return_value=None)):
+        assert await executor._execute_athena_query("SELECT 1") == []
+
+    executor._athena.forget_execution.assert_called_once_with("SELECT 1", "db")
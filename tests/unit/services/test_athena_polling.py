@@ -0,0 +1,155 @@
+"""
+Tests for adaptive Athena completion polling.
+"""
+
+import random
+import time
+
+import pytest
+
+from backend.services.athena_client import AsyncAthenaClient
+from backend.services.athena_polling import (
+    PREDICTED_FIRST_PROBE,
+    PREDICTED_MAX_DELAY,
+    ExecutionTimeStats,
+    PollSchedule,
+    QueryClass,
+    deadline_for,
+    sql_template_key,
+)
+
+
+class TestSqlTemplateKey:
+
+    def test_literals_do_not_change_key(self):
+        a = "SELECT * FROM cur WHERE month = '2025-01' LIMIT 5"
+        b = "select *  from cur\nwhere month = '2025-11' limit 10"
+        assert sql_template_key(a) == sql_template_key(b)
+
+    def test_different_shapes_differ(self):
+        a = "SELECT service, SUM(cost) FROM cur GROUP BY 1"
+        b = "SELECT region, SUM(cost) FROM cur GROUP BY 1"
+        assert sql_template_key(a) != sql_template_key(b)
+
+
+class TestPollSchedule:
+
+    def test_starts_at_tens_of_milliseconds_and_backs_off(self):
+        schedule = PollSchedule(
+            deadline_seconds=60, initial_delay=0.05, max_delay=2.0, multiplier=2.0,
+            rng=random.Random(0),
+        )
+        delays = [schedule.next_delay(0) for _ in range(8)]
+        assert delays[0] <= 0.05
+        assert delays[-1] > delays[0] * 10
+        assert max(delays) <= 2.0
+
+    def test_jitter_stays_within_equal_jitter_band(self):
+        schedule = PollSchedule(
+            deadline_seconds=60, initial_delay=0.1, max_delay=2.0, multiplier=2.0,
+            rng=random.Random(1),
+        )
+        first = schedule.next_delay(0)
+        assert 0.05 <= first <= 0.1
+
+    def test_deadline_stops_polling(self):
+        schedule = PollSchedule(deadline_seconds=1.0, initial_delay=0.05, max_delay=2.0, multiplier=2.0)
+        assert schedule.next_delay(0.99) <= 0.01 + 1e-9
+        assert schedule.next_delay(1.0) is None
+
+    def test_prediction_skips_early_probes(self):
+        schedule = PollSchedule(
+            deadline_seconds=60, predicted_seconds=3.0, initial_delay=0.05, max_delay=2.0, multiplier=2.0,
+        )
+        assert schedule.next_delay(0) == pytest.approx(3.0 * PREDICTED_FIRST_PROBE)
+        # Past the first probe the backoff starts afresh
+        assert schedule.next_delay(3.0) <= 0.05
+
+    def test_overdue_predicted_queries_poll_proportionally(self):
+        schedule = PollSchedule(
+            deadline_seconds=60, predicted_seconds=3.0, initial_delay=0.05, max_delay=2.0, multiplier=2.0,
+        )
+        delays = [schedule.next_delay(3.0) for _ in range(10)]
+        assert max(delays) <= 3.0 * PREDICTED_MAX_DELAY
+
+    def test_deadlines_per_query_class(self):
+        assert deadline_for(QueryClass.METADATA) < deadline_for(QueryClass.INTERACTIVE)
+        assert deadline_for(QueryClass.INTERACTIVE) < deadline_for(QueryClass.BATCH)
+
+
+class TestExecutionTimeStats:
+
+    def test_records_engine_time(self):
+        stats = ExecutionTimeStats()
+        stats.record("k", {"Statistics": {"EngineExecutionTimeInMillis": 1500}})
+        assert stats.predict_seconds("k") == pytest.approx(1.5)
+        stats.record("k", {"Statistics": {"EngineExecutionTimeInMillis": 500}})
+        assert 0.5 < stats.predict_seconds("k") < 1.5
+
+    def test_unknown_template_has_no_prediction(self):
+        assert ExecutionTimeStats().predict_seconds("missing") is None
+
+    def test_bounded(self):
+        stats = ExecutionTimeStats(max_templates=2)
+        for key in ("a", "b", "c"):
+            stats.record(key, {"Statistics": {"EngineExecutionTimeInMillis": 100}})
+        assert stats.predict_seconds("a") is None
+        assert stats.predict_seconds("c") is not None
+
+
+class _StubAthena:
+    def __init__(self, duration: float, final_state: str = "SUCCEEDED"):
+        self.duration = duration
+        self.final_state = final_state
+        self.started = time.monotonic()
+        self.polls = 0
+
+    def get_query_execution(self, QueryExecutionId):
+        self.polls += 1
+        done = time.monotonic() - self.started >= self.duration
+        return {
+            "QueryExecution": {
+                "Status": {"State": self.final_state if done else "RUNNING"},
+                "Statistics": {"EngineExecutionTimeInMillis": int(self.duration * 1000)},
+            }
+        }
+
+
+class TestWaitForQuery:
+
+    @pytest.mark.asyncio
+    async def test_fast_query_returns_well_under_a_second(self):
+        stub = _StubAthena(duration=0.05)
+        client = AsyncAthenaClient(client=stub, max_workers=2, call_timeout_seconds=5)
+        try:
+            started = time.monotonic()
+            response = await client.wait_for_query("q1", template_key=None)
+            elapsed = time.monotonic() - started
+        finally:
+            client.shutdown()
+
+        assert response["QueryExecution"]["Status"]["State"] == "SUCCEEDED"
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_deadline_returns_non_terminal_state(self):
+        stub = _StubAthena(duration=10)
+        client = AsyncAthenaClient(client=stub, max_workers=2, call_timeout_seconds=5)
+        try:
+            response = await client.wait_for_query("q1", deadline_seconds=0.2)
+        finally:
+            client.shutdown()
+
+        assert response["QueryExecution"]["Status"]["State"] == "RUNNING"
+
+    @pytest.mark.asyncio
+    async def test_failed_state_is_terminal(self):
+        stub = _StubAthena(duration=0, final_state="FAILED")
+        client = AsyncAthenaClient(client=stub, max_workers=2, call_timeout_seconds=5)
+        try:
+            response = await client.wait_for_query("q1")
+        finally:
+            client.shutdown()
+
+        assert response["QueryExecution"]["Status"]["State"] == "FAILED"
+        assert stub.polls == 1
@@ -0,0 +1,130 @@
+"""
+Tests for the Athena result-set cache.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from backend.services.athena_result_cache import (
+    AthenaResultCache,
+    canonicalize_sql,
+    result_cache_hits,
+    result_cache_misses,
+    result_scope,
+)
+from backend.services.cur_partitions import CURPartitionCatalog, CURPartitionScheme
+
+
+class _FakeValkey:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ttl_seconds=None):
+        self.store[key] = value
+        return True
+
+
+@pytest.fixture
+def catalog():
+    catalog = CURPartitionCatalog()
+    catalog.set("db", "cur", CURPartitionScheme.from_partitions(["billing_period"], [("2025-01",)]))
+    with patch("backend.services.athena_result_cache.cur_partition_catalog", catalog):
+        yield catalog
+
+
+@pytest.fixture
+def valkey():
+    fake = _FakeValkey()
+    with patch("backend.services.athena_result_cache.get_cache_service", AsyncMock(return_value=fake)):
+        yield fake
+
+
+def _counter_value(counter, **labels):
+    metric = counter.labels(**labels) if labels else counter
+    return metric._value.get()
+
+
+class TestCanonicalizeSql:
+
+    def test_whitespace_case_and_comments_ignored(self):
+        a = "SELECT service,\n  SUM(cost)  FROM cur -- top services\nGROUP BY 1;"
+        b = "select service, sum(cost) from cur group by 1"
+        assert canonicalize_sql(a) == canonicalize_sql(b)
+
+    def test_literals_are_preserved(self):
+        a = "SELECT 1 FROM cur WHERE month = '2025-01'"
+        b = "SELECT 1 FROM cur WHERE month = '2025-02'"
+        assert canonicalize_sql(a) != canonicalize_sql(b)
+        assert "'Prod  Env'" in canonicalize_sql("SELECT 1 FROM cur WHERE env = 'Prod  Env'")
+
+    def test_scope_is_order_insensitive(self):
+        assert result_scope(["222", "111"], "org") == result_scope(["111", "222"], "org")
+        assert result_scope(["111"]) != result_scope(["222"])
+
+
+class TestAthenaResultCache:
+
+    @pytest.mark.asyncio
+    async def test_round_trip_through_local_tier(self, catalog, valkey):
+        cache = AthenaResultCache(database="db", table="cur")
+        rows = [{"service": "AmazonEC2", "cost": 12.5}]
+        misses = _counter_value(result_cache_misses)
+        hits = _counter_value(result_cache_hits, tier="local")
+
+        assert await cache.get("SELECT 1", "s") is None
+        assert await cache.put("SELECT 1", "s", rows)
+        assert await cache.get("select  1;", "s") == rows
+
+        assert _counter_value(result_cache_misses) == misses + 1
+        assert _counter_value(result_cache_hits, tier="local") == hits + 1
+
+    @pytest.mark.asyncio
+    async def test_valkey_tier_shared_across_instances(self, catalog, valkey):
+        writer = AthenaResultCache(database="db", table="cur")
+        reader = AthenaResultCache(database="db", table="cur")
+        await writer.put("SELECT 1", "s", [{"a": 1}])
+        hits = _counter_value(result_cache_hits, tier="valkey")
+
+        assert await reader.get("SELECT 1", "s") == [{"a": 1}]
+        assert _counter_value(result_cache_hits, tier="valkey") == hits + 1
+
+    @pytest.mark.asyncio
+    async def test_scopes_do_not_share_entries(self, catalog, valkey):
+        cache = AthenaResultCache(database="db", table="cur")
+        await cache.put("SELECT 1", result_scope(["111"]), [{"a": 1}])
+        assert await cache.get("SELECT 1", result_scope(["222"])) is None
+
+    @pytest.mark.asyncio
+    async def test_new_partition_invalidates(self, catalog, valkey):
+        cache = AthenaResultCache(database="db", table="cur")
+        await cache.put("SELECT 1", "s", [{"a": 1}])
+
+        catalog.set("db", "cur", CURPartitionScheme.from_partitions(
+            ["billing_period"], [("2025-01",), ("2025-02",)]
+        ))
+        assert await cache.get("SELECT 1", "s") is None
+        assert cache._local == {}
+
+    @pytest.mark.asyncio
+    async def test_no_freshness_signal_disables_caching(self, valkey):
+        with patch("backend.services.athena_result_cache.cur_partition_catalog", CURPartitionCatalog()):
+            cache = AthenaResultCache(database="db", table="cur")
+            assert await cache.put("SELECT 1", "s", [{"a": 1}]) is False
+            assert await cache.get("SELECT 1", "s") is None
+        assert valkey.store == {}
+
+    @pytest.mark.asyncio
+    async def test_oversized_results_not_cached(self, catalog, valkey):
+        cache = AthenaResultCache(database="db", table="cur", max_entry_bytes=10)
+        assert await cache.put("SELECT 1", "s", [{"a": "x" * 100}]) is False
+
+    @pytest.mark.asyncio
+    async def test_local_tier_is_bounded(self, catalog, valkey):
+        cache = AthenaResultCache(database="db", table="cur", max_entries=2)
+        for i in range(3):
+            await cache.put(f"SELECT {i}", "s", [{"i": i}])
+        assert len(cache._local) == 2
@@ -0,0 +1,179 @@
+"""
+Tests for the streaming Athena result reader.
+"""
+
+import io
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.services.athena_query_service import AthenaQueryService
+from backend.services.athena_result_reader import AthenaResultReader, column_converter
+
+CSV_OUTPUT = (
+    '"service","account_id","cost","usage_days","is_spot"\n'
+    '"AmazonEC2","012345678901","12.5","3","true"\n'
+    '"Multi\nLine","012345678902","","","false"\n'
+    '"AmazonS3","012345678903","0.25","1",""\n'
+)
+
+METADATA = {
+    "ColumnInfo": [
+        {"Name": "service", "Type": "varchar"},
+        {"Name": "account_id", "Type": "varchar"},
+        {"Name": "cost", "Type": "double"},
+        {"Name": "usage_days", "Type": "bigint"},
+        {"Name": "is_spot", "Type": "boolean"},
+    ]
+}
+
+
+class _FakeAthena:
+    def __init__(self, output_location="s3://results/q1.csv"):
+        self.output_location = output_location
+        self.pages = []
+
+    async def get_query_execution(self, query_execution_id):
+        return {"QueryExecution": {"ResultConfiguration": {"OutputLocation": self.output_location}}}
+
+    async def get_query_results(self, query_execution_id, next_token=None, max_results=None):
+        if max_results == 1:
+            return {"ResultSet": {"ResultSetMetadata": METADATA, "Rows": []}}
+        index = int(next_token or 0)
+        page = dict(self.pages[index])
+        if index + 1 < len(self.pages):
+            page["NextToken"] = str(index + 1)
+        return page
+
+
+def _s3_with(body: bytes):
+    s3 = MagicMock()
+    s3.get_object.return_value = {"Body": io.BytesIO(body)}
+    return s3
+
+
+async def _collect(reader, qid="q1", batch_rows=None):
+    batches = []
+    async for _, rows in reader.iter_batches(qid, batch_rows=batch_rows):
+        batches.append(rows)
+    return batches
+
+
+class TestColumnConverter:
+
+    def test_types_from_metadata(self):
+        assert column_converter("bigint")("42") == 42
+        assert column_converter("decimal(38,10)")("1.50") == 1.5
+        assert column_converter("double")("") is None
+        assert column_converter("boolean")("TRUE") is True
+        # Account IDs are varchar: no numeric guessing, leading zero kept
+        assert column_converter("varchar")("012345678901") == "012345678901"
+        assert column_converter("date")("2025-01-01") == "2025-01-01"
+
+
+class TestAthenaResultReader:
+
+    @pytest.mark.asyncio
+    async def test_streams_typed_rows_from_s3(self):
+        s3 = _s3_with(CSV_OUTPUT.encode("utf-8"))
+        reader = AthenaResultReader(_FakeAthena(), s3_client=s3, batch_rows=2)
+
+        batches = await _collect(reader)
+
+        s3.get_object.assert_called_once_with(Bucket="results", Key="q1.csv")
+        assert [len(b) for b in batches] == [2, 1]
+        assert batches[0][0] == ["AmazonEC2", "012345678901", 12.5, 3, True]
+        assert batches[0][1] == ["Multi\nLine", "012345678902", None, None, False]
+        assert batches[1][0][4] is None
+
+    @pytest.mark.asyncio
+    async def test_read_all_caps_rows(self):
+        reader = AthenaResultReader(_FakeAthena(), s3_client=_s3_with(CSV_OUTPUT.encode("utf-8")))
+        rows = await reader.read_all("q1", max_rows=2)
+        assert len(rows) == 2
+        assert rows[0] == {
+            "service": "AmazonEC2", "account_id": "012345678901",
+            "cost": 12.5, "usage_days": 3, "is_spot": True,
+        }
+
+    @pytest.mark.asyncio
+    async def test_read_columnar(self):
+        reader = AthenaResultReader(_FakeAthena(), s3_client=_s3_with(CSV_OUTPUT.encode("utf-8")), batch_rows=2)
+        table = await reader.read_columnar("q1")
+        assert table.columns == ["service", "account_id", "cost", "usage_days", "is_spot"]
+        assert len(table) == 3
+        assert table.sum("cost") == 12.75
+        assert table[1]["cost"] is None
+
+    @pytest.mark.asyncio
+    async def test_unquoted_empty_fields_are_null(self):
+        body = (
+            '"service","account_id","cost","usage_days","is_spot"\n'
+            ',"","1.0",,\n'
+            '"a,,b",,,"2","true"\n'
+        )
+        reader = AthenaResultReader(_FakeAthena(), s3_client=_s3_with(body.encode("utf-8")))
+
+        [rows] = await _collect(reader)
+
+        assert rows[0] == [None, "", 1.0, None, None]
+        assert rows[1] == ["a,,b", None, None, 2, True]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_api_paging_when_s3_fails(self):
+        athena = _FakeAthena()
+        header = {"Data": [{"VarCharValue": c["Name"]} for c in METADATA["ColumnInfo"]]}
+        athena.pages = [
+            {"ResultSet": {"Rows": [header, {"Data": [
+                {"VarCharValue": "AmazonEC2"}, {"VarCharValue": "1"}, {"VarCharValue": "2.5"},
+                {"VarCharValue": "3"}, {"VarCharValue": "false"},
+            ]}]}},
+            {"ResultSet": {"Rows": [{"Data": [
+                {"VarCharValue": "AmazonS3"}, {"VarCharValue": "2"}, {},
+                {"VarCharValue": "1"}, {"VarCharValue": "true"},
+            ]}]}},
+        ]
+        s3 = MagicMock()
+        s3.get_object.side_effect = RuntimeError("AccessDenied")
+        reader = AthenaResultReader(athena, s3_client=s3)
+
+        rows = await reader.read_all("q1")
+
+        assert [r["service"] for r in rows] == ["AmazonEC2", "AmazonS3"]
+        assert rows[0]["cost"] == 2.5
+        assert rows[1]["cost"] is None
+
+
+class TestStreamingExports:
+
+    def _service(self):
+        service = AthenaQueryService.__new__(AthenaQueryService)
+        service._reader = AthenaResultReader(
+            _FakeAthena(), s3_client=_s3_with(CSV_OUTPUT.encode("utf-8")), batch_rows=1
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_csv_stream(self):
+        chunks = [c async for c in self._service().stream_results_csv("q1")]
+        assert len(chunks) == 3
+        assert chunks[0].startswith("service,account_id,cost,usage_days,is_spot")
+        assert "AmazonS3" in chunks[-1]
+
+    @pytest.mark.asyncio
+    async def test_empty_csv_stream_has_header(self):
+        service = AthenaQueryService.__new__(AthenaQueryService)
+        header = CSV_OUTPUT.splitlines(keepends=True)[0]
+        service._reader = AthenaResultReader(_FakeAthena(), s3_client=_s3_with(header.encode("utf-8")))
+
+        chunks = [c async for c in service.stream_results_csv("q1")]
+
+        assert "".join(chunks).splitlines() == ["service,account_id,cost,usage_days,is_spot"]
+
+    @pytest.mark.asyncio
+    async def test_json_stream_is_valid_array(self):
+        chunks = [c async for c in self._service().stream_results_json("q1")]
+        rows = json.loads("".join(chunks))
+        assert [r["service"] for r in rows] == ["AmazonEC2", "Multi\nLine", "AmazonS3"]
+        assert rows[0]["cost"] == 12.5
@@ -328,6 +328,30 @@ class TestCacheServiceGeneralOperations:
         assert result is True
         service._client.delete.assert_called_once_with("test_key")
 
+    @pytest.mark.asyncio
+    async def test_eval_script_registers_once(self):
+        """Test that a script is registered once and then invoked by reference"""
+        from unittest.mock import MagicMock
+
+        service = CacheService()
+        service._client = MagicMock()
+        registered = AsyncMock(return_value=[1, 1, 0])
+        service._client.register_script = MagicMock(return_value=registered)
+
+        for _ in range(2):
+            result = await service.eval_script("return 1", keys=["a", "b"], args=[5])
+
+        assert result == [1, 1, 0]
+        service._client.register_script.assert_called_once_with("return 1")
+        registered.assert_awaited_with(keys=["a", "b"], args=[5])
+
+    @pytest.mark.asyncio
+    async def test_eval_script_without_connection_returns_none(self):
+        """Test that eval_script reports an unavailable cache as None"""
+        service = CacheService()
+
+        assert await service.eval_script("return 1", keys=[], args=[]) is None
+
 
 class TestModuleLevelFunctions:
     """Tests for module-level helper functions"""
@@ -0,0 +1,142 @@
+"""
+Tests for /chat/stream progress events and Bedrock token streaming.
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from backend.api.chat import chat_stream
+from backend.models.schemas import ChatRequest
+from backend.services.chat_stream_events import (
+    ChatStreamEmitter,
+    bind_emitter,
+    chat_stream_ttfb,
+    emit_event,
+)
+from backend.services.llm_service import BedrockLLMService
+from backend.services.request_context import RequestContext
+
+
+def _ttfb_count(event):
+    for metric in chat_stream_ttfb.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_count") and sample.labels.get("event") == event:
+                return sample.value
+    return 0.0
+
+
+class TestEmitter:
+
+    def test_emit_without_stream_is_noop(self):
+        emit_event("status", message="nobody listening")
+
+    @pytest.mark.asyncio
+    async def test_events_from_task_arrive_in_order(self):
+        emitter = ChatStreamEmitter()
+
+        async def work():
+            emit_event("status", stage="a")
+            await asyncio.sleep(0)
+            emit_event("results", row_count=2)
+            return "done"
+
+        with bind_emitter(emitter):
+            task = asyncio.create_task(work())
+        events = [e async for e in emitter.events_until(task)]
+
+        assert events == [("status", {"stage": "a"}), ("results", {"row_count": 2})]
+        assert task.result() == "done"
+
+
+class TestChatStreamEndpoint:
+
+    @pytest.mark.asyncio
+    async def test_events_are_streamed_before_final_message(self):
+        context = RequestContext(
+            user_id=uuid4(), user_email="u@example.com",
+            organization_id=uuid4(), allowed_account_ids=["111122223333"],
+        )
+        before = _ttfb_count("results")
+
+        async def fake_workflow(**kwargs):
+            emit_event("status", stage="executing_query", message="Running query in Athena...")
+            emit_event("results", columns=["service"], rows=[{"service": "AmazonEC2"}], row_count=1)
+            emit_event("charts", data=[{"type": "bar"}])
+            return {"message": "EC2 cost: $1", "charts": [{"type": "bar"}], "suggestions": ["next"]}
+
+        with patch("backend.api.chat.conversation_manager") as manager, \
+                patch("backend.api.chat.execute_multi_agent_query", new=fake_workflow):
+            manager.create_thread.return_value = "thread-1"
+            response = await chat_stream(ChatRequest(message="EC2 costs"), context)
+            frames = [chunk async for chunk in response.body_iterator]
+
+        assert all(f.startswith("data: ") and f.endswith("\n\n") for f in frames)
+        events = [json.loads(f[len("data: "):]) for f in frames]
+        types = [e["type"] for e in events]
+        assert types == [
+            "start", "status", "status", "results", "charts", "message", "suggestions", "complete"
+        ]
+        # Charts already pushed early are not repeated
+        assert types.count("charts") == 1
+        assert events[3]["rows"] == [{"service": "AmazonEC2"}]
+        assert events[0]["conversation_id"] == "thread-1"
+        assert _ttfb_count("results") == before + 1
+
+
+class TestBedrockTokenStreaming:
+
+    def _service(self, client):
+        service = BedrockLLMService.__new__(BedrockLLMService)
+        service.settings = MagicMock(max_tokens=100, temperature=0.1)
+        service.model_id = "us.anthropic.claude-3-5-sonnet"
+        service.model_kwargs = {}
+        service.use_converse_api = True
+        service.initialized = True
+        service.bedrock_client = client
+        return service
+
+    @pytest.mark.asyncio
+    async def test_tokens_forwarded_to_stream(self):
+        client = MagicMock()
+        client.converse_stream.return_value = {"stream": [
+            {"messageStart": {"role": "assistant"}},
+            {"contentBlockDelta": {"delta": {"text": "Stop "}}},
+            {"contentBlockDelta": {"delta": {"text": "idle instances."}}},
+            {"messageStop": {"stopReason": "end_turn"}},
+        ]}
+        service = self._service(client)
+        emitter = ChatStreamEmitter()
+
+        with bind_emitter(emitter):
+            task = asyncio.create_task(service._invoke_bedrock(
+                [{"role": "user", "content": "why?"}], stream_tokens=True
+            ))
+        events = [e async for e in emitter.events_until(task)]
+
+        assert task.result() == "Stop idle instances."
+        assert [p["text"] for t, p in events if t == "token"] == ["Stop ", "idle instances."]
+        client.converse.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_no_stream_without_emitter(self):
+        client = MagicMock()
+        client.converse.return_value = {"output": {"message": {"content": [{"text": "ok"}]}}}
+        service = self._service(client)
+
+        assert await service._invoke_bedrock([{"role": "user", "content": "hi"}], stream_tokens=True) == "ok"
+        client.converse_stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stream_failure_before_tokens_falls_back(self):
+        client = MagicMock()
+        client.converse_stream.side_effect = RuntimeError("streaming not allowed")
+        client.converse.return_value = {"output": {"message": {"content": [{"text": "ok"}]}}}
+        service = self._service(client)
+
+        with bind_emitter(ChatStreamEmitter()):
+            text = await service._invoke_bedrock([{"role": "user", "content": "hi"}], stream_tokens=True)
+        assert text == "ok"
@@ -0,0 +1,100 @@
+"""
+Tests for the columnar query result and the vectorized chart/formatter paths.
+"""
+
+from backend.services.chart_data_builder import ChartDataBuilder
+from backend.services.chart_recommendation import ChartRecommendationEngine
+from backend.services.query_result import ColumnarResult, QueryResult, ResultMetadata
+from backend.services.response_formatter import aasmaaResponseFormatter
+
+ROWS = [
+    {"month": "2025-02", "service": "AmazonEC2", "cost_usd": 10.5, "usage_days": 3},
+    {"month": "2025-01", "service": "AmazonS3", "cost_usd": None, "usage_days": 1},
+    {"month": "2025-01", "service": "AmazonEC2", "cost_usd": 4.5, "usage_days": 2},
+]
+
+
+class TestColumnarResult:
+
+    def test_row_view_round_trips(self):
+        table = ColumnarResult.from_rows(ROWS)
+        assert table.to_dicts() == ROWS
+        assert table[-1] == ROWS[-1]
+        assert isinstance(table[0]["usage_days"], int)
+        assert table.is_numeric("cost_usd")
+        assert not table.is_numeric("service")
+
+    def test_slicing_keeps_columnar_storage(self):
+        table = ColumnarResult.from_rows(ROWS)
+        head = table[:2]
+        assert isinstance(head, ColumnarResult)
+        assert head.to_dicts() == ROWS[:2]
+        assert list(reversed(table)) == list(reversed(ROWS))
+
+    def test_missing_keys_stay_missing(self):
+        rows = [{"a": 1, "b": "x"}, {"a": 2.5}]
+        table = ColumnarResult.from_rows(rows)
+        assert table.to_dicts() == rows
+        assert table.text("b") == ["x", ""]
+
+    def test_mixed_and_large_values_keep_types(self):
+        rows = [{"v": 1, "id": 2 ** 60, "flag": True}, {"v": 1.5, "id": 1, "flag": False}]
+        table = ColumnarResult.from_rows(rows)
+        assert table.to_dicts() == rows
+        assert type(table[0]["v"]) is int
+        assert not table.is_numeric("id")
+        assert not table.is_numeric("flag")
+
+    def test_from_batches(self):
+        table = ColumnarResult.from_batches(["service", "cost"], [[["EC2", 1.0]], [["S3", 2.0]]])
+        assert len(table) == 2
+        assert table.sum("cost") == 3.0
+
+    def test_aggregations(self):
+        table = ColumnarResult.from_rows(ROWS)
+        assert table.sum("cost_usd") == 15.0
+        assert table.group_sum("month", "cost_usd") == (["2025-01", "2025-02"], [4.5, 10.5])
+        assert table.order_desc("cost_usd").tolist() == [0, 2, 1]
+        assert table.nunique("service") == 2
+        assert table.nunique("cost_usd") == 3
+
+    def test_first_present_sum(self):
+        rows = [{"cost_usd": None, "cost": 2}, {"cost": "3.5"}, {"cost_usd": 1, "cost": 100}]
+        table = ColumnarResult.from_rows(rows)
+        assert table.first_present_sum(["cost_usd", "cost"]) == 6.5
+        # NULL counts as 0 and stops the search for that row
+        assert table.first_present_sum(["cost_usd", "cost"], skip_null=False) == 4.5
+
+
+class TestConsumers:
+
+    def test_query_result_total_cost(self):
+        rows = [{"cost_usd": "1.5"}, {"cost_usd": None, "cost": 2}, {"unblended_cost": "n/a"}]
+        result = QueryResult(data=rows, metadata=ResultMetadata(data_source="athena"))
+        assert result.total_cost == 3.5
+        assert result.columnar.to_dicts() == rows
+
+    def test_formatter_sum_costs(self):
+        formatter = aasmaaResponseFormatter()
+        assert formatter._sum_costs(ROWS) == 15.0
+        assert formatter._sum_costs([{"monthly_cost": "2"}, {"monthly_cost": None}]) == 2.0
+
+    def test_bar_chart_top_five_plus_others(self):
+        rows = [{"service": f"svc{i}", "cost_usd": float(i)} for i in range(8)]
+        chart = ChartDataBuilder()._build_bar_chart(
+            "Cost by Service", "bar", "service", "cost_usd", ColumnarResult.from_rows(rows)
+        )
+        assert chart["data"]["labels"] == ["svc7", "svc6", "svc5", "svc4", "svc3", "Others (3 items)"]
+        assert chart["data"]["datasets"][0]["data"] == [7.0, 6.0, 5.0, 4.0, 3.0, 3.0]
+
+    def test_line_chart_aggregates_by_x(self):
+        chart = ChartDataBuilder()._build_line_chart(
+            "Trend", "line", "month", "cost_usd", None, ColumnarResult.from_rows(ROWS)
+        )
+        values = chart["data"]["datasets"][0]["data"]
+        assert [v for v in values if v is not None] == [4.5, 10.5]
+
+    def test_grouping_detection(self):
+        engine = ChartRecommendationEngine()
+        assert engine._has_grouping_column(ColumnarResult.from_rows(ROWS))
+        assert not engine._has_grouping_column(ROWS[:2])
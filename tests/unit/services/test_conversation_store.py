@@ -0,0 +1,355 @@
+"""
+Tests for the asyncio-native conversation store.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services.conversation_manager import build_query_context
+from backend.services.conversation_store import (
+    AsyncConversationStore,
+    ConversationWriteBuffer,
+    ExecutionRecord,
+    IntentRecord,
+    MessageRecord,
+)
+
+THREAD = "11111111-1111-1111-1111-111111111111"
+OTHER_THREAD = "22222222-2222-2222-2222-222222222222"
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def __iter__(self):
+        return iter(SimpleNamespace(**row) for row in self._rows)
+
+    def mappings(self):
+        return list(self._rows)
+
+
+class _FakeConnection:
+    def __init__(self, engine):
+        self._engine = engine
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        self._engine.statements.append((sql, params or {}))
+        if "FOR UPDATE" in sql:
+            return _Result([
+                {"thread_id": t, "user_id": u} for t, u in self._engine.owners.items()
+                if t in params["thread_ids"]
+            ])
+        if "UNION ALL" in sql:
+            return _Result(self._engine.context_rows)
+        return _Result([])
+
+
+class _FakeEngine:
+    def __init__(self, owners=None, context_rows=None):
+        self.owners = owners or {}
+        self.context_rows = context_rows or []
+        self.statements = []
+
+    def begin(self):
+        return _FakeConnection(self)
+
+    def connect(self):
+        return _FakeConnection(self)
+
+
+def _store(engine):
+    return AsyncConversationStore(db=SimpleNamespace(engine=engine))
+
+
+def _inserts(engine, table):
+    return [(sql, params) for sql, params in engine.statements if sql.startswith(f"INSERT INTO {table}")]
+
+
+class TestWriteRecords:
+
+    @pytest.mark.asyncio
+    async def test_one_statement_per_table(self):
+        engine = _FakeEngine(owners={THREAD: "alice", OTHER_THREAD: "alice"})
+        message = MessageRecord(THREAD, "alice", "assistant", "hi", "response")
+        records = [
+            MessageRecord(THREAD, "alice", "user", "q", "query"),
+            message,
+            MessageRecord(OTHER_THREAD, "alice", "user", "q2", "query"),
+            IntentRecord(THREAD, "alice", message.id, "q", None, "COST_BREAKDOWN", 1.7),
+            ExecutionRecord(THREAD, "alice", "Supervisor", "supervisor", "q", message_id=message.id),
+        ]
+
+        assert await _store(engine).write_records(records) == 5
+
+        assert len(engine.statements) == 4
+        assert "FOR UPDATE" in engine.statements[0][0]
+        assert engine.statements[0][1]["thread_ids"] == sorted([THREAD, OTHER_THREAD])
+        (_, message_params), = _inserts(engine, "conversation_messages")
+        # Per-thread position within the batch is added to the thread's MAX(ordering_index)
+        assert [message_params[f"m{i}_6"] for i in range(3)] == [1, 2, 1]
+        (_, intent_params), = _inserts(engine, "query_intents")
+        assert intent_params["i0_2"] == message.id
+        assert intent_params["i0_6"] == 1.0
+        (_, execution_params), = _inserts(engine, "agent_executions")
+        assert execution_params["e0_2"] == message.id
+
+    @pytest.mark.asyncio
+    async def test_non_owner_writes_nothing(self):
+        engine = _FakeEngine(owners={THREAD: "alice", OTHER_THREAD: "bob"})
+        records = [
+            MessageRecord(THREAD, "alice", "user", "q", "query"),
+            MessageRecord(OTHER_THREAD, "alice", "user", "q", "query"),
+        ]
+        with pytest.raises(PermissionError, match="HIGH-14"):
+            await _store(engine).write_records(records)
+        assert _inserts(engine, "conversation_messages") == []
+
+    @pytest.mark.asyncio
+    async def test_missing_thread_is_rejected(self):
+        engine = _FakeEngine()
+        with pytest.raises(PermissionError):
+            await _store(engine).add_message(THREAD, "alice", "user", "q", "query")
+
+    @pytest.mark.asyncio
+    async def test_add_message_returns_client_id(self):
+        engine = _FakeEngine(owners={THREAD: "alice"})
+        message_id = await _store(engine).add_message(THREAD, "alice", "user", "q", "query")
+        (_, params), = _inserts(engine, "conversation_messages")
+        assert params["m0_0"] == message_id
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_is_noop(self):
+        engine = _FakeEngine()
+        assert await _store(engine).write_records([]) == 0
+        assert engine.statements == []
+
+
+class TestContextForQuery:
+
+    @pytest.mark.asyncio
+    async def test_single_round_trip_matches_manager_merge(self):
+        now = datetime(2025, 1, 31, tzinfo=timezone.utc)
+        time_range = {"start_date": "2025-01-01", "end_date": "2025-01-31"}
+        rows = [
+            {"kind": "message", "id": "r-0", "intent_type": None, "role": "user", "content": "first",
+             "payload": "{}", "ordering_index": 1, "created_at": now - timedelta(minutes=2)},
+            {"kind": "intent", "id": "r-1", "intent_type": "COST_BREAKDOWN", "role": None, "content": None,
+             "payload": {"services": ["EC2"]}, "ordering_index": None,
+             "created_at": now - timedelta(minutes=2)},
+            {"kind": "intent", "id": "r-2", "intent_type": "TOP_N_RANKING", "role": None, "content": None,
+             "payload": {"services": ["S3"], "time_range": time_range}, "ordering_index": None,
+             "created_at": now},
+            {"kind": "message", "id": "r-3", "intent_type": None, "role": "assistant", "content": "second",
+             "payload": None, "ordering_index": 2, "created_at": now - timedelta(minutes=1)},
+        ]
+        engine = _FakeEngine(context_rows=rows)
+
+        context = await _store(engine).get_context_for_query(THREAD, "alice")
+
+        assert len(engine.statements) == 1
+        assert engine.statements[0][1]["user_id"] == "alice"
+        expected = build_query_context(
+            [
+                {"intent_type": "TOP_N_RANKING", "extracted_dimensions": rows[2]["payload"]},
+                {"intent_type": "COST_BREAKDOWN", "extracted_dimensions": rows[1]["payload"]},
+            ],
+            [
+                {"role": "assistant", "content": "second", "metadata": {}, "ordering_index": 2},
+                {"role": "user", "content": "first", "metadata": {}, "ordering_index": 1},
+            ],
+        )
+        assert context == expected
+        assert context["services"] == ["S3", "EC2"]
+        assert context["time_range"] == time_range
+
+    @pytest.mark.asyncio
+    async def test_errors_fall_back_to_empty_context(self):
+        class _Broken(_FakeEngine):
+            def connect(self):
+                raise RuntimeError("database unavailable")
+
+        context = await _store(_Broken()).get_context_for_query(THREAD, "alice")
+        assert context == build_query_context([], [])
+
+
+class _RecordingWriter:
+    def __init__(self, fail=None):
+        self.batches = []
+        self.fail = fail
+
+    async def __call__(self, records):
+        records = list(records)
+        if self.fail is not None:
+            error = self.fail(records)
+            if error is not None:
+                raise error
+        self.batches.append(records)
+        return len(records)
+
+
+def _message(thread=THREAD, user="alice", content="q"):
+    return MessageRecord(thread, user, "user", content, "query")
+
+
+class TestConversationWriteBuffer:
+
+    @pytest.mark.asyncio
+    async def test_coalesces_requests_into_one_write(self):
+        writer = _RecordingWriter()
+        buffer = ConversationWriteBuffer(writer, max_batch=100, flush_interval_seconds=60)
+        await buffer.enqueue([_message(content="a")])
+        await buffer.enqueue([_message(OTHER_THREAD, content="b"), _message(content="c")])
+
+        await buffer.close()
+
+        assert [[r.content for r in batch] for batch in writer.batches] == [["a", "b", "c"]]
+        assert len(buffer) == 0
+
+    @pytest.mark.asyncio
+    async def test_size_trigger_flushes_without_waiting(self):
+        writer = _RecordingWriter()
+        buffer = ConversationWriteBuffer(writer, max_batch=2, flush_interval_seconds=60)
+        await buffer.enqueue([_message(), _message()])
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert len(writer.batches) == 1
+        await buffer.close()
+
+    @pytest.mark.asyncio
+    async def test_time_trigger(self):
+        writer = _RecordingWriter()
+        buffer = ConversationWriteBuffer(writer, max_batch=100, flush_interval_seconds=0.01)
+        await buffer.enqueue([_message()])
+        await asyncio.sleep(0.05)
+        assert len(writer.batches) == 1
+        await buffer.close()
+
+    @pytest.mark.asyncio
+    async def test_backpressure_waits_for_flusher(self):
+        release = asyncio.Event()
+
+        async def slow_write(records):
+            await release.wait()
+            return len(records)
+
+        buffer = ConversationWriteBuffer(slow_write, max_batch=1, flush_interval_seconds=60, max_pending=2)
+        await buffer.enqueue([_message(), _message()])
+        blocked = asyncio.create_task(buffer.enqueue([_message(), _message()]))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        release.set()
+        await asyncio.wait_for(blocked, timeout=1)
+        await buffer.close()
+        assert len(buffer) == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_batches_are_retried_then_dropped(self):
+        writer = _RecordingWriter(fail=lambda records: RuntimeError("database unavailable"))
+        buffer = ConversationWriteBuffer(writer, flush_interval_seconds=60)
+        buffer._bind_loop()
+        await buffer.enqueue([_message()])
+
+        assert await buffer._flush_batch() is False
+        assert len(buffer) == 1
+        await buffer.close()
+        assert len(buffer) == 0
+        assert writer.batches == []
+
+    @pytest.mark.asyncio
+    async def test_foreign_thread_does_not_sink_the_batch(self):
+        def reject_other(records):
+            if any(r.thread_id == OTHER_THREAD for r in records):
+                return PermissionError("HIGH-14")
+            return None
+
+        writer = _RecordingWriter(fail=reject_other)
+        buffer = ConversationWriteBuffer(writer, flush_interval_seconds=60)
+        await buffer.enqueue([_message(content="mine"), _message(OTHER_THREAD, content="theirs")])
+        await buffer.close()
+
+        assert [[r.content for r in batch] for batch in writer.batches] == [["mine"]]
+
+    @pytest.mark.asyncio
+    async def test_partial_retry_requeues_only_unwritten_threads(self):
+        third_thread = "33333333-3333-3333-3333-333333333333"
+        outage = {"on": True}
+
+        def fail(records):
+            threads = {r.thread_id for r in records}
+            if OTHER_THREAD in threads and len(threads) > 1:
+                return PermissionError("HIGH-14")
+            if outage["on"] and threads == {third_thread}:
+                return RuntimeError("connection reset")
+            return None
+
+        writer = _RecordingWriter(fail=fail)
+        buffer = ConversationWriteBuffer(writer, flush_interval_seconds=60)
+        buffer._bind_loop()
+        await buffer.enqueue([
+            _message(content="a"), _message(third_thread, content="c"), _message(OTHER_THREAD, content="b"),
+        ])
+
+        assert await buffer._flush_batch() is False
+        assert [r.content for r in buffer._pending] == ["c"]
+
+        outage["on"] = False
+        assert await buffer._flush_batch() is True
+        written = [r.content for batch in writer.batches for r in batch]
+        assert sorted(written) == ["a", "b", "c"]
+        assert len(written) == len(set(written))
+
+
+class TestReadYourWrites:
+
+    @pytest.fixture
+    def store(self):
+        engine = _FakeEngine(owners={THREAD: "alice"}, context_rows=[
+            {"kind": "message", "id": "m-1", "intent_type": None, "role": "user", "content": "earlier",
+             "payload": {}, "ordering_index": 1, "created_at": datetime(2025, 1, 1, tzinfo=timezone.utc)},
+        ])
+        store = AsyncConversationStore(db=SimpleNamespace(engine=engine))
+        store.write_buffer = ConversationWriteBuffer(store.write_records, flush_interval_seconds=60)
+        return store, engine
+
+    @pytest.mark.asyncio
+    async def test_context_includes_unflushed_records(self, store):
+        store, engine = store
+        message_id = await store.add_message(THREAD, "alice", "user", "just asked", "query")
+        await store.enqueue([
+            IntentRecord(THREAD, "alice", message_id, "just asked", None, "COST_BREAKDOWN", 0.9,
+                         extracted_dimensions={"services": ["EC2"]}),
+        ])
+
+        context = await store.get_context_for_query(THREAD, "alice")
+        other_user = await store.get_context_for_query(THREAD, "mallory")
+
+        assert _inserts(engine, "conversation_messages") == []
+        assert [m["content"] for m in context["conversation_history"]] == ["earlier", "just asked"]
+        assert context["services"] == ["EC2"]
+        assert "just asked" not in [m["content"] for m in other_user["conversation_history"]]
+        await store.close()
+        assert len(_inserts(engine, "conversation_messages")) == 1
+
+    @pytest.mark.asyncio
+    async def test_history_includes_unflushed_messages(self, store):
+        store, engine = store
+        await store.add_message(THREAD, "alice", "user", "just asked", "query")
+
+        history = await store.get_conversation_history(THREAD, "alice", limit=100)
+        other_user = await store.get_conversation_history(THREAD, "mallory", limit=100)
+
+        assert [m["content"] for m in history] == ["just asked"]
+        assert other_user == []
+        await store.close()
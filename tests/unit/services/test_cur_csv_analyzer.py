@@ -4,7 +4,9 @@ Tests for backend/services/cur_csv_analyzer.py — Advisory Mode (CUR CSV upload
 Covers:
 - Column-name normalisation across the 3 AWS CUR header conventions
 - load_dataframe() bytes / gzip / DataFrame paths + required-column validation
+- iter_dataframes() + analyze_chunks() streaming matches the in-memory path
 - Each of the seven detectors firing on synthetic CUR rows
+- Shared pre-pass: usage-type families and categorical key columns
 - Summary aggregation (rows_analyzed, period_days, estimated_monthly_savings_usd)
 - Opportunity dicts are tagged source=cur_analysis so they flow into the
   org-scoped Opportunities store
@@ -21,7 +23,7 @@ import pandas as pd
 import pytest
 
 from backend.models.opportunities import OpportunityCategory, OpportunitySource
-from backend.services.cur_csv_analyzer import CURCSVAnalyzer, _canonicalise
+from backend.services.cur_csv_analyzer import CURCSVAnalyzer, _canonicalise, _usage_families
 
 
 # ---------------------------------------------------------------------------
@@ -341,6 +343,88 @@ class TestAnalyze:
         assert isinstance(result["opportunities"], list)
 
 
+# ---------------------------------------------------------------------------
+# Shared pre-pass
+# ---------------------------------------------------------------------------
+
+
+def _findings(result):
+    return sorted(
+        (o["title"], o["resource_id"] or "", o["estimated_monthly_savings"])
+        for o in result["opportunities"]
+    )
+
+
+class TestPrepare:
+    def test_usage_families_first_match_wins(self):
+        usage_type = pd.Series(
+            ["BoxUsage:m5.large", "USE1-DataTransfer-Out-Bytes", "EBS:SnapshotUsage", "TimedStorage-ByteHrs", None, "Requests"]
+        ).astype("category")
+        assert list(_usage_families(usage_type)) == [
+            "Compute (BoxUsage)",
+            "Data Transfer",
+            "EBS Snapshots",
+            "Storage",
+            "Other",
+            "Other",
+        ]
+
+    def test_categorical_columns_match_object_columns(self, synthetic_cur_df):
+        df = CURCSVAnalyzer.load_dataframe(synthetic_cur_df)
+        categorical = df.copy()
+        for col in categorical.columns:
+            if categorical[col].dtype == object:
+                categorical[col] = categorical[col].astype("category")
+
+        expected = CURCSVAnalyzer().analyze(df)
+        result = CURCSVAnalyzer().analyze(categorical)
+
+        assert result["summary"] == expected["summary"]
+        assert _findings(result) == _findings(expected)
+
+
+# ---------------------------------------------------------------------------
+# Streaming — iter_dataframes() + analyze_chunks()
+# ---------------------------------------------------------------------------
+
+
+class TestStreaming:
+    @pytest.fixture
+    def csv_bytes(self, synthetic_cur_df) -> bytes:
+        buf = io.StringIO()
+        synthetic_cur_df.to_csv(buf, index=False)
+        return buf.getvalue().encode("utf-8")
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_chunked_matches_in_memory(self, csv_bytes, compress):
+        expected = CURCSVAnalyzer().analyze(CURCSVAnalyzer.load_dataframe(csv_bytes))
+        payload = gzip.compress(csv_bytes) if compress else csv_bytes
+
+        analyzer = CURCSVAnalyzer()
+        result = analyzer.analyze_chunks(
+            CURCSVAnalyzer.iter_dataframes(io.BytesIO(payload), filename="cur.csv", chunksize=97)
+        )
+
+        assert result["summary"] == expected["summary"]
+        assert _findings(result) == _findings(expected)
+        assert analyzer.account_id == "123456789012"
+
+    def test_only_analyzed_columns_are_parsed(self, synthetic_cur_df):
+        buf = io.StringIO()
+        synthetic_cur_df.assign(**{"resourceTags/user:team": "platform"}).to_csv(buf, index=False)
+        chunk = next(CURCSVAnalyzer.iter_dataframes(buf.getvalue().encode("utf-8")))
+        assert "resource_tags_user:team" not in chunk.columns
+        assert "line_item_unblended_cost" in chunk.columns
+
+    def test_max_rows_spans_chunks(self, csv_bytes):
+        chunks = list(CURCSVAnalyzer.iter_dataframes(csv_bytes, max_rows=10, chunksize=4))
+        assert [len(c) for c in chunks] == [4, 4, 2]
+
+    def test_missing_columns_rejected_before_rows_are_read(self):
+        with pytest.raises(ValueError, match="AWS CUR export"):
+            next(CURCSVAnalyzer.iter_dataframes(b"foo,bar\n1,2\n"))
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -0,0 +1,230 @@
+"""
+Tests for CUR partition discovery and partition-pruning predicates.
+"""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.services.athena_cur_templates import AthenaCURTemplates, CURPatternMiningTemplates
+from backend.services.cur_partitions import CURPartitionCatalog, CURPartitionScheme, cur_partition_catalog
+from backend.services.text_to_sql_service import TextToSQLService
+from backend.utils.sql_validation import ValidationError
+
+
+@pytest.fixture
+def billing_period_scheme():
+    return CURPartitionScheme.from_partitions(
+        ["billing_period"], [("2024-12",), ("2025-01",), ("2025-02",)]
+    )
+
+
+@pytest.fixture
+def year_month_scheme():
+    return CURPartitionScheme.from_partitions(
+        ["year", "month"], [("2024", "12"), ("2025", "1"), ("2025", "2")]
+    )
+
+
+class TestCURPartitionScheme:
+
+    def test_billing_period_single_month(self, billing_period_scheme):
+        clause, years, months = billing_period_scheme.predicate("2025-01-01", "2025-01-31")
+        assert clause == "billing_period IN ('2025-01')"
+        assert years == ["2025"]
+        assert months == ["2025-01"]
+
+    def test_billing_period_spans_year_boundary(self, billing_period_scheme):
+        clause, _, _ = billing_period_scheme.predicate(date(2024, 11, 15), date(2025, 2, 3))
+        assert clause == "billing_period IN ('2024-11', '2024-12', '2025-01', '2025-02')"
+
+    def test_compact_billing_period_format_detected(self):
+        scheme = CURPartitionScheme.from_partitions(["billing_period"], [("202501",)])
+        clause, _, _ = scheme.predicate("2025-01-01", "2025-02-10")
+        assert clause == "billing_period IN ('202501', '202502')"
+
+    def test_year_month_across_years(self, year_month_scheme):
+        clause, years, months = year_month_scheme.predicate("2024-12-01", "2025-01-31")
+        assert clause == "((year = '2024' AND month IN ('12')) OR (year = '2025' AND month IN ('1')))"
+        assert years == ["2024", "2025"]
+        assert months == ["12", "1"]
+
+    def test_zero_padded_months_and_numeric_keys(self):
+        scheme = CURPartitionScheme.from_partitions(
+            ["year", "month"], [("2025", "01")], numeric_keys=["year"]
+        )
+        clause, _, _ = scheme.predicate("2025-01-01", "2025-02-01")
+        assert clause == "(year = 2025 AND month IN ('01', '02'))"
+
+    def test_unpartitioned_table_has_no_scheme(self):
+        assert CURPartitionScheme.from_partitions(["dt"], [("2025-01-01",)]) is None
+
+    def test_fingerprint_changes_when_partition_lands(self, billing_period_scheme):
+        grown = CURPartitionScheme.from_partitions(
+            ["billing_period"], [("2024-12",), ("2025-01",), ("2025-02",), ("2025-03",)]
+        )
+        assert grown.fingerprint != billing_period_scheme.fingerprint
+
+
+class TestTemplatesUsePartitionScheme:
+
+    def test_templates_inject_predicate(self, billing_period_scheme):
+        templates = AthenaCURTemplates("cost_db", "cur_table", partition_scheme=billing_period_scheme)
+        sql = templates.top_n_services("2025-01-01", "2025-01-31", 5)
+        assert "billing_period IN ('2025-01')" in sql
+        assert "1=1" not in sql
+
+    def test_pattern_mining_templates_inject_predicate(self, year_month_scheme):
+        templates = CURPatternMiningTemplates("cost_db", "cur_table", partition_scheme=year_month_scheme)
+        sql = templates.usage_type_cost_drivers("2025-01-01", "2025-02-28")
+        assert "(year = '2025' AND month IN ('1', '2'))" in sql
+
+    def test_top_services_ranking_covers_its_lookback(self, billing_period_scheme):
+        templates = AthenaCURTemplates("cost_db", "cur_table", partition_scheme=billing_period_scheme)
+        sql = templates.month_over_month_by_service("2025-02-10", "2025-02-20", top_services_only=5)
+        head, ranking = sql.split("product_product_name IN (", 1)
+        assert "billing_period IN ('2025-01', '2025-02')" in ranking
+        assert "billing_period IN ('2025-02')" in head
+
+    def test_discovered_scheme_used_by_default(self, billing_period_scheme):
+        templates = AthenaCURTemplates("disc_db", "disc_table")
+        cur_partition_catalog.set("disc_db", "disc_table", billing_period_scheme)
+        try:
+            clause, _, _ = templates._build_partition_filter("2025-02-01", "2025-02-28")
+        finally:
+            cur_partition_catalog.set("disc_db", "disc_table", None)
+        assert clause == "billing_period IN ('2025-02')"
+
+    def test_pruning_disabled_keeps_the_freshness_token(self, billing_period_scheme, monkeypatch):
+        from backend.config.settings import get_settings
+
+        monkeypatch.setattr(get_settings(), "cur_partition_pruning_enabled", False)
+        templates = AthenaCURTemplates("disc_db", "disc_table")
+        cur_partition_catalog.set("disc_db", "disc_table", billing_period_scheme)
+        try:
+            clause, _, _ = templates._build_partition_filter("2025-02-01", "2025-02-28")
+            token = cur_partition_catalog.freshness_token("disc_db", "disc_table")
+        finally:
+            cur_partition_catalog.set("disc_db", "disc_table", None)
+        assert clause == "1=1"
+        assert token is not None and billing_period_scheme.fingerprint in token
+
+    def test_dates_still_validated(self, billing_period_scheme):
+        templates = AthenaCURTemplates("cost_db", "cur_table", partition_scheme=billing_period_scheme)
+        with pytest.raises(ValidationError):
+            templates._build_partition_filter("2025-01-01' OR 1=1 --", "2025-01-31")
+
+
+class TestTextToSQLInjection:
+
+    @pytest.fixture
+    def service(self, billing_period_scheme):
+        from backend.config.settings import get_settings
+        settings = get_settings()
+        cur_partition_catalog.set(settings.aws_cur_database, settings.aws_cur_table, billing_period_scheme)
+        yield TextToSQLService()
+        cur_partition_catalog.set(settings.aws_cur_database, settings.aws_cur_table, None)
+
+    def test_between_filter_gets_partition_predicate(self, service):
+        sql = (
+            "SELECT line_item_product_code, SUM(line_item_unblended_cost) FROM db.cur "
+            "WHERE CAST(line_item_usage_start_date AS DATE) BETWEEN DATE '2025-01-01' AND DATE '2025-01-31' "
+            "GROUP BY 1"
+        )
+        out = service._inject_partition_filters(sql)
+        assert "DATE '2025-01-31' AND billing_period IN ('2025-01') GROUP BY 1" in out
+
+    def test_each_range_gets_its_own_predicate(self, service):
+        sql = (
+            "SELECT SUM(CASE WHEN CAST(line_item_usage_start_date AS DATE) BETWEEN DATE '2025-01-01' AND DATE '2025-01-31' "
+            "THEN c END), SUM(CASE WHEN CAST(line_item_usage_start_date AS DATE) BETWEEN DATE '2024-12-01' AND DATE '2024-12-31' "
+            "THEN c END) FROM db.cur"
+        )
+        out = service._inject_partition_filters(sql)
+        assert "billing_period IN ('2025-01')" in out
+        assert "billing_period IN ('2024-12')" in out
+
+    def test_open_range_pair(self, service):
+        sql = (
+            "SELECT 1 FROM db.cur WHERE CAST(line_item_usage_start_date AS DATE) >= DATE '2025-01-10' "
+            "AND CAST(line_item_usage_start_date AS DATE) <= DATE '2025-02-05' LIMIT 5"
+        )
+        out = service._inject_partition_filters(sql)
+        assert out.endswith("DATE '2025-02-05' AND billing_period IN ('2025-01', '2025-02') LIMIT 5")
+
+    def test_existing_partition_filter_left_alone(self, service):
+        sql = (
+            "SELECT 1 FROM db.cur WHERE billing_period = '2025-01' AND "
+            "CAST(line_item_usage_start_date AS DATE) BETWEEN DATE '2025-01-01' AND DATE '2025-01-31'"
+        )
+        assert service._inject_partition_filters(sql) == sql
+
+    def test_joins_left_alone(self, service):
+        sql = (
+            "SELECT 1 FROM db.cur a JOIN db.other b ON a.x = b.x WHERE "
+            "CAST(line_item_usage_start_date AS DATE) BETWEEN DATE '2025-01-01' AND DATE '2025-01-31'"
+        )
+        assert service._inject_partition_filters(sql) == sql
+
+    def test_no_scheme_no_change(self):
+        sql = "SELECT 1 FROM db.cur WHERE CAST(line_item_usage_start_date AS DATE) BETWEEN DATE '2025-01-01' AND DATE '2025-01-31'"
+        assert TextToSQLService()._inject_partition_filters(sql) == sql
+
+
+class TestDiscovery:
+
+    @pytest.mark.asyncio
+    async def test_glue_discovery(self):
+        glue = MagicMock()
+        glue.get_table.return_value = {
+            "Table": {"PartitionKeys": [{"Name": "billing_period", "Type": "string"}]}
+        }
+        glue.get_paginator.return_value.paginate.return_value = [
+            {"Partitions": [{"Values": ["2025-01"]}, {"Values": ["2025-02"]}]}
+        ]
+        catalog = CURPartitionCatalog()
+        with patch("backend.services.cur_partitions.get_aws_client", return_value=glue):
+            scheme = await catalog.discover("db", "cur")
+
+        assert scheme.keys == ("billing_period",)
+        assert catalog.get("db", "cur") is scheme
+        assert len(scheme.values) == 2
+
+    @pytest.mark.asyncio
+    async def test_show_partitions_fallback(self):
+        athena = MagicMock()
+
+        async def _start(**kwargs):
+            return {"QueryExecutionId": "q1"}
+
+        async def _wait(qid, **kwargs):
+            return {"QueryExecution": {"Status": {"State": "SUCCEEDED"}}}
+
+        async def _results(qid, next_token=None):
+            return {"ResultSet": {"Rows": [
+                {"Data": [{"VarCharValue": "year=2025/month=1"}]},
+                {"Data": [{"VarCharValue": "year=2025/month=2"}]},
+            ]}}
+
+        athena.start_query_execution = _start
+        athena.wait_for_query = _wait
+        athena.get_query_results = _results
+
+        catalog = CURPartitionCatalog()
+        with patch("backend.services.cur_partitions.get_aws_client", side_effect=RuntimeError("no glue")), \
+                patch("backend.services.athena_client.get_async_athena_client", return_value=athena):
+            scheme = await catalog.discover("db", "cur")
+
+        assert scheme.keys == ("year", "month")
+        clause, _, _ = scheme.predicate("2025-03-01", "2025-03-31")
+        assert clause == "(year = '2025' AND month IN ('3'))"
+
+    @pytest.mark.asyncio
+    async def test_failed_discovery_keeps_previous_scheme(self, billing_period_scheme):
+        catalog = CURPartitionCatalog()
+        catalog.set("db", "cur", billing_period_scheme)
+        with patch("backend.services.cur_partitions.get_aws_client", side_effect=RuntimeError("no glue")), \
+                patch("backend.services.athena_client.get_async_athena_client", side_effect=RuntimeError("no athena")):
+            scheme = await catalog.discover("db", "cur")
+        assert scheme is billing_period_scheme
@@ -14,6 +14,7 @@ from uuid import uuid4
 import pytest
 
 from backend.models.opportunities import OpportunityCategory, OpportunitySource
+from backend.services.athena_polling import QueryClass
 
 
 # ---------------------------------------------------------------------------
@@ -102,6 +103,8 @@ async def test_mine_ri_unused_hours_builds_opportunity(svc, mock_executor):
     assert opp["estimated_monthly_savings"] > 0
     # cur_validation_sql is populated so users can re-run the query themselves
     assert "reservation" in opp["cur_validation_sql"].lower()
+    # Mining scans are batch work, not held to the interactive deadline
+    assert mock_executor._execute_athena_query.call_args.kwargs["query_class"] == QueryClass.BATCH
 
 
 @pytest.mark.asyncio
@@ -294,7 +297,7 @@ async def test_fetch_service_cost_trend_signals(svc):
 async def test_fetch_all_cur_signals_aggregates_and_skips_failures(svc, mock_executor):
     """One Athena detector returns rows, the rest empty; one CE detector raises."""
 
-    def athena_side_effect(sql):
+    def athena_side_effect(sql, **kwargs):
         if "savings_plan" in sql.lower():
             return [
                 {
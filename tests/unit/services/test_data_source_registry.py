@@ -0,0 +1,115 @@
+"""
+Tests for the COPY-based partition swap in DataSourceRegistryService.
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import asynccontextmanager
+from datetime import date
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from backend.models.data_sources import DataSourceProvider, NormalizedCostBatch
+from backend.services.data_source_registry import _PARTITION_COLUMNS, DataSourceRegistryService
+
+
+class _DriverConnection:
+    def __init__(self):
+        self.copies = []
+
+    async def copy_records_to_table(self, table_name, *, records, columns):
+        self.copies.append((table_name, list(records), columns))
+
+
+class _Connection:
+    def __init__(self):
+        self.statements = []
+        self.driver_connection = _DriverConnection()
+
+    async def execute(self, statement, params=None):
+        self.statements.append((" ".join(str(statement).split()), params))
+
+    async def get_raw_connection(self):
+        return self
+
+
+class _Engine:
+    def __init__(self):
+        self.conn = _Connection()
+
+    @asynccontextmanager
+    async def begin(self):
+        yield self.conn
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    fake = _Engine()
+
+    async def _engine(self):
+        return fake
+
+    monkeypatch.setattr(DataSourceRegistryService, "_engine", _engine)
+    return fake
+
+
+def _batch():
+    return NormalizedCostBatch(
+        provider_type=DataSourceProvider.GCP_BILLING,
+        partition_month=[date(2026, 2, 1), date(2026, 1, 1), date(2026, 2, 1)],
+        account_or_project_id=["proj-a", None, "proj-b"],
+        service_name=["BigQuery", "BigQuery", "Compute Engine"],
+        region=["us", None, "us-east1"],
+        usage_quantity=[1.5, 0.0, 3.0],
+        usage_unit=["byte", None, "hour"],
+        cost_amount=[10.1, 0.25, 7.0],
+        currency=["USD", "USD", "EUR"],
+        record_count=[4, 1, 2],
+    )
+
+
+@pytest.mark.asyncio
+async def test_swaps_source_months_then_copies(engine):
+    service = DataSourceRegistryService(uuid4())
+    source_id, run_id = uuid4(), uuid4()
+
+    await service._store_normalized_records(source_id, run_id, _batch())
+
+    (lock_sql, lock_params), (delete_sql, delete_params) = engine.conn.statements
+    assert "pg_advisory_xact_lock" in lock_sql
+    assert str(source_id) in lock_params["lock_key"]
+    assert delete_sql.startswith("DELETE FROM normalized_cost_partitions")
+    assert delete_params == {
+        "organization_id": service.organization_id,
+        "data_source_id": source_id,
+        "months": [date(2026, 1, 1), date(2026, 2, 1)],
+    }
+
+    [(table, rows, columns)] = engine.conn.driver_connection.copies
+    assert table == "normalized_cost_partitions"
+    assert columns == _PARTITION_COLUMNS
+    assert len(rows) == 3
+
+    row = dict(zip(columns, rows[0]))
+    assert row["organization_id"] == service.organization_id
+    assert (row["data_source_id"], row["run_id"]) == (source_id, run_id)
+    assert row["provider_type"] == "gcp_billing"
+    assert row["partition_month"] == row["billing_period_start"] == date(2026, 2, 1)
+    assert row["cost_amount"] == Decimal("10.1")
+    assert row["usage_quantity"] == Decimal("1.5")
+    assert json.loads(row["tags"]) == {"aggregated_record_count": 4}
+    assert dict(zip(columns, rows[1]))["account_or_project_id"] is None
+    assert len({r[0] for r in rows}) == 3
+
+
+@pytest.mark.asyncio
+async def test_empty_batch_leaves_partitions_alone(engine):
+    service = DataSourceRegistryService(uuid4())
+
+    await service._store_normalized_records(uuid4(), uuid4(), NormalizedCostBatch(DataSourceProvider.AWS_CUR))
+
+    assert engine.conn.statements == []
+    assert engine.conn.driver_connection.copies == []
@@ -0,0 +1,102 @@
+"""
+Tests for the precomputed exemplar index of the embedding intent router.
+"""
+
+import hashlib
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from backend.services.embedding import embedding_intent_router as router
+
+
+class _FakeModel:
+    """Deterministic stand-in for SentenceTransformer.encode."""
+
+    def __init__(self, dim=16):
+        self.dim = dim
+        self.encoded = 0
+
+    def _vector(self, text):
+        seed = int(hashlib.sha256(text.encode("utf-8")).hexdigest()[:8], 16)
+        vector = np.random.default_rng(seed).standard_normal(self.dim).astype(np.float32)
+        return vector / np.linalg.norm(vector)
+
+    def encode(self, texts, convert_to_numpy=True, normalize_embeddings=True):
+        self.encoded += len(texts)
+        return np.stack([self._vector(t) for t in texts])
+
+
+@pytest.fixture
+def model():
+    fake = _FakeModel()
+    with patch.object(router, "SentenceTransformer", object), \
+            patch.object(router, "_load_model", lambda: fake), \
+            patch.object(router, "_index", None):
+        yield fake
+
+
+def _naive_scores(model, query):
+    q = model._vector(query)
+    return {
+        intent: max(float(model._vector(ex) @ q) for ex in examples)
+        for intent, examples in router._INTENT_EXAMPLES.items()
+    }
+
+
+class TestExemplarIndex:
+
+    def test_matrix_is_contiguous_and_normalized(self, model):
+        index = router.build_exemplar_index(model=model)
+        assert index.matrix.flags["C_CONTIGUOUS"]
+        assert index.matrix.dtype == np.float32
+        assert np.allclose(np.linalg.norm(index.matrix, axis=1), 1.0, atol=1e-5)
+        assert index.intents == tuple(router._INTENT_EXAMPLES)
+
+    def test_scores_match_per_exemplar_max(self, model):
+        query = "Top 10 services by cost"
+        scores = router.route_intent(query)
+        expected = _naive_scores(model, query)
+        assert scores.keys() == expected.keys()
+        for intent, value in expected.items():
+            assert scores[intent] == pytest.approx(value, abs=1e-5)
+
+    def test_exemplars_encoded_once(self, model):
+        router.route_intent("first question")
+        after_first = model.encoded
+        router.route_intent("second question")
+        # Only the query itself is encoded on later calls
+        assert model.encoded == after_first + 1
+
+    def test_batch_matches_single(self, model):
+        queries = ["cost trend by month", "idle instances", "compare dev vs prod"]
+        batch = router.route_intents(queries)
+        assert len(batch) == 3
+        for query, scores in zip(queries, batch):
+            single = router.route_intent(query)
+            assert scores == pytest.approx(single, abs=1e-6)
+
+    def test_persisted_matrix_is_memory_mapped(self, model, tmp_path):
+        first = router.build_exemplar_index(model=model, directory=str(tmp_path))
+        encoded = model.encoded
+        files = list(tmp_path.glob("*.npy"))
+        assert len(files) == 1 and router.exemplar_fingerprint() in files[0].name
+
+        second = router.build_exemplar_index(model=model, directory=str(tmp_path))
+        assert model.encoded == encoded
+        assert isinstance(second.matrix, np.memmap)
+        assert np.array_equal(first.matrix, second.matrix)
+
+    def test_exemplar_change_uses_new_file(self, model, tmp_path):
+        router.build_exemplar_index(model=model, directory=str(tmp_path))
+        changed = dict(router._INTENT_EXAMPLES, OTHER=["Something new"])
+        with patch.object(router, "_INTENT_EXAMPLES", changed):
+            router.build_exemplar_index(model=model, directory=str(tmp_path))
+        assert len(list(tmp_path.glob("*.npy"))) == 2
+
+
+def test_without_model_returns_empty_maps():
+    with patch.object(router, "SentenceTransformer", None):
+        assert router.route_intents(["a", "b"]) == [{}, {}]
+        assert router.warm_exemplar_index() is False
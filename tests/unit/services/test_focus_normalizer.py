@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from datetime import date
+
 import pandas as pd
+import pytest
 
 from backend.models.data_sources import DataSourceProvider
 from backend.services.focus_normalizer import FocusNormalizer
@@ -61,3 +64,33 @@ class TestFocusNormalizer:
         assert len(records) == 1
         assert records[0].service_name == "Databricks"
         assert records[0].cost_amount == 15.0
+
+    def test_normalize_batch_is_columnar(self):
+        df = pd.DataFrame(
+            [
+                {"date": "2026-02-28T23:30:00Z", "service": " Databricks ", "cost": 1.0, "account_id": "  "},
+                {"date": "2026-03-01T00:10:00Z", "service": "Databricks", "cost": 2.0, "account_id": "acct-1"},
+                {"date": "not-a-date", "service": "Databricks", "cost": 4.0},
+            ]
+        )
+
+        batch, errors = FocusNormalizer().normalize_batch(DataSourceProvider.GENERIC_COST, df)
+
+        assert len(errors) == 1
+        assert len(batch) == 2
+        assert batch.partition_month == [date(2026, 2, 1), date(2026, 3, 1)]
+        assert batch.service_name == ["Databricks", "Databricks"]
+        assert batch.account_or_project_id == [None, "acct-1"]
+        assert batch.currency == ["USD", "USD"]
+        assert batch.record_count == [1, 1]
+
+        records = batch.records()
+        assert [r.partition_month for r in records] == batch.partition_month
+        assert records[1].cost_amount == 2.0
+        assert records[1].tags == {"aggregated_record_count": 1}
+
+    def test_blank_service_is_rejected(self):
+        df = pd.DataFrame([{"date": "2026-02-01", "service": "   ", "cost": 1.0}])
+
+        with pytest.raises(ValueError, match="service_name"):
+            FocusNormalizer().normalize_batch(DataSourceProvider.GENERIC_COST, df)
@@ -64,6 +64,7 @@ _FULLY_MIGRATED = [
     "services/infrastructure_analyzer.py",
     "services/aws_optimization_signals.py",
     "services/arn_resolver.py",
+    "services/athena_client.py",
 ]
 
 
@@ -81,8 +82,9 @@ class TestStaticAnalysis:
 
     @pytest.mark.parametrize("source_file", _FULLY_MIGRATED)
     def test_imports_session_factory(self, source_file):
-        """Fully-migrated file must import create_aws_session."""
-        assert "create_aws_session" in _read_source(source_file)
+        """Fully-migrated file must import create_aws_session (or the registry built on it)."""
+        source = _read_source(source_file)
+        assert "create_aws_session" in source or "get_aws_client" in source
 
     @pytest.mark.parametrize("source_file", _FULLY_MIGRATED + ["services/multi_account_service.py"])
     def test_uses_aws_service_constants(self, source_file):
@@ -128,11 +130,13 @@ class TestAthenaExecutorUsesSessionFactory:
         mock_client = MagicMock()
         mock_session.client.return_value = mock_client
 
-        with patch('backend.agents.execute_query_v2.create_aws_session', return_value=mock_session):
+        with patch('backend.services.athena_client.create_aws_session', return_value=mock_session), \
+                patch('backend.services.athena_client._async_athena_client', None):
             from backend.agents.execute_query_v2 import AthenaExecutor
             executor = AthenaExecutor()
 
-        mock_session.client.assert_called_once_with('athena')
+        mock_session.client.assert_called_once()
+        assert mock_session.client.call_args.args[0] == 'athena'
         assert executor.athena_client is mock_client
 
 
@@ -255,28 +259,22 @@ class TestMultiAccountServiceUsesSessionFactory:
 
 
 class TestArnResolverUsesSessionFactory:
-    """Runtime verification: arn_resolver helper delegates to session factory."""
+    """Runtime verification: arn_resolver helper delegates to the client registry."""
 
     def test_helper_uses_factory(self):
-        mock_session = MagicMock()
         mock_client = MagicMock()
-        mock_session.client.return_value = mock_client
 
-        with patch('backend.services.arn_resolver.create_aws_session', return_value=mock_session) as mock_factory:
+        with patch('backend.services.arn_resolver.get_aws_client', return_value=mock_client) as mock_factory:
             from backend.services.arn_resolver import get_boto3_client
             result = get_boto3_client('ec2', 'ap-southeast-1')
 
-        mock_factory.assert_called_once_with(region_name='ap-southeast-1')
-        mock_session.client.assert_called_once_with('ec2')
+        mock_factory.assert_called_once_with('ec2', region_name='ap-southeast-1')
         assert result is mock_client
 
     def test_helper_normalises_empty_region_to_none(self):
         """Empty string region must be normalised to None for the factory."""
-        mock_session = MagicMock()
-        mock_session.client.return_value = MagicMock()
-
-        with patch('backend.services.arn_resolver.create_aws_session', return_value=mock_session) as mock_factory:
+        with patch('backend.services.arn_resolver.get_aws_client', return_value=MagicMock()) as mock_factory:
             from backend.services.arn_resolver import get_boto3_client
             get_boto3_client('s3', '')
 
-        mock_factory.assert_called_once_with(region_name=None)
+        mock_factory.assert_called_once_with('s3', region_name=None)
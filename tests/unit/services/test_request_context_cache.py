@@ -0,0 +1,241 @@
+"""
+Tests for the two-tier RequestContext cache.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from backend.services import request_context_cache as module
+from backend.services.cache_service import CacheService
+from backend.services.request_context import OrganizationInfo, RequestContext, SavedViewInfo
+from backend.services.request_context_cache import (
+    RequestContextCache,
+    context_from_payload,
+    context_to_payload,
+)
+
+
+class _FakeValkey:
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.mget_calls = 0
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ttl_seconds=None):
+        self.data[key] = value
+        self.ttls[key] = ttl_seconds
+        return True
+
+    async def get_many(self, keys):
+        self.mget_calls += 1
+        return [self.data.get(key) for key in keys]
+
+
+@pytest.fixture
+def valkey():
+    fake = _FakeValkey()
+    with patch.object(module, "get_cache_service", AsyncMock(return_value=fake)), \
+            patch.object(module, "_REBUMP_DELAY_SECONDS", 0):
+        yield fake
+
+
+def _context(email="alice@example.com", org_id=None, view_expires_at=None):
+    org_id = org_id or uuid4()
+    return RequestContext(
+        user_id=uuid4(),
+        user_email=email,
+        is_admin=False,
+        organization_id=org_id,
+        organization_name="Acme",
+        organization_info=OrganizationInfo(
+            id=org_id, name="Acme", slug="acme", subscription_tier="enterprise",
+            settings={"currency": "USD"}, saved_view_default_expiration_days=30,
+        ),
+        allowed_account_ids=["111111111111", "222222222222"],
+        active_saved_view=SavedViewInfo(
+            id=uuid4(), name="Prod", account_ids=[uuid4()],
+            default_time_range={"days": 30}, filters={"env": "prod"},
+            is_personal=True, expires_at=view_expires_at,
+        ),
+        effective_time_range={"days": 30},
+        effective_filters={"env": "prod"},
+        org_role="admin",
+    )
+
+
+async def _cache(context, **kwargs):
+    cache = RequestContextCache(local_ttl_seconds=30, local_max_entries=8, ttl_seconds=300, **kwargs)
+    versions = await cache.versions_for(context.user_email, context.user_id, context.organization_id)
+    if versions is not None:
+        await cache.put(context, versions)
+    return cache
+
+
+async def _settle(cache):
+    for task in list(cache._rebumps):
+        await task
+
+
+def test_payload_round_trip():
+    context = _context(view_expires_at=datetime(2030, 1, 1, tzinfo=timezone.utc))
+    restored = context_from_payload(context_to_payload(context))
+    assert context_to_payload(restored) == context_to_payload(context)
+    assert restored.active_saved_view.expires_at == context.active_saved_view.expires_at
+    assert restored.allowed_accounts_expire_at is None
+
+
+class TestRequestContextCache:
+
+    @pytest.mark.asyncio
+    async def test_local_hit_is_a_copy_with_request_id(self, valkey):
+        context = _context()
+        cache = await _cache(context)
+        request_id = uuid4()
+
+        hit = await cache.get("Alice@Example.com", request_id)
+
+        assert hit is not None and hit is not context
+        assert hit.request_id == request_id
+        assert hit.allowed_account_ids == context.allowed_account_ids
+        hit.allowed_account_ids.append("333333333333")
+        assert "333333333333" not in (await cache.get(context.user_email)).allowed_account_ids
+
+    @pytest.mark.asyncio
+    async def test_valkey_tier_is_shared_across_workers(self, valkey):
+        context = _context()
+        await _cache(context)
+        other_worker = RequestContextCache(local_ttl_seconds=30, local_max_entries=8, ttl_seconds=300)
+
+        hit = await other_worker.get(context.user_email)
+
+        assert hit is not None
+        assert context_to_payload(hit) == context_to_payload(context)
+
+    @pytest.mark.asyncio
+    async def test_miss_for_unknown_user(self, valkey):
+        cache = RequestContextCache(local_ttl_seconds=30, local_max_entries=8, ttl_seconds=300)
+        assert await cache.get("nobody@example.com") is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("invalidate", [
+        lambda cache, c: cache.invalidate_user(c.user_id),
+        lambda cache, c: cache.invalidate_user(user_email=c.user_email.upper()),
+        lambda cache, c: cache.invalidate_organization(c.organization_id),
+        lambda cache, c: cache.invalidate_all(),
+    ])
+    async def test_invalidation_reaches_every_worker(self, valkey, invalidate):
+        context = _context()
+        cache = await _cache(context)
+        other_worker = RequestContextCache(local_ttl_seconds=30, local_max_entries=8, ttl_seconds=300)
+        assert await other_worker.get(context.user_email) is not None
+
+        await invalidate(cache, context)
+        await _settle(cache)
+
+        assert await cache.get(context.user_email) is None
+        assert await other_worker.get(context.user_email) is None
+
+    @pytest.mark.asyncio
+    async def test_invalidation_is_scoped(self, valkey):
+        alice = _context()
+        bob = _context(email="bob@example.com")
+        cache = await _cache(alice)
+        versions = await cache.versions_for(bob.user_email, bob.user_id, bob.organization_id)
+        await cache.put(bob, versions)
+
+        await cache.invalidate_organization(alice.organization_id)
+        await _settle(cache)
+
+        assert await cache.get(alice.user_email) is None
+        assert await cache.get(bob.user_email) is not None
+
+    @pytest.mark.asyncio
+    async def test_load_racing_an_invalidation_is_rebumped(self, valkey):
+        context = _context()
+        cache = RequestContextCache(local_ttl_seconds=30, local_max_entries=8, ttl_seconds=300)
+        await cache.invalidate_user(context.user_id)
+        # A load that read the rows before the change but the versions after it
+        versions = await cache.versions_for(context.user_email, context.user_id, context.organization_id)
+        await cache.put(context, versions)
+        assert await cache.get(context.user_email) is not None
+
+        await _settle(cache)
+
+        assert await cache.get(context.user_email) is None
+
+    @pytest.mark.asyncio
+    async def test_expired_active_view_is_never_served(self, valkey):
+        context = _context(view_expires_at=datetime.now(timezone.utc) + timedelta(hours=1))
+        cache = await _cache(context)
+        assert await cache.get(context.user_email) is not None
+
+        expired = datetime.now(timezone.utc) - timedelta(seconds=1)
+        cache._local[context.user_email].context.active_saved_view.expires_at = expired
+        key = cache._entry_key(context.user_email)
+        valkey.data[key] = valkey.data[key].replace(
+            context_to_payload(context)["active_saved_view"]["expires_at"], expired.isoformat()
+        )
+
+        assert await cache.get(context.user_email) is None
+        cache._local.clear()
+        context.active_saved_view.expires_at = expired
+        await cache.put(context, ("0", "0", "0", "0"))
+        assert not cache._local
+
+    @pytest.mark.asyncio
+    async def test_expired_account_grant_is_never_served(self, valkey):
+        context = _context()
+        context.allowed_accounts_expire_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+        cache = await _cache(context)
+        key = cache._entry_key(context.user_email)
+        assert await cache.get(context.user_email) is not None
+        assert 59 <= valkey.ttls[key] <= 60
+
+        expired = datetime.now(timezone.utc) - timedelta(seconds=1)
+        cache._local[context.user_email].context.allowed_accounts_expire_at = expired
+        valkey.data[key] = valkey.data[key].replace(
+            context_to_payload(context)["allowed_accounts_expire_at"], expired.isoformat()
+        )
+
+        assert await cache.get(context.user_email) is None
+        cache._local.clear()
+        context.allowed_accounts_expire_at = expired
+        await cache.put(context, ("0", "0", "0", "0"))
+        assert not cache._local
+
+    @pytest.mark.asyncio
+    async def test_valkey_outage_degrades_to_miss(self):
+        context = _context()
+        with patch.object(module, "get_cache_service", AsyncMock(side_effect=ConnectionError("down"))), \
+                patch.object(module, "_REBUMP_DELAY_SECONDS", 0):
+            cache = await _cache(context)
+            assert await cache.get(context.user_email) is None
+            await cache.invalidate_user(context.user_id)
+            await _settle(cache)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("client", [None, AsyncMock(mget=AsyncMock(side_effect=TimeoutError("mget")))])
+    async def test_unreadable_versions_are_a_miss_and_not_cached(self, valkey, client):
+        context = _context()
+        cache = await _cache(context)
+        assert await cache.get(context.user_email) is not None
+
+        disconnected = CacheService()
+        disconnected._client = client
+        with patch.object(module, "get_cache_service", AsyncMock(return_value=disconnected)):
+            assert await cache.versions_for(context.user_email, context.user_id, context.organization_id) is None
+            assert await cache.get(context.user_email) is None
+
+    @pytest.mark.asyncio
+    async def test_local_tier_is_bounded(self, valkey):
+        cache = RequestContextCache(local_ttl_seconds=30, local_max_entries=2, ttl_seconds=300)
+        for i in range(3):
+            context = _context(email=f"user{i}@example.com")
+            await cache.put(context, ("0", "0", "0", "0"))
+        assert list(cache._local) == ["user1@example.com", "user2@example.com"]
@@ -0,0 +1,202 @@
+"""
+Tests for the text-to-SQL generation cache.
+"""
+
+import json
+import re
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from backend.services.text_to_sql_cache import (
+    TextToSQLCache,
+    anchor_tokens,
+    canonical_query,
+    text_to_sql_cache_hits,
+)
+from backend.services.text_to_sql_service import settings, text_to_sql_service
+
+
+class _FakeValkey:
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ttl_seconds=None):
+        self.store[key] = value
+        return True
+
+
+@pytest.fixture
+def valkey():
+    fake = _FakeValkey()
+    with patch("backend.services.text_to_sql_cache.get_cache_service", AsyncMock(return_value=fake)):
+        yield fake
+
+
+def _fake_encoder(vectors):
+    """Stand-in for the router model: known texts map to fixed unit vectors."""
+    def encode(texts):
+        return np.array([vectors[t] for t in texts], dtype=np.float32)
+    return encode
+
+
+def _counter_value(counter, **labels):
+    return counter.labels(**labels)._value.get()
+
+
+def _time_range(start, end):
+    return {"start_date": start, "end_date": end, "description": "Requested period"}
+
+
+GENERATION = {
+    "sql": (
+        f"SELECT line_item_product_code AS service, SUM(line_item_unblended_cost) AS cost_usd "
+        f"FROM {settings.aws_cur_database or 'cost_and_usage_db'}.{settings.aws_cur_table or 'costandusagereport'} "
+        "WHERE CAST(line_item_usage_start_date AS DATE) BETWEEN DATE '2025-01-01' AND DATE '2025-01-31' "
+        "GROUP BY 1 ORDER BY 2 DESC LIMIT 5"
+    ),
+    "explanation": "Top services",
+    "result_columns": ["service", "cost_usd"],
+    "query_type": "top_services",
+    "chart_suggestions": [],
+}
+
+
+class TestCanonicalQuery:
+
+    def test_relative_and_absolute_months_share_a_template(self):
+        last_month, period = canonical_query("What did we spend on EC2 last month?")
+        november, _ = canonical_query("what did we spend on ec2 November 2025")
+        assert last_month == november == "what did we cost on ec2 <period:calendar_month_full>"
+        assert period == "calendar_month_full"
+
+    def test_rolling_windows_share_a_template(self):
+        assert canonical_query("EC2 cost last 7 days")[0] == canonical_query("EC2 cost last 90 days")[0]
+
+    def test_anchor_tokens(self):
+        canonical, _ = canonical_query("top 10 EC2 costs by region")
+        assert anchor_tokens(canonical) == frozenset({"10", "ec2"})
+
+
+class TestTextToSQLCache:
+
+    @pytest.mark.asyncio
+    async def test_exact_round_trip(self, valkey):
+        cache = TextToSQLCache()
+        hits = _counter_value(text_to_sql_cache_hits, tier="local")
+
+        assert await cache.get("EC2 cost last month", "v1") is None
+        assert await cache.put("EC2 cost last month", "v1", GENERATION)
+        entry = await cache.get("ec2 spend  last month?", "v1")
+
+        assert entry["sql"] == GENERATION["sql"]
+        assert entry["cache_tier"] == "local"
+        assert _counter_value(text_to_sql_cache_hits, tier="local") == hits + 1
+
+    @pytest.mark.asyncio
+    async def test_valkey_tier_and_schema_version(self, valkey):
+        await TextToSQLCache().put("EC2 cost last month", "v1", GENERATION)
+        reader = TextToSQLCache()
+        assert (await reader.get("EC2 cost last month", "v1"))["cache_tier"] == "valkey"
+        assert await reader.get("EC2 cost last month", "v2") is None
+
+    @pytest.mark.asyncio
+    async def test_embedding_tier_requires_threshold_and_anchors(self, valkey):
+        stored, _ = canonical_query("EC2 cost last month")
+        close, _ = canonical_query("how much was EC2 cost last month")
+        other_service, _ = canonical_query("how much was S3 cost last month")
+        vectors = {
+            stored: np.array([1.0, 0.0]),
+            close: np.array([0.96, 0.28]),
+            other_service: np.array([0.96, 0.28]),
+        }
+        cache = TextToSQLCache(similarity_threshold=0.93)
+        with patch(
+            "backend.services.embedding.embedding_intent_router.encode", _fake_encoder(vectors)
+        ):
+            await cache.put("EC2 cost last month", "v1", GENERATION)
+            entry = await cache.get("how much was EC2 cost last month", "v1")
+            assert entry["cache_tier"] == "embedding"
+            assert await cache.get("how much was S3 cost last month", "v1") is None
+
+    @pytest.mark.asyncio
+    async def test_disabled_without_embedding_model(self, valkey):
+        cache = TextToSQLCache()
+        with patch("backend.services.embedding.embedding_intent_router.encode", lambda texts: None):
+            await cache.put("EC2 cost last month", "v1", GENERATION)
+            assert cache._index == {}
+            assert await cache.get("how much was EC2 cost last month", "v1") is None
+
+
+class TestGenerateSqlWithCache:
+
+    @pytest.fixture
+    def cache(self, valkey):
+        cache = TextToSQLCache()
+        with patch("backend.services.text_to_sql_service.text_to_sql_cache", cache):
+            yield cache
+
+    @pytest.mark.asyncio
+    async def test_second_question_rebinds_dates_without_llm(self, cache):
+        llm = AsyncMock(return_value=json.dumps(GENERATION))
+        with patch("backend.services.text_to_sql_service.llm_service.call_llm", llm):
+            first_sql, first = await text_to_sql_service.generate_sql(
+                "top services last month",
+                previous_context={"time_range": _time_range("2025-01-01", "2025-01-31")},
+            )
+            second_sql, second = await text_to_sql_service.generate_sql(
+                "Top services last month?",
+                previous_context={"time_range": _time_range("2025-02-01", "2025-02-28")},
+            )
+
+        assert llm.await_count == 1
+        assert first["generated_via"] == "text_to_sql_llm"
+        assert second["generated_via"] == "text_to_sql_cache"
+        assert "DATE '2025-02-01' AND DATE '2025-02-28'" in second_sql
+        assert "2025-01" not in second_sql
+
+    @pytest.mark.asyncio
+    async def test_follow_ups_bypass_cache(self, cache):
+        llm = AsyncMock(return_value=json.dumps(GENERATION))
+        history = [{"role": "user", "content": "top services last month"}]
+        with patch("backend.services.text_to_sql_service.llm_service.call_llm", llm):
+            await text_to_sql_service.generate_sql("top services last month", conversation_history=history)
+            await text_to_sql_service.generate_sql("top services last month", conversation_history=history)
+
+        assert llm.await_count == 2
+        assert cache._local == {}
+
+    @pytest.mark.asyncio
+    async def test_unrebindable_sql_not_cached(self, cache):
+        comparison = dict(GENERATION, sql=GENERATION["sql"].replace(
+            "GROUP BY", "OR CAST(line_item_usage_start_date AS DATE) = DATE '2024-12-31' GROUP BY"
+        ))
+        with patch(
+            "backend.services.text_to_sql_service.llm_service.call_llm",
+            AsyncMock(return_value=json.dumps(comparison)),
+        ):
+            await text_to_sql_service.generate_sql("top services last month")
+        assert cache._local == {}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("window", [
+        "CAST(line_item_usage_start_date AS DATE) >= DATE_ADD('month', -4, CURRENT_DATE)",
+        "line_item_usage_start_date >= NOW() - INTERVAL '4' MONTH",
+        "1 = 1",
+    ])
+    async def test_sql_without_literal_bounds_not_served_for_another_window(self, cache, window):
+        relative = dict(GENERATION, sql=re.sub(
+            r"CAST\(line_item_usage_start_date AS DATE\) BETWEEN .+? AND DATE '[\d-]+'", window, GENERATION["sql"]
+        ))
+        assert window in relative["sql"]
+        llm = AsyncMock(return_value=json.dumps(relative))
+        with patch("backend.services.text_to_sql_service.llm_service.call_llm", llm):
+            await text_to_sql_service.generate_sql("top services last 4 months")
+            await text_to_sql_service.generate_sql("top services last 6 months")
+
+        assert llm.await_count == 2
+        assert cache._local == {}
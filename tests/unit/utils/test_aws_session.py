@@ -9,6 +9,7 @@ from unittest.mock import patch, MagicMock
 import warnings
 
 from backend.utils.aws_session import (
+    AwsClientRegistry,
     create_aws_session,
     create_aws_client,
     create_aws_resource,
@@ -261,3 +262,95 @@ class TestSecurityNoExplicitCredentials:
 
         assert 'aws_access_key_id' not in params
         assert 'aws_secret_access_key' not in params
+
+
+class TestAwsClientRegistry:
+    """Tests for the process-wide client registry behind get_aws_client"""
+
+    @pytest.fixture
+    def registry(self):
+        with patch('backend.utils.aws_session.create_aws_session') as mock_session_fn:
+            def new_session(region_name=None):
+                session = MagicMock(name=f"session-{region_name}")
+                session.client.side_effect = lambda *args, **kwargs: MagicMock()
+                return session
+
+            mock_session_fn.side_effect = new_session
+            yield AwsClientRegistry(), mock_session_fn
+
+    def test_reuses_client_per_service_and_region(self, registry):
+        registry, mock_session_fn = registry
+
+        first = registry.get_client('s3', region_name='us-west-2')
+        again = registry.get_client('s3', region_name='us-west-2')
+        other_region = registry.get_client('s3', region_name='us-east-1')
+
+        assert first is again
+        assert first is not other_region
+        assert mock_session_fn.call_count == 2
+        assert len(registry) == 2
+
+    def test_applies_default_pool_config(self, registry):
+        from botocore.config import Config
+        registry, _ = registry
+
+        registry.get_client('athena', region_name='us-west-2', config=Config(connect_timeout=5))
+
+        call = registry._sessions[('us-west-2', None)].client.call_args
+        assert call.args == ('athena',)
+        assert call.kwargs['region_name'] == 'us-west-2'
+        assert call.kwargs['config'].max_pool_connections == 50
+        assert call.kwargs['config'].connect_timeout == 5
+        assert call.kwargs['config'].retries['mode'] == 'adaptive'
+
+    def test_distinct_configs_get_distinct_clients(self, registry):
+        from botocore.config import Config
+        registry, _ = registry
+
+        a = registry.get_client('s3', region_name='us-west-2', config=Config(read_timeout=10))
+        b = registry.get_client('s3', region_name='us-west-2', config=Config(read_timeout=10))
+        c = registry.get_client('s3', region_name='us-west-2', config=Config(read_timeout=60))
+
+        assert a is b
+        assert a is not c
+
+    def test_role_clients_use_refreshable_credentials(self):
+        from datetime import datetime, timedelta, timezone
+        from botocore.credentials import RefreshableCredentials
+
+        sts = MagicMock()
+        sts.assume_role.return_value = {"Credentials": {
+            "AccessKeyId": "AKIA_TEST",
+            "SecretAccessKey": "secret",
+            "SessionToken": "token",
+            "Expiration": datetime.now(timezone.utc) + timedelta(hours=1),
+        }}
+        base_session = MagicMock()
+        base_session.client.return_value = sts
+
+        with patch('backend.utils.aws_session.create_aws_session', return_value=base_session):
+            registry = AwsClientRegistry()
+            client = registry.get_client(
+                'ce', region_name='us-east-1', role_arn='arn:aws:iam::123456789012:role/reader'
+            )
+
+        credentials = registry._sessions[('us-east-1', 'arn:aws:iam::123456789012:role/reader')] \
+            ._session.get_credentials()
+        assert isinstance(credentials, RefreshableCredentials)
+        assert credentials.access_key == "AKIA_TEST"
+        assert sts.assume_role.call_args.kwargs['RoleArn'] == 'arn:aws:iam::123456789012:role/reader'
+        assert client is registry.get_client(
+            'ce', region_name='us-east-1', role_arn='arn:aws:iam::123456789012:role/reader'
+        )
+
+    def test_pool_usage_reports_configured_size(self):
+        registry = AwsClientRegistry()
+        with patch('backend.utils.aws_session.create_aws_session') as mock_session_fn:
+            import boto3
+            mock_session_fn.return_value = boto3.Session(
+                region_name='us-west-2', aws_access_key_id='x', aws_secret_access_key='y'
+            )
+            registry.get_client('s3', region_name='us-west-2')
+
+        (usage,) = registry.pool_usage()
+        assert usage == {"service": "s3", "region": "us-west-2", "in_use": 0, "idle": 0, "max": 50}